@@ -20,7 +20,7 @@ from .grouping import (Counselor, MultisigNotificationHandler, multisigInceptExn
                        multisigIssueExn, multisigRevokeExn, multisigRpyExn,
                        multisigExn, getEscrowedEvent, Multiplexor)
 from .habbing import (openHby, openHab, Habery, Signator, HaberyDoer, SIGNER,
-                      BaseHab, Hab, SignifyHab, SignifyGroupHab, GroupHab)
+                      BaseHab, Hab, SignifyHab, SignifyGroupHab, GroupHab, HabCache)
 from .httping import (SignatureValidationComponent, CesrRequest, CESR_CONTENT_TYPE,
                       parseCesrHttpRequest, createCESRRequest, streamCESRRequests,
                       Clienter, CESR_DESTINATION_HEADER)
@@ -41,6 +41,6 @@ from .signaling import (signal, Signal, Signaler,
                         SignalsEnd, SignalIterable)
 from .signing import serialize, signPaths, transSeal
 from .specing import SpecResource
-from .storing import Mailboxer, Respondant
+from .storing import Mailboxer, MailboxPruner, Respondant
 from .watching import (logger, Stateage, States, DiffState,
                        Adjudicator, AdjudicationDoer, diffState)
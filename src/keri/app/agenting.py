@@ -86,13 +86,10 @@ class Receiptor(doing.DoDoer):
                 yield from self.catchup(ser.pre, wit)
 
         clients = dict()
-        doers = []
         for wit in wits:
             try:
-                client, clientDoer = httpClient(hab, wit)
+                client, _ = httpClient(hab, wit, clienter=self.clienter)
                 clients[wit] = client
-                doers.append(clientDoer)
-                self.extend([clientDoer])
             except (MissingEntryError, gaierror) as e:
                 logger.error(f"unable to create http client for witness {wit}: {e}")
 
@@ -145,7 +142,8 @@ class Receiptor(doing.DoDoer):
             while len(client.responses) < sent:
                 yield self.tock
 
-        self.remove(doers)
+        for client in clients.values():
+            self.clienter.remove(client)
 
         return rcts.keys()
 
@@ -205,15 +203,14 @@ class Receiptor(doing.DoDoer):
 
         hab = self.hby.habs[pre]
 
-        client, clientDoer = httpClient(hab, wit)
-        self.extend([clientDoer])
+        client, _ = httpClient(hab, wit, clienter=self.clienter)
 
         for fmsg in hab.db.clonePreIter(pre=pre, version=hab.kever.serder.pvrsn):
             streamCESRRequests(client=client, dest=wit, ims=bytearray(fmsg))
             while not client.responses:
                 yield self.tock
 
-        self.remove([clientDoer])
+        self.clienter.remove(client)
 
     def witDo(self, tymth=None, tock=0.0, **kwa):
         """
@@ -284,9 +281,21 @@ class WitnessReceiptor(doing.DoDoer):
     for receipts from each of those witnesses, and propagates those receipts to each
     of the other witnesses after receiving the complete set.
 
-    Removes all Doers and exits as Done once all witnesses have been sent the entire
-    receipt set.  Could be enhanced to have a `once` method that runs once and cleans up
-    and an `all` method that runs and waits for more messages to receipt."""
+    Events are pipelined. Every queued event is sent as soon as it is dequeued
+    so many events may be in flight to a witness at once, each tracked until
+    it is fully receipted and its receipts have been propagated. One messenger
+    per controller and witness is reused for all events in flight and removed
+    once it is idle and no event in flight is witnessed by it. A witness that
+    has not seen the prior events of a KEL is caught up from the last event it
+    is known to have rather than from the start of the KEL.
+
+    Attributes:
+        witers (dict): messenger keyed by (pre, wit) of controller and witness
+            AIDs reused across events
+        queued (dict): count of messages queued to messenger keyed by (pre, wit)
+        sns (dict): sn of latest event of KEL sent to or receipted by witness
+            keyed by (pre, wit)
+        pending (dict): events in flight keyed by (pre, said) of event"""
 
     def __init__(self, hby, msgs=None, cues=None, force=False, auths=None, **kwa):
         """
@@ -306,6 +315,10 @@ class WitnessReceiptor(doing.DoDoer):
         self.msgs = msgs if msgs is not None else decking.Deck()
         self.cues = cues if cues is not None else decking.Deck()
         self.auths = auths if auths is not None else dict()
+        self.witers = dict()
+        self.queued = dict()
+        self.sns = dict()
+        self.pending = dict()
 
         super(WitnessReceiptor, self).__init__(doers=[doing.doify(self.receiptDo)], **kwa)
 
@@ -314,6 +327,9 @@ class WitnessReceiptor(doing.DoDoer):
         Sends events, their receipts, receipt signatures, delegation chain, and location record
          URLs between witnesses in the set of current witnesses.
 
+        Each pass sends all newly queued events then advances every event in
+        flight, cueing those that are fully receipted with receipts propagated.
+
         Returns:
             a doifiable Hio generator to perform event and receipt sending.
 
@@ -329,113 +345,225 @@ class WitnessReceiptor(doing.DoDoer):
 
         while True:
             while self.msgs:
-                evt = self.msgs.popleft()
-                pre = evt["pre"]
+                self.submit(self.msgs.popleft())
 
-                if pre not in self.hby.habs:
-                    continue
+            for key in list(self.pending):
+                if self.advance(self.pending[key]):
+                    for evt in self.pending.pop(key)["evts"]:
+                        self.cues.push(evt)
 
-                hab = self.hby.habs[pre]
+            self.prune()
+            yield self.tock
 
-                sn = evt["sn"] if "sn" in evt else hab.kever.sner.num
-                wits = hab.kever.wits
+    def submit(self, evt):
+        """Sends event of evt to each of its witnesses that has not yet
+        receipted it and adds event to .pending. Cues evt at once when event
+        is already fully receipted unless .force
+
+        Parameters:
+            evt (dict): {"pre": <str>, "sn": <int>} of event to receipt. sn
+                defaults to latest event"""
+        pre = evt["pre"]
+        if pre not in self.hby.habs:
+            return
+
+        hab = self.hby.habs[pre]
+        sn = evt["sn"] if "sn" in evt else hab.kever.sner.num
+        wits = hab.kever.wits
+
+        if len(wits) == 0:
+            return
+
+        # Match attachment genus to the event body so v1-only witnesses can parse.
+        serder, _, _ = hab.getOwnEvent(sn=sn)
+        msg = hab.msgOwnEvent(sn=sn, framed=True, gvrsn=serder.pvrsn)
+        ser = serdering.SerderKERI(raw=msg)
+
+        key = (ser.pre, ser.said)
+        if key in self.pending:  # already in flight so cue both when done
+            self.pending[key]["evts"].append(evt)
+            return
 
-                if len(wits) == 0:
+        # Check to see if we already have all the receipts we need for this event
+        wigers = hab.db.wigs.get(keys=(ser.preb, ser.saidb))
+        if len(wigers) == len(wits):
+            if not self.force:  # exit unless told to force resubmit of all receipts
+                self.cues.push(evt)
+                return
+        else:
+            indices = {wiger.index for wiger in wigers}
+            for idx, wit in enumerate(wits):
+                if idx in indices:  # witness already receipted event
                     continue
 
-                # Match attachment genus to the event body so v1-only witnesses can parse.
-                serder, _, _ = hab.getOwnEvent(sn=sn)
-                msg = hab.msgOwnEvent(sn=sn, framed=True, gvrsn=serder.pvrsn)
-                ser = serdering.SerderKERI(raw=msg)
+                for dmsg in hab.db.cloneDelegation(hab.kever):
+                    self.send(hab, wit, dmsg)
 
-                witers = []
-                for wit in wits:
-                    auth = self.auths[wit] if wit in self.auths else None
-                    witer = messenger(hab, wit, auth=auth)
-                    witers.append(witer)
-                    self.extend([witer])
+                self.catchup(hab, wit, ser)
+                self.send(hab, wit, msg)
 
-                # Check to see if we already have all the receipts we need for this event
-                wigers = hab.db.wigs.get(keys=(ser.preb, ser.saidb))
-                completed = len(wigers) == len(wits)
-                if len(wigers) != len(wits):  # We have all the receipts, skip
-                    for idx, witer in enumerate(witers):
-                        wit = wits[idx]
+        self.pending[key] = dict(evts=[evt], hab=hab, ser=ser, sn=sn, wits=wits, marks=None)
 
-                        for dmsg in hab.db.cloneDelegation(hab.kever):
-                            witer.msgs.append(bytearray(dmsg))
+    def advance(self, rec):
+        """Returns True when event of pending record rec is fully receipted and
+        its receipts have been sent to all of its witnesses. Propagates the
+        receipts once the full set of receipts is in.
 
-                        if ser.ked['t'] in (coring.Ilks.icp, coring.Ilks.dip) or \
-                                "ba" in ser.ked and wit in ser.ked["ba"]:  # Newly added witness, must send full KEL to catch up
-                            for fmsg in hab.db.clonePreIter(pre=pre, version=ser.pvrsn):
-                                witer.msgs.append(bytearray(fmsg))
+        Parameters:
+            rec (dict): pending record of event from .pending"""
+        if rec["marks"] is None:
+            hab, ser = rec["hab"], rec["ser"]
+            wigers = hab.db.wigs.get(keys=(ser.preb, ser.saidb))
+            if len(wigers) != len(rec["wits"]):
+                return False
+            rec["marks"] = self.propagate(hab, ser, rec["sn"], rec["wits"], wigers)
 
-                        witer.msgs.append(bytearray(msg))  # make a copy
-                        _ = (yield self.tock)
+        pre = rec["hab"].pre
+        return all(self.sent(pre, wit, mark) for wit, mark in rec["marks"].items())
 
-                    while True:
-                        wigers = hab.db.wigs.get(keys=(ser.preb, ser.saidb))
-                        if len(wigers) == len(wits):
-                            break
-                        _ = yield self.tock
+    def propagate(self, hab, ser, sn, wits, wigers):
+        """Sends each witness the receipts of ser from all the other witnesses
+        introducing the witnesses to each other when needed.
 
-                # If we started with all our receipts, exit unless told to force resubmit of all receipts
-                if completed and not self.force:
-                    self.cues.push(evt)
-                    continue
+        Returns:
+            dict: mark from .send of receipt message keyed by witness AID
 
-                # generate all rct msgs to send to all witnesses
-                awigers = wigers
-
-                # make sure all witnesses have fully receipted KERL and know about each other
-                for witer in witers:
-                    ewits = []
-                    wigers = []
-                    for i, wit in enumerate(wits):
-                        if wit == witer.wit:
-                            continue
-                        ewits.append(wit)
-                        wigers.append(awigers[i])
-
-                    if len(wigers) == 0:
-                        continue
-
-                    rctMsg = bytearray()
-
-                    # Now that the witnesses have not met each other, send them each other's receipts
-                    if ser.ked['t'] in (coring.Ilks.icp, coring.Ilks.dip):  # introduce new witnesses
-                        rctMsg.extend(schemes(self.hby.db, eids=ewits))
-                    elif ser.ked['t'] in (coring.Ilks.rot, coring.Ilks.drt) and \
-                            ("ba" in ser.ked and witer.wit in ser.ked["ba"]):  # Newly added witness, introduce to all
-                        rctMsg.extend(schemes(self.hby.db, eids=ewits))
-
-                    rserder = eventing.receipt(pre=ser.pre,
-                                               sn=sn,
-                                               said=ser.said,
-                                               version=ser.pvrsn,
-                                               kind=ser.kind)
-                    rctMsg.extend(eventing.messagize(serder=rserder, wigers=wigers,
-                                                     framed=True, gvrsn=ser.pvrsn))
-
-                    witer.msgs.append(rctMsg)
-                    _ = (yield self.tock)
+        Parameters:
+            hab (Hab): controller habitat of event
+            ser (SerderKERI): event receipted
+            sn (int): sequence number of event
+            wits (list): qb64 witness AIDs of event
+            wigers (list): full set of witness indexed signatures of event"""
+        wigerByIdx = {wiger.index: wiger for wiger in wigers}
+        marks = dict()
+        for idx, wit in enumerate(wits):
+            ewits = [w for i, w in enumerate(wits) if i != idx]
+            ewigers = [wigerByIdx[i] for i in range(len(wits)) if i != idx]
+            if len(ewigers) == 0:
+                continue
 
-                while True:
-                    done = True
-                    for witer in witers:
-                        if not witer.idle:
-                            yield 1.0
-                            done = False
-                            break
-                    if done:
-                        break
+            rctMsg = bytearray()
 
-                self.remove(witers)
+            # Now that the witnesses have not met each other, send them each other's receipts
+            if ser.ked['t'] in (coring.Ilks.icp, coring.Ilks.dip):  # introduce new witnesses
+                rctMsg.extend(schemes(self.hby.db, eids=ewits))
+            elif ser.ked['t'] in (coring.Ilks.rot, coring.Ilks.drt) and \
+                    ("ba" in ser.ked and wit in ser.ked["ba"]):  # Newly added witness, introduce to all
+                rctMsg.extend(schemes(self.hby.db, eids=ewits))
 
-                self.cues.push(evt)
-                yield self.tock
+            rserder = eventing.receipt(pre=ser.pre,
+                                       sn=sn,
+                                       said=ser.said,
+                                       version=ser.pvrsn,
+                                       kind=ser.kind)
+            rctMsg.extend(eventing.messagize(serder=rserder, wigers=ewigers,
+                                             framed=True, gvrsn=ser.pvrsn))
 
-            yield self.tock
+            marks[wit] = self.send(hab, wit, rctMsg)
+
+        return marks
+
+    def catchup(self, hab, wit, ser):
+        """Sends witness wit each event of the KEL of ser prior to ser that
+        the witness is not known to have, with all of its attachments.
+
+        Parameters:
+            hab (Hab): controller habitat of KEL
+            wit (str): qb64 AID of witness to catch up
+            ser (SerderKERI): event the witness is about to be sent"""
+        key = (ser.pre, wit)
+        last = self.sns[key] if key in self.sns else self.lastSn(hab, wit, ser.sn)
+        for sn in range(last + 1, ser.sn):
+            dig = hab.db.kels.getLast(keys=ser.pre, on=sn)
+            if dig is None or (fner := hab.db.fons.get(keys=(ser.pre, dig))) is None:
+                continue
+            self.send(hab, wit, hab.db.cloneEvtMsg(pre=ser.pre, fn=fner.num, dig=dig,
+                                                   gvrsn=ser.pvrsn))
+
+        self.sns[key] = max(last, ser.sn)
+
+    def lastSn(self, hab, wit, sn):
+        """Returns sn of latest event of KEL of hab before sn receipted by
+        witness wit or -1 when witness has receipted no event before sn.
+
+        Walks the KEL back once. The events since an establishment event are
+        checked with the witnesses of that establishment event. A witness not
+        in those witnesses can not have receipted any earlier event.
+
+        Parameters:
+            hab (Hab): controller habitat of KEL
+            wit (str): qb64 AID of witness
+            sn (int): sequence number to search back from"""
+        preb = hab.pre.encode("utf-8")
+        events = []  # (sn, dig) of events back to their establishment event
+        esn = sn
+        for digb in hab.db.kels.getBackIter(keys=preb, on=sn - 1):
+            serder = hab.db.evts.get(keys=(preb, digb))
+            if serder.sn >= esn:  # superseded event at sn already walked
+                continue
+            esn = serder.sn
+            events.append((esn, digb))
+            if not serder.estive:
+                continue
+
+            wits = [prefixer.qb64 for prefixer in hab.db.wits.get(keys=(preb, digb))]
+            if wit not in wits:
+                return -1
+            idx = wits.index(wit)
+            for num, digb in events:  # latest first
+                if any(wiger.index == idx for wiger in hab.db.wigs.get(keys=(preb, digb))):
+                    return num
+            events = []
+
+        return -1
+
+    def send(self, hab, wit, msg):
+        """Queues msg to messenger of hab for witness wit creating the
+        messenger when there is none.
+
+        Returns:
+            int: mark of msg as count of messages queued to messenger
+
+        Parameters:
+            hab (Hab): controller habitat of messenger used to look up witness
+                endpoints
+            wit (str): qb64 AID of witness
+            msg (bytes): message to send"""
+        key = (hab.pre, wit)
+        if key not in self.witers:
+            auth = self.auths[wit] if wit in self.auths else None
+            witer = messenger(hab, wit, auth=auth)
+            self.witers[key] = witer
+            self.queued[key] = 0
+            self.extend([witer])
+
+        self.witers[key].msgs.append(bytearray(msg))  # make a copy
+        self.queued[key] += 1
+        return self.queued[key]
+
+    def sent(self, pre, wit, mark):
+        """Returns True when message with mark from .send has been sent to
+        witness wit for controller pre. A message is sent once its messenger
+        has moved on to a later message or has gone idle.
+
+        Parameters:
+            pre (str): qb64 AID of controller
+            wit (str): qb64 AID of witness
+            mark (int): mark returned by .send"""
+        witer = self.witers[(pre, wit)]
+        taken = self.queued[(pre, wit)] - len(witer.msgs)
+        return taken > mark or (taken == mark and witer.idle)
+
+    def prune(self):
+        """Removes each messenger that is idle and whose witness witnesses no
+        event of its controller in .pending so that messengers do not
+        accumulate over all the witnesses ever receipted."""
+        used = {(rec["hab"].pre, wit) for rec in self.pending.values()
+                for wit in rec["wits"]}
+        for key in [key for key, witer in self.witers.items()
+                    if key not in used and witer.idle]:
+            self.remove([self.witers.pop(key)])
+            del self.queued[key]
 
 
 class WitnessInquisitor(doing.DoDoer):
@@ -827,7 +955,8 @@ class TCPStreamMessenger(doing.DoDoer):
 class HTTPMessenger(doing.DoDoer):
     """Send CESR messages to a witness over HTTP and capture responses."""
 
-    def __init__(self, hab, wit, url, msgs=None, sent=None, doers=None, auth=None, **kwa):
+    def __init__(self, hab, wit, url, msgs=None, sent=None, doers=None, auth=None,
+                 clienter=None, **kwa):
         """Initialize HTTP messenger with queues and optional auth.
 
         Parameters:
@@ -836,7 +965,10 @@ class HTTPMessenger(doing.DoDoer):
             url (str): http/https endpoint URL for the witness.
             msgs (Deck | None): outbound message queue.
             sent (Deck | None): response queue.
-            auth (str | None): optional 2FA auth codes for witnesses."""
+            auth (str | None): optional 2FA auth codes for witnesses.
+            clienter (Clienter | None): connection pool to take the client from.
+                When provided the client is run by clienter and released back
+                to it on exit otherwise this messenger runs its own client."""
         self.hab = hab
         self.wit = wit
         self.posted = 0
@@ -844,6 +976,7 @@ class HTTPMessenger(doing.DoDoer):
         self.sent = sent if sent is not None else decking.Deck()
         self.parser = None
         self.auth = auth
+        self.clienter = clienter
         doers = doers if doers is not None else []
         doers.extend([doing.doify(self.msgDo), doing.doify(self.responseDo)])
 
@@ -851,13 +984,24 @@ class HTTPMessenger(doing.DoDoer):
         if up.scheme != Schemes.http and up.scheme != Schemes.https:
             raise ValueError(f"invalid scheme {up.scheme} for HTTPMessenger")
 
-        self.client = http.clienting.Client(scheme=up.scheme, hostname=up.hostname, port=up.port)
-        clientDoer = http.clienting.ClientDoer(client=self.client)
-
-        doers.extend([clientDoer])
+        if self.clienter is not None:
+            if (client := self.clienter.connect(url)) is None:
+                raise gaierror(f"unable to connect to witness {wit} at {url}")
+            self.client = client
+        else:
+            self.client = http.clienting.Client(scheme=up.scheme, hostname=up.hostname, port=up.port)
+            clientDoer = http.clienting.ClientDoer(client=self.client)
+            doers.extend([clientDoer])
 
         super(HTTPMessenger, self).__init__(doers=doers, **kwa)
 
+    def exit(self, deeds=None):
+        """Release pooled client back to .clienter once this messenger exits."""
+        super(HTTPMessenger, self).exit(deeds=deeds)
+        if deeds is None and self.clienter is not None and self.client is not None:
+            self.clienter.remove(self.client)
+            self.client = None
+
     def msgDo(self, tymth=None, tock=0.0, **kwa):
         """Doer loop that sends queued messages over HTTP."""
         self.wind(tymth)
@@ -973,21 +1117,22 @@ def mailbox(hab, cid):
     return mbx
 
 
-def messenger(hab, pre, auth=None):
+def messenger(hab, pre, auth=None, clienter=None):
     """ Create a Messenger (tcp or http) based on available endpoints
 
     Parameters:
         hab (Habitat): Environment to use to look up witness URLs
         pre (str): qb64 identifier prefix of recipient to create a messanger for
         auth (str): optional auth code to send with any request for messenger
+        clienter (Clienter | None): connection pool for http messenger clients
 
     Returns:
         Optional (TcpWitnesser, HTTPMessenger): witnesser for ensuring full reciepts"""
     urls = hab.fetchUrls(eid=pre)
-    return messengerFrom(hab, pre, urls, auth)
+    return messengerFrom(hab, pre, urls, auth, clienter=clienter)
 
 
-def messengerFrom(hab, pre, urls, auth=None):
+def messengerFrom(hab, pre, urls, auth=None, clienter=None):
     """ Create a Witnesser (tcp or http) based on provided endpoints
 
     Parameters:
@@ -995,12 +1140,13 @@ def messengerFrom(hab, pre, urls, auth=None):
         pre (str): qb64 identifier prefix of recipient to create a messanger for
         urls (dict): map of schemes to urls of available endpoints
         auth (str): optional auth code to send with any request for messenger
+        clienter (Clienter | None): connection pool for http messenger clients
 
     Returns:
         Optional (TcpWitnesser, HTTPMessenger): witnesser for ensuring full reciepts"""
     if Schemes.http in urls or Schemes.https in urls:
         url = urls[Schemes.https] if Schemes.https in urls else urls[Schemes.http]
-        witer = HTTPMessenger(hab=hab, wit=pre, url=url, auth=auth)
+        witer = HTTPMessenger(hab=hab, wit=pre, url=url, auth=auth, clienter=clienter)
     elif Schemes.tcp in urls:
         url = urls[Schemes.tcp]
         witer = TCPMessenger(hab=hab, wit=pre, url=url)
@@ -1034,12 +1180,15 @@ def streamMessengerFrom(hab, pre, urls, msg, headers=None):
     return witer
 
 
-def httpClient(hab, wit):
+def httpClient(hab, wit, clienter=None):
     """ Create and return a http.client and http.ClientDoer for the witness
 
     Parameters:
         hab (Habitat): Environment to use to look up witness URLs
         wit (str): qb64 identifier prefix of witness for which to create a client
+        clienter (Clienter | None): connection pool to take the client from. When
+            provided the client is run by clienter so the returned ClientDoer is None
+            and the client must be released with clienter.remove(client)
 
     Returns:
         Client: Http client for connecting to remote identifier
@@ -1049,6 +1198,11 @@ def httpClient(hab, wit):
         raise MissingEntryError(f"unable to query witness {wit}, no http endpoint")
 
     url = urls[Schemes.https] if Schemes.https in urls else urls[Schemes.http]
+    if clienter is not None:
+        if (client := clienter.connect(url)) is None:
+            raise gaierror(f"unable to connect to witness {wit} at {url}")
+        return client, None
+
     up = urlparse(url)
     client = http.clienting.Client(scheme=up.scheme, hostname=up.hostname, port=up.port, path=up.path)
     clientDoer = http.clienting.ClientDoer(client=client)
@@ -15,6 +15,7 @@ from hio.help import decking, ogler
 from ..kering import (Roles, Vrsn_1_0, Version, Kinds,
                       ConfigurationError, ValidationError)
 from .agenting import messengerFrom, streamMessengerFrom
+from .httping import Clienter
 from ..core import (Bexter, Prefixer, Verfer, Texter, Diger,
                     Counter, SerderKERI,
                     MtrDex, Codens, NonTransDex)
@@ -45,15 +46,17 @@ class Poster(doing.DoDoer):
 
     """
 
-    def __init__(self, hby, mbx=None, evts=None, cues=None, version=None, kind=None, **kwa):
+    def __init__(self, hby, mbx=None, evts=None, cues=None, version=None, kind=None,
+                 clienter=None, **kwa):
         self.hby = hby
         self.mbx = mbx
         self.evts = evts if evts is not None else decking.Deck()
         self.cues = cues if cues is not None else decking.Deck()
         self.version = version if version is not None else getattr(hby, "version", Version)
         self.kind = kind if kind is not None else Kinds.json
+        self.clienter = clienter if clienter is not None else Clienter()  # pools http clients of messengers
 
-        doers = [doing.doify(self.deliverDo)]
+        doers = [self.clienter, doing.doify(self.deliverDo)]
         super(Poster, self).__init__(doers=doers, **kwa)
 
     def deliverDo(self, tymth=None, tock=0.0, **kwa):
@@ -186,7 +189,7 @@ class Poster(doing.DoDoer):
 
     def sendDirect(self, hab, ends, serder, atc):
         for ctrl, locs in ends.items():
-            witer = messengerFrom(hab=hab, pre=ctrl, urls=locs)
+            witer = messengerFrom(hab=hab, pre=ctrl, urls=locs, clienter=self.clienter)
 
             msg = bytearray(serder.raw)
             if atc is not None:
@@ -198,7 +201,7 @@ class Poster(doing.DoDoer):
             while not witer.idle:
                 _ = (yield self.tock)
 
-            self.remove([witer])
+            self.remove([witer])  # releases pooled client
 
     def forward(self, hab, ends, recp, serder, atc, topic):
         # If we are one of the mailboxes, just store locally in mailbox
@@ -228,7 +231,7 @@ class Poster(doing.DoDoer):
         ims = hab.endorse(serder=fwd, last=False, framed=True, gvrsn=gvrsn)
 
         # Transpose the signatures to point to the new location
-        witer = messengerFrom(hab=hab, pre=mbx, urls=mailbox)
+        witer = messengerFrom(hab=hab, pre=mbx, urls=mailbox, clienter=self.clienter)
         msg.extend(ims)
         msg.extend(atc)
 
@@ -238,6 +241,8 @@ class Poster(doing.DoDoer):
         while not witer.idle:
             _ = (yield self.tock)
 
+        self.remove([witer])  # releases pooled client
+
     def forwardToWitness(self, hab, ends, recp, serder, atc, topic):
         # If we are one of the mailboxes, just store locally in mailbox
         owits = oset(ends.keys())
@@ -266,7 +271,7 @@ class Poster(doing.DoDoer):
         ims = hab.endorse(serder=fwd, last=False, framed=True, gvrsn=gvrsn)
 
         # Transpose the signatures to point to the new location
-        witer = messengerFrom(hab=hab, pre=mbx, urls=mailbox)
+        witer = messengerFrom(hab=hab, pre=mbx, urls=mailbox, clienter=self.clienter)
         msg.extend(ims)
         msg.extend(atc)
 
@@ -276,6 +281,8 @@ class Poster(doing.DoDoer):
         while not witer.idle:
             _ = (yield self.tock)
 
+        self.remove([witer])  # releases pooled client
+
 
 class StreamPoster:
     """
@@ -3,6 +3,8 @@
 KERI
 keri.app.habbing module
 """
+from collections import OrderedDict
+from collections.abc import MutableMapping
 from contextlib import contextmanager
 from math import ceil
 from urllib.parse import urlsplit
@@ -127,14 +129,17 @@ class Habery:
         kvy (Kevery): Processes local key-event messages.
         psr (Parser): Parses framed local messages, dispatching to ``kvy``,
             ``rvy``, and ``exc``.
-        habs (dict): ``Hab`` instances keyed by their qb64 prefix.
+        habs (dict | HabCache): ``Hab`` instances keyed by their qb64 prefix.
             Use ``habByName`` to look up by name and ``habByPre`` to look up
-            by prefix.
+            by prefix.  A bounded ``HabCache`` when ``habCacheSize`` > 0.
+        habCacheSize (int): Max number of ``Hab`` instances kept in memory.
+            ``0`` means all habs are loaded eagerly on ``setup``.
         inited (bool): ``True`` once ``setup`` has completed successfully."""
+    HabCacheSize = 0  # max habs in memory when lazy, 0 means load all eagerly
 
     def __init__(self, *, name='test', base="", temp=False,
                  ks=None, db=None, cf=None, clear=False, headDirPath=None,
-                 version=Version, **kwa):
+                 version=Version, habCacheSize=None, **kwa):
         """Initialise a ``Habery`` instance.
 
         Opens (or reuses) the keystore, event database, and config file, then
@@ -160,6 +165,11 @@ class Habery:
             headDirPath (str | None): Override for the top-level directory path
                 used when creating ``ks`` and ``db``.
             version (Versionage): Parser attachment code table version.
+            habCacheSize (int | None): When > 0, habs are materialized lazily
+                on first access into a ``HabCache`` of at most this many
+                ``Hab`` instances and a new ``db`` does not build the
+                ``Kever`` of every hab on open.  ``None`` uses
+                ``HabCacheSize``.
             **kwa: Keyword arguments forwarded to ``setup`` and stored in
                 ``_inits`` for deferred initialisation.  See ``setup`` for the
                 full parameter list (``seed``, ``aeid``, ``bran``, ``pidx``,
@@ -168,6 +178,8 @@ class Habery:
         self.base = base
         self.temp = temp
         self.version = version
+        self.habCacheSize = (habCacheSize if habCacheSize is not None
+                             else self.HabCacheSize)
 
         self.ks = ks if ks is not None else Keeper(name=self.name,
                                                            base=self.base,
@@ -180,7 +192,8 @@ class Habery:
                                                   temp=self.temp,
                                                   reopen=True,
                                                   clear=clear,
-                                                  headDirPath=headDirPath)
+                                                  headDirPath=headDirPath,
+                                                  lazy=self.habCacheSize > 0)
         self.cf = cf if cf is not None else Configer(name=self.name,
                                                                base=self.base,
                                                                temp=self.temp,
@@ -195,7 +208,10 @@ class Habery:
         self.kvy.registerReplyRoutes(router=self.rtr)
         self.psr = Parser(framed=True, kvy=self.kvy, rvy=self.rvy,
                                   exc=self.exc, local=True, version=version)
-        self.habs = {}  # empty .habs
+        if self.habCacheSize > 0:
+            self.habs = HabCache(hby=self, size=self.habCacheSize)
+        else:
+            self.habs = {}  # empty .habs
         self._signator = None
         self.inited = False
 
@@ -209,7 +225,8 @@ class Habery:
 
 
     def setup(self, *, seed=None, aeid=None, bran=None, pidx=None, algo=None,
-              salt=None, tier=None, free=False, temp=None, ):
+              salt=None, tier=None, free=False, temp=None,
+              signerCacheSize=None, signerCacheTTL=None):
         """Finish initialisation of the ``Habery`` after ``db`` and ``ks`` are open.
 
         Intended to be called once both ``.db`` and ``.ks`` have been opened.
@@ -248,6 +265,11 @@ class Habery:
                 associated ``Doer`` exits.
             temp (bool | None): When ``True``, overrides the instance
                 ``temp`` flag to use fast salt-stretch methods during setup.
+            signerCacheSize (int | None): Max number of decrypted signers the
+                ``Manager`` caches in memory for signing.  ``None`` uses
+                ``Manager.SignerCacheSize`` which disables caching.
+            signerCacheTTL (float | None): Lifetime in seconds of each cached
+                decrypted signer.  ``None`` uses ``Manager.SignerCacheTTL``.
 
         Raises:
             ClosedError: If ``.ks`` or ``.db`` is not open when called.
@@ -277,7 +299,9 @@ class Habery:
 
         try:
             self.mgr = Manager(ks=self.ks, seed=seed, aeid=aeid, pidx=pidx,
-                                       algo=algo, salt=salt, tier=tier)
+                                       algo=algo, salt=salt, tier=tier,
+                                       signerCacheSize=signerCacheSize,
+                                       signerCacheTTL=signerCacheTTL)
         except AuthError as ex:
             self.close()
             raise ex
@@ -312,34 +336,23 @@ class Habery:
         member hab) populated from ``.habs``.  ``reconfigure`` is called both
         before and after loading.
 
+        When ``.habCacheSize`` > 0 no habs are loaded here.  Instead each is
+        materialized by ``loadHab`` on first access through ``.habs``.
+
         Raises:
             ConfigurationError: If a non-group ``Hab`` loaded from the database
                 has not been accepted into its own local KEL."""
         self.reconfigure()  # pre hab load reconfiguration
 
+        if self.habCacheSize > 0:  # lazy so load on first access
+            return
+
         groups = []
         for prefix, habord in self.db.habs.getTopItemIter():
             pre = habord.hid
-
-            # create Hab instance and inject dependencies
-            if habord.mid and not habord.sid:
-                hab = GroupHab(ks=self.ks, db=self.db, cf=self.cf, mgr=self.mgr,
-                               rtr=self.rtr, rvy=self.rvy, kvy=self.kvy, psr=self.psr,
-                               name=habord.name, pre=pre, temp=self.temp, smids=habord.smids)
-                groups.append(habord)
-            elif habord.sid and not habord.mid:
-                hab = SignifyHab(ks=self.ks, db=self.db, cf=self.cf, mgr=self.mgr,
-                                 rtr=self.rtr, rvy=self.rvy, kvy=self.kvy, psr=self.psr,
-                                 name=habord.name, pre=habord.sid)
-            elif habord.sid and habord.mid:
-                hab = SignifyGroupHab(smids=habord.smids, ks=self.ks, db=self.db, cf=self.cf, mgr=self.mgr,
-                                      rtr=self.rtr, rvy=self.rvy, kvy=self.kvy, psr=self.psr,
-                                      name=habord.name, pre=pre)
+            hab = self._habify(habord)
+            if habord.mid:
                 groups.append(habord)
-            else:
-                hab = Hab(ks=self.ks, db=self.db, cf=self.cf, mgr=self.mgr,
-                          rtr=self.rtr, rvy=self.rvy, kvy=self.kvy, psr=self.psr,
-                          name=habord.name, pre=pre, temp=self.temp)
 
             # Rules for acceptance:
             # It is accepted into its own local KEL even if it has not been fully
@@ -358,6 +371,64 @@ class Habery:
 
         self.reconfigure()  # post hab load reconfiguration
 
+    def _habify(self, habord):
+        """Return new ``Hab`` instance of the subclass given by ``habord``.
+
+        Parameters:
+            habord (HabitatRecord): persisted record of the hab.
+
+        Returns:
+            BaseHab: ``GroupHab``, ``SignifyHab``, ``SignifyGroupHab`` or
+                ``Hab`` with dependencies injected."""
+        pre = habord.hid
+        if habord.mid and not habord.sid:
+            return GroupHab(ks=self.ks, db=self.db, cf=self.cf, mgr=self.mgr,
+                            rtr=self.rtr, rvy=self.rvy, kvy=self.kvy, psr=self.psr,
+                            name=habord.name, pre=pre, temp=self.temp, smids=habord.smids)
+        elif habord.sid and not habord.mid:
+            return SignifyHab(ks=self.ks, db=self.db, cf=self.cf, mgr=self.mgr,
+                              rtr=self.rtr, rvy=self.rvy, kvy=self.kvy, psr=self.psr,
+                              name=habord.name, pre=habord.sid)
+        elif habord.sid and habord.mid:
+            return SignifyGroupHab(smids=habord.smids, ks=self.ks, db=self.db, cf=self.cf, mgr=self.mgr,
+                                   rtr=self.rtr, rvy=self.rvy, kvy=self.kvy, psr=self.psr,
+                                   name=habord.name, pre=pre)
+        else:
+            return Hab(ks=self.ks, db=self.db, cf=self.cf, mgr=self.mgr,
+                       rtr=self.rtr, rvy=self.rvy, kvy=self.kvy, psr=self.psr,
+                       name=habord.name, pre=pre, temp=self.temp)
+
+    def loadHab(self, pre):
+        """Materialize and return the ``Hab`` persisted at ``pre`` in ``db.habs``.
+
+        Used by ``HabCache`` to fill ``.habs`` on first access.  A non-group
+        hab whose own KEL can not be loaded raises just as ``loadHabs`` does
+        when not lazy.  Its ``db.habs`` record is left in place.
+
+        Parameters:
+            pre (str): qb64 AID prefix of the hab.
+
+        Returns:
+            BaseHab: new ``Hab`` instance of the subclass given by its record.
+
+        Raises:
+            KeyError: If there is no hab at ``pre``.
+            ConfigurationError: If the non-group hab at ``pre`` has not been
+                accepted into its own local KEL."""
+        if (habord := self.db.habs.get(keys=(pre,))) is None:
+            raise KeyError(pre)
+
+        hab = self._habify(habord)
+        if not hab.accepted and not habord.mid:  # no key state or KEL event
+            raise ConfigurationError(f"Problem loading Hab pre="
+                                     f"{pre} name={habord.name} from db.")
+
+        hab.inited = True
+        if habord.mid:  # member hab of group
+            hab.mhab = self.habs[habord.mid]
+
+        return hab
+
     def makeHab(self, name, ns=None, cf=None, **kwa):
         """Create, persist, and return a new local ``Hab``.
 
@@ -780,10 +851,7 @@ class Habery:
         Returns:
             Hab | None: The ``Hab`` registered under ``pre``, or ``None`` if
                 not found."""
-        if pre in self.habs:
-            return self.habs[pre]
-
-        return None
+        return self.habs.get(pre)
 
     def habByName(self, name, ns=None):
         """Return the ``Hab`` instance for a given name and optional namespace,
@@ -802,8 +870,7 @@ class Habery:
                 found."""
         ns = "" if ns is None else ns
         if (pre := self.db.names.get(keys=(ns, name))) is not None:
-            if pre in self.habs:
-                return self.habs[pre]
+            return self.habs.get(pre)
 
         return None
 
@@ -868,6 +935,66 @@ class Habery:
         return self._signator
 
 
+class HabCache(MutableMapping):
+    """Bounded read through cache of ``Hab`` instances keyed by qb64 prefix.
+
+    Used as ``Habery.habs`` when ``Habery.habCacheSize`` > 0 so that a Habery
+    hosting many AIDs need not materialize every ``Hab`` on startup.  A missing
+    hab is loaded from ``db.habs`` by ``Habery.loadHab`` on first access.  When
+    more than ``size`` habs are loaded the least recently used is evicted.
+    Iteration and ``len`` cover every hab in ``db.habs``, loaded or not.
+
+    Iterating ``.values()`` or ``.items()`` materializes every hab in turn
+    through the cache, evicting each once more than ``size`` are loaded, and
+    ``list(.values())`` holds all of them at once.  Iterate the prefixes and
+    look up one hab at a time instead.
+
+    Attributes:
+        hby (Habery): owner that loads habs.
+        size (int): max number of loaded ``Hab`` instances.
+        loaded (OrderedDict): loaded ``Hab`` instances in least recently used
+            order."""
+
+    def __init__(self, hby, size):
+        """Initialize instance.
+
+        Parameters:
+            hby (Habery): owner that loads habs.
+            size (int): max number of loaded ``Hab`` instances."""
+        self.hby = hby
+        self.size = size
+        self.loaded = OrderedDict()
+
+    def __getitem__(self, pre):
+        if (hab := self.loaded.get(pre)) is not None:
+            self.loaded.move_to_end(pre)
+            return hab
+
+        hab = self.hby.loadHab(pre)  # raises KeyError when no hab
+        self[pre] = hab
+        return hab
+
+    def __setitem__(self, pre, hab):
+        self.loaded[pre] = hab
+        self.loaded.move_to_end(pre)
+        while len(self.loaded) > self.size:
+            self.loaded.popitem(last=False)
+
+    def __delitem__(self, pre):
+        if self.loaded.pop(pre, None) is None and pre not in self:
+            raise KeyError(pre)
+
+    def __contains__(self, pre):
+        return pre in self.loaded or self.hby.db.habs.get(keys=(pre,)) is not None
+
+    def __iter__(self):
+        for (pre, ), _ in self.hby.db.habs.getTopItemIter():
+            yield pre
+
+    def __len__(self):
+        return self.hby.db.habs.cnt()
+
+
 SIGNER = "__signatory__"
 
 
@@ -3086,6 +3213,7 @@ class Hab(BaseHab):
         if ps_before.old.pubs:
             for pub in ps_before.old.pubs:
                 self.mgr.ks.pris.rem(pub)
+            self.mgr.clearSignerCache()
 
         return msg
 
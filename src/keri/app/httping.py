@@ -217,12 +217,23 @@ class Clienter(doing.DoDoer):
     It executes HTTP requests using a HIO HTTP Client run by a ClientDoer. Once a request has
     received a response then the corresponding Doer is removed from this Clienter.
 
+    Released clients whose keep-alive connection is still open are pooled as idle
+    clients keyed by (scheme, hostname, port) and reused by later requests to the
+    same host instead of opening a new TCP connection (and TLS handshake). Idle
+    clients are closed after .IdleTimeout seconds. At most .HostLimit clients per
+    host run at once. Clients requested beyond that limit are returned with their
+    request queued and are started once a client for that host is released, so
+    callers polling ``client.responses`` are unaffected.
+
     Doers:
         - clientDo: Periodically checks for stale clients and removes them if they have not received a response
-          within the specified timeout period.
+          within the specified timeout period. Closes expired idle clients and starts waiting clients.
     """
 
     TimeoutClient = 300  # seconds to wait for response before removing client, default is 5 minutes
+    IdleTimeout = 30  # seconds to keep an idle keep-alive client pooled before closing it
+    HostLimit = 8  # max running clients per (scheme, hostname, port)
+    IdleLimit = 4  # max idle clients pooled per (scheme, hostname, port)
 
     def __init__(self):
         """Initialize clienter with an empty list of client tuples.
@@ -231,36 +242,112 @@ class Clienter(doing.DoDoer):
             clients (list[tuple]): Active client tuples, each containing a
                 ``ClientDoer`` instance, an hio HTTP ``Client`` instance,
                 and a ``datetime`` timestamp.
+            idles (dict): Idle pooled client tuples keyed by (scheme, hostname, port).
+                Each value is a list of (Client, ClientDoer, datetime released).
+            waits (dict): Waiting client tuples keyed by (scheme, hostname, port)
+                for hosts at .HostLimit. Each value is a list of
+                (Client, ClientDoer, datetime requested).
+            stats (dict): Pool statistics counters: created, reused, waited, closed
             doers (list): Doers managed by this Clienter, initialized with clientDo.
         """
         self.clients = []
+        self.idles = dict()
+        self.waits = dict()
+        self.stats = dict(created=0, reused=0, waited=0, closed=0)
         doers = [doing.doify(self.clientDo)]
         super(Clienter, self).__init__(doers=doers)
 
-    def request(self, method, url, body=None, headers=None):
+    @staticmethod
+    def hostKey(scheme, hostname, port=None):
         """
-        Perform an HTTP request using a hio http Client and ClientDoer and returns the Client.
+        Returns normalized pool key tuple (scheme, hostname, port) with default port
+        for scheme when port not provided.
 
         Parameters:
-            method (str): HTTP method to use (e.g., "GET", "POST")
-            url (str): URL to send the request to
-            body (str or bytes, optional): Body of the request, defaults to None
-            headers (dict, optional): Headers to include in the request, defaults to None
+            scheme (str): http or https
+            hostname (str): host name or address
+            port (int | None): port
+        """
+        scheme = "https" if scheme.lower() == "https" else "http"
+        port = port if port else (443 if scheme == "https" else 80)
+        return (scheme, hostname.lower(), port)
+
+    def clientKey(self, client):
+        """
+        Returns pool key tuple (scheme, hostname, port) for hio HTTP Client.
+
+        Parameters:
+            client (http.clienting.Client): The hio HTTP Client
+        """
+        requester = client.requester
+        return self.hostKey(requester.scheme, requester.hostname, requester.port)
+
+    def connect(self, url):
+        """
+        Returns hio HTTP Client for the scheme, host and port of url without making any
+        request on it. Reuses an idle pooled client when available otherwise creates a new
+        one. The new client is started immediately unless its host is at .HostLimit in
+        which case it waits to be started by clientDo. Callers must .remove the client
+        when done with it which returns it to the pool when reusable.
+
+        Parameters:
+            url (str): URL of the host to connect to
 
         Returns:
-            http.clienting.Client: The hio HTTP Client used for the request, or None if an error occurs.
+            http.clienting.Client: The hio HTTP Client, or None if an error occurs.
         """
         purl = parse.urlparse(url)
 
+        key = self.hostKey(purl.scheme, purl.hostname or "", purl.port)
+        idles = self.idles.get(key, [])
+        while idles:
+            (pooled, doer, _) = idles.pop()
+            if self.reusable(pooled):
+                pooled.requester.path = purl.path or "/"
+                self.clients.append((pooled, doer, nowUTC()))
+                self.stats["reused"] += 1
+                return pooled
+            self.closeClient(doer)
+
         try:
             client = http.clienting.Client(scheme=purl.scheme,
                                            hostname=purl.hostname,
                                            port=purl.port,
+                                           path=purl.path or "/",
                                            portOptional=True)
         except Exception as e:
             print(f"error establishing client connection={e}")
             return None
 
+        clientDoer = http.clienting.ClientDoer(client=client)
+        self.stats["created"] += 1
+        if self.running(key) >= self.HostLimit:
+            self.waits.setdefault(key, []).append((client, clientDoer, nowUTC()))
+            self.stats["waited"] += 1
+        else:
+            self.extend([clientDoer])
+            self.clients.append((client, clientDoer, nowUTC()))
+
+        return client
+
+    def request(self, method, url, body=None, headers=None):
+        """
+        Perform an HTTP request using a hio http Client and ClientDoer and returns the Client.
+
+        Parameters:
+            method (str): HTTP method to use (e.g., "GET", "POST")
+            url (str): URL to send the request to
+            body (str or bytes, optional): Body of the request, defaults to None
+            headers (dict, optional): Headers to include in the request, defaults to None
+
+        Returns:
+            http.clienting.Client: The hio HTTP Client used for the request, or None if an error occurs.
+        """
+        purl = parse.urlparse(url)
+
+        if (client := self.connect(url)) is None:
+            return None
+
         if hasattr(body, "encode"):
             body = body.encode("utf-8")
 
@@ -272,32 +359,87 @@ class Clienter(doing.DoDoer):
             body=body
         )
 
-        clientDoer = http.clienting.ClientDoer(client=client)
-        self.extend([clientDoer])
-        self.clients.append((client, clientDoer, nowUTC()))
-
         return client
 
     def remove(self, client):
         """
-        Find a client tuple by hio HTTP Client and remove it and its Doer from the Clienter.
+        Find a client tuple by hio HTTP Client and remove it from the Clienter. A reusable
+        client is returned to the idle pool for its host otherwise its Doer is removed
+        which closes it.
 
         Parameters:
             client (http.clienting.Client): The hio HTTP Client to remove from the Clienter.
         """
         doers = [(c, d, dt) for (c, d, dt) in self.clients if c == client]
         if len(doers) == 0:
+            for waits in self.waits.values():
+                for tup in waits:
+                    if tup[0] == client:  # never started so just drop it
+                        waits.remove(tup)
+                        return
             return
 
         tup = doers[0]
         self.clients.remove(doers[0])
         (_, doer, _) = tup
+        idles = self.idles.setdefault(self.clientKey(client), [])
+        if self.reusable(client) and len(idles) < self.IdleLimit:
+            client.responses.clear()
+            idles.append((client, doer, nowUTC()))
+        else:
+            self.closeClient(doer)
+
+    def closeClient(self, doer):
+        """
+        Remove ClientDoer from this Clienter which closes its client.
+
+        Parameters:
+            doer (http.clienting.ClientDoer): The Doer of the client to close
+        """
         super(Clienter, self).remove([doer])
+        self.stats["closed"] += 1
+
+    @staticmethod
+    def reusable(client):
+        """
+        Returns True if hio HTTP Client has an open keep-alive connection with no
+        request in progress so it may be reused for another request.
+
+        Parameters:
+            client (http.clienting.Client): The hio HTTP Client
+        """
+        connector = client.connector
+        return (connector.connected and not connector.cutoff
+                and client.respondent is not None and client.respondent.persisted
+                and not client.requests and not client.waited)
+
+    def running(self, key):
+        """
+        Returns number of running clients, active and idle, for host key.
+
+        Parameters:
+            key (tuple): (scheme, hostname, port) pool key
+        """
+        active = sum(1 for (c, _, _) in self.clients if self.clientKey(c) == key)
+        return active + len(self.idles.get(key, []))
+
+    @property
+    def poolStats(self):
+        """
+        Returns dict of pool statistics: the .stats counters plus current counts
+        of active, idle and waiting clients.
+        """
+        return dict(self.stats,
+                    active=len(self.clients),
+                    idle=sum(len(idles) for idles in self.idles.values()),
+                    waiting=sum(len(waits) for waits in self.waits.values()))
 
     def clientDo(self, tymth, tock=0.0, **kwa):
         """ Periodically prune stale clients
 
-        Process existing clients and prune any that have receieved a response longer than timeout
+        Process existing clients and prune any that have receieved a response longer than timeout.
+        Close idle clients that have expired or lost their connection and start waiting
+        clients for hosts below .HostLimit.
 
         Parameters:
             tymth (function): injected function wrapper closure returned by .tymen() of
@@ -322,4 +464,19 @@ class Clienter(doing.DoDoer):
             for client in toRemove:
                 self.remove(client)
 
+            now = nowUTC()
+            for key, idles in self.idles.items():
+                for tup in list(idles):
+                    (client, doer, dt) = tup
+                    if ((now - dt) > datetime.timedelta(seconds=self.IdleTimeout)
+                            or client.connector.cutoff):
+                        idles.remove(tup)
+                        self.closeClient(doer)
+
+            for key, waits in self.waits.items():
+                while waits and self.running(key) < self.HostLimit:
+                    (client, doer, _) = waits.pop(0)
+                    self.extend([doer])
+                    self.clients.append((client, doer, nowUTC()))
+
             yield self.tock
@@ -30,7 +30,7 @@ from ..peer import Exchanger
 
 from .habbing import GroupHab
 from .directing import Directant
-from .storing import Mailboxer, Respondant
+from .storing import Mailboxer, MailboxPruner, Respondant
 from .httping import Clienter, createCESRRequest, parseCesrHttpRequest, CESR_CONTENT_TYPE
 from .forwarding import ForwardHandler
 from .agenting import httpClient
@@ -125,6 +125,8 @@ def setupWitness(hby, alias="witness", mbx=None, aids=None, tcpPort=5631, httpPo
                             responses=rep.cues, queries=httpEnd.qrycues)
 
     doers.extend([regDoer, httpServerDoer, rep, witStart, receiptEnd, *oobiery.doers])
+    if mbx.retainCount or mbx.retainAge:
+        doers.append(MailboxPruner(mbx=mbx))
     return doers
 
 
@@ -597,8 +599,8 @@ class MailboxDirector(doing.DoDoer):
         self.tock = tock
         _ = (yield self.tock)
 
-        habs = list(self.hby.habs.values())
-        for hab in habs:
+        for pre in list(self.hby.habs):  # one hab at a time when lazy
+            hab = self.hby.habs[pre]
             if hab.accepted:
                 self.addPollers(hab)
                 _ = (yield self.tock)
@@ -999,6 +1001,19 @@ class QryRpyMailboxIterable:
 
 
 class MailboxIterable:
+    """
+    MailboxIterable streams the messages of topics of a mailbox as server sent
+    events. Subscribes to its topics in the mailbox so that each next only
+    reads the topics notified of new messages since the last read instead of
+    scanning every topic.
+
+    Attributes:
+        mbx (Mailboxer): mailbox storage
+        pre (str): qb64 identifier prefix of topics
+        topics (dict): next index to read keyed by topic
+        retry (int): retry in milliseconds sent to the client
+        pending (set): topics with messages not yet read
+    """
     TimeoutMBX = 30000000
 
     def __init__(self, mbx, pre, topics, retry=5000):
@@ -1006,9 +1021,13 @@ class MailboxIterable:
         self.pre = pre
         self.topics = topics
         self.retry = retry
+        self.pending = set(topics)
 
     def __iter__(self):
         self.start = self.end = time.perf_counter()
+        for topic in self.topics:
+            self.mbx.subscribe(self.pre + topic, self)
+        self.pending = set(self.topics)  # may be stored before subscribed
         return self
 
     def __next__(self):
@@ -1019,21 +1038,42 @@ class MailboxIterable:
 
             data = bytearray()
             for topic, idx in self.topics.items():
+                if topic not in self.pending:
+                    continue
+                self.pending.discard(topic)
                 key = self.pre + topic
+                if (mark := self.mbx.marks.get(key)) is not None and mark < idx:
+                    continue  # already read every message stored
                 for fn, _, msg in self.mbx.cloneTopicIter(key, idx):
                     data.extend(bytearray("id: {}\nevent: {}\nretry: {}\ndata: ".format(fn, topic, self.retry)
                                           .encode("utf-8")))
                     data.extend(msg)
                     data.extend(b'\n\n')
-                    idx = idx + 1
+                    idx = fn + 1
                     self.start = time.perf_counter()
 
                 self.topics[topic] = idx
             self.end = time.perf_counter()
             return data
 
+        self.close()
         raise StopIteration
 
+    def notify(self, topic, on):
+        """Marks topic as having new message at on. Called by Mailboxer.storeMsg
+
+        Parameters:
+            topic (str): full topic of mailbox including .pre
+            on (int): index of new message at topic
+        """
+        if topic.startswith(self.pre):
+            self.pending.add(topic[len(self.pre):])
+
+    def close(self):
+        """Unsubscribes from topics of mailbox. Called by WSGI server when done"""
+        for topic in self.topics:
+            self.mbx.unsubscribe(self.pre + topic, self)
+
 
 class ReceiptEnd(doing.DoDoer):
     """ Endpoint class for Witnessing receipting functionality
@@ -25,7 +25,8 @@ Example usage::
 
 """
 import math
-from collections import namedtuple, deque
+import time
+from collections import namedtuple, deque, OrderedDict
 from dataclasses import dataclass, asdict, field
 
 import pysodium
@@ -623,6 +624,15 @@ class Manager:
             decryption key is derived seed (private signing key seed)
         inited (bool): True means fully initialized wrt database.
                           False means not yet fully initialized
+        signerCacheSize (int): max number of decrypted signers held in memory
+            by .sign keyed by public key. 0 means no caching so every signature
+            reads and decrypts its private key from .ks.pris
+        signerCacheTTL (float): lifetime in seconds of a cached decrypted
+            signer measured from when it was decrypted. Not extended on use.
+
+    Class Attributes:
+        SignerCacheSize (int): default .signerCacheSize
+        SignerCacheTTL (float): default .signerCacheTTL
 
     Attributes (Hidden):
 
@@ -635,6 +645,8 @@ class Manager:
                 is initialized. Its presence acts as an authentication, authorization,
                 and decryption secret for the Manager and must be stored on
                 another device from the device that runs the Manager.
+        _signers (OrderedDict): decrypted signer cache in least recently used
+                order with items pub qb64 => (Signer, monotonic time decrypted)
 
 
     Properties:
@@ -661,8 +673,11 @@ class Manager:
     Methods:
 
     """
+    SignerCacheSize = 0  # no caching of decrypted signers by default
+    SignerCacheTTL = 300.0  # seconds
 
-    def __init__(self, *, ks=None, seed=None, **kwa):
+    def __init__(self, *, ks=None, seed=None, signerCacheSize=None,
+                 signerCacheTTL=None, **kwa):
         """
         Setup Manager.
 
@@ -678,6 +693,11 @@ class Manager:
                 and decryption secret for the Manager and must be stored on
                 another device from the device that runs the Manager.
                 Currently only code MtrDex.Ed25519_Seed is supported.
+            signerCacheSize (int | None): max number of decrypted signers to
+                cache in memory for .sign. None means use .SignerCacheSize.
+                Trades memory exposure of private keys for signing latency.
+            signerCacheTTL (float | None): lifetime in seconds of each cached
+                decrypted signer. None means use .SignerCacheTTL
 
         Parameters:
             Passthrough to .setup for later initialization
@@ -700,6 +720,11 @@ class Manager:
         self.decrypter = None
         self._seed = seed if seed is not None else ""
         self.inited = False
+        self.signerCacheSize = (signerCacheSize if signerCacheSize is not None
+                                else self.SignerCacheSize)
+        self.signerCacheTTL = (signerCacheTTL if signerCacheTTL is not None
+                               else self.SignerCacheTTL)
+        self._signers = OrderedDict()
 
         # save keyword arg parameters to init later if db not opened yet
         self._inits = kwa
@@ -839,11 +864,83 @@ class Manager:
 
         self.ks.gbls.pin("aeid", aeid)  # set aeid in db
         self._seed = seed  # set .seed in memory
+        self.clearSignerCache()  # cached signers were decrypted under old aeid
 
         # update .decrypter
         self.decrypter = Decrypter(seed=seed) if seed else None
 
 
+    def clearSignerCache(self):
+        """
+        Removes and zeroizes all cached decrypted signers.
+        """
+        while self._signers:
+            self._evictSigner(next(iter(self._signers)))
+
+
+    def _evictSigner(self, pub):
+        """
+        Removes cached signer for pub and drops its private key material.
+        Best effort zeroize since python bytes are immutable so the cached
+        signer's reference to its raw seed is replaced with empty bytes.
+
+        Parameters:
+            pub (str): qb64 public key of cached signer
+        """
+        signer, _ = self._signers.pop(pub)
+        signer._raw = b''
+
+
+    def _fetchSigners(self, pubs):
+        """
+        Returns list of Signers one for each pub in pubs, from the decrypted
+        signer cache when enabled and fresh else from .ks.pris.
+
+        Cached signers older than .signerCacheTTL are evicted first. Least
+        recently used signers beyond .signerCacheSize are evicted last but
+        never those fetched for this call so that all returned signers are
+        usable.
+
+        Parameters:
+            pubs (Iterable[str]): qb64 public keys of signers
+
+        Raises:
+            DecryptError: when aeid but no decrypter
+            ValueError: when private key for a pub is missing from .ks.pris
+        """
+        signers = []
+        cached = self.signerCacheSize > 0
+        if cached:
+            now = time.monotonic()
+            for pub, (_, dt) in list(self._signers.items()):
+                if now - dt > self.signerCacheTTL:
+                    self._evictSigner(pub)
+
+        for pub in pubs:
+            if self.aeid and not self.decrypter:
+                raise DecryptError("Unauthorized decryption attempt. "
+                                          "Aeid but no decrypter.")
+            if cached and pub in self._signers:
+                self._signers.move_to_end(pub)
+                signers.append(self._signers[pub][0])
+                continue
+            if ((signer := self.ks.pris.get(pub, decrypter=self.decrypter))
+                    is None):
+                raise ValueError("Missing prikey in db for pubkey={}".format(pub))
+            if cached:
+                self._signers[pub] = (signer, now)
+            signers.append(signer)
+
+        if cached:
+            while len(self._signers) > self.signerCacheSize:
+                pub = next(iter(self._signers))
+                if any(signer is self._signers[pub][0] for signer in signers):
+                    break  # only signers fetched by this call remain
+                self._evictSigner(pub)
+
+        return signers
+
+
     @property
     def seed(self):
         """
@@ -1253,6 +1350,7 @@ class Manager:
             for pub in old.pubs:  # remove prior old prikeys not current old
                 self.ks.pris.rem(pub)
 
+        self.clearSignerCache()  # signing keys changed
         return (verfers, digers)
 
 
@@ -1366,25 +1464,10 @@ class Manager:
             # use paths to generate signers
 
         if pubs:
-            for pub in pubs:
-                if self.aeid and not self.decrypter:
-                    raise DecryptError("Unauthorized decryption attempt. "
-                                              "Aeid but no decrypter.")
-                if ((signer := self.ks.pris.get(pub, decrypter=self.decrypter))
-                        is None):
-                    raise ValueError("Missing prikey in db for pubkey={}".format(pub))
-                signers.append(signer)
+            signers = self._fetchSigners(pubs)
 
         else:
-            for verfer in verfers:
-                if self.aeid and not self.decrypter:
-                    raise DecryptError("Unauthorized decryption attempt. "
-                                              "Aeid but no decrypter.")
-                if ((signer := self.ks.pris.get(verfer.qb64,
-                                                decrypter=self.decrypter))
-                        is None):
-                    raise ValueError("Missing prikey in db for pubkey={}".format(verfer.qb64))
-                signers.append(signer)
+            signers = self._fetchSigners([verfer.qb64 for verfer in verfers])
 
         if indices and len(indices) != len(signers):
             raise ValueError(f"Mismatch indices length={len(indices)} and resultant"
@@ -1740,6 +1823,7 @@ class Manager:
             if erase:
                 for pub in old.pubs:  # remove prior old prikeys not current old
                     self.ks.pris.rem(pub)
+            self.clearSignerCache()  # signing keys changed
 
         return (verfers, digers)
 
@@ -4,6 +4,7 @@ keri.app.notifying module
 """
 import os
 from collections.abc import Iterable
+from itertools import islice
 from typing import Union, Type
 
 from ..kering import ValidationError
@@ -186,10 +187,17 @@ class DicterSuber(Suber):
 class Noter(LMDBer):
     """
     Noter stores Notifications generated by the agent that are
-    intended to be read and dismissed by the controller of the agent."""
+    intended to be read and dismissed by the controller of the agent.
+
+    Notes are keyed by (datetime, rid) so they may be paged through in order
+    by key with .getNotePage. The .nrdx index keys each note by its read
+    status first, (status, datetime, rid), so that read or unread notes
+    may be paged and counted without reading the others."""
     TailDirPath = os.path.join("keri", "not")
     AltTailDirPath = os.path.join(".keri", "not")
     TempPrefix = "keri_not_"
+    ReadStatus = "r"  # .nrdx status of read notes
+    UnreadStatus = "u"  # .nrdx status of unread notes
 
     def __init__(self, name="not", headDirPath=None, reopen=True, **kwa):
         """Create a notification store backed by LMDB
@@ -202,6 +210,7 @@ class Noter(LMDBer):
         self.notes = None
         self.nidx = None
         self.ncigs = None
+        self.nrdx = None
 
         super(Noter, self).__init__(name=name, headDirPath=headDirPath, reopen=reopen, **kwa)
 
@@ -218,9 +227,20 @@ class Noter(LMDBer):
         self.notes = DicterSuber(db=self, subkey='nots.', sep='/', klas=Notice)
         self.nidx = Suber(db=self, subkey='nidx.')
         self.ncigs = CesrSuber(db=self, subkey='ncigs.', klas=Cigar)
+        self.nrdx = Suber(db=self, subkey='nrdx.', sep='/')
+
+        if self.nrdx.cntAll() == 0 and not self.readonly:  # index existing notes
+            with self.transact():
+                for _, note in self.notes.getTopItemIter():
+                    self.nrdx.pin(keys=self._statusKeys(note), val=note.rid)
 
         return self.env
 
+    def _statusKeys(self, note):
+        """Returns keys of note in .nrdx read status index"""
+        status = self.ReadStatus if note.read else self.UnreadStatus
+        return (status, note.datetime, note.rid)
+
     def add(self, note, cigar):
         """
         Adds note to database, keyed by the datetime and said of the note.
@@ -236,9 +256,11 @@ class Noter(LMDBer):
         if self.nidx.get(keys=(rid,)) is not None:
             return False
 
-        self.nidx.pin(keys=(rid,), val=dt.encode())
-        self.ncigs.pin(keys=(rid,), val=cigar)
-        return self.notes.pin(keys=(dt, rid), val=note)
+        with self.transact():
+            self.nidx.pin(keys=(rid,), val=dt.encode())
+            self.ncigs.pin(keys=(rid,), val=cigar)
+            self.nrdx.pin(keys=self._statusKeys(note), val=rid)
+            return self.notes.pin(keys=(dt, rid), val=note)
 
     def update(self, note, cigar):
         """
@@ -252,12 +274,16 @@ class Noter(LMDBer):
             bool: True if the note was updated"""
         dt = note.datetime
         rid = note.rid
-        if self.nidx.get(keys=(rid,)) is None:
+        if (odt := self.nidx.get(keys=(rid,))) is None:
             return False
 
-        self.nidx.pin(keys=(rid,), val=dt.encode())
-        self.ncigs.pin(keys=(rid,), val=cigar)
-        return self.notes.pin(keys=(dt, rid), val=note)
+        with self.transact():
+            if (old := self.notes.get(keys=(odt, rid))) is not None:
+                self.nrdx.rem(keys=self._statusKeys(old))
+            self.nidx.pin(keys=(rid,), val=dt.encode())
+            self.ncigs.pin(keys=(rid,), val=cigar)
+            self.nrdx.pin(keys=self._statusKeys(note), val=rid)
+            return self.notes.pin(keys=(dt, rid), val=note)
 
     def get(self, rid):
         """
@@ -293,17 +319,91 @@ class Noter(LMDBer):
         note, _ = res
         dt = note.datetime
         rid = note.rid
-        self.nidx.rem(keys=(rid,))
-        self.ncigs.rem(keys=(rid,))
-        return self.notes.rem(keys=(dt, rid))
+        with self.transact():
+            self.nidx.rem(keys=(rid,))
+            self.ncigs.rem(keys=(rid,))
+            self.nrdx.rem(keys=self._statusKeys(note))
+            return self.notes.rem(keys=(dt, rid))
 
-    def getNoteCnt(self):
+    def getNoteCnt(self, read=None):
         """
         Return count over the all Notes
 
+        Parameters:
+            read (bool | None): True means count only read notes, False only
+                unread notes. None means count all notes
+
         Returns:
             int: count of all items"""
-        return self.notes.cntAll()
+        if read is None:
+            return self.notes.cntAll()
+        status = self.ReadStatus if read else self.UnreadStatus
+        return self.cntTop(db=self.nrdx.sdb, top=self.nrdx._tokey((status, "")))
+
+    def getNotePage(self, after=None, limit=25, read=None):
+        """
+        Returns page of notes in datetime order that start after the cursor
+        after, and cursor of the page to pass as after for the next page.
+        Seeks to after by key so each page costs the same regardless of how
+        many notes come before it.
+
+        Parameters:
+            after (tuple | str | datetime | None): cursor (datetime, rid) of
+                the last note of the previous page, or datetime after which
+                to start. None means start with first note
+            limit (int): max number of notes in page
+            read (bool | None): True means only read notes, False only unread
+                notes. None means all notes
+
+        Returns:
+            tuple[list[tuple[Notice, Cigar]], tuple | None]: (notes, cursor)
+                where notes are (note, cigar) couples of the page and cursor
+                is (datetime, rid) of last note of page or None when no
+                notes follow the page
+        """
+        if read is None:
+            sub, top = self.notes, b''
+        else:
+            sub = self.nrdx
+            top = sub._tokey((self.ReadStatus if read else self.UnreadStatus, ""))
+
+        if after is None:
+            start = b''
+        elif isinstance(after, (str, bytes)) or hasattr(after, "isoformat"):
+            after = after.isoformat() if hasattr(after, "isoformat") else after
+            start = top + sub._tokey((after, ""))  # skip all notes at datetime
+        else:
+            start = top + sub._tokey(tuple(after))
+
+        keys = []
+        for key, _ in self.getTopItemIter(db=sub.sdb, top=top, after=start):
+            keys.append(key[len(top):])
+            if len(keys) > limit:  # one more to know if page is last
+                break
+
+        more = len(keys) > limit
+        keys = keys[:limit]
+        raws = self._getVals(db=self.notes.sdb, keys=keys)
+        rids = [bytes(key).rpartition(b'/')[2] for key in keys]
+        cigs = self._getVals(db=self.ncigs.sdb, keys=rids)
+
+        notes = []
+        for raw, cig in zip(raws, cigs):
+            if raw is None:  # removed from .notes without index
+                continue
+            notes.append((Notice(raw=raw), Cigar(qb64b=cig) if cig is not None else None))
+
+        cursor = None
+        if more and keys:
+            cursor = tuple(sub._tokeys(keys[-1]))
+        return notes, cursor
+
+    def _getVals(self, db, keys):
+        """Returns list of values at keys in db read in one transaction with
+        None for missing keys"""
+        with self._begin(db=db) as txn:
+            return [bytes(val) if (val := txn.get(key)) is not None else None
+                    for key in keys]
 
     def getNotes(self, start=0, end=25):
         """
@@ -318,23 +418,15 @@ class Noter(LMDBer):
         if hasattr(start, "isoformat"):
             start = start.isoformat()
 
-        notes = []
-        it = self.notes.getTopItemIter(keys=())
-
-        # Run off the items before start
-        for _ in range(start):
-            try:
-                next(it)
-            except StopIteration:
-                break
+        # run off the items before start without deserializing them
+        stop = None if end == -1 else end + 1
+        items = [(key, bytes(val)) for key, val  # copy buffers within txn
+                 in islice(self.getTopItemIter(db=self.notes.sdb), start, stop)]
+        rids = [key.rpartition(b'/')[2] for key, _ in items]
+        cigs = self._getVals(db=self.ncigs.sdb, keys=rids)
 
-        for ((_, _), note) in it:
-            cig = self.ncigs.get(keys=(note.rid,))
-            notes.append((note, cig))
-            if (not end == -1) and len(notes) == (end - start) + 1:
-                break
-
-        return notes
+        return [(Notice(raw=val), Cigar(qb64b=cig) if cig is not None else None)
+                for (_, val), cig in zip(items, cigs)]
 
 
 class Notifier:
@@ -442,13 +534,17 @@ class Notifier:
 
         return False
 
-    def getNoteCnt(self):
+    def getNoteCnt(self, read=None):
         """
         Return count over the all Notes
 
+        Parameters:
+            read (bool | None): True means count only read notes, False only
+                unread notes. None means count all notes
+
         Returns:
             int: count of all items"""
-        return self.noter.getNoteCnt()
+        return self.noter.getNoteCnt(read=read)
 
     def getNotes(self, start=0, end=24):
         """
@@ -469,3 +565,30 @@ class Notifier:
             notes.append(note)
 
         return notes
+
+    def getNotePage(self, after=None, limit=25, read=None):
+        """
+        Returns page of notes that start after cursor after and cursor of the
+        next page. See Noter.getNotePage
+
+        Parameters:
+            after (tuple | str | datetime | None): cursor (datetime, rid) of
+                the last note of the previous page, or datetime after which
+                to start. None means start with first note
+            limit (int): max number of notes in page
+            read (bool | None): True means only read notes, False only unread
+                notes. None means all notes
+
+        Returns:
+            tuple[list[Notice], tuple | None]: (notes, cursor) where notes
+                have verified signatures and cursor is None when no notes
+                follow the page"""
+        notesigs, cursor = self.noter.getNotePage(after=after, limit=limit, read=read)
+        notes = []
+        for note, cig in notesigs:
+            if not self.hby.signator.verify(ser=note.raw, cigar=cig):
+                raise ValidationError("note stored without valid signature")
+
+            notes.append(note)
+
+        return notes, cursor
@@ -3,32 +3,55 @@
 keri.app.storing module
 """
 
+import datetime
+import weakref
+
 from hio.base import doing
 from hio.help import decking, ogler
 from ordered_set import OrderedSet as oset
 
 from .forwarding import Poster
 
-from ..core import SerderKERI, MtrDex, Diger, Prefixer
-from ..db import LMDBer, OnSuber, Suber
+from ..core import SerderKERI, MtrDex, Diger, Prefixer, Number
+from ..db import LMDBer, OnSuber, Suber, CesrSuber
+from ..help import helping
 
 logger = ogler.getLogger()
 
 
 class Mailboxer(LMDBer):
     """
-    Mailboxer stores exn messages in order and provider iterator access at an index."""
+    Mailboxer stores exn messages in order and provider iterator access at an index.
+
+    Subscribers registered with .subscribe for a topic are notified in process
+    by .storeMsg so that they need not poll the database for new messages.
+
+    Attributes:
+        retainCount (int): max messages kept per topic by .prune, 0 means all
+        retainAge (float): max seconds messages are kept by .prune, 0 means
+            forever
+        marks (dict): high-water mark of each topic as the on of the last
+            message stored at topic by this process keyed by str topic
+        subscribers (dict): WeakSet of subscribers keyed by str topic. Each
+            subscriber has method .notify(topic, on)"""
     TailDirPath = "keri/mbx"
     AltTailDirPath = ".keri/mbx"
     TempPrefix = "keri_mbx_"
+    RetainCount = 0  # max messages kept per topic, 0 means unlimited
+    RetainAge = 0.0  # max seconds messages are kept, 0 means forever
 
-    def __init__(self, name="mbx", headDirPath=None, reopen=True, **kwa):
+    def __init__(self, name="mbx", headDirPath=None, reopen=True,
+                 retainCount=None, retainAge=None, **kwa):
         """
 
         Parameters:
             headDirPath:
             perm:
             reopen:
+            retainCount (int | None): max messages kept per topic by .prune.
+                None means .RetainCount
+            retainAge (float | None): max seconds messages are kept by .prune.
+                None means .RetainAge
             kwa:
 
         Mailboxer uses two dbs for mailbox messages these are .tpcs and .msgs.
@@ -39,9 +62,19 @@ class Mailboxer(LMDBer):
         Each .tpcs val is the digest of the message.
         The message itself is stored in .msgs where the key is the msg digest
         and the value is the serialized messag itself.
-        Multiple messages can share the same topic but with a different ordinal."""
+        Multiple messages can share the same topic but with a different ordinal.
+        The time each message was stored is kept in .dts keyed by its digest.
+        The number of .tpcs entries that index each message is kept in .refs
+        keyed by its digest so that .prune only compacts the messages of the
+        entries it removes."""
         self.tpcs = None
         self.msgs = None
+        self.dts = None
+        self.refs = None
+        self.retainCount = retainCount if retainCount is not None else self.RetainCount
+        self.retainAge = retainAge if retainAge is not None else self.RetainAge
+        self.marks = dict()
+        self.subscribers = dict()
 
         super(Mailboxer, self).__init__(name=name, headDirPath=headDirPath, reopen=reopen, **kwa)
 
@@ -53,16 +86,68 @@ class Mailboxer(LMDBer):
         super(Mailboxer, self).reopen(**kwa)
         self.tpcs = OnSuber(db=self, subkey='tpcs.')
         self.msgs = Suber(db=self, subkey='msgs.')  # key states
+        self.dts = Suber(db=self, subkey='dts.')  # iso8601 datetime msg stored
+        self.refs = CesrSuber(db=self, subkey='refs.', klas=Number)  # count of tpcs
+        self.marks = dict()
+
+        if (not self.readonly and next(self.refs.getTopItemIter(), None) is None
+                and next(self.tpcs.getTopItemIter(), None) is not None):
+            self._indexRefs()  # mailbox stored before .refs
 
         return self.env
 
+    def _indexRefs(self):
+        """Counts the .tpcs entries that index each message into .refs"""
+        counts = dict()
+        for _, _, dig in self.tpcs.getTopItemIter():
+            counts[dig] = counts.get(dig, 0) + 1
+        with self.transact():
+            for dig, count in counts.items():
+                self.refs.pin(keys=dig, val=Number(num=count))
+
+    def _ref(self, dig, inc=1):
+        """Adds inc to the count in .refs of .tpcs entries indexing message
+        dig and returns the new count. Removes the count once zero."""
+        count = (number.num if (number := self.refs.get(keys=dig)) else 0) + inc
+        if count > 0:
+            self.refs.pin(keys=dig, val=Number(num=count))
+        else:
+            self.refs.rem(keys=dig)
+        return count
+
+    def subscribe(self, topic, subscriber):
+        """Registers subscriber to be notified by .storeMsg of new messages at
+        topic. Only weakly referenced so an abandoned subscriber is dropped.
+
+        Parameters:
+            topic (str | bytes): topic identifier of messages
+            subscriber (object): with method .notify(topic, on)"""
+        topic = topic.decode("utf-8") if hasattr(topic, "decode") else topic
+        self.subscribers.setdefault(topic, weakref.WeakSet()).add(subscriber)
+
+    def unsubscribe(self, topic, subscriber):
+        """Removes subscriber of topic if any
+
+        Parameters:
+            topic (str | bytes): topic identifier of messages
+            subscriber (object): subscribed with .subscribe"""
+        topic = topic.decode("utf-8") if hasattr(topic, "decode") else topic
+        if (subs := self.subscribers.get(topic)) is not None:
+            subs.discard(subscriber)
+            if not subs:
+                del self.subscribers[topic]
+
     def delTopic(self, key, on=0):
         """Removes topic index from .tpcs without deleting message from .msgs
 
         Returns:
             result (boo): True if full key consisting of key and serialized on
                 exists in database so removed. False otherwise (not removed)."""
-        return self.tpcs.rem(keys=key, on=on)
+        with self.transact():
+            if (dig := self.tpcs.get(keys=key, on=on)) is None:
+                return False
+            self._ref(dig, -1)
+            return self.tpcs.rem(keys=key, on=on)
 
     def appendToTopic(self, topic, val):
         """Appends val to end of db entries with same topic but with on
@@ -75,7 +160,9 @@ class Mailboxer(LMDBer):
         Parameters:
             topic (bytes):  topic identifier for message
             val (bytes): msg digest"""
-        return self.tpcs.append(key=topic, val=val)
+        with self.transact():
+            self._ref(val)
+            return self.tpcs.append(keys=topic, val=val)
 
 
     def getTopicMsgs(self, topic, fn=0):
@@ -114,8 +201,18 @@ class Mailboxer(LMDBer):
             msg = msg.encode("utf-8")
 
         digb = Diger(ser=msg, code=MtrDex.Blake3_256).qb64b
-        on = self.tpcs.append(keys=topic, val=digb)
-        return self.msgs.pin(keys=digb, val=msg)
+        with self.transact():
+            on = self.tpcs.append(keys=topic, val=digb)
+            self._ref(digb)
+            result = self.msgs.pin(keys=digb, val=msg)
+            self.dts.pin(keys=digb, val=helping.nowIso8601())
+
+        topic = topic.decode("utf-8") if hasattr(topic, "decode") else topic
+        self.marks[topic] = on
+        for subscriber in list(self.subscribers.get(topic, ())):
+            subscriber.notify(topic, on)
+
+        return result
 
 
     def cloneTopicIter(self, topic, fn=0):
@@ -139,6 +236,96 @@ class Mailboxer(LMDBer):
             if msg := self.msgs.get(keys=dig):
                 yield (on, topic, msg.encode("utf-8"))
 
+    def prune(self, now=None):
+        """Removes topic index entries in .tpcs beyond .retainCount per topic
+        or older than .retainAge and then compacts .msgs and .dts by removing
+        the messages of the removed entries that are no longer indexed at any
+        topic as counted by .refs. The last entry of each topic is always kept
+        so that the ordinals of a topic are never reused.
+
+        Parameters:
+            now (datetime | None): current time. None means now
+
+        Returns:
+            result (tuple[int, int]): (index entries, messages) removed
+        """
+        if not self.retainCount and not self.retainAge:
+            return (0, 0)
+
+        now = now if now is not None else helping.nowUTC()
+        cutoff = (now - datetime.timedelta(seconds=self.retainAge)
+                  if self.retainAge else None)
+
+        stale = []  # (topic, on, dig) of entries to remove
+        group, entries = None, []
+        for keys, on, dig in self.tpcs.getTopItemIter():
+            topic = self.tpcs.sep.join(keys)
+            if topic != group:
+                stale.extend(self._staleEntries(group, entries, cutoff))
+                group, entries = topic, []
+            entries.append((on, dig))
+        stale.extend(self._staleEntries(group, entries, cutoff))
+
+        removed = 0
+        with self.transact():
+            for topic, on, dig in stale:
+                self.tpcs.rem(keys=topic, on=on)
+                if self._ref(dig, -1) <= 0:  # no longer indexed at any topic
+                    self.dts.rem(keys=dig)
+                    removed += 1 if self.msgs.rem(keys=dig) else 0
+
+        return (len(stale), removed)
+
+    def _staleEntries(self, topic, entries, cutoff):
+        """Returns list of (topic, on, dig) of entries of topic not retained
+
+        Parameters:
+            topic (str | None): topic of entries
+            entries (list): (on, dig) of entries at topic in order
+            cutoff (datetime | None): entries stored before cutoff are stale.
+                None means no age limit
+        """
+        stale = []
+        excess = len(entries) - self.retainCount if self.retainCount else 0
+        for i, (on, dig) in enumerate(entries[:-1]):  # always keep last
+            if i < excess:
+                stale.append((topic, on, dig))
+            elif cutoff is not None and (dt := self.dts.get(keys=dig)) is not None:
+                if helping.fromIso8601(dt) < cutoff:
+                    stale.append((topic, on, dig))
+        return stale
+
+
+class MailboxPruner(doing.Doer):
+    """
+    MailboxPruner periodically prunes messages of a Mailboxer beyond its
+    retention policy and compacts the messages no longer referenced.
+
+    Attributes:
+        mbx (Mailboxer): mailbox storage to prune
+    """
+
+    def __init__(self, mbx, tock=60.0, **kwa):
+        """
+        Parameters:
+            mbx (Mailboxer): mailbox storage to prune
+            tock (float): seconds between prunes
+        """
+        self.mbx = mbx
+        super(MailboxPruner, self).__init__(tock=tock, **kwa)
+
+    def recur(self, tyme):
+        """Prunes mailbox once per .tock
+
+        Returns:
+            done (bool): False to keep recurring
+        """
+        entries, msgs = self.mbx.prune()
+        if entries:
+            logger.info("Mailbox pruned %d topic entries and %d messages.",
+                        entries, msgs)
+        return False
+
 
 
 class Respondant(doing.DoDoer):
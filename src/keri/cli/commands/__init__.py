@@ -4,29 +4,20 @@ KERI
 keri.app.cli.commands Package
 """
 
-from .aid import status
-from .clean import CleanDoer
-from .decrypt import decrypt
-from .event import event
-from .export import ExportDoer
-from .import_ import ImportDoer
-from .incept import (InceptOptions, emptyOptions, mergeArgsWithFile,
-                     InceptDoer)
-from .init import InitDoer
-from .interact import InteractDoer
-from .introduce import IntroduceDoer
-from .kevers import KeverDoer
-from .list import list_identifiers, ids
-from .nonce import nonce
-from .query import query, LaunchDoer
-from .rename import rename
-from .rollback import rollback
-from .rotate import (RotateOptions, rotate, emptyOptions,
-                     mergeArgsWithFile, RotateDoer)
-from .saidify import saidify
-from .salt import passcode
-from .sign import sign
-from .status import status
-from .time import time
-from .verify import verify
-from .version import version
+from ..common import lazyExports
+
+_exports = dict(status="status", CleanDoer="clean", decrypt="decrypt",
+                event="event", ExportDoer="export", ImportDoer="import_",
+                InceptOptions="incept", emptyOptions="rotate",
+                mergeArgsWithFile="rotate", InceptDoer="incept",
+                InitDoer="init", InteractDoer="interact",
+                IntroduceDoer="introduce", KeverDoer="kevers",
+                list_identifiers="list", ids="list", nonce="nonce",
+                query="query", LaunchDoer="query", rename="rename",
+                rollback="rollback", RotateOptions="rotate", rotate="rotate",
+                RotateDoer="rotate", saidify="saidify", passcode="salt",
+                sign="sign", time="time", verify="verify", version="version")
+
+__all__ = list(_exports)
+
+__getattr__, __dir__ = lazyExports(globals(), _exports)
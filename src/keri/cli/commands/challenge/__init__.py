@@ -5,6 +5,11 @@ keri.app.cli.commands.challenge Package
 
 """
 
-from .generate import generate, generateWords
-from .respond import RespondDoer
-from .verify import VerifyDoer
+from ...common import lazyExports
+
+_exports = dict(generate="generate", generateWords="generate",
+                RespondDoer="respond", VerifyDoer="verify")
+
+__all__ = list(_exports)
+
+__getattr__, __dir__ = lazyExports(globals(), _exports)
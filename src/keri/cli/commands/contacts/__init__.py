@@ -5,11 +5,12 @@ keri.app.cli.commands.contacts Package
 
 """
 
-from .add import ContactAddDoer
-from .delete import delete
-from .find import find
-from .get import get
-from .list import list
-from .query import ContactQueryDoer
-from .rename import rename
-from .replace import replace
+from ...common import lazyExports
+
+_exports = dict(ContactAddDoer="add", delete="delete", find="find", get="get",
+                list="list", ContactQueryDoer="query", rename="rename",
+                replace="replace")
+
+__all__ = list(_exports)
+
+__getattr__, __dir__ = lazyExports(globals(), _exports)
@@ -5,5 +5,10 @@ keri.app.cli.commands.delegate Package
 
 """
 
-from .confirm import ConfirmDoer
-from .request import RequestDoer
+from ...common import lazyExports
+
+_exports = dict(ConfirmDoer="confirm", RequestDoer="request")
+
+__all__ = list(_exports)
+
+__getattr__, __dir__ = lazyExports(globals(), _exports)
@@ -5,4 +5,10 @@ keri.app.cli.commands.did Package
 
 """
 
-from .generate import generate
+from ...common import lazyExports
+
+_exports = dict(generate="generate")
+
+__all__ = list(_exports)
+
+__getattr__, __dir__ = lazyExports(globals(), _exports)
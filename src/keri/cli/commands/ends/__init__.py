@@ -5,6 +5,10 @@ keri.app.cli.commands.ends Package
 
 """
 
-from .add import RoleDoer
-from .export import ExportDoer
-from .list import RoleDoer
+from ...common import lazyExports
+
+_exports = dict(RoleDoer="list", ExportDoer="export")
+
+__all__ = list(_exports)
+
+__getattr__, __dir__ = lazyExports(globals(), _exports)
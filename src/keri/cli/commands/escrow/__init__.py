@@ -7,9 +7,13 @@ keri.app.cli.commands.escrow Package
 
 import argparse
 
-from .clear import clear
-from .list import escrows
+from ...common import lazyExports
 
+_exports = dict(clear="clear", escrows="list")
 
+__all__ = list(_exports)
 
-parser = argparse.ArgumentParser(description="A collection of escrow operations")
\ No newline at end of file
+__getattr__, __dir__ = lazyExports(globals(), _exports)
+
+
+parser = argparse.ArgumentParser(description="A collection of escrow operations")
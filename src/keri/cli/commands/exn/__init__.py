@@ -5,4 +5,10 @@ keri.app.cli.commands.exn Package
 
 """
 
-from .send import SendDoer
\ No newline at end of file
+from ...common import lazyExports
+
+_exports = dict(SendDoer="send")
+
+__all__ = list(_exports)
+
+__getattr__, __dir__ = lazyExports(globals(), _exports)
@@ -5,8 +5,11 @@ keri.app.cli.commands.ipex Package
 
 """
 
-from .admit import AdmitDoer
-from .grant import GrantDoer
-from .join import JoinDoer
-from .list import ListDoer
-from .spurn import SpurnDoer
+from ...common import lazyExports
+
+_exports = dict(AdmitDoer="admit", GrantDoer="grant", JoinDoer="join",
+                ListDoer="list", SpurnDoer="spurn")
+
+__all__ = list(_exports)
+
+__getattr__, __dir__ = lazyExports(globals(), _exports)
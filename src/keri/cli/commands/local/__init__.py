@@ -5,4 +5,10 @@ keri.app.cli.commands.local Package
 
 """
 
-from .watch import watch, WatchDoer
+from ...common import lazyExports
+
+_exports = dict(watch="watch", WatchDoer="watch")
+
+__all__ = list(_exports)
+
+__getattr__, __dir__ = lazyExports(globals(), _exports)
@@ -5,4 +5,10 @@ keri.app.cli.commands.location Package
 
 """
 
-from .add import add_loc, LocationDoer
+from ...common import lazyExports
+
+_exports = dict(add_loc="add", LocationDoer="add")
+
+__all__ = list(_exports)
+
+__getattr__, __dir__ = lazyExports(globals(), _exports)
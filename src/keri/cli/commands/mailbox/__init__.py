@@ -5,7 +5,11 @@ keri.app.cli.commands.mailbox Package
 
 """
 
-from .add import AddDoer, add
-from .debug import ReadDoer
-from .list import listMailboxes
-from .update import update
+from ...common import lazyExports
+
+_exports = dict(AddDoer="add", add="add", ReadDoer="debug",
+                listMailboxes="list", update="update")
+
+__all__ = list(_exports)
+
+__getattr__, __dir__ = lazyExports(globals(), _exports)
@@ -5,6 +5,10 @@ keri.app.cli.commands.migrate Package
 
 """
 
-from .list import ListDoer
-from .run import MigrateDoer
-from .show import CleanDoer
+from ...common import lazyExports
+
+_exports = dict(ListDoer="list", MigrateDoer="run", CleanDoer="show")
+
+__all__ = list(_exports)
+
+__getattr__, __dir__ = lazyExports(globals(), _exports)
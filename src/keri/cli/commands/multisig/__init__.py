@@ -5,12 +5,16 @@ keri.app.cli.commands.multisig Package
 
 """
 
-from .continue_ import ContinueDoer
-from .demo import demo
-from .incept import inceptMultisig, GroupMultisigIncept
-from .interact import interactGroupIdentifier, GroupMultisigInteract
-from .join import join, JoinDoer
-from .notice import NoticeDoer
-from .rotate import rotateGroupIdentifier, GroupMultisigRotate
-from .shell import MultiSigShell
-from .update import update, UpdateDoer
+from ...common import lazyExports
+
+_exports = dict(ContinueDoer="continue_", demo="demo",
+                inceptMultisig="incept", GroupMultisigIncept="incept",
+                interactGroupIdentifier="interact",
+                GroupMultisigInteract="interact", join="join",
+                JoinDoer="join", NoticeDoer="notice",
+                rotateGroupIdentifier="rotate", GroupMultisigRotate="rotate",
+                MultiSigShell="shell", update="update", UpdateDoer="update")
+
+__all__ = list(_exports)
+
+__getattr__, __dir__ = lazyExports(globals(), _exports)
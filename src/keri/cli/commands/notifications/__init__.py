@@ -6,6 +6,10 @@ keri.app.cli.commands.notifications package
 
 """
 
-from .list import NotesDoer
-from .mark import MarkDoer
-from .rem import RemoveDoer
+from ...common import lazyExports
+
+_exports = dict(NotesDoer="list", MarkDoer="mark", RemoveDoer="rem")
+
+__all__ = list(_exports)
+
+__getattr__, __dir__ = lazyExports(globals(), _exports)
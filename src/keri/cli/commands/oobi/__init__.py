@@ -6,6 +6,11 @@ keri.app.cli.commands.oobi package
 
 """
 
-from .clean import list_oobis, oobis
-from .generate import generate
-from .resolve import OobiDoer
+from ...common import lazyExports
+
+_exports = dict(list_oobis="clean", oobis="clean", generate="generate",
+                OobiDoer="resolve")
+
+__all__ = list(_exports)
+
+__getattr__, __dir__ = lazyExports(globals(), _exports)
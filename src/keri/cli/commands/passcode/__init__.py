@@ -6,6 +6,10 @@ keri.app.cli.commands.passcode package
 
 """
 
-from .generate import salt
-from .remove import remove
-from .set import set_passcode
+from ...common import lazyExports
+
+_exports = dict(salt="generate", remove="remove", set_passcode="set")
+
+__all__ = list(_exports)
+
+__getattr__, __dir__ = lazyExports(globals(), _exports)
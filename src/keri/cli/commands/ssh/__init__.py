@@ -6,4 +6,10 @@ keri.app.cli.commands.ssh package
 
 """
 
-from .export import export
+from ...common import lazyExports
+
+_exports = dict(export="export")
+
+__all__ = list(_exports)
+
+__getattr__, __dir__ = lazyExports(globals(), _exports)
@@ -6,8 +6,12 @@ keri.app.cli.commands.vc package
 
 """
 
-from .create import CredentialIssuer
-from .export import export_credentials, ExportDoer
-from .import_ import ImportDoer
-from .list import ListDoer
-from .revoke import RevokeDoer
+from ...common import lazyExports
+
+_exports = dict(CredentialIssuer="create", export_credentials="export",
+                ExportDoer="export", ImportDoer="import_", ListDoer="list",
+                RevokeDoer="revoke")
+
+__all__ = list(_exports)
+
+__getattr__, __dir__ = lazyExports(globals(), _exports)
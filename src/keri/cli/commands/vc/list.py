@@ -125,7 +125,7 @@ class ListDoer(doing.DoDoer):
         else:
             print(f"Current {'issued' if self.issued else 'received'}"
                   f" credentials for {self.hab.name} ({self.hab.pre}):\n")
-            creds = self.rgy.reger.cloneCreds(saids, self.hab.db)
+            creds = self.rgy.reger.cloneCreds(saids, self.hab.db, depth=0)  # chains not shown
             for idx, cred in enumerate(creds):
                 sad = cred['sad']
                 status = cred["status"]
@@ -6,6 +6,11 @@ keri.app.cli.commands.vc.registry package
 
 """
 
-from .incept import RegistryInceptor
-from .list import list_registries
-from .status import registryStatus, RegistryStatusor
+from ....common import lazyExports
+
+_exports = dict(RegistryInceptor="incept", list_registries="list",
+                registryStatus="status", RegistryStatusor="status")
+
+__all__ = list(_exports)
+
+__getattr__, __dir__ = lazyExports(globals(), _exports)
@@ -5,4 +5,10 @@ keri.kli.commands.vc.schema module
 
 """
 
-from .import_ import ImportDoer
+from ....common import lazyExports
+
+_exports = dict(ImportDoer="import_")
+
+__all__ = list(_exports)
+
+__getattr__, __dir__ = lazyExports(globals(), _exports)
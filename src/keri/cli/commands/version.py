@@ -9,7 +9,7 @@ from hio.base import doing
 
 from keri import __version__
 
-from ..common import Parsery, existingHby
+from ..common import Parsery
 
 
 parser = argparse.ArgumentParser(description='Print version of KLI', parents=[Parsery.keystore(required=False)])
@@ -33,5 +33,7 @@ def version(tymth, tock=0.0, **opts):
     print(f"Library version: {__version__}")
 
     if name is not None:
+        from ..common import existingHby  # only import app when db is opened
+
         with existingHby(name=name, base=base, bran=bran) as hby:
             print(f"Database version: {hby.db.version}")
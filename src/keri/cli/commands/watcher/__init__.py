@@ -5,6 +5,11 @@ keri.app.cli.commands.watcher Package
 
 """
 
-from .add import add, AddDoer
-from .adjudicate import AdjudicationDoer
-from .list import listWatchers
+from ...common import lazyExports
+
+_exports = dict(add="add", AddDoer="add", AdjudicationDoer="adjudicate",
+                listWatchers="list")
+
+__all__ = list(_exports)
+
+__getattr__, __dir__ = lazyExports(globals(), _exports)
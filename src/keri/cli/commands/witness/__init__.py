@@ -5,8 +5,12 @@ keri.app.cli.commands.witness Package
 
 """
 
-from .authenticate import AuthDoer
-from .demo import demo, InitDoer
-from .list import listWitnesses
-from .start import launch, runWitness
-from .submit import SubmitDoer
+from ...common import lazyExports
+
+_exports = dict(AuthDoer="authenticate", demo="demo", InitDoer="demo",
+                listWitnesses="list", launch="start", runWitness="start",
+                SubmitDoer="submit")
+
+__all__ = list(_exports)
+
+__getattr__, __dir__ = lazyExports(globals(), _exports)
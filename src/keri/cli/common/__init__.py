@@ -3,11 +3,54 @@
 KERI
 keri.app.cli.common Package
 
+Exported names are imported from their module on first access so that a
+command importing only Parsery does not import the app dependencies of
+existingHby.
 """
 
-from .config import loadConfig, parseData, checkRequiredArgs, loadFileOptions
-from .displaying import printIdentifier, printExternal
-from .existing import setupHby, existingHby, existingHab, aliasInput
-from .parsing import Parsery, parseDataItems, parseVersion
-from .rotating import addRotationArgs
-from .terming import Colors, Symbols
+from importlib import import_module
+
+_exports = dict(loadConfig="config", parseData="config",
+                checkRequiredArgs="config", loadFileOptions="config",
+                printIdentifier="displaying", printExternal="displaying",
+                setupHby="existing", existingHby="existing",
+                existingHab="existing", aliasInput="existing",
+                Parsery="parsing", parseDataItems="parsing",
+                parseVersion="parsing",
+                addRotationArgs="rotating",
+                Colors="terming", Symbols="terming")
+
+__all__ = list(_exports)
+
+
+def lazyExports(namespace, exports):
+    """Returns module level (__getattr__, __dir__) functions for the package
+    whose globals are namespace so that each name in exports is imported from
+    its module on first access instead of when the package is imported.
+
+    A module of the package that has already been imported shadows an
+    exported name that is the same as the module name.
+
+    Parameters:
+        namespace (dict): globals() of package
+        exports (dict): module name relative to package keyed by exported name
+
+    Usage:
+        __getattr__, __dir__ = lazyExports(globals(), dict(Parsery="parsing"))
+    """
+    package = namespace["__name__"]
+
+    def __getattr__(name):
+        if (module := exports.get(name)) is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(import_module(f".{module}", package), name)
+        namespace[name] = value  # cache so later access skips __getattr__
+        return value
+
+    def __dir__():
+        return sorted(set(namespace) | set(exports))
+
+    return __getattr__, __dir__
+
+
+__getattr__, __dir__ = lazyExports(globals(), _exports)
@@ -3,19 +3,104 @@
 keri.cli module
 
 """
+import argparse
+import pkgutil
+import sys
+from importlib import import_module
+
 import multicommand
 
 from .. import help
 
-from ..app import directing
 from ..cli import commands
 
 
 logger = help.ogler.getLogger()
 
+SummaryLength = 50  # max length of command description shown in parent help
+
+
+def loadParser(argv, prog=None):
+    """Returns argument parser for argv that only imports the command modules
+    on the path of the subcommand selected by argv. Sibling commands are
+    registered by name only from the command package index so that their
+    modules and dependencies are not imported.
+
+    When argv does not select a command module, such as for help or an
+    unknown command, returns the full parser of every command as built by
+    multicommand.create_parser.
+
+    Parameters:
+        argv (list): command line arguments without program name
+        prog (str | None): program name used in usage messages. None means
+            file name of sys.argv[0]
+
+    Returns:
+        parser (argparse.ArgumentParser): parser of kli command line
+    """
+    if prog is None:
+        prog = sys.argv[0].split("/")[-1]
+    parser = _loadPackageParser(commands, list(argv), [prog])
+    if parser is None:
+        return multicommand.create_parser(commands, prog=prog)
+    return parser
+
+
+def _loadPackageParser(pkg, argv, progs):
+    """Returns parser of command package pkg with only the command selected
+    by argv loaded or None when argv does not select a command module.
+
+    Parameters:
+        pkg (module): command package
+        argv (list): remaining command line arguments
+        progs (list): program and command names of pkg
+    """
+    index = [(info.name.rpartition(".")[2], info.ispkg)
+             for info in pkgutil.iter_modules(pkg.__path__)]
+    names = dict(index)
+    if not argv or argv[0] not in names:
+        return None
+
+    selected = argv[0]
+    mod = import_module(f"{pkg.__name__}.{selected}")
+    if names[selected]:  # command package
+        child = _loadPackageParser(mod, argv[1:], progs + [selected])
+    else:
+        child = getattr(mod, "parser", None)
+    if not isinstance(child, argparse.ArgumentParser):
+        return None
+
+    if (base := getattr(pkg, "parser", None)) is not None:  # config only
+        # not base itself nor its arguments which include the subparsers that
+        # multicommand.create_parser adds to base once it ran in this process
+        parser = argparse.ArgumentParser(**_parserConfig(base))
+    else:
+        parser = argparse.ArgumentParser()
+    subs = parser.add_subparsers(description=" ", metavar="command")
+    for name, _ in index:
+        if name != selected:
+            subs.add_parser(name, add_help=False)  # placeholder never parsed
+            continue
+
+        description = child.description
+        if description is not None and len(description) > SummaryLength:
+            description = description[:SummaryLength - 4] + " ..."
+        subs.add_parser(name, parents=[child],
+                        **_parserConfig(child, prog=" ".join(progs + [name]),
+                                        help=description, add_help=False))
+
+    return parser
+
+
+def _parserConfig(parser, **kwa):
+    """Returns init keyword arguments of parser updated with kwa"""
+    config = {k: v for k, v in vars(parser).items() if not k.startswith("_")}
+    config.update(kwa)
+    return config
+
 
 def main():
-    parser = multicommand.create_parser(commands)
+    parser = loadParser(sys.argv[1:])
     args = parser.parse_args()
 
     if not hasattr(args, 'handler'):
@@ -23,6 +108,8 @@ def main():
         return
 
     try:
+        from ..app import directing
+
         doers = args.handler(args)
         directing.runController(doers=doers, expire=0.0)
 
@@ -17,7 +17,8 @@ from .counting import (GenDex, ProGen, CtrDex_1_0, CtrDex_2_0, QTDex_1_0,
                        CodeNames, SealDex_2_0, Codens, Codenage, Cizage, Counter)
 from .eventing import (simple, ample, deWitnessCouple, deReceiptCouple,
                        deSourceCouple, deReceiptTriple, deTransReceiptQuadruple,
-                       deTransReceiptQuintuple, verifySigs, validateSigs,
+                       deTransReceiptQuintuple, verifyBatch, preverify, verifySigs,
+                       validateSigs,
                        state, incept, delcept, rotate, deltate,
                        interact, receipt, query, reply, prod, bare, loadEvent,
                        exchept, exchange, messagize, Kever, Kevery, LastEstLoc)
@@ -27,7 +28,7 @@ from .kraming import Kramer, AuthTypes, Pruner
 from .mapping import Mapper, EscapeDex, Compactor, Aggor
 from .parsing import Parser
 from .routing import Router, Revery, Route, compile_uri_template
-from .scheming import CacheResolver, JSONSchema, Schemer
+from .scheming import CacheResolver, JSONSchema, Schemer, ValidatorCache
 from .serdering import FieldDom, Serdery, Serder, SerderKERI, SerderACDC
 from .signing import (Tiers, Signer, Salter, Cipher, CiXDex,
                       Encrypter, Decrypter, Streamer)
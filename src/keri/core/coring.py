@@ -1336,17 +1336,66 @@ class Matter:
         return full
 
 
+    @classmethod
+    def _fastTables(cls):
+        """Returns tuple (hards, sizes) of precomputed decode tables for the fast
+        path of ._exfil built once per class from .Hards and .Sizes.
+
+        hards (list[int]): hard size hs indexed by ordinal of first code char.
+            0 when not the start of a hard code.
+        sizes (dict): maps hard code as both str and bytes to tuple
+            (code, fs, pad, ps, ls, ns) for fixed size codes without soft part,
+            where pad is ps prepad b'A' chars and ns is the decoded size
+            of pad plus material. Other codes are left to the general path.
+        """
+        if (tables := cls.__dict__.get("_FastTables")) is None:
+            hards = [0] * 128
+            for first, hs in cls.Hards.items():
+                hards[ord(first)] = hs
+            sizes = {}
+            for code, (hs, ss, xs, fs, ls) in cls.Sizes.items():
+                if ss or not fs:  # soft or variable size so general path
+                    continue
+                ps = hs % 4
+                entry = (code, fs, b'A' * ps, ps, ls, (ps + fs - hs) * 3 // 4)
+                sizes[code] = entry
+                sizes[code.encode()] = entry
+            tables = cls._FastTables = (hards, sizes)
+        return tables
+
+
     def _exfil(self, qb64b):
         """Extracts self.code and self.raw from qualified base64 qb64b of type
         str or bytes or bytearray or memoryview
 
         Detects if str and converts to bytes
 
+        Fixed size codes without soft part, which cover keys, signatures and
+        digests, are extracted with the precomputed tables from ._fastTables
+        using one base64 decode. Everything else, including all error
+        reporting, falls through to the general path.
+
         Parameters:
             qb64b (str|bytes|bytearray|memoryview): fully qualified base64 from stream"""
         if not qb64b:  # empty need more bytes
             raise ShortageError("Empty material.")
 
+        hards, sizes = self._fastTables()
+        text = isinstance(qb64b, str)
+        first = ord(qb64b[0]) if text else qb64b[0]
+        if first < 128 and (hs := hards[first]) and len(qb64b) >= hs:
+            hard = qb64b[:hs]
+            if (entry := sizes.get(hard if text else bytes(hard))) is not None:
+                code, fs, pad, ps, ls, ns = entry
+                if len(qb64b) >= fs:
+                    body = qb64b[hs:fs]
+                    paw = decodeB64(pad + (body.encode() if text else body))
+                    if len(paw) == ns and not any(paw[:ps+ls]):
+                        self._code = code
+                        self._soft = ''
+                        self._raw = paw[ps+ls:]
+                        return
+
         first = qb64b[:1]  # extract first char code selector
         if isinstance(first, memoryview):
             first = bytes(first)
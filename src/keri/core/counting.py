@@ -603,6 +603,14 @@ class Counter:
     # converted from first two code char. Used for ._bexfil.
     Bards = ({codeB64ToB2(c): hs for c, hs in Hards.items()})
 
+    # FastHards table maps first two code chars as both str and bytes to hard
+    # size, hs. FastSizes maps id of version specific sizes table to its fast
+    # table of hard code as both str and bytes to tuple (code, hs, fs).
+    # Used for fast path of ._exfil.
+    FastHards = dict(Hards)
+    FastHards.update({c.encode(): hs for c, hs in Hards.items()})
+    FastSizes = {}
+
     # Sizes table indexes size tables first by major version and then by
     # lastest minor version
     # Each size table maps hs chars of code to Cizage namedtuple of (hs, ss, fs)
@@ -797,12 +805,12 @@ class Counter:
             countB64 (str | None): count of framed material in quadlets/triplets
                 for composition as Base64 representation of int.
                 useful for genus-version version as count
-            qb64b (bytes | bytearray | None): fully qualified crypto material text domain
-                    if code nor tag is provided
+            qb64b (bytes | bytearray | memoryview | None): fully qualified crypto
+                    material text domain if code nor tag is provided
                 qb64 (str | None) fully qualified crypto material text domain
                     if code nor tag not qb64b is provided
-                qb2 (bytes | bytearray | None)  fully qualified crypto material binary domain
-                    if code nor tag not qb64b nor qb54 is provided
+                qb2 (bytes | bytearray | memoryview | None)  fully qualified crypto
+                    material binary domain if code nor tag not qb64b nor qb54 is provided
             strip (bool):  True means strip counter contents from input stream
                 bytearray after parsing qb64b or qb2. False means do not strip.
                 default False
@@ -1175,12 +1183,37 @@ class Counter:
 
 
     def _exfil(self, qb64b):
-        """Extracts self.code and self.count from qualified base64 bytes qb64b"""
+        """Extracts self.code and self.count from qualified base64 bytes qb64b
+
+        Codes are looked up in the precomputed .FastHards and .FastSizes tables
+        without intermediate str conversions. Everything else, including all
+        error reporting, falls through to the general path.
+        """
         if not qb64b or len(qb64b) < 2:  # need more bytes
             raise ShortageError("Empty material, Need more characters.")
 
+        if (sizes := self.FastSizes.get(id(self._sizes))) is None:
+            sizes = {}
+            for code, (hs, ss, fs) in self._sizes.items():
+                sizes[code] = sizes[code.encode()] = (code, hs, fs)
+            self.FastSizes[id(self._sizes)] = sizes
+
+        text = isinstance(qb64b, str)
+        first = qb64b[:2]
+        if (hs := self.FastHards.get(first if text else bytes(first))) is not None:
+            hard = qb64b[:hs]
+            if (entry := sizes.get(hard if text else bytes(hard))) is not None:
+                code, hs, fs = entry
+                if len(qb64b) >= fs:
+                    count = qb64b[hs:fs]
+                    self._count = b64ToInt(count if text else bytes(count))
+                    self._code = code
+                    return
+
 
         first = qb64b[:2]  # extract first two char code selector
+        if isinstance(first, memoryview):
+            first = bytes(first)
         if hasattr(first, "decode"):
             first = first.decode("utf-8")
         if first not in self.Hards:
@@ -1195,6 +1228,8 @@ class Counter:
             raise ShortageError("Need {} more characters.".format(hs - len(qb64b)))
 
         hard = qb64b[:hs]  # get hard code
+        if isinstance(hard, memoryview):
+            hard = bytes(hard)
         if hasattr(hard, "decode"):
             hard = hard.decode("utf-8")  # decode converts bytearray/bytes to str
         if hard not in self._sizes:  # Sizes needs str not bytes
@@ -1210,6 +1245,8 @@ class Counter:
             raise ShortageError("Need {} more characters.".format(fs - len(qb64b)))
 
         count = qb64b[hs:fs]  # extract count chars
+        if isinstance(count, memoryview):
+            count = bytes(count)
         if hasattr(count, "decode"):
             count = count.decode("utf-8")
         count = b64ToInt(count)  # compute int count
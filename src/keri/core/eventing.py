@@ -2,12 +2,19 @@
 """
 keri.core.eventing module
 """
+import copy
 import datetime
 import logging
+import os
+import threading
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
 from dataclasses import asdict
 from urllib.parse import urlsplit
 from math import ceil
+
+import lmdb
 from ordered_set import OrderedSet as oset
 from hio.help import decking, ogler
 
@@ -53,6 +60,16 @@ LastEstLoc = namedtuple("LastEstLoc", 's d')
 
 Kind = Kinds.cesr
 
+# Number of worker threads for batch signature verification. Zero means verify
+# serially in the calling thread. libsodium releases the GIL so verifications
+# of large batches such as big multisig groups or bulk imports run in parallel.
+KERIVerifyWorkersKey = "KERI_VERIFY_WORKERS"
+VerifyWorkers = int(os.getenv(KERIVerifyWorkersKey, "0"))
+VerifyBatchMin = 8  # min batch size worth dispatching to worker threads
+_verifyPools = {}  # ThreadPoolExecutor per worker count lazily created for verifyBatch
+_verifyLock = threading.Lock()  # guards creation of pools in _verifyPools
+_preverified = None  # results keyed by triple of signatures verified by preverify
+
 
 # Future make Cues dataclasses  instead of dicts. Dataclasses so may be converted
 # to/from dicts easily  example: dict(kin="receipt", serder=serder)
@@ -313,6 +330,95 @@ def deTransReceiptQuintuple(data, strip=False):
     return ediger, sprefixer, snumber, sdiger, siger
 
 
+def verifyBatch(triples, workers=None):
+    """
+    Returns list of bool verification results, one for each triple in triples
+    in the same order, True when the signature verifies False otherwise.
+
+    Verifies all the triples as one batch. Triples may span signatures from
+    multiple events and multiple signers. When workers > 1 and the batch has
+    at least VerifyBatchMin triples then verifies on a thread pool shared by
+    all callers with the same number of workers otherwise verifies serially.
+    Triples already verified by an enclosing preverify are not verified again.
+
+    Parameters:
+        triples (Iterable[tuple]): of (sig, ser, verfer) where sig is bytes
+            signature, ser is bytes signed serialization and verfer is Verfer
+            instance of public key
+        workers (int | None): number of worker threads. None means use
+            module VerifyWorkers"""
+    triples = list(triples)
+    workers = VerifyWorkers if workers is None else workers
+
+    if not triples:
+        return []
+
+    if _preverified is None:
+        return _verifyTriples(triples, workers)
+
+    results = [_preverified.get((sig, ser, verfer.qb64b))
+               for sig, ser, verfer in triples]
+    misses = [i for i, result in enumerate(results) if result is None]
+    if misses:
+        for i, result in zip(misses, _verifyTriples([triples[i] for i in misses],
+                                                    workers)):
+            results[i] = result
+    return results
+
+
+def _verifyTriples(triples, workers):
+    """
+    Returns list of bool verification results of list triples verified on
+    the pool of workers threads when worth it otherwise serially.
+    """
+    if workers <= 1 or len(triples) < VerifyBatchMin:
+        return [verfer.verify(sig, ser) for sig, ser, verfer in triples]
+
+    if (pool := _verifyPools.get(workers)) is None:
+        with _verifyLock:
+            if (pool := _verifyPools.get(workers)) is None:
+                pool = _verifyPools[workers] = ThreadPoolExecutor(
+                    max_workers=workers, thread_name_prefix="keri-verify")
+
+    return list(pool.map(lambda triple: triple[2].verify(triple[0], triple[1]),
+                         triples))
+
+
+@contextmanager
+def preverify(triples, workers=None):
+    """
+    Context manager that verifies triples up front as one batch so that
+    verifyBatch calls inside its context, such as verifySigs of each event of
+    an escrow pass, look up the results of any of those triples instead of
+    verifying them again one event at a time. Triples already verified by an
+    enclosing preverify are not verified again and the results of a nested
+    preverify are kept until the outermost one exits.
+
+    Parameters:
+        triples (Iterable[tuple]): of (sig, ser, verfer) as for verifyBatch
+        workers (int | None): number of worker threads. None means use
+            module VerifyWorkers
+
+    Usage:
+        with preverify(triples):
+            for serder, sigers in events:
+                verifySigs(raw=serder.raw, sigers=sigers, verfers=verfers)
+    """
+    global _preverified
+
+    triples = list(triples)
+    results = verifyBatch(triples, workers=workers)
+    prior = _preverified
+    if prior is None:  # outermost
+        _preverified = {}
+    _preverified.update(((sig, ser, verfer.qb64b), result)
+                        for (sig, ser, verfer), result in zip(triples, results))
+    try:
+        yield
+    finally:
+        _preverified = prior
+
+
 def verifySigs(raw, sigers, verfers):
     """
     Returns tuple of (vsigers, vindices) where:
@@ -334,25 +440,29 @@ def verifySigs(raw, sigers, verfers):
     # indices count for threshold will be erroneous. Does not modify in place
     # passed in sigers list, but instead depends on caller to use indices to
     # modify its copy to filter out unverifiable or duplicate sigers
-    usigs = oset([siger.qb64 for siger in sigers])
-    usigers = [Siger(qb64=sig) for sig in usigs]
+    # Shallow copy of each unique siger avoids reparsing from qb64.
+    usigers = {}
+    for siger in sigers:
+        usigers.setdefault(siger.qb64b, siger)
 
     # verify indexes of attached signatures against verifiers and assign
     # verfer to each usiger
     uvsigers = []
-    for siger in usigers:
+    for siger in usigers.values():
         if siger.index >= len(verfers):
             logger.info(f"Skipped sig: index={siger.index} too large")
             continue
 
+        siger = copy.copy(siger)
         siger.verfer = verfers[siger.index]  # assign verfer
         uvsigers.append(siger)
 
     # create lists of unique verified signatures and indices
     vindices = []
     vsigers = []
-    for siger in uvsigers:
-        if siger.verfer.verify(siger.raw, raw):
+    results = verifyBatch((siger.raw, raw, siger.verfer) for siger in uvsigers)
+    for siger, result in zip(uvsigers, results):
+        if result:
             vindices.append(siger.index)
             vsigers.append(siger)
 
@@ -2096,16 +2206,17 @@ class Kever:
         # .validateSigsDelWigs above ensures thresholds met otherwise raises exception
         # all validated above so may add to KEL and FEL logs as first seen
         # returns fn == None if already logged fn log is non idempotent
-        fn, dts = self.logEvent(serder=serder, sigers=sigers, wigers=wigers,
-                                wits=wits,
-                                first=True if not check else False,
-                                delnum=delsner, diger=delsger,
-                                firner=firner, dater=dater, local=local)
-        if fn is not None:  # first is non-idempotent for fn check mode fn is None
-            self.fner = Number(num=fn)
-            self.dater = Dater(dts=dts)
-            self.db.states.pin(keys=self.prefixer.qb64,
-                               val=self.state())
+        with self.db.transact():  # log event and key state at once or none
+            fn, dts = self.logEvent(serder=serder, sigers=sigers, wigers=wigers,
+                                    wits=wits,
+                                    first=True if not check else False,
+                                    delnum=delsner, diger=delsger,
+                                    firner=firner, dater=dater, local=local)
+            if fn is not None:  # first is non-idempotent for fn check mode fn is None
+                self.fner = Number(num=fn)
+                self.dater = Dater(dts=dts)
+                self.db.states.pin(keys=self.prefixer.qb64,
+                                   val=self.state())
 
 
     @property
@@ -2504,32 +2615,38 @@ class Kever:
 
             # .valSigWigsDel above ensures thresholds met otherwise raises exception
             # all validated above so may add to KEL and FEL logs as first seen
-            fn, dts = self.logEvent(serder=serder, sigers=sigers, wigers=wigers,
-                                    wits=wits,
-                                    first=True if not check else False,
-                                    delnum=delsner, diger=delsger,
-                                    firner=firner, dater=dater, local=local)
-
-            # nxt and signatures verify so update state
-            self.sner = sner  # sequence number Number instance
-            self.serder = serder  # need whole serder for digest agility compare
-            self.ilk = ilk
-            self.tholder = tholder
-            self.verfers = serder.verfers
-            self.ndigers = serder.ndigers
-            self.ntholder = serder.ntholder
-
-            self.toader = toader
-            self.wits = wits
-            self.cuts = cuts
-            self.adds = adds
-
-            # last establishment event location need this to recognize recovery events
-            self.lastEst = LastEstLoc(s=self.sner.num, d=self.serder.said)
-            if fn is not None:  # first is non-idempotent for fn check mode fn is None
-                self.fner = Number(num=fn)
-                self.dater = Dater(dts=dts)
-                self.db.states.pin(keys=self.prefixer.qb64, val=self.state())
+            prior = dict(vars(self))  # restore in memory state when not committed
+            try:
+                with self.db.transact():  # log event and key state at once or none
+                    fn, dts = self.logEvent(serder=serder, sigers=sigers, wigers=wigers,
+                                            wits=wits,
+                                            first=True if not check else False,
+                                            delnum=delsner, diger=delsger,
+                                            firner=firner, dater=dater, local=local)
+
+                    # nxt and signatures verify so update state
+                    self.sner = sner  # sequence number Number instance
+                    self.serder = serder  # need whole serder for digest agility compare
+                    self.ilk = ilk
+                    self.tholder = tholder
+                    self.verfers = serder.verfers
+                    self.ndigers = serder.ndigers
+                    self.ntholder = serder.ntholder
+
+                    self.toader = toader
+                    self.wits = wits
+                    self.cuts = cuts
+                    self.adds = adds
+
+                    # last establishment event location need this to recognize recovery events
+                    self.lastEst = LastEstLoc(s=self.sner.num, d=self.serder.said)
+                    if fn is not None:  # first is non-idempotent for fn check mode fn is None
+                        self.fner = Number(num=fn)
+                        self.dater = Dater(dts=dts)
+                        self.db.states.pin(keys=self.prefixer.qb64, val=self.state())
+            except Exception:
+                vars(self).update(prior)
+                raise
 
 
         elif ilk == Ilks.ixn:  # subsequent interaction event
@@ -2569,17 +2686,23 @@ class Kever:
 
             # .validateSigsDelWigs above ensures thresholds met otherwise raises exception
             # all validated above so may add to KEL and FEL logs as first seen
-            fn, dts = self.logEvent(serder=serder, sigers=sigers, wigers=wigers,
-                                    first=True if not check else False)  # First seen accepted
-
-            # validates so update state
-            self.sner = sner  # sequence number Number instance
-            self.serder = serder  # need for digest agility includes .serder.diger
-            self.ilk = ilk
-            if fn is not None:  # first is non-idempotent for fn check mode fn is None
-                self.fner = Number(num=fn)
-                self.dater = Dater(dts=dts)
-                self.db.states.pin(keys=self.prefixer.qb64, val=self.state())
+            prior = dict(vars(self))  # restore in memory state when not committed
+            try:
+                with self.db.transact():  # log event and key state at once or none
+                    fn, dts = self.logEvent(serder=serder, sigers=sigers, wigers=wigers,
+                                            first=True if not check else False)  # First seen accepted
+
+                    # validates so update state
+                    self.sner = sner  # sequence number Number instance
+                    self.serder = serder  # need for digest agility includes .serder.diger
+                    self.ilk = ilk
+                    if fn is not None:  # first is non-idempotent for fn check mode fn is None
+                        self.fner = Number(num=fn)
+                        self.dater = Dater(dts=dts)
+                        self.db.states.pin(keys=self.prefixer.qb64, val=self.state())
+            except Exception:
+                vars(self).update(prior)
+                raise
 
         else:  # unsupported event ilk so discard
             raise ValidationError("Unsupported ilk = {} for evt = {}.".format(ilk, ked))
@@ -2894,7 +3017,7 @@ class Kever:
                 if len(windices) < toader.num:  # not fully witnessed yet
                     if self.escrowPWEvent(serder=serder, wigers=wigers, sigers=sigers,
                                           delsner=delsner, delsger=delsger,
-                                          local=local):
+                                          local=local) and self.cues is not None:
                         # cue to query for witness receipts
                         self.cues.push(dict(kin="query", q=dict(pre=serder.pre, sn=serder.snh)))
                     msg = (f"AID {pre[:4]}...{pre[-4:]}: Failure satisfying toad={toader.num} "
@@ -3321,9 +3444,10 @@ class Kever:
                 # Have to wait until delegating event at sn shows up in kel
                 # ToDo XXXX process  this cue of query to fetch delegating event from
                 # delegator
-                self.cues.push(dict(kin="query", q=dict(pre=delpre,
-                                                                  sn=delsner.numh,
-                                                                  dig=delsger.qb64)))
+                if self.cues is not None:
+                    self.cues.push(dict(kin="query", q=dict(pre=delpre,
+                                                            sn=delsner.numh,
+                                                            dig=delsger.qb64)))
                 #  escrow event here
                 inceptive = True if serder.ilk in (Ilks.icp, Ilks.dip) else False
                 sn = Number(num=serder.sn).validate(inceptive=inceptive).sn
@@ -3633,66 +3757,74 @@ class Kever:
                 True means event source is local (protected).
                 False means event source is remote (unprotected).
                 Event validation logic is a function of local or remote"""
-        local = True if local else False
-        fn = None  # None means not a first seen log event so does not return an fn
-        dgkeys = (serder.pre, serder.said)
-        dgkey = dgKey(serder.preb, serder.saidb)
-        nowdater = Dater()  # now timestamp
-        self.db.dtss.put(keys=dgkey, val=nowdater)  # idempotent do not change dts if already
-        if sigers:
-            self.db.sigs.put(keys=dgkey, vals=sigers)  # idempotent
-        if wigers:
-            self.db.wigs.put(keys=dgkey, vals=wigers)
-        if wits:
-            self.db.wits.put(keys=dgkey, vals=[Prefixer(qb64=w) for w in wits])
-
-        self.db.evts.put(keys=(serder.pre, serder.said), val=serder)  # idempotent (maybe already excrowed)
-        # update event source
-
-        # delegation for authorized delegated or issued event
-        # when delnum and diger are provided they are only assured to be valid
-        # kever for event if kel is delegated and not locallyOwned
-        # and not locallyWitnessed as the validateDelegation is short circuited
-        # for non delegated kels, local controllers, and local witnesses.
-        # These checks prevent ddos via malicious source seal attachments.
-        # MUST NOT setAes if not delegated or locallyOwned or locallyWitnessed
-        if (self.delpre and not serder.ilk == Ilks.ixn and not self.locallyOwned()
-            and not self.locallyWitnessed(wits=wits) and delnum and diger):
-            self.db.aess.pin(keys=(serder.preb, serder.saidb), val=(Number(num=delnum.num, code=NumDex.Huge), diger))  # authorizer (delegator/issuer) event seal
-
-        if esr := self.db.esrs.get(keys=dgkeys):  # preexisting esr
-            if local and not esr.local:  # local overwrites prexisting remote
-                esr.local = local
-                self.db.esrs.pin(keys=dgkeys, val=esr)
-            # otherwise don't change
-        else:  # not preexisting so put
-            esr = EventSourceRecord(local=local)
-            self.db.esrs.put(keys=dgkeys, val=esr)
-
-        pre = self.prefixer.qb64
-        if first:  # append event dig to first seen database in order
-            fn = self.db.fels.append(keys=serder.preb, val=serder.saidb)
-            if firner and fn != firner.sn:  # cloned replay but replay fn not match
-                if self.cues is not None:  # cue to notice BadCloneFN
-                    self.cues.push(dict(kin="noticeBadCloneFN", serder=serder,
-                                        fn=fn, firner=firner, dater=dater))
-                logger.info("Kever: Mismatch Cloned Replay FN: %s First seen "
-                            "ordinal fn %s and clone fn %s, said=%s",
-                            serder.preb, fn, firner.sn, serder.said)
-                logger.debug("Event body=\n%s\n", serder.pretty())
-            if dater:  # cloned replay use original's dts from dater
-                nowdater = dater
-            self.db.dtss.pin(keys=dgkey, val=nowdater)  # first seen so set dts to now
-            self.db.fons.pin(keys=dgkey, val=Number(sn=fn))
-            logger.debug("AID %s...%s: First seen %s at sn=%s valid event SAID=%s for %s at %s",
-                         pre[:4], pre[-4:], serder.ilk, fn, serder.said,
-                         serder.pre, nowdater.dts)
+        with self.db.transact():  # commit all writes at once or none
+            local = True if local else False
+            fn = None  # None means not a first seen log event so does not return an fn
+            dgkeys = (serder.pre, serder.said)
+            dgkey = dgKey(serder.preb, serder.saidb)
+            nowdater = Dater()  # now timestamp
+            self.db.dtss.put(keys=dgkey, val=nowdater)  # idempotent do not change dts if already
+            if sigers:
+                self.db.sigs.put(keys=dgkey, vals=sigers)  # idempotent
+            if wigers:
+                self.db.wigs.put(keys=dgkey, vals=wigers)
+            if wits:
+                self.db.wits.put(keys=dgkey, vals=[Prefixer(qb64=w) for w in wits])
+
+            self.db.evts.put(keys=(serder.pre, serder.said), val=serder)  # idempotent (maybe already excrowed)
+            # update event source
+
+            # delegation for authorized delegated or issued event
+            # when delnum and diger are provided they are only assured to be valid
+            # kever for event if kel is delegated and not locallyOwned
+            # and not locallyWitnessed as the validateDelegation is short circuited
+            # for non delegated kels, local controllers, and local witnesses.
+            # These checks prevent ddos via malicious source seal attachments.
+            # MUST NOT setAes if not delegated or locallyOwned or locallyWitnessed
+            if (self.delpre and not serder.ilk == Ilks.ixn and not self.locallyOwned()
+                and not self.locallyWitnessed(wits=wits) and delnum and diger):
+                self.db.aess.pin(keys=(serder.preb, serder.saidb), val=(Number(num=delnum.num, code=NumDex.Huge), diger))  # authorizer (delegator/issuer) event seal
+
+            if esr := self.db.esrs.get(keys=dgkeys):  # preexisting esr
+                if local and not esr.local:  # local overwrites prexisting remote
+                    esr.local = local
+                    self.db.esrs.pin(keys=dgkeys, val=esr)
+                # otherwise don't change
+            else:  # not preexisting so put
+                esr = EventSourceRecord(local=local)
+                self.db.esrs.put(keys=dgkeys, val=esr)
+
+            pre = self.prefixer.qb64
+            if first:  # append event dig to first seen database in order
+                fn = self.db.fels.append(keys=serder.preb, val=serder.saidb)
+                if firner and fn != firner.sn:  # cloned replay but replay fn not match
+                    if self.cues is not None:  # cue to notice BadCloneFN
+                        self.cues.push(dict(kin="noticeBadCloneFN", serder=serder,
+                                            fn=fn, firner=firner, dater=dater))
+                    logger.info("Kever: Mismatch Cloned Replay FN: %s First seen "
+                                "ordinal fn %s and clone fn %s, said=%s",
+                                serder.preb, fn, firner.sn, serder.said)
+                    logger.debug("Event body=\n%s\n", serder.pretty())
+                if dater:  # cloned replay use original's dts from dater
+                    nowdater = dater
+                self.db.dtss.pin(keys=dgkey, val=nowdater)  # first seen so set dts to now
+                self.db.fons.pin(keys=dgkey, val=Number(sn=fn))
+                self.db.wake(pre, sn=serder.sn)  # escrows waiting on event may unescrow
+                logger.debug("AID %s...%s: First seen %s at sn=%s valid event SAID=%s for %s at %s",
+                             pre[:4], pre[-4:], serder.ilk, fn, serder.said,
+                             serder.pre, nowdater.dts)
+                logger.debug("Event Body=\n%s\n", serder.pretty())
+            self.db.kels.add(keys=serder.preb, on=serder.sn, val=serder.saidb)
+            self.db.indexSeals(serder)  # anchored seal index for sealing event lookup
+            if serder.estive and self.db.verifiers.size:  # cache once committed
+                self.db.afterCommit(lambda: self.db.verifiers.pin(serder.pre, serder.sn,
+                                                                  serder.said,
+                                                                  serder.tholder,
+                                                                  serder.verfers))
+            logger.info("AID %s...%s: Added to KEL %s at sn=%s valid event SAID=%s",
+                        pre[:4], pre[-4:], serder.ilk, serder.sn, serder.said)
             logger.debug("Event Body=\n%s\n", serder.pretty())
-        self.db.kels.add(keys=serder.preb, on=serder.sn, val=serder.saidb)
-        logger.info("AID %s...%s: Added to KEL %s at sn=%s valid event SAID=%s",
-                    pre[:4], pre[-4:], serder.ilk, serder.sn, serder.said)
-        logger.debug("Event Body=\n%s\n", serder.pretty())
-        return (fn, nowdater.dts)  # (fn int, dts str) if first else (None, dts str)
+            return (fn, nowdater.dts)  # (fn int, dts str) if first else (None, dts str)
 
 
     def escrowMFEvent(self, serder, sigers, wigers=None,
@@ -3710,28 +3842,29 @@ class Kever:
                 True means event source is local (protected).
                 False means event source is remote (unprotected).
                 Event validation logic is a function of local or remote"""
-        local = True if local else False
-        dgkey = dgKey(serder.preb, serder.saidb)
-        if esr := self.db.esrs.get(keys=dgkey):  # preexisting esr
-            if local and not esr.local:  # local overwrites prexisting remote
-                esr.local = local
-                self.db.esrs.pin(keys=dgkey, val=esr)
-            # otherwise don't change
-        else:  # not preexisting so put
-            esr = EventSourceRecord(local=local)
-            self.db.esrs.put(keys=dgkey, val=esr)
-
-        self.db.dtss.put(keys=dgkey, val=Dater())
-        self.db.sigs.put(keys=(serder.preb, serder.saidb), vals=sigers)
-        self.db.evts.put(keys=(serder.preb, serder.saidb), val=serder)
-        if wigers:
-            self.db.wigs.put(keys=dgkey, vals=wigers)
-        if delsner and delsger:
-            self.db.udes.put(keys=dgkey, val=(delsner, delsger))
+        with self.db.transact():  # commit all writes at once or none
+            local = True if local else False
+            dgkey = dgKey(serder.preb, serder.saidb)
+            if esr := self.db.esrs.get(keys=dgkey):  # preexisting esr
+                if local and not esr.local:  # local overwrites prexisting remote
+                    esr.local = local
+                    self.db.esrs.pin(keys=dgkey, val=esr)
+                # otherwise don't change
+            else:  # not preexisting so put
+                esr = EventSourceRecord(local=local)
+                self.db.esrs.put(keys=dgkey, val=esr)
+
+            self.db.dtss.put(keys=dgkey, val=Dater())
+            self.db.sigs.put(keys=(serder.preb, serder.saidb), vals=sigers)
+            self.db.evts.put(keys=(serder.preb, serder.saidb), val=serder)
+            if wigers:
+                self.db.wigs.put(keys=dgkey, vals=wigers)
+            if delsner and delsger:
+                self.db.udes.put(keys=dgkey, val=(delsner, delsger))
 
-        self.db.misfits.add(keys=(serder.pre, serder.snh), val=serder.saidb)
-        # log escrowed
-        logger.debug("Kever: escrowed misfit event=\n%s\n", serder.pretty())
+            self.db.misfits.add(keys=(serder.pre, serder.snh), val=serder.saidb)
+            # log escrowed
+            logger.debug("Kever: escrowed misfit event=\n%s\n", serder.pretty())
 
 
     def escrowDelegableEvent(self, serder, sigers, wigers=None, local=True):
@@ -3747,25 +3880,26 @@ class Kever:
                 True means event source is local (protected).
                 False means event source is remote (unprotected).
                 Event validation logic is a function of local or remote"""
-        local = True if local else False
-        dgkey = dgKey(serder.preb, serder.saidb)
-        if esr := self.db.esrs.get(keys=dgkey):  # preexisting esr
-            if local and not esr.local:  # local overwrites prexisting remote
-                esr.local = local
-                self.db.esrs.pin(keys=dgkey, val=esr)
-            # otherwise don't change
-        else:  # not preexisting so put
-            esr = EventSourceRecord(local=local)
-            self.db.esrs.put(keys=dgkey, val=esr)
-
-        self.db.dtss.put(keys=dgkey, val=Dater())
-        self.db.sigs.put(keys=dgkey, vals=sigers)
-        self.db.evts.put(keys=(serder.preb, serder.saidb), val=serder)
-        if wigers:
-            self.db.wigs.put(keys=(serder.preb, serder.saidb), vals=wigers)
-        self.db.delegables.add(snKey(serder.preb, serder.sn), serder.saidb)
-        # log escrowed
-        logger.debug("Kever: escrowed delegable event =\n%s\n", serder.pretty())
+        with self.db.transact():  # commit all writes at once or none
+            local = True if local else False
+            dgkey = dgKey(serder.preb, serder.saidb)
+            if esr := self.db.esrs.get(keys=dgkey):  # preexisting esr
+                if local and not esr.local:  # local overwrites prexisting remote
+                    esr.local = local
+                    self.db.esrs.pin(keys=dgkey, val=esr)
+                # otherwise don't change
+            else:  # not preexisting so put
+                esr = EventSourceRecord(local=local)
+                self.db.esrs.put(keys=dgkey, val=esr)
+
+            self.db.dtss.put(keys=dgkey, val=Dater())
+            self.db.sigs.put(keys=dgkey, vals=sigers)
+            self.db.evts.put(keys=(serder.preb, serder.saidb), val=serder)
+            if wigers:
+                self.db.wigs.put(keys=(serder.preb, serder.saidb), vals=wigers)
+            self.db.delegables.add(snKey(serder.preb, serder.sn), serder.saidb)
+            # log escrowed
+            logger.debug("Kever: escrowed delegable event =\n%s\n", serder.pretty())
 
 
     def escrowPSEvent(self, serder, *, sigers=None, wigers=None,
@@ -3784,30 +3918,35 @@ class Kever:
                 True means event source is local (protected).
                 False means event source is remote (unprotected).
                 Event validation logic is a function of local or remote"""
-        local = True if local else False
-        dgkey = dgKey(serder.preb, serder.saidb)
-        self.db.dtss.put(keys=dgkey, val=Dater())  # idempotent
-        if sigers:
-            self.db.sigs.put(keys=dgkey, vals=sigers)
-        if wigers:
-            self.db.wigs.put(keys=dgkey, vals=wigers)
-        if delsner and delsger:
-            self.db.udes.put(keys=dgkey, val=(delsner, delsger))  # idempotent
-
-        self.db.evts.put(keys=(serder.preb, serder.saidb), val=serder)
-        # update event source
-        if esr := self.db.esrs.get(keys=dgkey):  # preexisting esr
-            if local and not esr.local:  # local overwrites prexisting remote
-                esr.local = local
-                self.db.esrs.pin(keys=dgkey, val=esr)
-            # otherwise don't change
-        else:  # not preexisting so put
-            esr = EventSourceRecord(local=local)
-            self.db.esrs.put(keys=dgkey, val=esr)
-
-        snkey = snKey(serder.preb, serder.sn)
-        self.db.pses.add(keys=serder.preb, on=serder.sn, val=serder.saidb)
-        logger.debug("Kever: Escrowed partially signed or delegated event = \n%s\n", serder.pretty())
+        with self.db.transact():  # commit all writes at once or none
+            local = True if local else False
+            dgkey = dgKey(serder.preb, serder.saidb)
+            self.db.dtss.put(keys=dgkey, val=Dater())  # idempotent
+            self.db.expire(serder.pre, self.db.dtss.get(keys=dgkey), EscrowTimeoutPS)
+            woke = False  # new sigs or source couple may now unescrow
+            if sigers:
+                woke = self.db.sigs.put(keys=dgkey, vals=sigers) or woke
+            if wigers:
+                woke = self.db.wigs.put(keys=dgkey, vals=wigers) or woke
+            if delsner and delsger:  # idempotent
+                woke = self.db.udes.put(keys=dgkey, val=(delsner, delsger)) or woke
+            if woke:
+                self.db.wake(serder.pre)
+
+            self.db.evts.put(keys=(serder.preb, serder.saidb), val=serder)
+            # update event source
+            if esr := self.db.esrs.get(keys=dgkey):  # preexisting esr
+                if local and not esr.local:  # local overwrites prexisting remote
+                    esr.local = local
+                    self.db.esrs.pin(keys=dgkey, val=esr)
+                # otherwise don't change
+            else:  # not preexisting so put
+                esr = EventSourceRecord(local=local)
+                self.db.esrs.put(keys=dgkey, val=esr)
+
+            snkey = snKey(serder.preb, serder.sn)
+            self.db.pses.add(keys=serder.preb, on=serder.sn, val=serder.saidb)
+            logger.debug("Kever: Escrowed partially signed or delegated event = \n%s\n", serder.pretty())
 
 
     def escrowPWEvent(self, serder, *, sigers=None, wigers=None,
@@ -3825,31 +3964,36 @@ class Kever:
                 True means event source is local (protected).
                 False means event source is remote (unprotected).
                 Event validation logic is a function of local or remote"""
-        local = True if local else False
-        dgkey = dgKey(serder.preb, serder.saidb)
-        self.db.dtss.put(keys=dgkey, val=Dater())  # idempotent
+        with self.db.transact():  # commit all writes at once or none
+            local = True if local else False
+            dgkey = dgKey(serder.preb, serder.saidb)
+            self.db.dtss.put(keys=dgkey, val=Dater())  # idempotent
+            self.db.expire(serder.pre, self.db.dtss.get(keys=dgkey), EscrowTimeoutPS)
 
-        if sigers:
-            self.db.sigs.put(keys=dgkey, vals=sigers)
-        if wigers:
-            self.db.wigs.put(keys=dgkey, vals=wigers)
-        if delsner and delsger:
-            self.db.udes.put(keys=dgkey, val=(delsner, delsger))  # idempotent
-
-        self.db.evts.put(keys=(serder.preb, serder.saidb), val=serder)
-        # update event source
-        if (esr := self.db.esrs.get(keys=dgkey)):  # preexisting esr
-            if local and not esr.local:  # local overwrites prexisting remote
-                esr.local = local
-                self.db.esrs.pin(keys=dgkey, val=esr)
-            # otherwise don't change
-        else: # not preexisting so put
-            esr = EventSourceRecord(local=local)
-            self.db.esrs.put(keys=dgkey, val=esr)
-
-        logger.trace("Kever state: Escrowed partially witnessed event = %s", serder.said)
-        logger.trace("Event Body=\n%s\n", serder.pretty())
-        return self.db.pwes.add(keys=serder.preb, on=serder.sn, val=serder.saidb)
+            woke = False  # new sigs or source couple may now unescrow
+            if sigers:
+                woke = self.db.sigs.put(keys=dgkey, vals=sigers) or woke
+            if wigers:
+                woke = self.db.wigs.put(keys=dgkey, vals=wigers) or woke
+            if delsner and delsger:  # idempotent
+                woke = self.db.udes.put(keys=dgkey, val=(delsner, delsger)) or woke
+            if woke:
+                self.db.wake(serder.pre)
+
+            self.db.evts.put(keys=(serder.preb, serder.saidb), val=serder)
+            # update event source
+            if (esr := self.db.esrs.get(keys=dgkey)):  # preexisting esr
+                if local and not esr.local:  # local overwrites prexisting remote
+                    esr.local = local
+                    self.db.esrs.pin(keys=dgkey, val=esr)
+                # otherwise don't change
+            else: # not preexisting so put
+                esr = EventSourceRecord(local=local)
+                self.db.esrs.put(keys=dgkey, val=esr)
+
+            logger.trace("Kever state: Escrowed partially witnessed event = %s", serder.said)
+            logger.trace("Event Body=\n%s\n", serder.pretty())
+            return self.db.pwes.add(keys=serder.preb, on=serder.sn, val=serder.saidb)
 
 
     def escrowPDEvent(self, serder, *, sigers=None, wigers=None,
@@ -3877,39 +4021,51 @@ class Kever:
                 True means event source is local (protected).
                 False means event source is remote (unprotected).
                 Event validation logic is a function of local or remote"""
-        local = True if local else False
-        dgkey = dgKey(serder.preb, serder.saidb)
-        self.db.dtss.put(keys=dgkey, val=Dater())  # idempotent
+        with self.db.transact():  # commit all writes at once or none
+            local = True if local else False
+            dgkey = dgKey(serder.preb, serder.saidb)
+            self.db.dtss.put(keys=dgkey, val=Dater())  # idempotent
+            self.db.expire(serder.pre, self.db.dtss.get(keys=dgkey), EscrowTimeoutPS)
+
+            woke = False  # new sigs or source couple may now unescrow
+            if sigers:  # idempotent
+                woke = self.db.sigs.put(keys=dgkey, vals=sigers) or woke
+            if wigers:  # idempotent
+                woke = self.db.wigs.put(keys=dgkey, vals=wigers) or woke
+            if delsner and delsger:  # non-idempotent pin to repair replace
+                if (couple := self.db.udes.get(keys=dgkey)) is None or (
+                        couple[0].qb64 != delsner.qb64 or couple[1].qb64 != delsger.qb64):
+                    woke = True
+                self.db.udes.pin(keys=dgkey, val=(delsner, delsger))  # non-idempotent
+                logger.debug(f"Kever state: Replaced escrow source couple sn="
+                             f"{delsner.num}, said={delsger.qb64} for partially "
+                             f"delegated/authorized event said={serder.said}.")
+            else:
+                self.db.udes.rem(keys=dgkey)  # nullify non-idempotent
+                logger.debug(f"Kever state: Nullified escrow source couple for "
+                             f"partially delegated/authorized event said="
+                             f"{serder.said}.")
 
-        if sigers:  # idempotent
-            self.db.sigs.put(keys=dgkey, vals=sigers)
-        if wigers:  # idempotent
-            self.db.wigs.put(keys=dgkey, vals=wigers)
-        if delsner and delsger:  # non-idempotent pin to repair replace
-            self.db.udes.pin(keys=dgkey, val=(delsner, delsger))  # non-idempotent
-            logger.debug(f"Kever state: Replaced escrow source couple sn="
-                         f"{delsner.num}, said={delsger.qb64} for partially "
-                         f"delegated/authorized event said={serder.said}.")
-        else:
-            self.db.udes.rem(keys=dgkey)  # nullify non-idempotent
-            logger.debug(f"Kever state: Nullified escrow source couple for "
-                         f"partially delegated/authorized event said="
-                         f"{serder.said}.")
+            self.db.evts.put(keys=(serder.preb, serder.saidb), val=serder)  # idempotent
 
-        self.db.evts.put(keys=(serder.preb, serder.saidb), val=serder)  # idempotent
+            # update event source local or remote
+            if (esr := self.db.esrs.get(keys=dgkey)):  # preexisting esr
+                if local and not esr.local:  # local overwrites prexisting remote
+                    esr.local = local
+                    self.db.esrs.pin(keys=dgkey, val=esr)
+                # otherwise don't change
+            else: # not preexisting so put
+                esr = EventSourceRecord(local=local)
+                self.db.esrs.put(keys=dgkey, val=esr)
 
-        # update event source local or remote
-        if (esr := self.db.esrs.get(keys=dgkey)):  # preexisting esr
-            if local and not esr.local:  # local overwrites prexisting remote
-                esr.local = local
-                self.db.esrs.pin(keys=dgkey, val=esr)
-            # otherwise don't change
-        else: # not preexisting so put
-            esr = EventSourceRecord(local=local)
-            self.db.esrs.put(keys=dgkey, val=esr)
+            # wake when delegator accepts event that may anchor delegation
+            delpre = serder.delpre if serder.ilk == Ilks.dip else self.delpre
+            self.db.wait(serder.pre, on=delpre)
+            if woke:
+                self.db.wake(serder.pre)
 
-        logger.debug(f"Kever: Escrowed partially delegated event=\n%s\n", serder.pretty())
-        return self.db.pdes.add(keys=serder.pre, on=serder.sn, val=serder.said)
+            logger.debug(f"Kever: Escrowed partially delegated event=\n%s\n", serder.pretty())
+            return self.db.pdes.add(keys=serder.pre, on=serder.sn, val=serder.said)
 
 
     def state(self):
@@ -4117,6 +4273,8 @@ class Kevery:
             non-idempotent way. Useful for reinitializing the Kevers from
             a persisted KEL without updating non-idempotent first seen .fels
             and timestamps.
+        swept (datetime.datetime|None): time of last full sweep of all escrows.
+            None means not yet swept.
 
     Properties:
         .kevers is dict of db kevers indexed by pre (qb64) of each Kever
@@ -4131,6 +4289,7 @@ class Kevery:
     TimeoutVRE = 3600  # seconds to timeout unverified transferable receipt escrows
     TimeoutKSN = 3600  # seconds to timeout key state notice message escrows
     TimeoutQNF = 300   # seconds to timeout query not found escrows
+    SweepEscrows = 60  # seconds between full sweeps of all escrows for timeouts
 
     def __init__(self, *, cues=None, db=None, rvy=None, exc=None, tvy=None,
                  cf=None, kramer=None, enableKram=False,
@@ -4185,6 +4344,7 @@ class Kevery:
         self.cloned = True if cloned else False  # process as cloned
         self.direct = True if direct else False  # process as direct mode
         self.check = True if check else False  # process as check mode
+        self.swept = None  # no full escrow sweep yet
 
 
     @property
@@ -4279,18 +4439,20 @@ class Kevery:
                 # raises exception if problem
                 # otherwise adds to KEL
                 # create kever from serder
-                kever = Kever(serder=serder,
-                              sigers=sigers,
-                              wigers=wigers,
-                              db=self.db,
-                              delsner=delsner,
-                              delsger=delsger,
-                              firner=firner if self.cloned else None,
-                              dater=dater if self.cloned else None,
-                              cues=self.cues,
-                              eager=eager,
-                              local=local,
-                              check=self.check)
+                # replays when map full so event is not dropped
+                kever = self.db.replay(Kever,
+                                       serder=serder,
+                                       sigers=sigers,
+                                       wigers=wigers,
+                                       db=self.db,
+                                       delsner=delsner,
+                                       delsger=delsger,
+                                       firner=firner if self.cloned else None,
+                                       dater=dater if self.cloned else None,
+                                       cues=self.cues,
+                                       eager=eager,
+                                       local=local,
+                                       check=self.check)
                 self.kevers[pre] = kever  # not exception so add to kevers
 
                 # At this point  the inceptive event (icp or dip) given by serder
@@ -4346,7 +4508,8 @@ class Kevery:
                         # signatures to be added to the databse
                         # Not first seen version of event so ignore return
                         # idempotent update db logs
-                        kever.logEvent(serder, sigers=sigers, wigers=wigers)
+                        self.db.replay(kever.logEvent, serder, sigers=sigers,
+                                       wigers=wigers)
 
                 else:  # escrow likely duplicitous event
                     self.escrowLDEvent(serder=serder, sigers=sigers)
@@ -4357,6 +4520,8 @@ class Kevery:
 
             else:  # rot, drt, or ixn, so sn matters
                 kever = self.kevers[pre]  # get existing kever for pre
+                if kever.cues is None:  # reloaded from key state by .db.kevers
+                    kever.cues = self.cues
                 sno = kever.sner.num + 1  # proper sn of new inorder event
 
                 if sn > sno:  # sn later than sno so out of order escrow
@@ -4377,11 +4542,12 @@ class Kevery:
                     # verify signatures etc and update state if valid
                     # raise exception if problem.
                     # Otherwise adds to KELs
-                    kever.update(serder=serder, sigers=sigers, wigers=wigers,
-                                 delsner=delsner, delsger=delsger,
-                                 firner=firner if self.cloned else None,
-                                 dater=dater if self.cloned else None,
-                                 eager=eager, local=local, check=self.check)
+                    # replays when map full so event is not dropped
+                    self.db.replay(kever.update, serder=serder, sigers=sigers,
+                                   wigers=wigers, delsner=delsner, delsger=delsger,
+                                   firner=firner if self.cloned else None,
+                                   dater=dater if self.cloned else None,
+                                   eager=eager, local=local, check=self.check)
 
                     # At this point the non-inceptive event (rot, drt, or ixn)
                     # given by serder together with its attachments has been
@@ -4431,7 +4597,8 @@ class Kevery:
                             # signatures to be added to the databse
                             # Not first seen version of event so ignore return
                             # idempotent update db logs
-                            kever.logEvent(serder, sigers=sigers, wigers=wigers)  # idempotent update db logs
+                            self.db.replay(kever.logEvent, serder, sigers=sigers,
+                                           wigers=wigers)  # idempotent update db logs
 
                     else:  # escrow likely duplicitous event
                         self.escrowLDEvent(serder=serder, sigers=sigers)
@@ -4517,7 +4684,8 @@ class Kevery:
                         index = wits.index(rpre)
                         # create witness indexed signature
                         wiger = Siger(raw=cigar.raw, index=index, verfer=cigar.verfer)
-                        self.db.wigs.add(keys=dgkey, val=wiger)  # write to db
+                        if self.db.wigs.add(keys=dgkey, val=wiger):  # write to db
+                            self.db.wake(pre)  # new wig may complete witnessing
                     else:  # not witness rect write receipt to database
                         self.db.rcts.add(keys=dgkey, val=(cigar.verfer, cigar))
 
@@ -4546,7 +4714,8 @@ class Kevery:
 
                 if wiger.verfer.verify(wiger.raw, lserder.raw):
                     # write receipt indexed sig to database
-                    self.db.wigs.add(keys=dgkey, val=wiger)
+                    if self.db.wigs.add(keys=dgkey, val=wiger):
+                        self.db.wake(pre)  # new wig may complete witnessing
 
             for sprefixer, snumber, sdiger, sigers in tsgs:  # iterate over each tsg
                 if not self.lax and sprefixer.qb64 in self.prefixes:  # own is receipter
@@ -4875,6 +5044,7 @@ class Kevery:
                                   "".format(ked["s"]))
 
         # process each couple to verify sig and write to db
+        vcigars = []  # couples to verify as one batch
         for cigar in cigars:
             if cigar.verfer.transferable:  # skip transferable verfers
                 continue  # skip invalid couplets
@@ -4893,14 +5063,21 @@ class Kevery:
 
                     continue  # skip own receipt attachment on non-local event
 
-            if cigar.verfer.verify(cigar.raw, serder.raw):
-                wits = self.fetchWitnessState(pre, sn)
+            vcigars.append(cigar)
+
+        results = verifyBatch((cigar.raw, serder.raw, cigar.verfer) for cigar in vcigars)
+        wits = None
+        for cigar, result in zip(vcigars, results):
+            if result:
+                if wits is None:  # fetch once for all verified couples
+                    wits = self.fetchWitnessState(pre, sn)
                 rpre = cigar.verfer.qb64  # prefix of receiptor
                 if rpre in wits:  # its a witness receipt
                     index = wits.index(rpre)
                     # create witness indexed signature and write to db
                     wiger = Siger(raw=cigar.raw, index=index, verfer=cigar.verfer)
-                    self.db.wigs.add(keys=(pre, ldig), val=wiger)
+                    if self.db.wigs.add(keys=(pre, ldig), val=wiger):
+                        self.db.wake(pre)  # new wig may complete witnessing
                 else:  # write receipt to database
                     self.db.rcts.add(keys=(pre, ldig), val=(cigar.verfer, cigar))
 
@@ -4990,7 +5167,11 @@ class Kevery:
                         raise ValidationError(f"Index={siger.index} to large for keys.")
 
                     siger.verfer = sverfers[siger.index]  # assign verfer
-                    if siger.verfer.verify(siger.raw, serder.raw):  # verify sig
+
+                results = verifyBatch((siger.raw, serder.raw, siger.verfer)
+                                      for siger in sigers)
+                for siger, result in zip(sigers, results):
+                    if result:  # verified sig
                         # good sig so write receipt to database
                         keys = (pre, serder.said, sprefixer.qb64, snumber.onkey, sdiger.qb64)
                         self.db.vrcs.add(keys=keys, val=siger)  # add to ioset at keys
@@ -5705,27 +5886,28 @@ class Kevery:
                 True means event source is local (protected).
                 False means event source is remote (unprotected).
                 Event validation logic is a function of local or remote"""
-        local = True if local else False
-        dgkey = dgKey(serder.preb, serder.saidb)
-        if esr := self.db.esrs.get(keys=dgkey):  # preexisting esr
-            if local and not esr.local:  # local overwrites prexisting remote
-                esr.local = local
-                self.db.esrs.pin(keys=dgkey, val=esr)
-            # otherwise don't change
-        else:  # not preexisting so put
-            esr = EventSourceRecord(local=local)
-            self.db.esrs.put(keys=(serder.preb, serder.saidb), val=esr)
-
-        self.db.dtss.put(keys=dgkey, val=Dater())
-        self.db.sigs.put(keys=dgkey, vals=sigers)
-        self.db.evts.put(keys=(serder.preb, serder.saidb), val=serder)
-        if wigers:
-            self.db.wigs.put(keys=dgkey, vals=wigers)
-        if number and diger:
-            self.db.udes.put(keys=dgkey, val=(number, diger))  # idempotent
-        self.db.misfits.add(keys=(serder.pre, serder.snh), val=serder.saidb)
-        # log escrowed
-        logger.debug("Kevery process: escrowed misfit event=\n%s", serder.pretty())
+        with self.db.transact():  # commit all writes at once or none
+            local = True if local else False
+            dgkey = dgKey(serder.preb, serder.saidb)
+            if esr := self.db.esrs.get(keys=dgkey):  # preexisting esr
+                if local and not esr.local:  # local overwrites prexisting remote
+                    esr.local = local
+                    self.db.esrs.pin(keys=dgkey, val=esr)
+                # otherwise don't change
+            else:  # not preexisting so put
+                esr = EventSourceRecord(local=local)
+                self.db.esrs.put(keys=(serder.preb, serder.saidb), val=esr)
+
+            self.db.dtss.put(keys=dgkey, val=Dater())
+            self.db.sigs.put(keys=dgkey, vals=sigers)
+            self.db.evts.put(keys=(serder.preb, serder.saidb), val=serder)
+            if wigers:
+                self.db.wigs.put(keys=dgkey, vals=wigers)
+            if number and diger:
+                self.db.udes.put(keys=dgkey, val=(number, diger))  # idempotent
+            self.db.misfits.add(keys=(serder.pre, serder.snh), val=serder.saidb)
+            # log escrowed
+            logger.debug("Kevery process: escrowed misfit event=\n%s", serder.pretty())
 
 
     def escrowOOEvent(self, serder, sigers, delsner=None, delsger=None, wigers=None, local=True):
@@ -5741,27 +5923,29 @@ class Kevery:
                 True means event source is local (protected).
                 False means event source is remote (unprotected).
                 Event validation logic is a function of local or remote"""
-        local = True if local else False
-        dgkey = dgKey(serder.preb, serder.saidb)
-        if esr := self.db.esrs.get(keys=dgkey):  # preexisting esr
-            if local and not esr.local:  # local overwrites prexisting remote
-                esr.local = local
-                self.db.esrs.pin(keys=dgkey, val=esr)
-            # otherwise don't change
-        else:  # not preexisting so put
-            esr = EventSourceRecord(local=local)
-            self.db.esrs.put(keys=dgkey, val=esr)
-
-        self.db.dtss.put(keys=dgkey, val=Dater())
-        self.db.sigs.put(keys=dgkey, vals=sigers)
-        self.db.evts.put(keys=(serder.preb, serder.saidb), val=serder)
-        if wigers:
-            self.db.wigs.put(keys=dgkey, vals=wigers)
-        if delsner and delsger:
-            self.db.udes.put(keys=dgkey, val=(delsner, delsger))  # idempotent
-        self.db.ooes.add(keys=serder.preb, on=serder.sn, val=serder.saidb)
-        # log escrowed
-        logger.debug("Kevery process: escrowed out of order event=\n%s", serder.pretty())
+        with self.db.transact():  # commit all writes at once or none
+            local = True if local else False
+            dgkey = dgKey(serder.preb, serder.saidb)
+            if esr := self.db.esrs.get(keys=dgkey):  # preexisting esr
+                if local and not esr.local:  # local overwrites prexisting remote
+                    esr.local = local
+                    self.db.esrs.pin(keys=dgkey, val=esr)
+                # otherwise don't change
+            else:  # not preexisting so put
+                esr = EventSourceRecord(local=local)
+                self.db.esrs.put(keys=dgkey, val=esr)
+
+            self.db.dtss.put(keys=dgkey, val=Dater())
+            self.db.expire(serder.pre, self.db.dtss.get(keys=dgkey), self.TimeoutOOE)
+            self.db.sigs.put(keys=dgkey, vals=sigers)
+            self.db.evts.put(keys=(serder.preb, serder.saidb), val=serder)
+            if wigers:
+                self.db.wigs.put(keys=dgkey, vals=wigers)
+            if delsner and delsger:
+                self.db.udes.put(keys=dgkey, val=(delsner, delsger))  # idempotent
+            self.db.ooes.add(keys=serder.preb, on=serder.sn, val=serder.saidb)
+            # log escrowed
+            logger.debug("Kevery process: escrowed out of order event=\n%s", serder.pretty())
 
     def escrowQueryNotFoundEvent(self, prefixer, serder, sigers, cigars=None):
         """
@@ -5772,19 +5956,23 @@ class Kevery:
             serder (SerderKERI): instance of  event
             sigers (list): of Siger instance for  event
             cigars (list): of non-transferable receipts"""
-        cigars = cigars if cigars is not None else []
-        dgkey = dgKey(prefixer.qb64b, serder.saidb)
-        self.db.dtss.put(keys=dgkey, val=Dater())
-        self.db.sigs.put(keys=dgkey, vals=sigers)
-        self.db.evts.put(keys=(prefixer.qb64b, serder.saidb), val=serder)
-        self.db.qnfs.add(keys=(prefixer.qb64, serder.said), val=serder.saidb)
+        with self.db.transact():  # commit all writes at once or none
+            cigars = cigars if cigars is not None else []
+            dgkey = dgKey(prefixer.qb64b, serder.saidb)
+            self.db.dtss.put(keys=dgkey, val=Dater())
+            self.db.expire(prefixer.qb64, self.db.dtss.get(keys=dgkey), self.TimeoutQNF)
+            self.db.sigs.put(keys=dgkey, vals=sigers)
+            self.db.evts.put(keys=(prefixer.qb64b, serder.saidb), val=serder)
+            self.db.qnfs.add(keys=(prefixer.qb64, serder.said), val=serder.saidb)
 
-        for cigar in cigars:
-            self.db.rcts.add(keys=(prefixer.qb64, serder.said), val=(cigar.verfer, cigar))
+            for cigar in cigars:
+                self.db.rcts.add(keys=(prefixer.qb64, serder.said), val=(cigar.verfer, cigar))
+            # wake on event of queried prefix
+            self.db.wait(prefixer.qb64, on=serder.ked.get("q", {}).get("i"))
 
-        # log escrowed
-        logger.trace("Kevery: escrowed query not found event = %s", serder.said)
-        logger.trace("Event Body=\n%s\n", serder.pretty())
+            # log escrowed
+            logger.trace("Kevery: escrowed query not found event = %s", serder.said)
+            logger.trace("Event Body=\n%s\n", serder.pretty())
 
     def escrowLDEvent(self, serder, sigers, local=True):
         """
@@ -5797,23 +5985,25 @@ class Kevery:
                 True means event source is local (protected).
                 False means event source is remote (unprotected).
                 Event validation logic is a function of local or remote"""
-        local = True if local else False
-        dgkey = dgKey(serder.preb, serder.saidb)
-        if esr := self.db.esrs.get(keys=dgkey):  # preexisting esr
-            if local and not esr.local:  # local overwrites prexisting remote
-                esr.local = local
-                self.db.esrs.pin(keys=dgkey, val=esr)
-            # otherwise don't change
-        else:  # not preexisting so put
-            esr = EventSourceRecord(local=local)
-            self.db.esrs.put(keys=dgkey, val=esr)
-
-        self.db.dtss.put(keys=dgkey, val=Dater())
-        self.db.sigs.put(keys=dgkey, vals=sigers)
-        self.db.evts.put(keys=(serder.preb, serder.saidb), val=serder)
-        self.db.addLde(snKey(serder.preb, serder.sn), serder.saidb)
-        # log duplicitous
-        logger.debug("Kevery process: escrowed likely duplicitous event=\n%s\n", serder.pretty())
+        with self.db.transact():  # commit all writes at once or none
+            local = True if local else False
+            dgkey = dgKey(serder.preb, serder.saidb)
+            if esr := self.db.esrs.get(keys=dgkey):  # preexisting esr
+                if local and not esr.local:  # local overwrites prexisting remote
+                    esr.local = local
+                    self.db.esrs.pin(keys=dgkey, val=esr)
+                # otherwise don't change
+            else:  # not preexisting so put
+                esr = EventSourceRecord(local=local)
+                self.db.esrs.put(keys=dgkey, val=esr)
+
+            self.db.dtss.put(keys=dgkey, val=Dater())
+            self.db.expire(serder.pre, self.db.dtss.get(keys=dgkey), self.TimeoutLDE)
+            self.db.sigs.put(keys=dgkey, vals=sigers)
+            self.db.evts.put(keys=(serder.preb, serder.saidb), val=serder)
+            self.db.addLde(snKey(serder.preb, serder.sn), serder.saidb)
+            # log duplicitous
+            logger.debug("Kevery process: escrowed likely duplicitous event=\n%s\n", serder.pretty())
 
     def escrowUWReceipt(self, serder, wigers, said):
         """
@@ -5832,23 +6022,26 @@ class Kevery:
                     of receipted event
             said (str): qb64 said of receipted event not serder.dig because
                 serder is a receipt not the receipted event"""
-        # note receipt dig algo may not match database dig also so must always
-        # serder.compare to match. So receipts for same event may have different
-        # digs of that event due to different algos. So the escrow may have
-        # different dup at same key, sn.  Escrow needs to include dig
-        # so can compare digs from receipt and in database for receipted event
-        # with different algos.  Can't lookup event by dig for same reason. Must
-        # lookup last event by sn not by dig.
-        self.db.dtss.put(keys=dgKey(serder.preb, said), val=Dater())
-        for wiger in wigers:  # escrow each couple
-            # don't know witness pre yet without witness list so no verfer in wiger
-            # if wiger.verfer.transferable:  # skip transferable verfers
-            # continue  # skip invalid triplets
-            self.db.uwes.add(keys=serder.preb, on=serder.sn, val=(said, wiger.qb64))
-
-        # log escrowed
-        logger.debug("Kevery process: escrowed unverified witness indexed receipt"
-                     " of pre= %s sn=%x dig=%s", serder.pre, serder.sn, said)
+        with self.db.transact():  # commit all writes at once or none
+            # note receipt dig algo may not match database dig also so must always
+            # serder.compare to match. So receipts for same event may have different
+            # digs of that event due to different algos. So the escrow may have
+            # different dup at same key, sn.  Escrow needs to include dig
+            # so can compare digs from receipt and in database for receipted event
+            # with different algos.  Can't lookup event by dig for same reason. Must
+            # lookup last event by sn not by dig.
+            self.db.dtss.put(keys=dgKey(serder.preb, said), val=Dater())
+            self.db.expire(serder.pre, self.db.dtss.get(keys=dgKey(serder.preb, said)),
+                           self.TimeoutUWE)
+            for wiger in wigers:  # escrow each couple
+                # don't know witness pre yet without witness list so no verfer in wiger
+                # if wiger.verfer.transferable:  # skip transferable verfers
+                # continue  # skip invalid triplets
+                self.db.uwes.add(keys=serder.preb, on=serder.sn, val=(said, wiger.qb64))
+
+            # log escrowed
+            logger.debug("Kevery process: escrowed unverified witness indexed receipt"
+                         " of pre= %s sn=%x dig=%s", serder.pre, serder.sn, said)
 
     def escrowUReceipt(self, serder, cigars, said):
         """
@@ -5863,26 +6056,29 @@ class Kevery:
             cigars (list): of Cigar instances for event receipt
             said (str): qb64 said in receipt of receipted event not serder.dig because
             serder: of receipt not receipted event"""
-        # note receipt dig algo may not match database dig also so must always
-        # serder.compare to match. So receipts for same event may have different
-        # digs of that event due to different algos. So the escrow may have
-        # different dup at same key, sn.  Escrow needs to include dig
-        # so can compare digs from receipt and in database for receipted event
-        # with different algos.  Can't lookup event by dig for same reason. Must
-        # lookup last event by sn not by dig.
-        self.db.dtss.put(keys=dgKey(serder.preb, said), val=Dater())
-        for cigar in cigars:  # escrow each triple
-            if cigar.verfer.transferable:  # skip transferable verfers
-                continue  # skip invalid triplets
-            trituple = (
-                Diger(qb64=said),
-                Prefixer(qb64=cigar.verfer.qb64),
-                cigar
-            )
-            self.db.ures.add(keys=(serder.pre, Number(num=serder.sn, code=NumDex.Huge).qb64), val=trituple)
-        # log escrowed
-        logger.debug("Kevery process: escrowed unverified receipt of pre= %s "
-                     " sn=%x dig=%s", serder.pre, serder.sn, said)
+        with self.db.transact():  # commit all writes at once or none
+            # note receipt dig algo may not match database dig also so must always
+            # serder.compare to match. So receipts for same event may have different
+            # digs of that event due to different algos. So the escrow may have
+            # different dup at same key, sn.  Escrow needs to include dig
+            # so can compare digs from receipt and in database for receipted event
+            # with different algos.  Can't lookup event by dig for same reason. Must
+            # lookup last event by sn not by dig.
+            self.db.dtss.put(keys=dgKey(serder.preb, said), val=Dater())
+            self.db.expire(serder.pre, self.db.dtss.get(keys=dgKey(serder.preb, said)),
+                           self.TimeoutURE)
+            for cigar in cigars:  # escrow each triple
+                if cigar.verfer.transferable:  # skip transferable verfers
+                    continue  # skip invalid triplets
+                trituple = (
+                    Diger(qb64=said),
+                    Prefixer(qb64=cigar.verfer.qb64),
+                    cigar
+                )
+                self.db.ures.add(keys=(serder.pre, Number(num=serder.sn, code=NumDex.Huge).qb64), val=trituple)
+            # log escrowed
+            logger.debug("Kevery process: escrowed unverified receipt of pre= %s "
+                         " sn=%x dig=%s", serder.pre, serder.sn, said)
 
     def escrowTRGroups(self, serder, tsgs):
         """
@@ -5905,33 +6101,37 @@ class Kevery:
                 snu is receipter est event sn
                 dig is receipt est evant dig
                 sig is indexed sig of receiptor of receipted event"""
-        # Receipt dig algo may not match database dig. So must always
-        # serder.compare to match. So receipts for same event may have different
-        # digs of that event due to different algos. So the escrow may have
-        # different dup at same key, sn.  Escrow needs to be quintuple with
-        # edig, validator prefix, validtor est event sn, validator est evvent dig
-        # and sig stored at kel pre, sn so can compare digs
-        # with different algos.  Can't lookup by dig for the same reason. Must
-        # lookup last event by sn not by dig.#
-        # ToDo XXXX Is this approach still valid or do SAIDs now make it obsolete?
-        for tsg in tsgs:
-            prefixer, number, saider, sigers = tsg
-            self.db.dtss.put(keys=dgKey(serder.preb, serder.saidb), val=Dater())
-            # since serder of of receipt not receipted event must use dig in
-            # serder.ked["d"] not serder.dig
-            for siger in sigers:  # escrow each quintlet
-                quintuple = (
-                    Diger(qb64=serder.ked["d"]),
-                    prefixer,
-                    Number(num=number.sn),
-                    Diger(qb64=saider.qb64),
-                    siger,
-                )
-                self.db.vres.add(keys=snKey(serder.preb, serder.sn), val=quintuple)
-            # log escrowed
-            logger.debug("Kevery process: escrowed unverified transferable receipt "
-                         "of pre=%s sn=%x dig=%s by pre=%s", serder.pre,
-                         serder.sn, serder.ked["d"], prefixer.qb64)
+        with self.db.transact():  # commit all writes at once or none
+            # Receipt dig algo may not match database dig. So must always
+            # serder.compare to match. So receipts for same event may have different
+            # digs of that event due to different algos. So the escrow may have
+            # different dup at same key, sn.  Escrow needs to be quintuple with
+            # edig, validator prefix, validtor est event sn, validator est evvent dig
+            # and sig stored at kel pre, sn so can compare digs
+            # with different algos.  Can't lookup by dig for the same reason. Must
+            # lookup last event by sn not by dig.#
+            # ToDo XXXX Is this approach still valid or do SAIDs now make it obsolete?
+            for tsg in tsgs:
+                prefixer, number, saider, sigers = tsg
+                self.db.dtss.put(keys=dgKey(serder.preb, serder.saidb), val=Dater())
+                self.db.expire(serder.pre, self.db.dtss.get(keys=dgKey(serder.preb, serder.saidb)),
+                               self.TimeoutVRE)
+                # since serder of of receipt not receipted event must use dig in
+                # serder.ked["d"] not serder.dig
+                for siger in sigers:  # escrow each quintlet
+                    quintuple = (
+                        Diger(qb64=serder.ked["d"]),
+                        prefixer,
+                        Number(num=number.sn),
+                        Diger(qb64=saider.qb64),
+                        siger,
+                    )
+                    self.db.vres.add(keys=snKey(serder.preb, serder.sn), val=quintuple)
+                self.db.wait(serder.pre, on=prefixer.qb64)  # wake on receiptor est event
+                # log escrowed
+                logger.debug("Kevery process: escrowed unverified transferable receipt "
+                             "of pre=%s sn=%x dig=%s by pre=%s", serder.pre,
+                             serder.sn, serder.ked["d"], prefixer.qb64)
 
 
     def escrowTReceipts(self, serder, prefixer, number, saider, sigers):
@@ -5954,34 +6154,38 @@ class Kevery:
                 snu is receipter est event sn
                 dig is receipt est evant dig
                 sig is indexed sig of receiptor of receipted event"""
-        # Receipt dig algo may not match database dig. So must always
-        # serder.compare to match. So receipts for same event may have different
-        # digs of that event due to different algos. So the escrow may have
-        # different dup at same key, sn.  Escrow needs to be quintuple with
-        # edig, validator prefix, validtor est event sn, validator est evvent dig
-        # and sig stored at kel pre, sn so can compare digs
-        # with different algos.  Can't lookup by dig for the same reason. Must
-        # lookup last event by sn not by dig.
-        #ToDo XXXX Is this approach obsolete now that we have SAIDs? Do we have to compare
-        # digests for same algo, or do we always refer to the event SAID?
-
-        self.db.dtss.put(keys=dgKey(serder.preb, serder.saidb), val=Dater())
-        # since serder of of receipt not receipted event must use dig in
-        # serder.ked["d"] not serder.dig
-
-        for siger in sigers:  # escrow each quintlet
-            quintuple = (
-                Diger(qb64=serder.ked["d"]),
-                prefixer,
-                Number(num=number.sn),
-                Diger(qb64=saider.qb64),
-                siger,
-            )
-            self.db.vres.add(keys=snKey(serder.preb, serder.sn), val=quintuple)
-        # log escrowed
-        logger.debug("Kevery process: escrowed unverified transferable receipt "
-                    "of pre=%s sn=%x dig=%s by pre=%s", serder.pre,
-                    serder.sn, serder.ked["d"], prefixer.qb64)
+        with self.db.transact():  # commit all writes at once or none
+            # Receipt dig algo may not match database dig. So must always
+            # serder.compare to match. So receipts for same event may have different
+            # digs of that event due to different algos. So the escrow may have
+            # different dup at same key, sn.  Escrow needs to be quintuple with
+            # edig, validator prefix, validtor est event sn, validator est evvent dig
+            # and sig stored at kel pre, sn so can compare digs
+            # with different algos.  Can't lookup by dig for the same reason. Must
+            # lookup last event by sn not by dig.
+            #ToDo XXXX Is this approach obsolete now that we have SAIDs? Do we have to compare
+            # digests for same algo, or do we always refer to the event SAID?
+
+            self.db.dtss.put(keys=dgKey(serder.preb, serder.saidb), val=Dater())
+            self.db.expire(serder.pre, self.db.dtss.get(keys=dgKey(serder.preb, serder.saidb)),
+                           self.TimeoutVRE)
+            # since serder of of receipt not receipted event must use dig in
+            # serder.ked["d"] not serder.dig
+
+            for siger in sigers:  # escrow each quintlet
+                quintuple = (
+                    Diger(qb64=serder.ked["d"]),
+                    prefixer,
+                    Number(num=number.sn),
+                    Diger(qb64=saider.qb64),
+                    siger,
+                )
+                self.db.vres.add(keys=snKey(serder.preb, serder.sn), val=quintuple)
+            self.db.wait(serder.pre, on=prefixer.qb64)  # wake on receiptor est event
+            # log escrowed
+            logger.debug("Kevery process: escrowed unverified transferable receipt "
+                        "of pre=%s sn=%x dig=%s by pre=%s", serder.pre,
+                        serder.sn, serder.ked["d"], prefixer.qb64)
 
 
     def escrowTransReceiptGroup(self, serder, sprefixer, snumber, diger, sigers):
@@ -5998,45 +6202,67 @@ class Kevery:
             snumber (Number):  instance of sn of est event for receiptor key state
             diger (Diger): instance said digest est event or receipt key state
             sigers (list[Siger]): signatures of receiptor"""
-        # Receipt dig algo may not match database dig. So must always
-        # serder.compare to match. So receipts for same event may have different
-        # digs of that event due to different algos. So the escrow may have
-        # different dup at same key, sn.  Escrow needs to be quintuple with
-        # edig, validator prefix, validtor est event sn, validator est evvent dig
-        # and sig stored at kel pre, sn so can compare digs
-        # with different algos.  Can't lookup by dig for the same reason. Must
-        # lookup last event by sn not by dig.
-        # ToDo XXXX Is this approach obsolete now that we have SAIDs? Do we have to compare
-        # digests for same algo, or do we always refer to the event SAID?
-
-        self.db.dtss.put(keys=dgKey(serder.preb, serder.said), val=Dater())
-        for siger in sigers:
-            quintuple = (
-                Diger(qb64=serder.said),     # event digest
-                sprefixer,                  # Prefixer receiptor
-                Number(num=snumber.sn),     # SN of est event of receiptor key state
-                Diger(qb64=diger.qb64), # est event said of receiptro key state
-                siger,                  # signature of receiptor using est event key state
-            )
-            self.db.vres.add(keys=snKey(serder.preb, serder.sn), val=quintuple)
-            # log escrowed
-            logger.debug("Kevery process: escrowed unverified transferabe validator "
-                         "receipt of pre= %s sn=%x dig=%s", serder.pre, serder.sn,
-                         serder.said)
+        with self.db.transact():  # commit all writes at once or none
+            # Receipt dig algo may not match database dig. So must always
+            # serder.compare to match. So receipts for same event may have different
+            # digs of that event due to different algos. So the escrow may have
+            # different dup at same key, sn.  Escrow needs to be quintuple with
+            # edig, validator prefix, validtor est event sn, validator est evvent dig
+            # and sig stored at kel pre, sn so can compare digs
+            # with different algos.  Can't lookup by dig for the same reason. Must
+            # lookup last event by sn not by dig.
+            # ToDo XXXX Is this approach obsolete now that we have SAIDs? Do we have to compare
+            # digests for same algo, or do we always refer to the event SAID?
+
+            self.db.dtss.put(keys=dgKey(serder.preb, serder.said), val=Dater())
+            self.db.expire(serder.pre, self.db.dtss.get(keys=dgKey(serder.preb, serder.said)),
+                           self.TimeoutVRE)
+            for siger in sigers:
+                quintuple = (
+                    Diger(qb64=serder.said),     # event digest
+                    sprefixer,                  # Prefixer receiptor
+                    Number(num=snumber.sn),     # SN of est event of receiptor key state
+                    Diger(qb64=diger.qb64), # est event said of receiptro key state
+                    siger,                  # signature of receiptor using est event key state
+                )
+                self.db.vres.add(keys=snKey(serder.preb, serder.sn), val=quintuple)
+                # log escrowed
+                logger.debug("Kevery process: escrowed unverified transferabe validator "
+                             "receipt of pre= %s sn=%x dig=%s", serder.pre, serder.sn,
+                             serder.said)
+            self.db.wait(serder.pre, on=sprefixer.qb64)  # wake on receiptor est event
 
     def processEscrows(self):
         """
-        Iterate throush escrows and process any that may now be finalized"""
+        Iterate throush escrows and process any that may now be finalized.
+
+        Only reprocesses the escrowed entries of the prefixes woken in
+        .db.wakes by newly accepted events, receipts, or signatures since the
+        last call or whose escrowed entries reached their deadline in
+        .db.deadlines. Every .SweepEscrows seconds sweeps all the escrows in
+        full so that any wake or deadline not indexed is caught such as
+        escrows left by a prior process."""
         try:
-            self.processEscrowOutOfOrders()
-            self.processEscrowUnverWitness()
-            self.processEscrowUnverNonTrans()
-            self.processEscrowUnverTrans()
-            self.processEscrowPartialDels()
-            self.processEscrowPartialWigs()
-            self.processEscrowPartialSigs()
-            self.processEscrowDuplicitous()
-            self.processQueryNotFound()
+            now = helping.nowUTC()
+            if (self.swept is None or (now - self.swept) >
+                    datetime.timedelta(seconds=self.SweepEscrows)):
+                self.swept = now
+                self.db.wakes.clear()  # full sweep covers all woken escrows
+                with self.preverifyEscrows():
+                    self.processEscrowOutOfOrders()
+                    self.processEscrowUnverWitness()
+                    self.processEscrowUnverNonTrans()
+                    self.processEscrowUnverTrans()
+                    self.processEscrowPartialDels()
+                    self.processEscrowPartialWigs()
+                    self.processEscrowPartialSigs()
+                    self.processEscrowDuplicitous()
+                    self.processQueryNotFound()
+
+            for pre in self.db.expired(now):  # escrows of pre may be stale
+                self.processEscrowOutOfOrders(pre=pre)
+                self.db.wake(pre)  # times out its other escrows
+            self.processWokeEscrows()
 
         except Exception as ex:  # log diagnostics errors etc
             if logger.isEnabledFor(logging.DEBUG):
@@ -6044,13 +6270,106 @@ class Kevery:
                 logger.exception("Kevery other escrow process error: %s\n", ex.args[0])
             raise ex
 
-    def processEscrowOutOfOrders(self):
+    def processWokeEscrows(self):
+        """
+        Process the escrowed entries of each prefix woken in .db.wakes.
+        Out of order escrows are only reprocessed at the sn after the latest
+        accepted event of the prefix. Unescrowing may wake further prefixes or
+        later sns of the same prefix so repeats until no new wakes remain.
+        A prefix woken without an accepted event is only reprocessed once per
+        call so that re-escrow of the same entry may not loop."""
+        done = set()  # (pre, sn) already processed this call
+        with self.preverifyEscrows(pres=()):  # keeps results across passes
+            while True:
+                wakes = [(pre, sn) for pre, sn in self.db.wakes.items()
+                         if (pre, sn) not in done]
+                if not wakes:
+                    break
+                with self.preverifyEscrows(pres={pre for pre, _ in wakes}):
+                    for pre, sn in wakes:
+                        if self.db.wakes.get(pre, sn) == sn:
+                            del self.db.wakes[pre]
+                        done.add((pre, sn))
+                        if sn is not None:
+                            self.processEscrowOutOfOrders(pre=pre, sn=sn + 1)
+                        self.processEscrowUnverWitness(pre=pre)
+                        self.processEscrowUnverNonTrans(pre=pre)
+                        self.processEscrowUnverTrans(pre=pre)
+                        self.processEscrowPartialDels(pre=pre)
+                        self.processEscrowPartialWigs(pre=pre)
+                        self.processEscrowPartialSigs(pre=pre)
+                        self.processEscrowDuplicitous(pre=pre)
+                        self.processQueryNotFound(pre=pre)
+
+    def preverifyEscrows(self, pres=None):
+        """
+        Returns preverify context manager that verifies the signatures given by
+        .escrowTriples of an escrow pass as one batch across its events so that
+        reprocessing each event looks up its verification results. When module
+        VerifyWorkers is not more than one a batch is verified serially anyway
+        so returns a context that does nothing and each event verifies its own.
+
+        Parameters:
+            pres (Iterable[str] | None): qb64 prefixes of woken escrowed
+                entries of pass. None means all escrowed entries.
+        """
+        if VerifyWorkers <= 1:
+            return nullcontext()
+        return preverify(self.escrowTriples(pres=pres))
+
+    def escrowTriples(self, pres=None):
+        """
+        Returns list of (sig, ser, verfer) triples of the controller and
+        witness signatures of the events in the out of order, partial signature
+        and partial witness escrows whose verifiers are known before
+        reprocessing. These are the keys and witnesses of an inception event
+        and the keys of any other establishment event from the event itself
+        and the keys and witnesses of an interaction event from the accepted
+        key state of its prefix. Signatures of other events are verified when
+        their event is reprocessed.
+
+        Parameters:
+            pres (Iterable[str] | None): qb64 prefixes of escrowed entries.
+                None means all escrowed entries.
+        """
+        triples = []
+        for escrow in (self.db.ooes, self.db.pses, self.db.pwes):
+            for keys in ([b''] if pres is None else pres):
+                for pre, sn, edig in escrow.getAllItemIter(keys=keys):
+                    if isinstance(pre, (tuple, list)):
+                        pre = pre[0]
+                    if (serder := self.db.evts.get(keys=(pre, edig))) is None:
+                        continue
+                    verfers = werfers = None
+                    if serder.estive:
+                        verfers = serder.verfers
+                        if serder.ilk in (Ilks.icp, Ilks.dip):
+                            werfers = serder.berfers
+                    elif pre in self.kevers:
+                        kever = self.kevers[pre]
+                        verfers = kever.verfers
+                        werfers = [Verfer(qb64=wit) for wit in kever.wits]
+                    for sigers, vs in ((self.db.sigs.get(keys=(pre, edig)), verfers),
+                                       (self.db.wigs.get(keys=(pre, edig)), werfers)):
+                        if not vs:
+                            continue
+                        triples.extend((siger.raw, serder.raw, vs[siger.index])
+                                       for siger in sigers if siger.index < len(vs))
+        return triples
+
+    def processEscrowOutOfOrders(self, pre=None, sn=None):
         """
         Process events escrowed by Kever that are recieved out-of-order.
         An event is out of order if its prior event has not been accepted into its KEL.
         Without the prior event there is no way to know the key state and therefore no way
         to verify signatures on the out-of-order event.
 
+        Parameters:
+            pre (str|None): qb64 identifier prefix of woken escrowed entries.
+                None means sweep all entries.
+            sn (int|None): sequence number of woken escrowed entries of pre
+                whose prior event was just accepted. None means all sns of pre.
+
         Escrowed items are indexed in database table keyed by prefix and
         sn with duplicates given by different dig inserted in insertion order.
         This allows FIFO processing of events with same prefix and sn but different
@@ -6081,104 +6400,116 @@ class Kevery:
                         Get and Attach Signatures
                         Process event as if it came in over the wire
                         If successful then remove from escrow table"""
-        for pre, sn, edig in self.db.ooes.getAllItemIter():
+        if pre is None:  # sweep all
+            items = self.db.ooes.getAllItemIter()
+        elif sn is None:  # all of woken pre
+            items = self.db.ooes.getAllItemIter(keys=pre)
+        else:  # only at woken sn of pre
+            items = self.db.ooes.getItemIter(keys=pre, on=sn)
+
+        for pre, sn, edig in items:
 
             if isinstance(pre, (tuple, list)):
                 pre = pre[0]
             edig = edig.encode("utf-8")  # convert back to bytes
-            try:
-                dgkey = dgKey(pre, edig)
-                if not (esr := self.db.esrs.get(keys=dgkey)):  # get event source, otherwise error
-                    # no local source so raise ValidationError which unescrows below
-                    # no local source so raise ValidationError which unescrows below
-                    msg = f"OOO Missing escrowed event source at dig = {edig}"
-                    logger.trace("Kevery unescrow error: %s", msg)
-                    raise ValidationError(msg)
+            with self.db.transact():  # accept or re-escrow and unescrow at once
+                try:
+                    dgkey = dgKey(pre, edig)
+                    if not (esr := self.db.esrs.get(keys=dgkey)):  # get event source, otherwise error
+                        # no local source so raise ValidationError which unescrows below
+                        # no local source so raise ValidationError which unescrows below
+                        msg = f"OOO Missing escrowed event source at dig = {edig}"
+                        logger.trace("Kevery unescrow error: %s", msg)
+                        raise ValidationError(msg)
 
-                 # check date if expired then remove escrow.
-                dater = self.db.dtss.get(keys=dgkey)
-                if dater is None:  # no datetime stored
-                    # no date time so raise ValidationError which unescrows below
-                    msg = f"OOO Missing escrowed event datetime at dig = {edig.decode()}"
-                    logger.trace("Kevery unescrow error: %s", msg)
-                    raise ValidationError(msg)
+                     # check date if expired then remove escrow.
+                    dater = self.db.dtss.get(keys=dgkey)
+                    if dater is None:  # no datetime stored
+                        # no date time so raise ValidationError which unescrows below
+                        msg = f"OOO Missing escrowed event datetime at dig = {edig.decode()}"
+                        logger.trace("Kevery unescrow error: %s", msg)
+                        raise ValidationError(msg)
 
-                # do date math here and discard if stale
-                dtnow = helping.nowUTC()
-                dte = dater.datetime
-                if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutOOE):
-                    # escrow stale so raise ValidationError which unescrows below
-                    msg = f"OOO Stale event escrow at dig = {edig.decode()}"
-                    logger.trace("Kevery unescrow error: %s", msg)
-                    raise ValidationError(msg)
+                    # do date math here and discard if stale
+                    dtnow = helping.nowUTC()
+                    dte = dater.datetime
+                    if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutOOE):
+                        # escrow stale so raise ValidationError which unescrows below
+                        msg = f"OOO Stale event escrow at dig = {edig.decode()}"
+                        logger.trace("Kevery unescrow error: %s", msg)
+                        raise ValidationError(msg)
 
-                # get the escrowed event using edig
-                if (eserder := self.db.evts.get(keys=(pre, bytes(edig)))) is None:
-                    # no event so raise ValidationError which unescrows below
-                    msg = f"OOO Missing escrowed event at dig = {edig.decode()}"
-                    logger.trace("Kevery unescrow error: %s", msg)
-                    raise ValidationError(msg)
+                    # get the escrowed event using edig
+                    if (eserder := self.db.evts.get(keys=(pre, bytes(edig)))) is None:
+                        # no event so raise ValidationError which unescrows below
+                        msg = f"OOO Missing escrowed event at dig = {edig.decode()}"
+                        logger.trace("Kevery unescrow error: %s", msg)
+                        raise ValidationError(msg)
 
-                #  get sigs and attach
-                sigers = self.db.sigs.get(keys=(pre, edig))
-                if not sigers:  # otherwise its a list of sigs
-                    # no sigs so raise ValidationError which unescrows below
-                    msg = f"OOO Missing escrowed event sigs at dig = {edig.decode()}"
-                    logger.trace("Kevery unescrow error: %s", msg)
-                    raise ValidationError(msg)
+                    #  get sigs and attach
+                    sigers = self.db.sigs.get(keys=(pre, edig))
+                    if not sigers:  # otherwise its a list of sigs
+                        # no sigs so raise ValidationError which unescrows below
+                        msg = f"OOO Missing escrowed event sigs at dig = {edig.decode()}"
+                        logger.trace("Kevery unescrow error: %s", msg)
+                        raise ValidationError(msg)
 
-                # process event
-                sigers = self.db.sigs.get(keys=(pre, edig))
-
-                #  get wigers
-                wigers = self.db.wigs.get(keys=(pre, bytes(edig)))
-                self.processEvent(serder=eserder, sigers=sigers, wigers=wigers, local=esr.local)
-
-                # If process does NOT validate event with sigs, becasue it is
-                # still out of order then process will attempt to re-escrow
-                # and then raise OutOfOrderError (subclass of ValidationError)
-                # so we can distinquish between ValidationErrors that are
-                # re-escrow vs non re-escrow. We want process to be idempotent
-                # with respect to processing events that result in escrow items.
-                # On re-escrow attempt by process, Ooe escrow is called by
-                # Kevery.self.escrowOOEvent Which calls
-                # self.db.ooes.addOn(pre, sn, serder.digb)
-                # which in turn will not enter dig as dup if one already exists.
-                # So re-escrow attempt will not change the escrowed ooe db.
-                # Non re-escrow ValidationError means some other issue so unescrow.
-                # No error at all means processed successfully so also unescrow.
-
-            except OutOfOrderError as ex:
-                # still waiting on missing prior event to validate
-                if logger.isEnabledFor(logging.TRACE):
-                    logger.trace("Kevery OOO escrow unescrow failed: %s\n", ex.args[0])
-                    logger.exception("Kevery OOO escrow unescrow failed: %s\n", ex.args[0])
+                    # process event
+                    sigers = self.db.sigs.get(keys=(pre, edig))
 
-            except Exception as ex:  # log diagnostics errors etc
-                # error other than out of order so remove from OO escrow
-                self.db.ooes.rem(keys=pre, on=sn, val=edig)  # removes one escrow at key val
-                if logger.isEnabledFor(logging.DEBUG):
-                    logger.debug("Kevery: OOO escrow other error on escrow: %s\n", ex.args[0])
-                    logger.exception("Kevery: OOO escrow other error on : %s\n", ex.args[0])
+                    #  get wigers
+                    wigers = self.db.wigs.get(keys=(pre, bytes(edig)))
+                    self.processEvent(serder=eserder, sigers=sigers, wigers=wigers, local=esr.local)
 
-            else:  # unescrow succeeded, remove from escrow
-                # We don't remove all escrows at pre,sn because some might be
-                # duplicitous so we process remaining escrows in spite of found
-                # valid event escrow.
-                self.db.ooes.rem(keys=pre, on=sn, val=edig)  # removes one escrow at key val
-                logger.info("Kevery OOO unescrow succeeded in valid event: "
-                            "event=%s", eserder.said)
-                logger.debug("Event=\n%s\n", eserder.pretty())
+                    # If process does NOT validate event with sigs, becasue it is
+                    # still out of order then process will attempt to re-escrow
+                    # and then raise OutOfOrderError (subclass of ValidationError)
+                    # so we can distinquish between ValidationErrors that are
+                    # re-escrow vs non re-escrow. We want process to be idempotent
+                    # with respect to processing events that result in escrow items.
+                    # On re-escrow attempt by process, Ooe escrow is called by
+                    # Kevery.self.escrowOOEvent Which calls
+                    # self.db.ooes.addOn(pre, sn, serder.digb)
+                    # which in turn will not enter dig as dup if one already exists.
+                    # So re-escrow attempt will not change the escrowed ooe db.
+                    # Non re-escrow ValidationError means some other issue so unescrow.
+                    # No error at all means processed successfully so also unescrow.
 
+                except OutOfOrderError as ex:
+                    # still waiting on missing prior event to validate
+                    if logger.isEnabledFor(logging.TRACE):
+                        logger.trace("Kevery OOO escrow unescrow failed: %s\n", ex.args[0])
+                        logger.exception("Kevery OOO escrow unescrow failed: %s\n", ex.args[0])
+                    self.db.expire(pre, dater, self.TimeoutOOE)  # still escrowed
 
-    def processEscrowPartialSigs(self):
-        """
-        Process events escrowed by Kever that were only partially fulfilled,
-        either due to missing signatures or missing dependent events like a
-        delegating event.  But event has at least one verified signature.
+                except lmdb.MapFullError:
+                    raise  # rolled back so stays escrowed until map grown
 
-        Escrowed items are indexed in database table keyed by prefix and
-        sequence number with duplicates inserted in insertion order. This allows
+                except Exception as ex:  # log diagnostics errors etc
+                    # error other than out of order so remove from OO escrow
+                    self.db.ooes.rem(keys=pre, on=sn, val=edig)  # removes one escrow at key val
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Kevery: OOO escrow other error on escrow: %s\n", ex.args[0])
+                        logger.exception("Kevery: OOO escrow other error on : %s\n", ex.args[0])
+
+                else:  # unescrow succeeded, remove from escrow
+                    # We don't remove all escrows at pre,sn because some might be
+                    # duplicitous so we process remaining escrows in spite of found
+                    # valid event escrow.
+                    self.db.ooes.rem(keys=pre, on=sn, val=edig)  # removes one escrow at key val
+                    logger.info("Kevery OOO unescrow succeeded in valid event: "
+                                "event=%s", eserder.said)
+                    logger.debug("Event=\n%s\n", eserder.pretty())
+
+
+    def processEscrowPartialSigs(self, pre=None):
+        """
+        Process events escrowed by Kever that were only partially fulfilled,
+        either due to missing signatures or missing dependent events like a
+        delegating event.  But event has at least one verified signature.
+
+        Escrowed items are indexed in database table keyed by prefix and
+        sequence number with duplicates inserted in insertion order. This allows
         FIFO processing of events with same prefix and sn.
         Uses  .db.pses.addOn(pre, sn, val) which is OnIoVal with dups.
 
@@ -6196,6 +6527,10 @@ class Kevery:
                 pre is str qb64 of identifier prefix of event
                 sn is int sequence number of event
 
+        Parameters:
+            pre (str|None): qb64 identifier prefix of woken escrowed entries.
+                None means sweep all entries.
+
         Steps:
             Each pass  (walk index table)
                 For each prefix,sn
@@ -6207,125 +6542,130 @@ class Kevery:
 
         #key = ekey = b''  # both start same. when not same means escrows found
         #while True:  # break when done
-        for pre, sn, edig in self.db.pses.getAllItemIter():
+        for pre, sn, edig in self.db.pses.getAllItemIter(keys=pre if pre else b''):
             eserder = None
-            try:
-                if isinstance(pre, (tuple, list)):
-                    pre = pre[0]
-                edig = edig.encode("utf-8") # convert back to bytes
-                dgkey = dgKey(pre, edig)
-                if not (esr := self.db.esrs.get(keys=dgkey)):  # get event source, otherwise error
-                    # no local source so raise ValidationError which unescrows below
-                    msg = f"PSE Missing escrowed event source at dig = {edig.decode()}"
-                    logger.info("Kevery unescrow error: %s", msg)
-                    raise ValidationError(msg)
+            with self.db.transact():  # accept or re-escrow and unescrow at once
+                try:
+                    if isinstance(pre, (tuple, list)):
+                        pre = pre[0]
+                    edig = edig.encode("utf-8") # convert back to bytes
+                    dgkey = dgKey(pre, edig)
+                    if not (esr := self.db.esrs.get(keys=dgkey)):  # get event source, otherwise error
+                        # no local source so raise ValidationError which unescrows below
+                        msg = f"PSE Missing escrowed event source at dig = {edig.decode()}"
+                        logger.info("Kevery unescrow error: %s", msg)
+                        raise ValidationError(msg)
 
-                # check date if expired then remove escrow.
-                dater = self.db.dtss.get(keys=dgkey)
-                if dater is None:  # no datetime stored
-                    # no date time so raise ValidationError which unescrows below
-                    msg = f"PSE Missing escrowed event datetime at dig = {edig.decode()}"
-                    logger.trace("Kevery unescrow error: %s", msg)
-                    raise ValidationError(msg)
+                    # check date if expired then remove escrow.
+                    dater = self.db.dtss.get(keys=dgkey)
+                    if dater is None:  # no datetime stored
+                        # no date time so raise ValidationError which unescrows below
+                        msg = f"PSE Missing escrowed event datetime at dig = {edig.decode()}"
+                        logger.trace("Kevery unescrow error: %s", msg)
+                        raise ValidationError(msg)
 
-                # do date math here and discard if stale
-                dtnow = helping.nowUTC()
-                dte = dater.datetime
-                if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutPSE):
-                    # escrow stale so raise ValidationError which unescrows below
-                    msg = f"PSE Stale event escrow at dig = {edig.decode()}"
-                    logger.trace("Kevery unescrow error: %s", msg)
-                    raise ValidationError(msg)
+                    # do date math here and discard if stale
+                    dtnow = helping.nowUTC()
+                    dte = dater.datetime
+                    if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutPSE):
+                        # escrow stale so raise ValidationError which unescrows below
+                        msg = f"PSE Stale event escrow at dig = {edig.decode()}"
+                        logger.trace("Kevery unescrow error: %s", msg)
+                        raise ValidationError(msg)
 
-                # get the escrowed event using edig
-                if (eserder := self.db.evts.get(keys=(pre, bytes(edig)))) is None:
-                    # no event so so raise ValidationError which unescrows below
-                    msg = f"PSE Missing escrowed evt at dig = {edig.decode()}"
-                    logger.trace("Kevery unescrow error: %s", msg)
-                    raise ValidationError(msg)
-                #  get sigs and attach
-                sigers = self.db.sigs.get(keys=(pre, edig))
-                if not sigers:  # otherwise its a list of sigs
-                    # no sigs so raise ValidationError which unescrows below
-                    msg = f"PSE Missing escrowed evt sigs at dig = {edig.decode()}"
-                    logger.trace("Kevery unescrow error: %s", msg)
-                    raise ValidationError(msg)
-                wigers = self.db.wigs.get(keys=(pre, bytes(edig)))
-                if not wigers:  # empty list wigs witness sigs not wits
-                    # wigs maybe empty  if not wits or if wits while waiting
-                    # for first witness signature
-                    # which may not arrive until some time after event is fully signed
-                    # so just log for debugging but do not unescrow by raising
-                    # ValidationError
-                    logger.debug("Kevery unescrow wigs: No event wigs yet at."
-                                 "dig = %s", edig.decode())
-
-                # seal source couple (sequence number, said diger) of delegator/issuer if any
-                sner, sger = None, None
-                if (couple := self.db.udes.get(keys=dgkey)):
-                    sner, sger = couple
-
-                # process event
-                sigers = self.db.sigs.get(keys=(pre, edig))
-                self.processEvent(serder=eserder, sigers=sigers, wigers=wigers,
-                                  delsner=sner,
-                                  delsger=sger,
-                                  eager=True, local=esr.local)
-
-                # If process does NOT validate sigs or delegation seal (when delegated),
-                # but there is still one valid signature then process will
-                # attempt to re-escrow and then raise MissingSignatureError
-                # or MissingDelegationSealError (subclass of ValidationError)
-                # so we can distinquish between ValidationErrors that are
-                # re-escrow vs non re-escrow. We want process to be idempotent
-                # with respect to processing events that result in escrow items.
-                # On re-escrow attempt by process, Pse escrow is called by
-                # Kever.self.escrowPSEvent Which calls
-                # self.db.pses.addOn(pre, sn, serder.digb)
-                # which in turn will not enter dig as dup if one already exists.
-                # So re-escrow attempt will not change the escrowed pse db.
-                # Non re-escrow ValidationError means some other issue so unescrow.
-                # No error at all means processed successfully so also unescrow.
-
-            except MissingSignatureError  as ex:  # MissingDelegationError)
-                # still waiting on missing sigs or missing seal to validate
-                # processEvent idempotently reescrowed
-                if logger.isEnabledFor(logging.TRACE):
-                    logger.trace("Kevery: PSE unescrow failed: %s\n", ex.args[0])
-                    logger.exception("Kevery: PSE unescrow failed: %s\n", ex.args[0])
+                    # get the escrowed event using edig
+                    if (eserder := self.db.evts.get(keys=(pre, bytes(edig)))) is None:
+                        # no event so so raise ValidationError which unescrows below
+                        msg = f"PSE Missing escrowed evt at dig = {edig.decode()}"
+                        logger.trace("Kevery unescrow error: %s", msg)
+                        raise ValidationError(msg)
+                    #  get sigs and attach
+                    sigers = self.db.sigs.get(keys=(pre, edig))
+                    if not sigers:  # otherwise its a list of sigs
+                        # no sigs so raise ValidationError which unescrows below
+                        msg = f"PSE Missing escrowed evt sigs at dig = {edig.decode()}"
+                        logger.trace("Kevery unescrow error: %s", msg)
+                        raise ValidationError(msg)
+                    wigers = self.db.wigs.get(keys=(pre, bytes(edig)))
+                    if not wigers:  # empty list wigs witness sigs not wits
+                        # wigs maybe empty  if not wits or if wits while waiting
+                        # for first witness signature
+                        # which may not arrive until some time after event is fully signed
+                        # so just log for debugging but do not unescrow by raising
+                        # ValidationError
+                        logger.debug("Kevery unescrow wigs: No event wigs yet at."
+                                     "dig = %s", edig.decode())
+
+                    # seal source couple (sequence number, said diger) of delegator/issuer if any
+                    sner, sger = None, None
+                    if (couple := self.db.udes.get(keys=dgkey)):
+                        sner, sger = couple
 
-            except Exception as ex:  # log diagnostics errors etc
-                # error other than waiting on sigs  so remove from escrow
-                self.db.pses.rem(keys=pre, on=sn, val=edig)  # removes one escrow at key val
-                #self.db.udes.rem(keys=dgkey)  # leave here since could PartialDelegationEscrow
+                    # process event
+                    sigers = self.db.sigs.get(keys=(pre, edig))
+                    self.processEvent(serder=eserder, sigers=sigers, wigers=wigers,
+                                      delsner=sner,
+                                      delsger=sger,
+                                      eager=True, local=esr.local)
+
+                    # If process does NOT validate sigs or delegation seal (when delegated),
+                    # but there is still one valid signature then process will
+                    # attempt to re-escrow and then raise MissingSignatureError
+                    # or MissingDelegationSealError (subclass of ValidationError)
+                    # so we can distinquish between ValidationErrors that are
+                    # re-escrow vs non re-escrow. We want process to be idempotent
+                    # with respect to processing events that result in escrow items.
+                    # On re-escrow attempt by process, Pse escrow is called by
+                    # Kever.self.escrowPSEvent Which calls
+                    # self.db.pses.addOn(pre, sn, serder.digb)
+                    # which in turn will not enter dig as dup if one already exists.
+                    # So re-escrow attempt will not change the escrowed pse db.
+                    # Non re-escrow ValidationError means some other issue so unescrow.
+                    # No error at all means processed successfully so also unescrow.
+
+                except MissingSignatureError  as ex:  # MissingDelegationError)
+                    # still waiting on missing sigs or missing seal to validate
+                    # processEvent idempotently reescrowed
+                    if logger.isEnabledFor(logging.TRACE):
+                        logger.trace("Kevery: PSE unescrow failed: %s\n", ex.args[0])
+                        logger.exception("Kevery: PSE unescrow failed: %s\n", ex.args[0])
+                    self.db.expire(pre, dater, self.TimeoutPSE)  # still escrowed
+
+                except lmdb.MapFullError:
+                    raise  # rolled back so stays escrowed until map grown
 
-                if eserder is not None and eserder.ked["t"] in (Ilks.dip, Ilks.drt,):
-                    self.cues.push(dict(kin="psUnescrow", serder=eserder))
+                except Exception as ex:  # log diagnostics errors etc
+                    # error other than waiting on sigs  so remove from escrow
+                    self.db.pses.rem(keys=pre, on=sn, val=edig)  # removes one escrow at key val
+                    #self.db.udes.rem(keys=dgkey)  # leave here since could PartialDelegationEscrow
+
+                    if eserder is not None and eserder.ked["t"] in (Ilks.dip, Ilks.drt,):
+                        self.cues.push(dict(kin="psUnescrow", serder=eserder))
 
-                if logger.isEnabledFor(logging.DEBUG):
-                    logger.trace("Kevery: PSE other error on unescrow: %s\n",
-                                 ex.args[0])
-                    logger.exception("Kevery: PSE other error on unescrow: %s\n",
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.trace("Kevery: PSE other error on unescrow: %s\n",
                                      ex.args[0])
+                        logger.exception("Kevery: PSE other error on unescrow: %s\n",
+                                         ex.args[0])
 
-            else:  # unescrow succeeded, remove from escrow
-                # We don't remove all escrows at pre,sn because some might be
-                # duplicitous so we process remaining escrows in spite of found
-                # valid event escrow.
-                self.db.pses.rem(keys=pre, on=sn, val=edig)  # removes one escrow at key val
-                self.db.udes.rem(keys=dgkey)  # remove escrow if any
+                else:  # unescrow succeeded, remove from escrow
+                    # We don't remove all escrows at pre,sn because some might be
+                    # duplicitous so we process remaining escrows in spite of found
+                    # valid event escrow.
+                    self.db.pses.rem(keys=pre, on=sn, val=edig)  # removes one escrow at key val
+                    self.db.udes.rem(keys=dgkey)  # remove escrow if any
 
-                if eserder is not None and eserder.ked["t"] in (Ilks.dip, Ilks.drt,):
-                    self.cues.push(dict(kin="psUnescrow", serder=eserder))
+                    if eserder is not None and eserder.ked["t"] in (Ilks.dip, Ilks.drt,):
+                        self.cues.push(dict(kin="psUnescrow", serder=eserder))
 
-                logger.info("Kevery: PSE unescrow succeeded in valid event event= %s", eserder.said)
-                logger.debug(f"Event=\n%s\n", eserder.pretty())
+                    logger.info("Kevery: PSE unescrow succeeded in valid event event= %s", eserder.said)
+                    logger.debug(f"Event=\n%s\n", eserder.pretty())
 
-            #if ekey == key:  # still same so no escrows found on last while iteration
-                #break
-            #key = ekey  # setup next while iteration, with key after ekey
+                #if ekey == key:  # still same so no escrows found on last while iteration
+                    #break
+                #key = ekey  # setup next while iteration, with key after ekey
 
-    def processEscrowPartialWigs(self):
+    def processEscrowPartialWigs(self, pre=None):
         """
         Process events escrowed by Kever that were only partially fulfilled
         due to missing signatures from witnesses. Events only make into this
@@ -6351,6 +6691,10 @@ class Kevery:
                 pre is str qb64 of identifier prefix of event
                 sn is int sequence number of event
 
+        Parameters:
+            pre (str|None): qb64 identifier prefix of woken escrowed entries.
+                None means sweep all entries.
+
         Steps:
             Each pass  (walk index table)
                 For each prefix,sn
@@ -6360,122 +6704,127 @@ class Kevery:
                         Get and Attach Witness Signatures
                         Process event as if it came in over the wire
                         If successful then remove from escrow table"""
-        for pre, sn, edig in self.db.pwes.getAllItemIter(keys=b''):
-            try:
-                if isinstance(pre, (tuple, list)):
-                    pre = pre[0]
-                edig = edig.encode("utf-8")
-                dgkey = dgKey(pre, edig)
-                if not (esr := self.db.esrs.get(keys=dgkey)):  # get event source, otherwise error
-                    # no local source so raise ValidationError which unescrows below
-                    msg = f"PWE Missing escrowed event source at dig = {edig.decode()}"
-                    logger.info("Kevery unescrow error: %s", msg)
-                    raise ValidationError(msg)
+        for pre, sn, edig in self.db.pwes.getAllItemIter(keys=pre if pre else b''):
+            with self.db.transact():  # accept or re-escrow and unescrow at once
+                try:
+                    if isinstance(pre, (tuple, list)):
+                        pre = pre[0]
+                    edig = edig.encode("utf-8")
+                    dgkey = dgKey(pre, edig)
+                    if not (esr := self.db.esrs.get(keys=dgkey)):  # get event source, otherwise error
+                        # no local source so raise ValidationError which unescrows below
+                        msg = f"PWE Missing escrowed event source at dig = {edig.decode()}"
+                        logger.info("Kevery unescrow error: %s", msg)
+                        raise ValidationError(msg)
 
-                # check date if expired then remove escrow.
-                dater = self.db.dtss.get(keys=dgkey)
-                if dater is None:  # no datetime stored
-                    # no date time so raise ValidationError which unescrows below
-                    msg = f"PWE Missing escrowed event datetime at dig = {edig.decode()}"
-                    logger.trace("Kevery unescrow error: %s", msg)
-                    raise ValidationError(msg)
+                    # check date if expired then remove escrow.
+                    dater = self.db.dtss.get(keys=dgkey)
+                    if dater is None:  # no datetime stored
+                        # no date time so raise ValidationError which unescrows below
+                        msg = f"PWE Missing escrowed event datetime at dig = {edig.decode()}"
+                        logger.trace("Kevery unescrow error: %s", msg)
+                        raise ValidationError(msg)
 
-                # do date math here and discard if stale
-                dtnow = helping.nowUTC()
-                dte = dater.datetime
-                if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutPWE):
-                    # escrow stale so raise ValidationError which unescrows below
-                    msg = f"PWE Stale event escrow at dig = {edig.decode()}"
-                    logger.trace("Kevery unescrow error: %s", msg)
-                    raise ValidationError(msg)
+                    # do date math here and discard if stale
+                    dtnow = helping.nowUTC()
+                    dte = dater.datetime
+                    if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutPWE):
+                        # escrow stale so raise ValidationError which unescrows below
+                        msg = f"PWE Stale event escrow at dig = {edig.decode()}"
+                        logger.trace("Kevery unescrow error: %s", msg)
+                        raise ValidationError(msg)
 
-                # get the escrowed event using edig
-                if (eserder := self.db.evts.get((pre, bytes(edig)))) is None:
-                    # no event so so raise ValidationError which unescrows below
-                    msg = f"PWE Missing escrowed evt at dig = {edig.decode()}"
-                    logger.trace("Kevery unescrow error: %s", msg)
-                    raise ValidationError(msg)
+                    # get the escrowed event using edig
+                    if (eserder := self.db.evts.get((pre, bytes(edig)))) is None:
+                        # no event so so raise ValidationError which unescrows below
+                        msg = f"PWE Missing escrowed evt at dig = {edig.decode()}"
+                        logger.trace("Kevery unescrow error: %s", msg)
+                        raise ValidationError(msg)
 
-                #  get sigs
-                sigers = self.db.sigs.get(keys=(pre, edig))  # list of sigs
-                if not sigers:  # empty list
-                    # no sigs so raise ValidationError which unescrows below
-                    msg = f"PWE Missing escrowed evt sigs at dig = {edig.decode()}"
-                    logger.trace("Kevery unescrow error: %s", msg)
-                    raise ValidationError(msg)
+                    #  get sigs
+                    sigers = self.db.sigs.get(keys=(pre, edig))  # list of sigs
+                    if not sigers:  # empty list
+                        # no sigs so raise ValidationError which unescrows below
+                        msg = f"PWE Missing escrowed evt sigs at dig = {edig.decode()}"
+                        logger.trace("Kevery unescrow error: %s", msg)
+                        raise ValidationError(msg)
 
-                #  get witness signatures (wigs not wits)
-                wigers = self.db.wigs.get(keys=(pre, bytes(edig)))
-
-                if not wigers:  # empty list
-                    # wigs maybe empty if not wits or if wits while waiting
-                    # for first witness signature
-                    # which may not arrive until some time after event is fully signed
-                    # so just log for debugging but do not unescrow by raising
-                    # ValidationError
-                    logger.debug("Kevery: PWE unescrow wigs: No event wigs yet at."
-                                 "dig = %s", edig.decode())
-
-                    # raise ValidationError("Missing escrowed evt wigs at "
-                    # "dig = {}.".format(bytes(edig)))
-
-                # process event
-                sigers = self.db.sigs.get(keys=(pre, edig))
-
-                # seal source couple (sequence number, said diger) of delegator/issuer if any
-                sner = sger = None
-                if (couple := self.db.udes.get(keys=(pre, bytes(edig)))):
-                    sner, sger = couple
-
-                self.processEvent(serder=eserder, sigers=sigers, wigers=wigers,
-                                  delsner=sner,
-                                  delsger=sger,
-                                  eager=True, local=esr.local)
-
-                # If process does NOT validate wigs then process will attempt
-                # to re-escrow and then raise MissingWitnessSignatureError
-                # (subclass of ValidationError)
-                # so we can distinquish between ValidationErrors that are
-                # re-escrow vs non re-escrow. We want process to be idempotent
-                # with respect to processing events that result in escrow items.
-                # On re-escrow attempt by process, Pwe escrow is called by
-                # Kever.self.escrowPWEvent Which calls
-                # self.db.pwes.addOn(pre, sn, serder.digb)
-                # which in turn will NOT enter dig as dup if one already exists.
-                # So re-escrow attempt will not change the escrowed pwe db.
-                # Non re-escrow ValidationError means some other issue so unescrow.
-                # No error at all means processed successfully so also unescrow.
-                # Assumes that controller signature validation and delegation
-                # validation will be successful as event would not be in
-                # partially witnessed escrow unless they had already validated
-
-            except MissingWitnessSignatureError as ex:  # MissingDelegationError
-                # still waiting on missing witness sigs or delegation
-                # processEvent idempotently reescrowed
-                if logger.isEnabledFor(logging.TRACE):
-                    logger.trace("Kevery: PWE unescrow failed: %s\n", ex.args[0])
-                    logger.exception("Kevery: PWE unescrow failed: %s\n", ex.args[0])
+                    #  get witness signatures (wigs not wits)
+                    wigers = self.db.wigs.get(keys=(pre, bytes(edig)))
 
-            except Exception as ex:  # log diagnostics errors etc
-                # error other than waiting on wigs so remove from escrow
-                self.db.pwes.rem(keys=pre, on=sn, val=edig)  # removes one escrow at key val
-                #self.db.udes.rem(keys=dgkey)  # leave here since could PartialDelegationEscrow
-                if logger.isEnabledFor(logging.TRACE):
-                    logger.trace("Kevery: PWE other error on unescrow: %s\n", ex.args[0])
-                    logger.exception("Kevery: PWE other error unescrow: %s\n", ex.args[0])
+                    if not wigers:  # empty list
+                        # wigs maybe empty if not wits or if wits while waiting
+                        # for first witness signature
+                        # which may not arrive until some time after event is fully signed
+                        # so just log for debugging but do not unescrow by raising
+                        # ValidationError
+                        logger.debug("Kevery: PWE unescrow wigs: No event wigs yet at."
+                                     "dig = %s", edig.decode())
 
-            else:  # unescrow succeeded, remove from escrow
-                # We don't remove all escrows at pre,sn because some might be
-                # duplicitous so we process remaining escrows in spite of found
-                # valid event escrow.
-                self.db.pwes.rem(keys=pre, on=sn, val=edig)  # removes one escrow at key val
-                self.db.udes.rem(keys=dgkey)  # remove escrow if any
-                logger.info("Kevery: PWE unescrow succeeded in valid event: key = %s \tdigest = %s",
-                           pre, sn, edig.decode())
-                logger.debug("Event=\n%s\n", eserder.pretty())
+                        # raise ValidationError("Missing escrowed evt wigs at "
+                        # "dig = {}.".format(bytes(edig)))
+
+                    # process event
+                    sigers = self.db.sigs.get(keys=(pre, edig))
+
+                    # seal source couple (sequence number, said diger) of delegator/issuer if any
+                    sner = sger = None
+                    if (couple := self.db.udes.get(keys=(pre, bytes(edig)))):
+                        sner, sger = couple
+
+                    self.processEvent(serder=eserder, sigers=sigers, wigers=wigers,
+                                      delsner=sner,
+                                      delsger=sger,
+                                      eager=True, local=esr.local)
+
+                    # If process does NOT validate wigs then process will attempt
+                    # to re-escrow and then raise MissingWitnessSignatureError
+                    # (subclass of ValidationError)
+                    # so we can distinquish between ValidationErrors that are
+                    # re-escrow vs non re-escrow. We want process to be idempotent
+                    # with respect to processing events that result in escrow items.
+                    # On re-escrow attempt by process, Pwe escrow is called by
+                    # Kever.self.escrowPWEvent Which calls
+                    # self.db.pwes.addOn(pre, sn, serder.digb)
+                    # which in turn will NOT enter dig as dup if one already exists.
+                    # So re-escrow attempt will not change the escrowed pwe db.
+                    # Non re-escrow ValidationError means some other issue so unescrow.
+                    # No error at all means processed successfully so also unescrow.
+                    # Assumes that controller signature validation and delegation
+                    # validation will be successful as event would not be in
+                    # partially witnessed escrow unless they had already validated
+
+                except MissingWitnessSignatureError as ex:  # MissingDelegationError
+                    # still waiting on missing witness sigs or delegation
+                    # processEvent idempotently reescrowed
+                    if logger.isEnabledFor(logging.TRACE):
+                        logger.trace("Kevery: PWE unescrow failed: %s\n", ex.args[0])
+                        logger.exception("Kevery: PWE unescrow failed: %s\n", ex.args[0])
+                    self.db.expire(pre, dater, self.TimeoutPWE)  # still escrowed
+
+                except lmdb.MapFullError:
+                    raise  # rolled back so stays escrowed until map grown
+
+                except Exception as ex:  # log diagnostics errors etc
+                    # error other than waiting on wigs so remove from escrow
+                    self.db.pwes.rem(keys=pre, on=sn, val=edig)  # removes one escrow at key val
+                    #self.db.udes.rem(keys=dgkey)  # leave here since could PartialDelegationEscrow
+                    if logger.isEnabledFor(logging.TRACE):
+                        logger.trace("Kevery: PWE other error on unescrow: %s\n", ex.args[0])
+                        logger.exception("Kevery: PWE other error unescrow: %s\n", ex.args[0])
+
+                else:  # unescrow succeeded, remove from escrow
+                    # We don't remove all escrows at pre,sn because some might be
+                    # duplicitous so we process remaining escrows in spite of found
+                    # valid event escrow.
+                    self.db.pwes.rem(keys=pre, on=sn, val=edig)  # removes one escrow at key val
+                    self.db.udes.rem(keys=dgkey)  # remove escrow if any
+                    logger.info("Kevery: PWE unescrow succeeded in valid event: key = %s \tdigest = %s",
+                               pre, sn, edig.decode())
+                    logger.debug("Event=\n%s\n", eserder.pretty())
 
 
-    def processEscrowPartialDels(self):
+    def processEscrowPartialDels(self, pre=None):
         """
         Process delgated events escrowed by Kever that were only partially fulfilled
         due to missing or unverified delegation seals from delegators.
@@ -6491,6 +6840,10 @@ class Kevery:
         Value in each .pdes entry is dgkey (SAID) of event stored in db.evts where
         db.evts holds SerderKERI.raw of event.
 
+        Parameters:
+            pre (str|None): qb64 identifier prefix of woken escrowed entries.
+                None means sweep all entries.
+
         Steps:
             Each pass  (walk index table)
                 For each prefix,sn
@@ -6501,137 +6854,142 @@ class Kevery:
                         Process event as if it came in over the wire
                         If successful then remove from escrow table"""
 
-        for (epre,), esn, edig in self.db.pdes.getAllItemIter(keys=b''):
-            try:
-                dgkey = dgKey(epre, edig)
-                if not (esr := self.db.esrs.get(keys=dgkey)):  # get event source, otherwise error
-                    # no local source so raise ValidationError which unescrows below
-                    msg = f"PDE Missing escrowed event source at dig = {edig}"
-                    logger.info("Kevery unescrow error: %s", msg)
-                    raise ValidationError(msg)
+        for (epre,), esn, edig in self.db.pdes.getAllItemIter(keys=pre if pre else b''):
+            with self.db.transact():  # accept or re-escrow and unescrow at once
+                try:
+                    dgkey = dgKey(epre, edig)
+                    if not (esr := self.db.esrs.get(keys=dgkey)):  # get event source, otherwise error
+                        # no local source so raise ValidationError which unescrows below
+                        msg = f"PDE Missing escrowed event source at dig = {edig}"
+                        logger.info("Kevery unescrow error: %s", msg)
+                        raise ValidationError(msg)
 
-                # check date if expired then remove escrow.
-                dater = self.db.dtss.get(keys=dgkey)
-                if dater is None:  # no datetime stored
-                    # no date time so raise ValidationError which unescrows below
-                    msg = f"PDE Missing escrowed event datetime at dig = {edig}"
-                    logger.info("Kevery unescrow error: %s", msg)
-                    raise ValidationError(msg)
+                    # check date if expired then remove escrow.
+                    dater = self.db.dtss.get(keys=dgkey)
+                    if dater is None:  # no datetime stored
+                        # no date time so raise ValidationError which unescrows below
+                        msg = f"PDE Missing escrowed event datetime at dig = {edig}"
+                        logger.info("Kevery unescrow error: %s", msg)
+                        raise ValidationError(msg)
 
-                # do date math here and discard if stale
-                dtnow = helping.nowUTC()
-                dte = dater.datetime
-                if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutPWE):
-                    # escrow stale so raise ValidationError which unescrows below
-                    msg = f"PDE Stale event escrow at dig = {edig}"
-                    logger.info("Kevery unescrow error: %s", msg)
-                    raise ValidationError(msg)
+                    # do date math here and discard if stale
+                    dtnow = helping.nowUTC()
+                    dte = dater.datetime
+                    if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutPWE):
+                        # escrow stale so raise ValidationError which unescrows below
+                        msg = f"PDE Stale event escrow at dig = {edig}"
+                        logger.info("Kevery unescrow error: %s", msg)
+                        raise ValidationError(msg)
 
-                # get the escrowed event using edig
-                if (eserder := self.db.evts.get(keys=(epre, edig))) is None:
-                    # no event so so raise ValidationError which unescrows below
-                    msg = f"PDE Missing escrowed evt at dig = {edig}"
-                    logger.info("Kevery unescrow error: %s", msg)
-                    raise ValidationError(msg)
+                    # get the escrowed event using edig
+                    if (eserder := self.db.evts.get(keys=(epre, edig))) is None:
+                        # no event so so raise ValidationError which unescrows below
+                        msg = f"PDE Missing escrowed evt at dig = {edig}"
+                        logger.info("Kevery unescrow error: %s", msg)
+                        raise ValidationError(msg)
 
-                #  get sigs
-                sigers = self.db.sigs.get(keys=dgkey)  # list of sigs
-                if not sigers:  # empty list
-                    # no sigs so raise ValidationError which unescrows below
-                    msg = f"PDE Missing escrowed evt sigs at dig = {edig}"
-                    logger.info("Kevery unescrow error: %s", edig)
-                    raise ValidationError(msg)
+                    #  get sigs
+                    sigers = self.db.sigs.get(keys=dgkey)  # list of sigs
+                    if not sigers:  # empty list
+                        # no sigs so raise ValidationError which unescrows below
+                        msg = f"PDE Missing escrowed evt sigs at dig = {edig}"
+                        logger.info("Kevery unescrow error: %s", edig)
+                        raise ValidationError(msg)
 
-                # get witness signatures (wigs not wits) assumes wont be in this
-                # escrow if wigs not needed because no wits
-                wigers = self.db.wigs.get(keys=dgkey)  # list of wigs if any
-                # may want to checks wits and wigs here. We are assuming that
-                # never get to this escrow if wits and not wigs
-                #if wits and not wigers:  # non empty wits but empty wigs
-                    ## wigs maybe empty  if not wits or if wits while waiting
-                    ## for first witness signature
-                    ## which may not arrive until some time after event is fully signed
-                    ## so just log for debugging but do not unescrow by raising
-                    ## ValidationError
-                    #logger.info("Kevery unescrow error: Missing event wigs at."
-                                #"dig = %s", bytes(edig))
-
-                    #raise ValidationError("Missing escrowed evt wigs at "
-                                          #"dig = {}.".format(bytes(edig)))
-
-                # setup parameters to process event
-                sigers = self.db.sigs.get(keys=dgkey)
-
-                # seal source couple (sequence number, said diger) of delegator/issuer if any
-                # If delegator KEL not available should also cue a trigger to
-                # get it if still missing when processing escrow.
-                sner = sger = None
-                if (couple := self.db.udes.get(keys=(epre, edig))):
-                    sner, sger = couple  # provided
-
-                #elif eserder.ked["t"] in (Ilks.dip, Ilks.drt,): # walk kel to find
-                    #if eserder.pre in self.kevers:
-                        #delpre = self.kevers[eserder.pre].delpre
-                    #else:
-                        #delpre = eserder.ked["di"]
-                    #seal = dict(i=eserder.ked["i"], s=eserder.snh, d=eserder.said)
-                    #srdr = self.db.findAnchoringSealEvent(pre=delpre, seal=seal)
-                    #if srdr is not None:  # found seal in srdr
-                        #number = Number(sn=srdr.sn)
-                        #diger = Diger(qb64=srdr.said)
-                        #self.db.udes.put(keys=dgkey, val=(number, diger))
-
-                self.processEvent(serder=eserder, sigers=sigers, wigers=wigers,
-                                  delsner=sner,
-                                  delsger=sger,
-                                  eager=True, local=esr.local)
-
-                # If process does NOT validate delegation then process will attempt
-                # to re-escrow and then raise MissingDelegationError
-                # (subclass of ValidationError)
-                # so we can distinquish between ValidationErrors that are
-                # re-escrow vs non re-escrow. We want process to be idempotent
-                # with respect to processing events that result in escrow items.
-                # On re-escrow attempt by process, Pses escrow is called by
-                # Kever.self.escrowPDEvent Which calls
-                # self.db.pdes.addOn(pre, sn, serder.digb)
-                # which in turn will NOT enter dig as dup if one already exists.
-                # So re-escrow attempt will not change the escrows in db.pdes.
-                # Non re-escrow ValidationError means some other issue so unescrow.
-                # No error at all means processed successfully so also unescrow.
-                # Assumes that controller signature validation and delegation
-                # validation will be successful as event would not be in
-                # partially witnessed escrow unless they had already validated
-
-            except MissingDelegationError as ex:
-                # still waiting on missing delegation source seal
-                # processEvent idempotently reescrowed
-                if logger.isEnabledFor(logging.DEBUG):
-                    logger.exception("Kevery PDE unescrow failed: %s", ex.args[0])
+                    # get witness signatures (wigs not wits) assumes wont be in this
+                    # escrow if wigs not needed because no wits
+                    wigers = self.db.wigs.get(keys=dgkey)  # list of wigs if any
+                    # may want to checks wits and wigs here. We are assuming that
+                    # never get to this escrow if wits and not wigs
+                    #if wits and not wigers:  # non empty wits but empty wigs
+                        ## wigs maybe empty  if not wits or if wits while waiting
+                        ## for first witness signature
+                        ## which may not arrive until some time after event is fully signed
+                        ## so just log for debugging but do not unescrow by raising
+                        ## ValidationError
+                        #logger.info("Kevery unescrow error: Missing event wigs at."
+                                    #"dig = %s", bytes(edig))
+
+                        #raise ValidationError("Missing escrowed evt wigs at "
+                                              #"dig = {}.".format(bytes(edig)))
+
+                    # setup parameters to process event
+                    sigers = self.db.sigs.get(keys=dgkey)
+
+                    # seal source couple (sequence number, said diger) of delegator/issuer if any
+                    # If delegator KEL not available should also cue a trigger to
+                    # get it if still missing when processing escrow.
+                    sner = sger = None
+                    if (couple := self.db.udes.get(keys=(epre, edig))):
+                        sner, sger = couple  # provided
+
+                    #elif eserder.ked["t"] in (Ilks.dip, Ilks.drt,): # walk kel to find
+                        #if eserder.pre in self.kevers:
+                            #delpre = self.kevers[eserder.pre].delpre
+                        #else:
+                            #delpre = eserder.ked["di"]
+                        #seal = dict(i=eserder.ked["i"], s=eserder.snh, d=eserder.said)
+                        #srdr = self.db.findAnchoringSealEvent(pre=delpre, seal=seal)
+                        #if srdr is not None:  # found seal in srdr
+                            #number = Number(sn=srdr.sn)
+                            #diger = Diger(qb64=srdr.said)
+                            #self.db.udes.put(keys=dgkey, val=(number, diger))
 
-            except Exception as ex:  # log diagnostics errors etc
-                # error other than waiting on sigs or seal so remove from escrow
-                # removes one event escrow at key val
-                self.db.pdes.rem(keys=epre, on=esn, val=edig)  # event idx escrow
-                self.db.udes.rem(keys=dgkey)  # remove source seal escrow if any
-                if logger.isEnabledFor(logging.DEBUG):
-                    logger.exception("Kevery PDE unescrowed: %s", ex.args[0])
-                else:
-                    logger.error("Kevery PDE unescrowed: %s", ex.args[0])
+                    self.processEvent(serder=eserder, sigers=sigers, wigers=wigers,
+                                      delsner=sner,
+                                      delsger=sger,
+                                      eager=True, local=esr.local)
 
-            else:  # unescrow succeeded, remove from escrow
-                # We don't remove all escrows at pre,sn because some might be
-                # duplicitous so we process remaining escrows in spite of found
-                # valid event escrow.
-                 # removes one event escrow at key val
-                self.db.pdes.rem(keys=epre, on=esn, val=edig)  # event idx escrow
-                self.db.udes.rem(keys=dgkey)  # remove source seal escrow if any
-                logger.info("Kevery PDE unescrow succeeded in valid event: "
-                            "event=%s", eserder.said)
-                logger.debug("Event=\n%s\n", eserder.pretty())
+                    # If process does NOT validate delegation then process will attempt
+                    # to re-escrow and then raise MissingDelegationError
+                    # (subclass of ValidationError)
+                    # so we can distinquish between ValidationErrors that are
+                    # re-escrow vs non re-escrow. We want process to be idempotent
+                    # with respect to processing events that result in escrow items.
+                    # On re-escrow attempt by process, Pses escrow is called by
+                    # Kever.self.escrowPDEvent Which calls
+                    # self.db.pdes.addOn(pre, sn, serder.digb)
+                    # which in turn will NOT enter dig as dup if one already exists.
+                    # So re-escrow attempt will not change the escrows in db.pdes.
+                    # Non re-escrow ValidationError means some other issue so unescrow.
+                    # No error at all means processed successfully so also unescrow.
+                    # Assumes that controller signature validation and delegation
+                    # validation will be successful as event would not be in
+                    # partially witnessed escrow unless they had already validated
+
+                except MissingDelegationError as ex:
+                    # still waiting on missing delegation source seal
+                    # processEvent idempotently reescrowed
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.exception("Kevery PDE unescrow failed: %s", ex.args[0])
+                    self.db.expire(epre, dater, self.TimeoutPWE)  # still escrowed
+
+                except lmdb.MapFullError:
+                    raise  # rolled back so stays escrowed until map grown
+
+                except Exception as ex:  # log diagnostics errors etc
+                    # error other than waiting on sigs or seal so remove from escrow
+                    # removes one event escrow at key val
+                    self.db.pdes.rem(keys=epre, on=esn, val=edig)  # event idx escrow
+                    self.db.udes.rem(keys=dgkey)  # remove source seal escrow if any
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.exception("Kevery PDE unescrowed: %s", ex.args[0])
+                    else:
+                        logger.error("Kevery PDE unescrowed: %s", ex.args[0])
+
+                else:  # unescrow succeeded, remove from escrow
+                    # We don't remove all escrows at pre,sn because some might be
+                    # duplicitous so we process remaining escrows in spite of found
+                    # valid event escrow.
+                     # removes one event escrow at key val
+                    self.db.pdes.rem(keys=epre, on=esn, val=edig)  # event idx escrow
+                    self.db.udes.rem(keys=dgkey)  # remove source seal escrow if any
+                    logger.info("Kevery PDE unescrow succeeded in valid event: "
+                                "event=%s", eserder.said)
+                    logger.debug("Event=\n%s\n", eserder.pretty())
 
 
-    def processEscrowUnverWitness(self):
+    def processEscrowUnverWitness(self, pre=None):
         """
         Process escrowed unverified event receipts from witness receiptors
         A receipt is unverified if the associated event has not been accepted
@@ -6669,6 +7027,10 @@ class Kevery:
                 pre is str qb64 of identifier prefix of receipted event
                 sn is int sequence number of receipted event
 
+        Parameters:
+            pre (str|None): qb64 identifier prefix of woken escrowed entries.
+                None means sweep all entries.
+
         Steps:
             Each pass  (walk index table)
                 For each prefix,sn
@@ -6678,7 +7040,7 @@ class Kevery:
                         verify wigs via wigers
                         If successful then remove from escrow table"""
         #for (pre, snh), (rdiger, wiger) in self.db.uwes.getTopItemIter():
-        for (pre, ), sn, (rdig, wig) in self.db.uwes.getTopItemIter():
+        for (pre, ), sn, (rdig, wig) in self.db.uwes.getTopItemIter(keys=(pre, '') if pre else ''):
             try:
                 #rdigerBytes = rdig.encode('utf-8')
                 # check date if expired then remove escrow.
@@ -6721,6 +7083,7 @@ class Kevery:
                     logger.trace("Kevery: UWE unescrow failed: %s\n", ex.args[0])
                     logger.exception("Kevery: UWE unescrow failed: %s\n",
                                      ex.args[0])
+                self.db.expire(pre, dater, self.TimeoutUWE)  # still escrowed
 
             except Exception as ex:  # log diagnostics errors etc
                 # error other than out of order so remove from OO escrow
@@ -6736,7 +7099,7 @@ class Kevery:
                 self.db.uwes.rem(keys=(pre,), on=sn, val=(rdig, wig))
                 logger.info("Kevery UWE unescrow succeeded for event pre=%s sn=%s", pre, sn)
 
-    def processEscrowUnverNonTrans(self):
+    def processEscrowUnverNonTrans(self, pre=None):
         """
         Process escrowed unverified event receipts from nontrans receiptors
         A receipt is unverified if the associated event has not been accepted
@@ -6773,6 +7136,10 @@ class Kevery:
                 pre is str qb64 of identifier prefix of receipted event
                 sn is int sequence number of receipted event
 
+        Parameters:
+            pre (str|None): qb64 identifier prefix of woken escrowed entries.
+                None means sweep all entries.
+
         Steps:
             Each pass  (walk index table)
                 For each prefix,sn
@@ -6782,7 +7149,7 @@ class Kevery:
                         verify sigs via cigars
                         If successful then remove from escrow table"""
 
-        for (pre, sn), (rsaider, sprefixer, cigar) in self.db.ures.getTopItemIter():
+        for (pre, sn), (rsaider, sprefixer, cigar) in self.db.ures.getTopItemIter(keys=(pre, '') if pre else ''):
             sn = Seqner(qb64=sn).sn
             try:
                 cigar.verfer = Verfer(qb64b=sprefixer.qb64b)
@@ -6861,7 +7228,8 @@ class Kevery:
                         index = wits.index(rpre)
                         # create witness indexed signature and write to db
                         wiger = Siger(raw=cigar.raw, index=index, verfer=cigar.verfer)
-                        self.db.wigs.add(keys=(pre, serder.said), val=wiger)
+                        if self.db.wigs.add(keys=(pre, serder.said), val=wiger):
+                            self.db.wake(pre)  # new wig may complete witnessing
                     else:  # write receipt to database
                         self.db.rcts.add(keys=(pre, serder.said), val=(cigar.verfer, cigar))
 
@@ -6871,6 +7239,7 @@ class Kevery:
                 if logger.isEnabledFor(logging.TRACE):  # adds exception data
                     logger.trace("Kevery: UNT other error on unescrow: %s\n", ex.args[0])
                     logger.exception("Kevery: UNT other error on unescrow: %s\n", ex.args[0])
+                self.db.expire(pre, dater, self.TimeoutURE)  # still escrowed
 
             except Exception as ex:  # log diagnostics errors etc
                 # error other than out of order so remove from OO escrow
@@ -6912,86 +7281,90 @@ class Kevery:
                         If successful then remove from escrow table"""
 
         for (pre, sn), dig in self.db.delegables.getTopItemIter():
-            try:
-                edig = dig.encode("utf-8")
-                dgkey = dgKey(pre.encode("utf-8"), edig)
-                if not (esr := self.db.esrs.get(keys=dgkey)):  # get event source, otherwise error
-                    # no local source so raise ValidationError which unescrows below
-                    msg = f"DEL Missing escrowed event source at dig = {edig.decode()}"
-                    logger.info("Kevery unescrow error: %s", msg)
-                    raise ValidationError(msg)
+            with self.db.transact():  # accept or re-escrow and unescrow at once
+                try:
+                    edig = dig.encode("utf-8")
+                    dgkey = dgKey(pre.encode("utf-8"), edig)
+                    if not (esr := self.db.esrs.get(keys=dgkey)):  # get event source, otherwise error
+                        # no local source so raise ValidationError which unescrows below
+                        msg = f"DEL Missing escrowed event source at dig = {edig.decode()}"
+                        logger.info("Kevery unescrow error: %s", msg)
+                        raise ValidationError(msg)
 
-                # check date if expired then remove escrow.
-                dater = self.db.dtss.get(keys=dgkey)
-                if dater is None:  # no datetime stored
-                    # no date time so raise ValidationError which unescrows below
-                    msg = f"DEL Missing escrowed event datetime at dig = {edig.decode()}"
-                    logger.info("Kevery unescrow error: %s", msg)
-                    raise ValidationError(msg)
+                    # check date if expired then remove escrow.
+                    dater = self.db.dtss.get(keys=dgkey)
+                    if dater is None:  # no datetime stored
+                        # no date time so raise ValidationError which unescrows below
+                        msg = f"DEL Missing escrowed event datetime at dig = {edig.decode()}"
+                        logger.info("Kevery unescrow error: %s", msg)
+                        raise ValidationError(msg)
 
-                # do date math here and discard if stale
-                dtnow = helping.nowUTC()
-                dte = dater.datetime
-                if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutOOE):
-                    # escrow stale so raise ValidationError which unescrows below
-                    msg = f"DEL Stale event escrow at dig = {edig.decode()}"
-                    logger.info("Kevery unescrow error: %s", msg)
-                    raise ValidationError(msg)
+                    # do date math here and discard if stale
+                    dtnow = helping.nowUTC()
+                    dte = dater.datetime
+                    if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutOOE):
+                        # escrow stale so raise ValidationError which unescrows below
+                        msg = f"DEL Stale event escrow at dig = {edig.decode()}"
+                        logger.info("Kevery unescrow error: %s", msg)
+                        raise ValidationError(msg)
 
-                # get the escrowed event using edig
-                if (eserder := self.db.evts.get(keys=(pre, bytes(edig)))) is None:
-                    # no event so raise ValidationError which unescrows below
-                    msg = f"DEL Missing escrowed evt at dig = {edig.decode()}"
-                    logger.info("Kevery unescrow error: %s", msg)
-                    raise ValidationError(msg)
+                    # get the escrowed event using edig
+                    if (eserder := self.db.evts.get(keys=(pre, bytes(edig)))) is None:
+                        # no event so raise ValidationError which unescrows below
+                        msg = f"DEL Missing escrowed evt at dig = {edig.decode()}"
+                        logger.info("Kevery unescrow error: %s", msg)
+                        raise ValidationError(msg)
 
-                #  get sigs and attach
-                sigers = self.db.sigs.get(keys=(pre, edig))
-                if not sigers:  # otherwise its a list of sigs
-                    # no sigs so raise ValidationError which unescrows below
-                    msg = f"DEL Missing escrowed evt sigs at dig = {edig.decode()}"
-                    logger.info("Kevery unescrow error: %s", msg)
-                    raise ValidationError(msg)
+                    #  get sigs and attach
+                    sigers = self.db.sigs.get(keys=(pre, edig))
+                    if not sigers:  # otherwise its a list of sigs
+                        # no sigs so raise ValidationError which unescrows below
+                        msg = f"DEL Missing escrowed evt sigs at dig = {edig.decode()}"
+                        logger.info("Kevery unescrow error: %s", msg)
+                        raise ValidationError(msg)
 
-                sigers = self.db.sigs.get(keys=(pre, edig))
+                    sigers = self.db.sigs.get(keys=(pre, edig))
 
-                #  get wigers
-                wigers = self.db.wigs.get(keys=(pre, bytes(edig)))
+                    #  get wigers
+                    wigers = self.db.wigs.get(keys=(pre, bytes(edig)))
 
-                # parse the event if we have a delegate seal
-                if (duple := self.db.aess.get(keys=(pre.encode("utf-8"), edig))) is not None:
-                    delsner, delsger = duple  #  Number from aess
+                    # parse the event if we have a delegate seal
+                    if (duple := self.db.aess.get(keys=(pre.encode("utf-8"), edig))) is not None:
+                        delsner, delsger = duple  #  Number from aess
 
-                    # process event
-                    self.processEvent(serder=eserder, sigers=sigers, wigers=wigers,
-                                      delsner=delsner, delsger=delsger, local=esr.local)
-                else:
-                    raise MissingDelegableApprovalError("No delegation seal found for event.")
+                        # process event
+                        self.processEvent(serder=eserder, sigers=sigers, wigers=wigers,
+                                          delsner=delsner, delsger=delsger, local=esr.local)
+                    else:
+                        raise MissingDelegableApprovalError("No delegation seal found for event.")
 
-            except MissingDelegableApprovalError as ex:
-                # still waiting on missing delegation approval
-                if logger.isEnabledFor(logging.DEBUG):
-                    logger.exception("Kevery DEL unescrow failed: %s", ex.args[0])
+                except MissingDelegableApprovalError as ex:
+                    # still waiting on missing delegation approval
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.exception("Kevery DEL unescrow failed: %s", ex.args[0])
 
-            except Exception as ex:  # log diagnostics errors etc
-                # error other than out of order so remove from OO escrow
-                self.db.delegables.rem(keys=(pre, sn,), val=edig)  # removes one escrow at key val
-                if logger.isEnabledFor(logging.DEBUG):
-                    logger.exception("Kevery DEL other unescrow error: %s", ex.args[0])
-                else:
-                    logger.error("Kevery DEL other unescrow error: %s", ex.args[0])
+                except lmdb.MapFullError:
+                    raise  # rolled back so stays escrowed until map grown
 
-            else:  # unescrow succeeded, remove from escrow
-                # We don't remove all escrows at pre,sn because some might be
-                # duplicitous so we process remaining escrows in spite of found
-                # valid event escrow.
-                self.db.delegables.rem(keys=(pre, sn,), val=edig)  # removes one escrow at key val
-                logger.info("Kevery DEL unescrow succeeded in valid event: "
-                            "event=%s", eserder.said)
-                logger.debug(f"Event=\n%s\n", eserder.pretty())
+                except Exception as ex:  # log diagnostics errors etc
+                    # error other than out of order so remove from OO escrow
+                    self.db.delegables.rem(keys=(pre, sn,), val=edig)  # removes one escrow at key val
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.exception("Kevery DEL other unescrow error: %s", ex.args[0])
+                    else:
+                        logger.error("Kevery DEL other unescrow error: %s", ex.args[0])
+
+                else:  # unescrow succeeded, remove from escrow
+                    # We don't remove all escrows at pre,sn because some might be
+                    # duplicitous so we process remaining escrows in spite of found
+                    # valid event escrow.
+                    self.db.delegables.rem(keys=(pre, sn,), val=edig)  # removes one escrow at key val
+                    logger.info("Kevery DEL unescrow succeeded in valid event: "
+                                "event=%s", eserder.said)
+                    logger.debug(f"Event=\n%s\n", eserder.pretty())
 
 
-    def processQueryNotFound(self):
+    def processQueryNotFound(self, pre=None):
         """
         Process qry events escrowed by Kevery for KELs that have not yet met the criteria of the query.
         A missing KEL or criteria for an event in a KEL at a particular sequence number or an event containing a
@@ -7006,6 +7379,10 @@ class Kevery:
 
         Value is dgkey for event stored in .Evt where .Evt has serder.raw of event.
 
+        Parameters:
+            pre (str|None): qb64 identifier prefix of woken escrowed entries.
+                None means sweep all entries.
+
         Steps:
             Each pass  (walk index table)
                 For each prefix,sn
@@ -7015,7 +7392,7 @@ class Kevery:
                         Process event as if it came in over the wire
                         If successful then remove from escrow table"""
 
-        key = ekey = b''  # both start same. when not same means escrows found
+        key = ekey = (pre, '') if pre else b''  # both start same. when not same means escrows found
         pre = b''
         sn = 0
         while True:  # break when done
@@ -7073,6 +7450,9 @@ class Kevery:
                     if logger.isEnabledFor(logging.TRACE):
                         logger.trace("Kevery: QNF unescrow failed: %s\n", ex.args[0])
                         logger.exception("Kevery: QNF unescrow failed: %s\n", ex.args[0])
+                    # still escrowed so wait again on event of queried prefix
+                    self.db.wait(pre, on=eserder.ked.get("q", {}).get("i"))
+                    self.db.expire(pre, dater, self.TimeoutQNF)
 
                 except Exception as ex:  # log diagnostics errors etc
                     # error other than out of order so remove from OO escrow
@@ -7192,13 +7572,14 @@ class Kevery:
                 msg = f"PWE Bad escrowed witness receipt wig at pre={pre} sn={sn:x}."
                 logger.trace("Kevery unescrow error: %s", msg)
                 raise ValidationError(msg)
-            self.db.wigs.add(keys=(pre, serder.said), val=wiger)
+            if self.db.wigs.add(keys=(pre, serder.said), val=wiger):
+                self.db.wake(pre)  # new wig may complete witnessing
             # processEscrowPartialWigs removes from this .Pwes escrow
             # when fully witnessed using self.db.pwes.remOn(pre, sn, dig)
 
         return found
 
-    def processEscrowUnverTrans(self):
+    def processEscrowUnverTrans(self, pre=None):
         """
         Process event receipts from transferable identifiers (validators)
         escrowed by Kever that are unverified.
@@ -7233,6 +7614,10 @@ class Kevery:
                 sigers is list of Siger instances for receipted event
 
 
+        Parameters:
+            pre (str|None): qb64 identifier prefix of woken escrowed entries.
+                None means sweep all entries.
+
         Steps:
             Each pass  (walk index table)
                 For each prefix,sn
@@ -7243,7 +7628,7 @@ class Kevery:
                         If successful then remove from escrow table"""
 
         ims = bytearray()
-        key = ekey = b''  # both start same. when not same means escrows found
+        key = ekey = (pre, '') if pre else b''  # both start same. when not same means escrows found
         while True:  # break when done
             for ekey, equinlet in self.db.vres.getTopItemIter(keys=key):
                 try:
@@ -7341,6 +7726,9 @@ class Kevery:
                     if logger.isEnabledFor(logging.TRACE):  # adds exception data
                         logger.trace("Kevery: VRE escrow unescrow failed: %s\n", ex.args[0])
                         logger.exception("Kevery: VRE escrow unescrow failed: %s\n", ex.args[0])
+                    # still escrowed so wait again on receiptor est event
+                    self.db.wait(pre, on=sprefixer.qb64)
+                    self.db.expire(pre, dater, self.TimeoutVRE)
 
                 except Exception as ex:  # log diagnostics errors etc
                     # error other than out of order so remove from OO escrow
@@ -7361,7 +7749,7 @@ class Kevery:
                 break
             key = ekey  # setup next while iteration, with key after ekey
 
-    def processEscrowDuplicitous(self):
+    def processEscrowDuplicitous(self, pre=None):
         """
         Process events escrowed by Kever that are likely duplicitous.
         An event is likely duplicitous if a different version of event already
@@ -7388,6 +7776,10 @@ class Kevery:
                 pre is str qb64 of identifier prefix of event
                 sn is int sequence number of event
 
+        Parameters:
+            pre (str|None): qb64 identifier prefix of woken escrowed entries.
+                None means sweep all entries.
+
         Steps:
             Each pass  (walk index table)
                 For each prefix,sn
@@ -7396,91 +7788,96 @@ class Kevery:
                         Get and Attach Signatures
                         Process event as if it came in over the wire
                         If successful then remove from escrow table"""
-        key = ekey = b''  # both start same. when not same means escrows found
+        key = ekey = pre if pre else b''  # both start same. when not same means escrows found
         while True:  # break when done
             for (pre,), sn, edig in self.db.ldes.getAllItemIter(keys=key):
-                try:
-                    # pre and sn are already unpacked
-                    ekey = snKey(pre, sn)
-                    if hasattr(edig, "encode"):
-                        edig = edig.encode("utf-8")  # convert to bytes for legacy compatibility
-                    dgkey = dgKey(pre, edig)
-                    if not (esr := self.db.esrs.get(keys=dgkey)):  # get event source, otherwise error
-                        # no local source so raise ValidationError which unescrows below
-                        msg = f"DUP Missing escrowed event source at dig = {edig.decode()}"
-                        logger.info("Kevery unescrow error: %s", msg)
-                        raise ValidationError(msg)
-
-                    # check date if expired then remove escrow.
-                    dater = self.db.dtss.get(keys=dgkey)
-                    if dater is None:  # no datetime stored
-                        # no date time so raise ValidationError which unescrows below
-                        msg = f"DUP Missing escrowed event datetime at dig = {edig.decode()}"
-                        logger.trace("Kevery unescrow error: %s", msg)
-                        raise ValidationError(msg)
-
-                    # do date math here and discard if stale
-                    dtnow = helping.nowUTC()
-                    dte = dater.datetime
-                    if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutLDE):
-                        # escrow stale so raise ValidationError which unescrows below
-                        msg = f"DUP Stale event escrow at dig = {edig.decode()}"
-                        logger.trace("Kevery unescrow error: %s", msg)
-                        raise ValidationError(msg)
-
-                    # get the escrowed event using edig
-                    if (eserder := self.db.evts.get(keys=(pre, bytes(edig)))) is None:
-                        # no event so raise ValidationError which unescrows below
-                        msg = f"DUP Missing escrowed evt at dig = {edig.decode()}"
-                        logger.trace("Kevery unescrow error: %s", msg)
-                        raise ValidationError(msg)
-
-                    #  get sigs and attach
-                    sigers = self.db.sigs.get(keys=(pre, edig))
-                    if not sigers:  # otherwise its a list of sigs
-                        # no sigs so raise ValidationError which unescrows below
-                        msg = f"DUP Missing escrowed evt sigs at dig = {edig.decode()}"
-                        logger.trace("Kevery unescrow error: %s", msg)
-                        raise ValidationError(msg)
-
-                    sigers = self.db.sigs.get(keys=(pre, edig))
-                    self.processEvent(serder=eserder, sigers=sigers, local=esr.local)
-
-                    # If process does NOT validate event with sigs, becasue it is
-                    # still out of order then process will attempt to re-escrow
-                    # and then raise OutOfOrderError (subclass of ValidationError)
-                    # so we can distinquish between ValidationErrors that are
-                    # re-escrow vs non re-escrow. We want process to be idempotent
-                    # with respect to processing events that result in escrow items.
-                    # On re-escrow attempt by process, Ooe escrow is called by
-                    # Kevery.self.escrowOOEvent Which calls
-                    # self.db.ooes.addOn(pre, sn, serder.digb)
-                    # which in turn will not enter dig as dup if one already exists.
-                    # So re-escrow attempt will not change the escrowed ooe db.
-                    # Non re-escrow ValidationError means some other issue so unescrow.
-                    # No error at all means processed successfully so also unescrow.
-
-                except LikelyDuplicitousError as ex:
-                    # still can't determine if duplicitous
-                    if logger.isEnabledFor(logging.TRACE):
-                        logger.trace("Kevery: DUP unescrow failed: %s\n", ex.args[0])
-                        logger.exception("Kevery: DUP unescrow failed: %s\n", ex.args[0])
-
-                except Exception as ex:  # log diagnostics errors etc
-                    # error other than likely duplicitous so remove from escrow
-                    self.db.ldes.rem(keys=pre, on=sn, val=edig)  # removes one escrow at key val
-                    if logger.isEnabledFor(logging.DEBUG):
-                        logger.trace("Kevery: DUP other unescrow error: %s\n", ex.args[0])
-                        logger.exception("Kevery: DUP other unescrow error: %s\n", ex.args[0])
-
-                else:  # unescrow succeeded, remove from escrow
-                    # We don't remove all escrows at pre,sn because some might be
-                    # duplicitous so we process remaining escrows in spite of found
-                    # valid event escrow.
-                    self.db.ldes.rem(keys=pre, on=sn, val=edig)  # removes one escrow at key val
-                    logger.info("Kevery DUP unescrow succeeded in valid event: event=%s",
-                                eserder.said)
-                    logger.debug("event=\n%s\n", eserder.pretty())
+                with self.db.transact():  # accept or re-escrow and unescrow at once
+                    try:
+                        # pre and sn are already unpacked
+                        ekey = snKey(pre, sn)
+                        if hasattr(edig, "encode"):
+                            edig = edig.encode("utf-8")  # convert to bytes for legacy compatibility
+                        dgkey = dgKey(pre, edig)
+                        if not (esr := self.db.esrs.get(keys=dgkey)):  # get event source, otherwise error
+                            # no local source so raise ValidationError which unescrows below
+                            msg = f"DUP Missing escrowed event source at dig = {edig.decode()}"
+                            logger.info("Kevery unescrow error: %s", msg)
+                            raise ValidationError(msg)
+
+                        # check date if expired then remove escrow.
+                        dater = self.db.dtss.get(keys=dgkey)
+                        if dater is None:  # no datetime stored
+                            # no date time so raise ValidationError which unescrows below
+                            msg = f"DUP Missing escrowed event datetime at dig = {edig.decode()}"
+                            logger.trace("Kevery unescrow error: %s", msg)
+                            raise ValidationError(msg)
+
+                        # do date math here and discard if stale
+                        dtnow = helping.nowUTC()
+                        dte = dater.datetime
+                        if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutLDE):
+                            # escrow stale so raise ValidationError which unescrows below
+                            msg = f"DUP Stale event escrow at dig = {edig.decode()}"
+                            logger.trace("Kevery unescrow error: %s", msg)
+                            raise ValidationError(msg)
+
+                        # get the escrowed event using edig
+                        if (eserder := self.db.evts.get(keys=(pre, bytes(edig)))) is None:
+                            # no event so raise ValidationError which unescrows below
+                            msg = f"DUP Missing escrowed evt at dig = {edig.decode()}"
+                            logger.trace("Kevery unescrow error: %s", msg)
+                            raise ValidationError(msg)
+
+                        #  get sigs and attach
+                        sigers = self.db.sigs.get(keys=(pre, edig))
+                        if not sigers:  # otherwise its a list of sigs
+                            # no sigs so raise ValidationError which unescrows below
+                            msg = f"DUP Missing escrowed evt sigs at dig = {edig.decode()}"
+                            logger.trace("Kevery unescrow error: %s", msg)
+                            raise ValidationError(msg)
+
+                        sigers = self.db.sigs.get(keys=(pre, edig))
+                        self.processEvent(serder=eserder, sigers=sigers, local=esr.local)
+
+                        # If process does NOT validate event with sigs, becasue it is
+                        # still out of order then process will attempt to re-escrow
+                        # and then raise OutOfOrderError (subclass of ValidationError)
+                        # so we can distinquish between ValidationErrors that are
+                        # re-escrow vs non re-escrow. We want process to be idempotent
+                        # with respect to processing events that result in escrow items.
+                        # On re-escrow attempt by process, Ooe escrow is called by
+                        # Kevery.self.escrowOOEvent Which calls
+                        # self.db.ooes.addOn(pre, sn, serder.digb)
+                        # which in turn will not enter dig as dup if one already exists.
+                        # So re-escrow attempt will not change the escrowed ooe db.
+                        # Non re-escrow ValidationError means some other issue so unescrow.
+                        # No error at all means processed successfully so also unescrow.
+
+                    except LikelyDuplicitousError as ex:
+                        # still can't determine if duplicitous
+                        if logger.isEnabledFor(logging.TRACE):
+                            logger.trace("Kevery: DUP unescrow failed: %s\n", ex.args[0])
+                            logger.exception("Kevery: DUP unescrow failed: %s\n", ex.args[0])
+                        self.db.expire(pre, dater, self.TimeoutLDE)  # still escrowed
+
+                    except lmdb.MapFullError:
+                        raise  # rolled back so stays escrowed until map grown
+
+                    except Exception as ex:  # log diagnostics errors etc
+                        # error other than likely duplicitous so remove from escrow
+                        self.db.ldes.rem(keys=pre, on=sn, val=edig)  # removes one escrow at key val
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.trace("Kevery: DUP other unescrow error: %s\n", ex.args[0])
+                            logger.exception("Kevery: DUP other unescrow error: %s\n", ex.args[0])
+
+                    else:  # unescrow succeeded, remove from escrow
+                        # We don't remove all escrows at pre,sn because some might be
+                        # duplicitous so we process remaining escrows in spite of found
+                        # valid event escrow.
+                        self.db.ldes.rem(keys=pre, on=sn, val=edig)  # removes one escrow at key val
+                        logger.info("Kevery DUP unescrow succeeded in valid event: event=%s",
+                                    eserder.said)
+                        logger.debug("event=\n%s\n", eserder.pretty())
 
             if ekey == key:  # still same so no escrows found on last while iteration
                 break
@@ -250,9 +250,11 @@ class Indexer:
             code (str): stable (hard) part of derivation code
             index (int): main index offset into list or length of material
             ondex (int | None): other index offset into list or length of material
-            qb64b (bytes): fully qualified Base64 crypto material
+            qb64b (bytes | bytearray | memoryview): fully qualified Base64
+                crypto material. Strips when bytearray and strip is True.
             qb64 (str | bytes): fully qualified Base64 crypto material
-            qb2 (bytes): fully qualified binary crypto material
+            qb2 (bytes | bytearray | memoryview): fully qualified binary crypto
+                material. Strips when bytearray and strip is True.
             strip (bool): True means strip counter contents from input stream
                 bytearray after parsing qb64b or qb2. False means do not strip
 
@@ -518,6 +520,38 @@ class Indexer:
         return full
 
 
+    @classmethod
+    def _fastTables(cls):
+        """Returns tuple (hards, sizes) of precomputed decode tables for the fast
+        path of ._exfil built once per class from .Hards and .Sizes.
+
+        hards (list[int]): hard size hs indexed by ordinal of first code char.
+            0 when not the start of a hard code.
+        sizes (dict): maps hard code as both str and bytes to tuple
+            (code, ms, os, fs, pad, ps, ns, current) for fixed size codes
+            without lead bytes, where pad is ps prepad b'A' chars, ns is the
+            decoded size of pad plus material and current is True when code
+            is in IdxCrtSigDex. Other codes are left to the general path.
+        """
+        if (tables := cls.__dict__.get("_FastTables")) is None:
+            hards = [0] * 128
+            for first, hs in cls.Hards.items():
+                hards[ord(first)] = hs
+            sizes = {}
+            currents = set(IdxCrtSigDex)
+            for code, (hs, ss, os, fs, ls) in cls.Sizes.items():
+                if not fs or ls:  # variable size or lead so general path
+                    continue
+                cs = hs + ss
+                ps = cs % 4
+                entry = (code, ss - os, os, fs, b'A' * ps, ps,
+                         (ps + fs - cs) * 3 // 4, code in currents)
+                sizes[code] = entry
+                sizes[code.encode()] = entry
+            tables = cls._FastTables = (hards, sizes)
+        return tables
+
+
     def _exfil(self, qb64b):
         """
         Extracts self.code, self.index, and self.raw from qualified base64 bytes qb64b
@@ -525,11 +559,41 @@ class Indexer:
         cs = hs + ss
         ms = ss - os (main index size)
         when fs None then size computed & fs = size * 4 + cs
+
+        Fixed size codes are extracted with the precomputed tables from
+        ._fastTables using one base64 decode. Everything else, including all
+        error reporting, falls through to the general path.
         """
         if not qb64b:  # empty need more bytes
             raise ShortageError("Empty material.")
 
+        hards, sizes = self._fastTables()
+        text = isinstance(qb64b, str)
+        first = ord(qb64b[0]) if text else qb64b[0]
+        if first < 128 and (hs := hards[first]) and len(qb64b) >= hs:
+            hard = qb64b[:hs]
+            if (entry := sizes.get(hard if text else bytes(hard))) is not None:
+                code, ms, os, fs, pad, ps, ns, current = entry
+                if len(qb64b) >= fs:
+                    full = qb64b[:fs]
+                    full = full.encode() if text else bytes(full)
+                    cs = hs + ms + os
+                    index = b64ToInt(full[hs:hs+ms])
+                    ondex = b64ToInt(full[hs+ms:cs]) if os else None
+                    if not current:
+                        ondex = ondex if os else index
+                    if not (current and ondex):  # nonzero ondex error on general path
+                        paw = decodeB64(pad + full[cs:])
+                        if len(paw) == ns and not any(paw[:ps]):
+                            self._code = code
+                            self._index = index
+                            self._ondex = None if current else ondex
+                            self._raw = paw[ps:]
+                            return
+
         first = qb64b[:1]  # extract first char code selector
+        if isinstance(first, memoryview):
+            first = bytes(first)
         if hasattr(first, "decode"):
             first = first.decode("utf-8")
         if first not in self.Hards:
@@ -547,6 +611,8 @@ class Indexer:
             raise ShortageError(f"Need {hs - len(qb64b)} more characters.")
 
         hard = qb64b[:hs]  # get hard code
+        if isinstance(hard, memoryview):
+            hard = bytes(hard)
         if hasattr(hard, "decode"):
             hard = hard.decode("utf-8")
         if hard not in self.Sizes:
@@ -564,11 +630,15 @@ class Indexer:
             raise ShortageError(f"Need {cs - len(qb64b)} more characters.")
 
         index = qb64b[hs:hs+ms]  # extract index/size chars
+        if isinstance(index, memoryview):
+            index = bytes(index)
         if hasattr(index, "decode"):
             index = index.decode("utf-8")
         index = b64ToInt(index)  # compute int index
 
         ondex = qb64b[hs+ms:hs+ms+os]  # extract ondex chars
+        if isinstance(ondex, memoryview):
+            ondex = bytes(ondex)
         if hasattr(ondex, "decode"):
             ondex = ondex.decode("utf-8")
 
@@ -595,6 +665,8 @@ class Indexer:
             raise ShortageError(f"Need {fs - len(qb64b)} more chars.")
 
         qb64b = qb64b[:fs]  # fully qualified primitive code plus material
+        if isinstance(qb64b, memoryview):
+            qb64b = bytes(qb64b)
         if hasattr(qb64b, "encode"):  # only convert extracted chars from stream
             qb64b = qb64b.encode("utf-8")
 
@@ -126,6 +126,12 @@ class Kramer:
         # Staged accept-window increases (see changeConfig, reconcileConfig)
         self._pending = {}
 
+        # Latest start of validity in ms over the msgc and tmsc entries, that
+        # is max(mdt - d) and max(xdt). None means unknown so that the next
+        # prune pass does a full scan which also indexes any unindexed entries.
+        self._msgHorizon = None
+        self._txnHorizon = None
+
     @classmethod
     def _mergeOobiDenials(cls, fullDenials):
         """Add built-in OOBI denial exemptions unless config already covers them.
@@ -1209,7 +1215,7 @@ class Kramer:
                     mcr = MsgCacheRecord(
                         mdt=mdts, d=d, ml=ml, pml=pml,
                         xl=cacheTypeRecord.xl, pxl=cacheTypeRecord.pxl)
-                    self.db.kramMSGC.pin(key, mcr)
+                    self._pinMsgCache(key, mcr)
                     return msg
 
                 elif authType == AuthTypes.AttachedSignatureSingleKey:
@@ -1224,7 +1230,7 @@ class Kramer:
                     mcr = MsgCacheRecord(
                         mdt=mdts, d=d, ml=ml, pml=pml,
                         xl=cacheTypeRecord.xl, pxl=cacheTypeRecord.pxl)
-                    self.db.kramMSGC.pin(key, mcr)
+                    self._pinMsgCache(key, mcr)
                     return msg
 
                 elif authType == AuthTypes.AttachedSignatureMultiKey:
@@ -1239,7 +1245,7 @@ class Kramer:
                     mcr = MsgCacheRecord(
                         mdt=mdts, d=d, ml=ml, pml=pml,
                         xl=cacheTypeRecord.xl, pxl=cacheTypeRecord.pxl)
-                    self.db.kramMSGC.pin(key, mcr)
+                    self._pinMsgCache(key, mcr)
 
                     # Check if threshold is immediately satisfied
                     sigIndices = [sig.index for sig in sigResult.sigers]
@@ -1463,7 +1469,7 @@ class Kramer:
                         mcr = TxnMsgCacheRecord(
                             mdt=mdts, xdt=xdts, d=d, ml=ml, pml=pml,
                             xl=cacheTypeRecord.xl, pxl=cacheTypeRecord.pxl)
-                        self.db.kramTMSC.pin(key, mcr)
+                        self._pinTxnMsgCache(key, mcr)
                         return msg
 
                     elif authType == AuthTypes.AttachedSignatureSingleKey:
@@ -1478,7 +1484,7 @@ class Kramer:
                         mcr = TxnMsgCacheRecord(
                             mdt=mdts, xdt=xdts, d=d, ml=ml, pml=pml,
                             xl=cacheTypeRecord.xl, pxl=cacheTypeRecord.pxl)
-                        self.db.kramTMSC.pin(key, mcr)
+                        self._pinTxnMsgCache(key, mcr)
                         return msg
 
                 elif authType == AuthTypes.AttachedSignatureMultiKey:
@@ -1524,7 +1530,7 @@ class Kramer:
                     mcr = TxnMsgCacheRecord(
                         mdt=mdts, xdt=xdts, d=d, ml=ml, pml=pml,
                         xl=cacheTypeRecord.xl, pxl=cacheTypeRecord.pxl)
-                    self.db.kramTMSC.pin(key, mcr)
+                    self._pinTxnMsgCache(key, mcr)
 
                     # Check if threshold is immediately satisfied
                     sigIndices = [sig.index for sig in sigResult.sigers]
@@ -2092,15 +2098,116 @@ class Kramer:
                 raise KramError("Coverage hole detected, new configuration is invalid")
 
 
+    @staticmethod
+    def _expiry(dts, lag):
+        """Returns expiry index key element for ISO-8601 datetime dts plus lag
+        in ms as 16 char hex of epoch ms so that keys sort by expiry.
+
+        Parameters:
+            dts (str): ISO-8601 datetime, mdt or xdt of cache record
+            lag (int): ms after dts at which cache record expires
+        """
+        return f"{int(helping.fromIso8601(dts).timestamp() * 1000) + lag:016x}"
+
+
+    def _pinMsgCache(self, key, mcr):
+        """Pins mcr at key in .kramMSGC and keeps expiry index .kramMSGX in sync
+
+        Parameters:
+            key (tuple): (AID, MID)
+            mcr (MsgCacheRecord): cache record
+        """
+        if (old := self.db.kramMSGC.get(key)) is not None:
+            self.db.kramMSGX.rem(keys=(self._expiry(old.mdt, old.d + old.pml), *key))
+        self.db.kramMSGC.pin(key, mcr)
+        self.db.kramMSGX.pin(keys=(self._expiry(mcr.mdt, mcr.d + mcr.pml), *key),
+                             val=mcr.mdt)
+        if self._msgHorizon is not None:
+            start = int(helping.fromIso8601(mcr.mdt).timestamp() * 1000) - mcr.d
+            self._msgHorizon = max(self._msgHorizon, start)
+
+
+    def _pinTxnMsgCache(self, key, mcr):
+        """Pins mcr at key in .kramTMSC and keeps expiry index .kramTMSX in sync
+
+        Parameters:
+            key (tuple): (AID, XID, MID)
+            mcr (TxnMsgCacheRecord): cache record
+        """
+        if (old := self.db.kramTMSC.get(key)) is not None:
+            self.db.kramTMSX.rem(keys=(self._expiry(old.xdt, old.pxl), *key))
+        self.db.kramTMSC.pin(key, mcr)
+        self.db.kramTMSX.pin(keys=(self._expiry(mcr.xdt, mcr.pxl), *key),
+                             val=mcr.xdt)
+        if self._txnHorizon is not None:
+            start = int(helping.fromIso8601(mcr.xdt).timestamp() * 1000)
+            self._txnHorizon = max(self._txnHorizon, start)
+
+
+    def _remMsgState(self, aid, mid):
+        """Removes partial multi-key state and non auth attachments at (aid, mid)"""
+        self.db.kramPMKM.rem(keys=(aid, mid))
+        self.db.kramPMKS.rem(keys=(aid, mid))
+        self.db.kramPMSK.rem(keys=(aid, mid))
+
+        # Remove non Auth Partials
+        self._remNonAuthAttachments((aid, mid))
+
+
     def _pruneMessages(self, rdt_ms):
         """
-        Check message ID and prune expired cache entries and associated state.
-        rdt (Iso8601): receiver time
-        pml (int): prune lag cache value in milliseconds
-        d (int): drift lag cache value in milliseconds
+        Prune expired message cache entries and associated state.
+
+        Walks the expiry index .kramMSGX from its earliest entry up to rdt_ms
+        so each pass costs only the number of expired entries. Falls back to
+        a full scan of .kramMSGC when some entry may start after rdt_ms, that
+        is, on the first pass or after the receiver clock went backwards.
+
+        Parameters:
+            rdt_ms (int): receiver time in milliseconds
+
+        Returns:
+            pruned (bool): True if any cache entry was pruned
+        """
+        if self._msgHorizon is None or rdt_ms < self._msgHorizon:
+            return self._scanMessages(rdt_ms)
+
+        expired = []
+        for keys, _ in self.db.kramMSGX.getTopItemIter():
+            if int(keys[0], 16) >= rdt_ms:
+                break  # index is sorted by expiry so rest are not expired
+            expired.append(keys)
+
+        pruned = False
+        for keys in expired:
+            self.db.kramMSGX.rem(keys=keys)
+            exp, aid, mid = keys
+            cache = self.db.kramMSGC.get(keys=(aid, mid))
+            if cache is None or self._expiry(cache.mdt, cache.d + cache.pml) != exp:
+                continue  # stale index entry
+
+            self.db.kramMSGC.rem(keys=(aid, mid))
+            self._remMsgState(aid, mid)
+            pruned = True
+
+        return pruned
+
+
+    def _scanMessages(self, rdt_ms):
+        """
+        Check every message cache entry and prune those outside of the window
+        along with associated state. Indexes surviving entries in .kramMSGX
+        and resets the message horizon.
+
+        Parameters:
+            rdt_ms (int): receiver time in milliseconds
+
+        Returns:
+            pruned (bool): True if any cache entry was pruned
         """
         # Initialize a flag to track if pruned
         pruned = False
+        horizon = 0
 
         # Iterate over all message cache entries
         for (aid, mid), cache in list(self.db.kramMSGC.getTopItemIter()):
@@ -2111,29 +2218,76 @@ class Kramer:
             # Get the drift and prune lag values from the cache record
             d = cache.d
             pml = cache.pml
+            exp = f"{mdt_ms + d + pml:016x}"
 
             # Apply the comparison from the whitepaper
             if not rdt_ms - d - pml <= mdt_ms <= rdt_ms + d:
                 self.db.kramMSGC.rem(keys=(aid, mid))
-                self.db.kramPMKM.rem(keys=(aid, mid))
-                self.db.kramPMKS.rem(keys=(aid, mid))
-                self.db.kramPMSK.rem(keys=(aid, mid))
-
-                # Remove non Auth Partials
-                self._remNonAuthAttachments((aid, mid))
-
+                self.db.kramMSGX.rem(keys=(exp, aid, mid))
+                self._remMsgState(aid, mid)
                 pruned = True
+            else:
+                self.db.kramMSGX.pin(keys=(exp, aid, mid), val=cache.mdt)
+                horizon = max(horizon, mdt_ms - d)
 
+        self._msgHorizon = horizon
         return pruned
 
+
     def _pruneExchanges(self, rdt_ms):
         """
-        Check exchanges ID and prune expired cache entries and associated state.
-        rdt (int): receiver time in milliseconds
-        pxl (int): prune lag cache value in milliseconds
+        Prune expired transactioned message cache entries and associated state.
+
+        Walks the expiry index .kramTMSX from its earliest entry up to rdt_ms.
+        Falls back to a full scan of .kramTMSC when some exchange may start
+        after rdt_ms, that is, on the first pass or after the receiver clock
+        went backwards.
+
+        Parameters:
+            rdt_ms (int): receiver time in milliseconds
+
+        Returns:
+            pruned (bool): True if any cache entry was pruned
+        """
+        if self._txnHorizon is None or rdt_ms < self._txnHorizon:
+            return self._scanExchanges(rdt_ms)
+
+        expired = []
+        for keys, _ in self.db.kramTMSX.getTopItemIter():
+            if int(keys[0], 16) >= rdt_ms:
+                break  # index is sorted by expiry so rest are not expired
+            expired.append(keys)
+
+        pruned = False
+        for keys in expired:
+            self.db.kramTMSX.rem(keys=keys)
+            exp, aid, xid, mid = keys
+            cache = self.db.kramTMSC.get(keys=(aid, xid, mid))
+            if cache is None or self._expiry(cache.xdt, cache.pxl) != exp:
+                continue  # stale index entry
+
+            self.db.kramTMSC.rem(keys=(aid, xid, mid))
+            self._remMsgState(aid, mid)
+            pruned = True
+
+        return pruned
+
+
+    def _scanExchanges(self, rdt_ms):
+        """
+        Check every transactioned message cache entry and prune those outside
+        of the exchange window along with associated state. Indexes surviving
+        entries in .kramTMSX and resets the exchange horizon.
+
+        Parameters:
+            rdt_ms (int): receiver time in milliseconds
+
+        Returns:
+            pruned (bool): True if any cache entry was pruned
         """
         # Initialize a flag to track if pruned
         pruned = False
+        horizon = 0
 
         # Iterate over all message cache entries
         for (aid, xid, mid), cache in list(self.db.kramTMSC.getTopItemIter()):
@@ -2143,19 +2297,19 @@ class Kramer:
 
             # Get the prune lag values from the cache record
             pxl = cache.pxl
+            exp = f"{xdt_ms + pxl:016x}"
 
             # Apply the comparison
             if not xdt_ms <= rdt_ms <= xdt_ms + pxl:
                 self.db.kramTMSC.rem(keys=(aid, xid, mid))
-                self.db.kramPMKM.rem(keys=(aid, mid))
-                self.db.kramPMKS.rem(keys=(aid, mid))
-                self.db.kramPMSK.rem(keys=(aid, mid))
-
-                # Remove non Auth Partials
-                self._remNonAuthAttachments((aid, mid))
-
+                self.db.kramTMSX.rem(keys=(exp, aid, xid, mid))
+                self._remMsgState(aid, mid)
                 pruned = True
+            else:
+                self.db.kramTMSX.pin(keys=(exp, aid, xid, mid), val=cache.xdt)
+                horizon = max(horizon, xdt_ms)
 
+        self._txnHorizon = horizon
         return pruned
 
 
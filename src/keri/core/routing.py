@@ -17,12 +17,26 @@ from .eventing import validateSigs
 
 logger = ogler.getLogger()
 
+FieldSegmentRex = re.compile(r"{([a-zA-Z]\w*)}")  # whole segment field of template
+
 
 class Router:
     """Reply message router
 
     Reply message router that accepts registration of route `r` handlers and dispatches
-    reply messages to the appropriate handler."""
+    reply messages to the appropriate handler.
+
+    Routes are compiled into a table so that dispatch does not regex match every
+    registered route. Templates without fields are looked up by exact path,
+    templates whose fields are whole path segments by a segment trie and any
+    other templates by regex. When more than one route matches the one added
+    first wins.
+
+    Attributes:
+        routes (list): registered Route instances in order added
+        exacts (dict): Route keyed by lowercased path of templates without fields
+        trie (RouteNode): root of segment trie of templates with field segments
+        scans (list): Route instances only matched by regex"""
 
     defaultResourceFunc = "processReply"
 
@@ -31,7 +45,12 @@ class Router:
 
         Parameters:
             routes (list): preregistered routes for this router"""
-        self.routes = routes if routes is not None else list()
+        self.routes = list()
+        self.exacts = dict()
+        self.trie = RouteNode()
+        self.scans = list()
+        for route in (routes if routes is not None else []):
+            self._index(route)
 
     def addRoute(self, routeTemplate, resource, suffix=None):
         """Add a route between a route template and a resource
@@ -45,9 +64,46 @@ class Router:
                 can be mapped to the same resource."""
 
         fields, regex = compile_uri_template(routeTemplate)
-        self.routes.append(
-            Route(regex=regex, fields=fields, resource=resource, suffix=suffix)
-        )
+        self._index(Route(regex=regex, fields=fields, resource=resource,
+                          suffix=suffix, template=routeTemplate))
+
+    def _index(self, route):
+        """Append route to .routes and compile it into the route table
+
+        Parameters:
+            route (Route): route to register"""
+        route.order = len(self.routes)
+        self.routes.append(route)
+
+        if route.template is None:  # preregistered without template
+            self.scans.append(route)
+            return
+
+        template = route.template
+        if template != "/" and template.endswith("/"):
+            template = template[:-1]  # normalized as by compile_uri_template
+
+        if not route.fields:  # unless shadowed by route added earlier
+            if self._find(route=template)[0] is None:
+                self.exacts[template.lower()] = route
+            return
+
+        node = self.trie
+        names = []
+        for segment in template.split("/"):
+            if (field := FieldSegmentRex.fullmatch(segment)) is not None:
+                node = node.var if node.var is not None else node.addVar()
+                names.append(field.group(1))
+            elif "{" in segment or "}" in segment:  # partial field segment
+                self.scans.append(route)
+                return
+            else:
+                node = node.lits.setdefault(segment.lower(), RouteNode())
+                names.append(None)
+
+        if node.route is None:  # first added wins
+            node.route = route
+            node.names = names
 
     def dispatch(self, serder, diger, cigars, tsgs):
         """
@@ -60,7 +116,7 @@ class Router:
         ked = serder.ked
         # Dispatch based on route
         r = ked["r"]
-        route, match = self._find(route=r)
+        route, kwargs = self._find(route=r)
         if route is None:
             raise ValidationError(f"No resource is registered to handle route {r}")
 
@@ -68,7 +124,6 @@ class Router:
         if route.suffix is not None:
             fname += route.suffix
 
-        kwargs = match.groupdict()
         for name in route.fields:
             if name not in kwargs:
                 raise ValidationError(f"parameter {name} not found in route {r}")
@@ -77,22 +132,50 @@ class Router:
         fn(serder=serder, diger=diger, route=r, cigars=cigars, tsgs=tsgs, **kwargs)
 
     def _find(self, route):
-        """Linear seach thru added routes, returning the first one that matchs
+        """Find the first added route that matches route
 
-        Searches through the registered routes until a regex in one of the routes matches
-        the provided route and returns the Route object along with the re.Match object.
+        Looks up the exact path first which is final as exact routes shadowed
+        by earlier routes are not indexed. Otherwise walks the segment trie
+        then regex matches the remaining routes that were added earlier than
+        the best match so far.
 
         Parameters:
             route (str): the route from the `r` of the reply message
 
         Returns:
             Route: the Route object with the resource that is registered to process this rpy message
-            re.Match:  the regular expression match that contains the grouping of matched parameters."""
-        for r in self.routes:
+            dict: matched field values keyed by field name"""
+        if (best := self.exacts.get(route.lower())) is not None:
+            return best, {}
+
+        params = {}
+        segments = route.split("/")
+        nodes = [self.trie]
+        for segment in segments:
+            if not nodes:
+                break
+            lowered = segment.lower()
+            kids = []
+            for node in nodes:
+                if (kid := node.lits.get(lowered)) is not None:
+                    kids.append(kid)
+                if segment and node.var is not None:  # field matches [^/]+
+                    kids.append(node.var)
+            nodes = kids
+
+        for node in nodes:
+            if node.route is not None and (best is None or node.route.order < best.order):
+                best = node.route
+                params = {name: segment for name, segment
+                          in zip(node.names, segments) if name is not None}
+
+        for r in self.scans:
+            if best is not None and r.order > best.order:
+                break
             if res := r.regex.search(route):
-                return r, res
+                return r, res.groupdict()
 
-        return None, None
+        return best, params
 
     def processRouteNotFound(
         self, *, serder, diger, route, cigars=None, tsgs=None, **kwargs
@@ -577,20 +660,51 @@ class Route:
         .regex (re): compiled url template regex
         .fields (set): field names for matches in regex
         .resource (object): the handler for this route
-            .suffix(Optional(str)): a suffix to be applied to the handler method"""
+            .suffix(Optional(str)): a suffix to be applied to the handler method
+        .template (Optional(str)): route template the regex was compiled from
+        .order (int): position in Router.routes assigned when registered"""
 
-    def __init__(self, regex, fields, resource, suffix=None):
+    def __init__(self, regex, fields, resource, suffix=None, template=None):
         """Initialize instance of route
 
         Parameters:
             regex (re): compiled url template regex
             fields (set): field names for matches in regex
             resource (object): the handler for this route
-                suffix(Optional(str)): a suffix to be applied to the handler method"""
+                suffix(Optional(str)): a suffix to be applied to the handler method
+            template (Optional(str)): route template the regex was compiled from
+                None means only matched by regex"""
         self.regex = regex
         self.fields = fields
         self.resource = resource
         self.suffix = suffix
+        self.template = template
+        self.order = 0
+
+
+class RouteNode:
+    """Node of Router segment trie of route templates
+
+    Properties:
+        .lits (dict): child RouteNode keyed by lowercased literal path segment
+        .var (Optional(RouteNode)): child RouteNode for a field path segment
+        .route (Optional(Route)): route whose template ends at this node
+        .names (list): field name or None for literal of each template segment"""
+
+    __slots__ = ("lits", "var", "route", "names")
+
+    def __init__(self):
+        """Initialize empty node"""
+        self.lits = dict()
+        self.var = None
+        self.route = None
+        self.names = []
+
+    def addVar(self):
+        """Returns new child RouteNode for a field path segment"""
+        self.var = RouteNode()
+        return self.var
+
 
 
 def compile_uri_template(template):
@@ -5,6 +5,7 @@ keri.core.scheming module
 self-addressing and schema support
 """
 import json
+from collections import OrderedDict
 
 import cbor2 as cbor
 import jsonschema
@@ -21,6 +22,107 @@ from ..kering import ValidationError, DeserializeError
 logger = ogler.getLogger()
 
 
+class ValidatorCache:
+    """
+    ValidatorCache is a process-wide cache of compiled JSON Schema validators
+    keyed by schema SAID. Because a schema is content addressed by its SAID
+    the compiled validator of a SAID never changes so it may be shared by every
+    database in the process. A validator that resolves $ref through the
+    registry of a CacheResolver is cached by SAID and registry so that each
+    database only resolves the schemas it holds. Schemas checked against the
+    JSON Schema meta-schema are remembered by SAID so that reloading them from
+    a database does not check them again.
+
+    Attributes:
+        size (int): max entries of each of .validators and .checked. Least
+            recently used entries are evicted first.
+        validators (OrderedDict): (registry, validator) duples of compiled
+            validators keyed by schema SAID or by (SAID, id(registry)) when
+            bound to registry
+        checked (OrderedDict): True keyed by SAID of each schema that passed
+            check_schema
+        hits (int): number of validators found in cache
+        misses (int): number of validators compiled
+    """
+    Size = 1024  # default max entries per cache
+
+    def __init__(self, size=None):
+        """
+        Parameters:
+            size (int | None): max entries per cache. None means .Size
+        """
+        self.size = size if size is not None else self.Size
+        self.validators = OrderedDict()
+        self.checked = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _cache(self, cache, key, val):
+        """Adds val at key of LRU cache evicting least recently used"""
+        cache[key] = val
+        cache.move_to_end(key)
+        while len(cache) > self.size:
+            cache.popitem(last=False)
+
+    def validator(self, said, schema, registry=None):
+        """Returns compiled validator of schema with SAID said. Compiles and
+        caches validator when not cached. Raises jsonschema SchemaError when
+        schema is not valid JSON Schema
+
+        Parameters:
+            said (str): qb64 SAID of schema
+            schema (dict): JSON Schema with SAID said
+            registry (referencing.Registry | None): registry that resolves
+                $ref of schema. None means no $ref resolution
+        """
+        key = said if registry is None else (said, id(registry))
+        if (entry := self.validators.get(key)) is not None and entry[0] is registry:
+            self.validators.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        cls = jsonschema.validators.validator_for(schema)
+        if said not in self.checked:
+            cls.check_schema(schema)  # raises SchemaError
+            self._cache(self.checked, said, True)
+        if registry is None:
+            validator = cls(schema)
+        else:
+            validator = cls(schema, registry=registry)
+        # registry kept with its validator so its id is not reused while cached
+        self._cache(self.validators, key, (registry, validator))
+        return validator
+
+    def check(self, said, schema):
+        """Returns True if schema with SAID said is valid Draft 7 JSON Schema.
+        Only checks schema when not already checked.
+
+        Parameters:
+            said (str): qb64 SAID of schema
+            schema (dict): JSON Schema with SAID said
+        """
+        if said in self.checked:
+            self.checked.move_to_end(said)
+            return True
+
+        try:
+            jsonschema.Draft7Validator.check_schema(schema=schema)
+        except jsonschema.exceptions.SchemaError:
+            return False
+
+        self._cache(self.checked, said, True)
+        return True
+
+    def clear(self):
+        """Removes all cached entries"""
+        self.validators.clear()
+        self.checked.clear()
+
+
+validatorCache = ValidatorCache()  # process-wide cache keyed by schema SAID
+
+
 class CacheResolver:
     """ Sample jsonschema resolver for loading schema $ref references from a local hash.
 
@@ -34,6 +136,8 @@ class CacheResolver:
 
         """
         self.db = db
+        self.resources = OrderedDict()  # referencing.Resource by schema SAID
+        self._registry = None
 
 
     def add(self, key, schema):
@@ -80,12 +184,17 @@ class CacheResolver:
         """ Locally cached schema resolver
 
         Returns a referencing.Registry for returning locally cached schema based on self-addressing
-        identifier URIs.
+        identifier URIs. The registry is built once per resolver and the schema
+        resources it retrieves from .db are cached by SAID in .resources so
+        that only schemas held by .db resolve.
 
         Parameters:
             scer (Optional(bytes)) is the source document that is being processed for reference resolution
 
         """
+        if self._registry is not None:
+            return self._registry
+
         def retrieve(uri):
             try:
                 idx = uri.rindex(":")
@@ -93,13 +202,22 @@ class CacheResolver:
             except ValueError:
                 key = uri
 
+            if (resource := self.resources.get(key)) is not None:
+                self.resources.move_to_end(key)
+                return resource
+
             schemer = self.db.schema.get(key)
             if not schemer:
                 raise referencing.exceptions.NoSuchResource(ref=uri)
 
-            return referencing.jsonschema.DRAFT7.create_resource(schemer.sed)
+            resource = referencing.jsonschema.DRAFT7.create_resource(schemer.sed)
+            self.resources[key] = resource
+            while len(self.resources) > validatorCache.size:  # evict LRU
+                self.resources.popitem(last=False)
+            return resource
 
-        return referencing.Registry(retrieve=retrieve)
+        self._registry = referencing.Registry(retrieve=retrieve)
+        return self._registry
 
 
 class JSONSchema:
@@ -217,7 +335,7 @@ class JSONSchema:
 
 
     @staticmethod
-    def verify_schema(schema):
+    def verify_schema(schema, said=None):
         """ Validate schema integrity
 
         Returns True if the provided schema validates successfully
@@ -225,7 +343,12 @@ class JSONSchema:
 
         Parameters:
             schema (dict): is the JSON schema to verify
+            said (str | None): verified qb64 SAID of schema. When provided the
+                result is cached so the schema is only checked once per process
         """
+        if said is not None:
+            return validatorCache.check(said, schema)
+
         try:
             jsonschema.Draft7Validator.check_schema(schema=schema)
         except jsonschema.exceptions.SchemaError:
@@ -234,12 +357,15 @@ class JSONSchema:
         return True
 
 
-    def verify_json(self, schema=b'', raw=b''):
+    def verify_json(self, schema=b'', raw=b'', said=None):
         """ Verify the raw content against the schema for JSON that conforms to the schema
 
         Parameters:
             schema (bytes): is the schema use for validation
             raw (bytes): is JSON to validate against the Schema
+            said (str | None): verified qb64 SAID of schema. When provided the
+                validator compiled for schema is cached by said and by the
+                registry of .resolver if any in validatorCache
 
         Returns:
             boolean: True if the JSON passes validation against the
@@ -252,7 +378,12 @@ class JSONSchema:
             kwargs = dict()
             if self.resolver is not None:
                 kwargs["registry"] = self.resolver.resolver(scer=raw)
-            jsonschema.validate(instance=d, schema=schema, **kwargs)
+            if said is None:
+                jsonschema.validate(instance=d, schema=schema, **kwargs)
+            else:
+                validator = validatorCache.validator(said, schema, **kwargs)
+                if (error := jsonschema.exceptions.best_match(validator.iter_errors(d))) is not None:
+                    raise error
         except jsonschema.exceptions.ValidationError as ex:
             raise ValidationError(f'Credential validation exception: {ex}')
         except jsonschema.exceptions.SchemaError as ex:
@@ -451,7 +582,7 @@ class Schemer:
             raw (bytes): is serialised JSON content to verify against schema
         """
 
-        return self.typ.verify_json(schema=self.sed, raw=raw)
+        return self.typ.verify_json(schema=self.sed, raw=raw, said=self.said)
 
 
     def pretty(self, *, size=1024):
@@ -472,4 +603,4 @@ class Schemer:
 
         """
 
-        return self.typ.verify_schema(schema=self.sed)
+        return self.typ.verify_schema(schema=self.sed, said=self.said)
@@ -180,12 +180,15 @@ class Serdery:
             # then can populate smellage  "proto pvrsn kind size gvrsn"
             # Serder._inhale then does its .loads given the smellage kind is CESR
 
+            # peek through memoryview so offsetting past ctr and label does
+            # not copy the remainder of ims
             lsize = 0  # label size in bytes
-            if not fixed:  # extract label for version field
-                labeler = Labeler(qb64b=ims[ctr.fullSize:])  # offset past ctr
-                lsize = labeler.fullsize
+            with memoryview(ims) as view:
+                if not fixed:  # extract label for version field
+                    labeler = Labeler(qb64b=view[ctr.fullSize:])  # offset past ctr
+                    lsize = labeler.fullSize
 
-            verser = Verser(qb64b=ims[ctr.fullSize+lsize:])  # in text domain
+                verser = Verser(qb64b=view[ctr.fullSize+lsize:])  # in text domain
             proto, pvrsn, gvrsn = verser.versage
             smellage = Smellage(proto=proto, pvrsn=pvrsn, kind=Kinds.cesr,
                                 size=size, gvrsn=gvrsn)
@@ -2129,6 +2132,11 @@ class SerderKERI(Serder):
     """SerderKERI is Serder subclass with Labels for KERI packet types (ilks) and
     properties for exposing field values of KERI messages
 
+    Derived primitive properties .sner, .tholder, .verfers, .ntholder,
+    .ndigers, .bner, and .berfers are memoized per instance so each is
+    materialized at most once. List valued ones are memoized as tuples and
+    returned as fresh lists of the same shared instances.
+
     See docs for Serder
 
     Inherited Properties:
@@ -2214,6 +2222,23 @@ class SerderKERI(Serder):
     Proto = Protocols.keri  # default protocol type
 
 
+    def _memoize(self, label, make):
+        """Returns derived value of field memoized on this instance so that it
+        is materialized at most once from ._sad. Memos are dropped whenever
+        ._sad is replaced.
+
+        Parameters:
+            label (str): memo label usually name of property
+            make (Callable): returns derived value from ._sad when not memoized
+        """
+        memos = self.__dict__.get("_memos")
+        if memos is None or memos[0] is not self._sad:  # missing or stale
+            memos = self._memos = (self._sad, {})
+        if label not in memos[1]:
+            memos[1][label] = make()
+        return memos[1][label]
+
+
     def _verify(self, **kwa):
         """Verifies said(s) in sad against raw
         Override for protocol and ilk specific verification behavior. Especially
@@ -2351,7 +2376,8 @@ class SerderKERI(Serder):
             sner (Number|None): Number instance of ._sad["s"] hex number str converted
         """
         # auto converts hex num str to int
-        return Number(num=self._sad["s"]) if 's' in self._sad else None
+        return self._memoize("sner", lambda: Number(num=self._sad["s"])
+                                             if 's' in self._sad else None)
 
 
     @property
@@ -2403,7 +2429,8 @@ class SerderKERI(Serder):
                                     or None if missing.
 
         """
-        return Tholder(sith=self._sad["kt"]) if "kt" in self._sad else None
+        return self._memoize("tholder", lambda: Tholder(sith=self._sad["kt"])
+                                                if "kt" in self._sad else None)
 
 
     @property
@@ -2425,8 +2452,10 @@ class SerderKERI(Serder):
                         One for each key. None means list missing from .sad['k']
 
         """
-        keys = self._sad.get("k")
-        return [Verfer(qb64=key) for key in keys] if keys is not None else None
+        verfers = self._memoize("verfers", lambda: tuple(Verfer(qb64=key)
+                                    for key in self._sad["k"])
+                                    if self._sad.get("k") is not None else None)
+        return list(verfers) if verfers is not None else None
 
 
     @property
@@ -2437,7 +2466,8 @@ class SerderKERI(Serder):
                                or None if missing.
 
         """
-        return Tholder(sith=self._sad["nt"]) if "nt" in self._sad else None
+        return self._memoize("ntholder", lambda: Tholder(sith=self._sad["nt"])
+                                                 if "nt" in self._sad else None)
 
 
     @property
@@ -2463,8 +2493,10 @@ class SerderKERI(Serder):
         if self.pvrsn.major < 2 and self.pvrsn.minor < 1 and self.ilk == Ilks.vcp:
             return None
 
-        digs = self._sad.get("n")
-        return [Diger(qb64=dig) for dig in digs] if digs is not None else None
+        ndigers = self._memoize("ndigers", lambda: tuple(Diger(qb64=dig)
+                                    for dig in self._sad["n"])
+                                    if self._sad.get("n") is not None else None)
+        return list(ndigers) if ndigers is not None else None
 
 
     @property
@@ -2476,7 +2508,8 @@ class SerderKERI(Serder):
             bner (Number|None): of ._sad["bt"] hex number str converted to Number.
                                 None if missing.
         """
-        return Number(num=self._sad["bt"]) if 'bt' in self._sad else None
+        return self._memoize("bner", lambda: Number(num=self._sad["bt"])
+                                             if 'bt' in self._sad else None)
 
     toader = bner  # alias
 
@@ -2517,8 +2550,10 @@ class SerderKERI(Serder):
                                         None if missing.
 
         """
-        baks = self._sad.get("b")
-        return [Verfer(qb64=bak) for bak in baks] if baks is not None else None
+        berfers = self._memoize("berfers", lambda: tuple(Verfer(qb64=bak)
+                                    for bak in self._sad["b"])
+                                    if self._sad.get("b") is not None else None)
+        return list(berfers) if berfers is not None else None
 
     witnesses = berfers  # alias
 
@@ -3,11 +3,16 @@
 KERI
 keri.db.basing module
 """
+import datetime
+import heapq
 import importlib
+import itertools
+import json
 import os
 import shutil
-from collections import namedtuple
-from contextlib import contextmanager
+import time
+from contextlib import contextmanager, nullcontext
+import blake3
 import lmdb
 import semver
 from ordered_set import OrderedSet as oset
@@ -17,6 +22,7 @@ from hio.help import ogler
 
 from keri import __version__
 from .dbing import LMDBer, dgKey, openLMDB
+from ..help import helping
 from ..kering import (MissingEntryError, DatabaseError, SerializeError,
                       ConfigurationError, ValidationError, Version,
                       Vrsn_1_0, Vrsn_2_0)
@@ -46,9 +52,27 @@ def _strip_prerelease(version_str):
 MIGRATIONS = [
     ("0.6.8", ["hab_data_rename"]),
     ("1.0.0", ["add_key_and_reg_state_schemas"]),
-    ("1.2.0", ["rekey_habs"])
+    ("1.2.0", ["rekey_habs"]),
+    ("2.0.0", ["add_seal_index"]),
 ]
 
+# migrations that build derived indexes. Run whenever their completion marker
+# in .migs is missing regardless of database version
+INDEX_MIGRATIONS = ["add_seal_index"]
+
+
+def _sealDigest(seal):
+    """Returns hex Blake3_256 digest of seal dict as key into .ancs index.
+    Digest is over compact JSON of seal in field order so same type of seal
+    with same values in same order has same digest.
+
+    Parameters:
+        seal (dict): anchored seal of any type
+    """
+    ser = json.dumps(seal, separators=(",", ":"), ensure_ascii=False,
+                     default=str).encode()
+    return blake3.blake3(ser).hexdigest()
+
 
 # ToDo XXXX maybe
 '''
@@ -77,16 +101,32 @@ class statedict(dict):
     Subclass of dict that has db as attribute and employs read through cache
     from db Baser.stts of kever states to reload kever from state in database
     when not found in memory as dict item.
+
+    When .size is non zero at most .size kevers are kept in memory. The least
+    recently used kever is evicted once .size is exceeded, except kevers of
+    locally owned prefixes in .db.prefixes which are pinned. An evicted kever
+    is reloaded from its persisted key state on next access.
+
+    Attributes:
+        db (Baser | None): database of key states for read through
+        size (int): max kevers in memory, 0 means unbounded
+        hits (int): count of lookups found in memory
+        misses (int): count of lookups reloaded from .db.states
+        evictions (int): count of kevers evicted from memory
     """
-    __slots__ = ('db')  # no .__dict__ just for db reference
+    __slots__ = ('db', 'size', 'hits', 'misses', 'evictions')  # no .__dict__
 
-    def __init__(self, *pa, **kwa):
+    def __init__(self, *pa, size=0, **kwa):
         super(statedict, self).__init__(*pa, **kwa)
         self.db = None
+        self.size = size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
 
     def __getitem__(self, k):
         try:
-            return super(statedict, self).__getitem__(k)
+            val = super(statedict, self).__getitem__(k)
         except KeyError as ex:
             if not self.db:
                 raise ex  # reraise KeyError
@@ -97,9 +137,39 @@ class statedict(dict):
                 kever = Kever(state=ksr, db=self.db)
             except MissingEntryError:  # no kel event for keystate
                 raise ex  # reraise KeyError
+            self.misses += 1
             self.__setitem__(k, kever)
             return kever
 
+        self.hits += 1
+        if self.size:  # move to most recently used end
+            super(statedict, self).__delitem__(k)
+            super(statedict, self).__setitem__(k, val)
+        return val
+
+    def __setitem__(self, k, v):
+        if self.size and super(statedict, self).__contains__(k):
+            super(statedict, self).__delitem__(k)  # move to most recent end
+        super(statedict, self).__setitem__(k, v)
+        if self.size and len(self) > self.size:
+            self.evict()
+
+    def evict(self):
+        """Evict least recently used unpinned kevers until at most .size
+        remain in memory. Kevers of prefixes in .db.prefixes are pinned.
+        """
+        pins = self.db.prefixes if self.db else ()
+        excess = len(self) - self.size
+        stale = []
+        for k in self.keys():  # least recently used first
+            if excess <= len(stale):
+                break
+            if k not in pins:
+                stale.append(k)
+        for k in stale:
+            super(statedict, self).__delitem__(k)
+        self.evictions += len(stale)
+
     def __contains__(self, k):
         if not super(statedict, self).__contains__(k):
             try:
@@ -119,14 +189,95 @@ class statedict(dict):
 
         Returns:
             kever: converted from underlying dict or database
+                When .size is non zero reads through to database so that an
+                evicted kever is reloaded
 
         """
+        if self.size:
+            try:
+                return self.__getitem__(k)
+            except KeyError:
+                return default
+
         if not super(statedict, self).__contains__(k):
             return default
         else:
             return self.__getitem__(k)
 
 
+class verifierdict(dict):
+    """
+    Subclass of dict that is a bounded in memory cache of the signing threshold
+    and verifiers of accepted establishment events keyed by (pre, sn) with
+    value (dig, tholder, verfers) for Baser.resolveVerifiers. Accepted
+    establishment events do not change so entries never go stale. A superseding
+    recovery event at the same sn replaces the entry.
+
+    The least recently used entry is evicted once .size is exceeded.
+    .size of 0 means caching is disabled.
+
+    Attributes:
+        size (int): max entries in memory, 0 means none
+        hits (int): count of lookups found in memory
+        misses (int): count of lookups not found in memory
+        evictions (int): count of entries evicted from memory
+    """
+    __slots__ = ('size', 'hits', 'misses', 'evictions')  # no .__dict__
+
+    def __init__(self, *pa, size=0, **kwa):
+        super(verifierdict, self).__init__(*pa, **kwa)
+        self.size = size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def hitRate(self):
+        """Returns fraction of lookups found in memory, 0.0 when none"""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def fetch(self, pre, sn, dig=None):
+        """Returns (tholder, verfers) of establishment event of pre at sn or
+        None when not cached or cached event does not match dig
+
+        Parameters:
+            pre (str): qb64 identifier prefix
+            sn (int): sequence number of establishment event
+            dig (str | None): qb64 said of establishment event. None means any
+        """
+        key = (pre, sn)
+        if (val := super(verifierdict, self).get(key)) is None or \
+                (dig is not None and val[0] != dig):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        super(verifierdict, self).__delitem__(key)  # move to most recent end
+        super(verifierdict, self).__setitem__(key, val)
+        return val[1], val[2]
+
+    def pin(self, pre, sn, dig, tholder, verfers):
+        """Caches tholder and verfers of establishment event dig of pre at sn
+        replacing any superseded event at sn
+
+        Parameters:
+            pre (str): qb64 identifier prefix
+            sn (int): sequence number of establishment event
+            dig (str): qb64 said of establishment event
+            tholder (Tholder): signing threshold of event
+            verfers (list): Verfer instances of signing keys of event
+        """
+        if not self.size:
+            return
+        key = (pre, sn)
+        self.pop(key, None)  # move to most recent end
+        super(verifierdict, self).__setitem__(key, (dig, tholder, verfers))
+        while len(self) > self.size:
+            super(verifierdict, self).__delitem__(next(iter(self)))
+            self.evictions += 1
+
+
 def openDB(*, cls=None, name="test", **kwa):
     """
     Returns contextmanager generated by openLMDB but with Baser instance as default
@@ -161,6 +312,9 @@ def reopenDB(db, clear=False, **kwa):
 
 
 KERIBaserMapSizeKey = "KERI_BASER_MAP_SIZE"
+KERIBaserEvtsCacheSizeKey = "KERI_BASER_EVTS_CACHE_SIZE"
+KERIBaserKeversCacheSizeKey = "KERI_BASER_KEVERS_CACHE_SIZE"
+KERIBaserVerifiersCacheSizeKey = "KERI_BASER_VERIFIERS_CACHE_SIZE"
 
 
 class Baser(LMDBer):
@@ -173,9 +327,22 @@ class Baser(LMDBer):
         prefixes (OrderedSet): local prefixes corresponding to habitats for
             this db
         groups (OrderedSet): group hab identifier prefixes for this db
+        wakes (dict): escrow wake index keyed by qb64 identifier prefix whose
+            escrowed entries may now be unescrowed. Value is int sn of latest
+            first seen event of prefix or None when no event was accepted.
+            Consumed by Kevery.processEscrows.
+        waiters (dict): escrow dependency index keyed by qb64 identifier prefix
+            of dependency such as delegator or receiptor. Value is OrderedSet
+            of qb64 identifier prefixes with escrowed entries waiting on it.
+        deadlines (dict): escrow timeout index keyed by qb64 identifier prefix
+            with escrowed entries. Value is earliest datetime at which one of
+            its entries may go stale. Popped by .expired.
+        expiries (list): heap of (datetime, pre) duples of .deadlines ordered
+            by datetime so .expired only pops the due ones.
 
         .evts is named subDB instance of SerderSuber whose values are serialized
             key events
+            Caches up to .EvtsCacheSize deserialized events when non zero
             subkey 'evts.'
             dgKey (prefix + digest)
             DB is keyed by identifier prefix plus digest of serialized event
@@ -217,6 +384,15 @@ class Baser(LMDBer):
             (fixed 24-char), used to lookup authorizer's source event in .kels.
             Only one value per DB key is allowed.
 
+        .ancs is named subDB instance of IoSetSuber for anchored seal index
+            that maps each seal anchored in key event to SAID of that key
+            event. Populated by Kever.logEvent for every event added to .kels.
+            subkey 'ancs.'
+            Key: (prefix, digest of seal dict) of anchoring KEL and seal
+            Value: qb64 SAID of anchoring event used to lookup event in .evts.
+            More than one value per DB key is allowed.
+            Only complete once .sealIndexed, otherwise lookups walk the KEL.
+
         .sigs is named subDB instance of CesrIoSetSuber (klas=Siger) for
             fully qualified indexed event signatures from the controller.
             subkey 'sigs.'
@@ -749,6 +925,18 @@ class Baser(LMDBer):
             datetimes, drift, and lag values.
             subkey 'tmsc.'
 
+        .kramMSGX is named subDB instance of Suber for the KRAM message cache
+            expiry index. Maps (expiry, AID, MID) to the message datetime of
+            the .kramMSGC entry at (AID, MID) where expiry is the 16 char hex
+            of mdt + d + pml in epoch milliseconds so keys sort by expiry.
+            subkey 'msgx.'
+
+        .kramTMSX is named subDB instance of Suber for the KRAM transactioned
+            message cache expiry index. Maps (expiry, AID, XID, MID) to the
+            exchange datetime of the .kramTMSC entry at (AID, XID, MID) where
+            expiry is the 16 char hex of xdt + pxl in epoch milliseconds.
+            subkey 'tmsx.'
+
         .kramPMKM is named subDB instance of SerderSuber for KRAM partially signed
             multi-key messages. Maps (AID, MID) key to the associated
             SerderKERI message.
@@ -859,10 +1047,20 @@ class Baser(LMDBer):
 
     Properties:
         kevers (statedict): read through cache of kevers of states for KELs in db
+            Keeps at most .KeversCacheSize kevers in memory when non zero
+            but never evicts kevers of local .prefixes
+        verifiers (verifierdict): bounded cache of tholder and verfers of
+            accepted establishment events for .resolveVerifiers
+            Keeps at most .VerifiersCacheSize entries, 0 means none
 
     """
+    MaxNamedDBs = 128  # more named sub dbs than LMDBer default
+    EvtsCacheSize = 0  # max cached deserialized events in .evts, 0 means none
+    KeversCacheSize = 0  # max kevers in memory in .kevers, 0 means unbounded
+    VerifiersCacheSize = 4096  # max entries in .verifiers, 0 means none
+    CloneLogCount = 10000  # events between progress logs of .cloneObjsInto
 
-    def __init__(self, headDirPath=None, reopen=False, **kwa):
+    def __init__(self, headDirPath=None, reopen=False, lazy=False, **kwa):
         """
         Setup named sub databases.
 
@@ -877,13 +1075,22 @@ class Baser(LMDBer):
                 If not provided use default .HeadDirpath
             mode is int numeric os dir permissions for database directory
             reopen (bool): True means database will be reopened by this init
+            lazy (bool): True means .reload does not build the Kevers of .habs
+                so they are read through into .kevers on first access instead
+                False means .reload builds Kevers of all .habs up front
 
 
         """
+        self.lazy = True if lazy else False
         self.prefixes = oset()  # should change to hids for hab ids
         self.groups = oset()  # group hab ids
+        self.wakes = dict()  # escrow wakes, pre: sn of latest accepted or None
+        self.waiters = dict()  # escrow dependencies, pre: oset of waiting pres
+        self.deadlines = dict()  # escrow timeouts, pre: earliest deadline
+        self.expiries = []  # heap of (deadline, pre) of .deadlines
         self._kevers = statedict()
         self._kevers.db = self  # assign db for read through cache of kevers
+        self._sealIndexed = False  # read through cache of .sealIndexed
 
         if (mapSize := os.getenv(KERIBaserMapSizeKey)) is not None:
             try:
@@ -892,6 +1099,29 @@ class Baser(LMDBer):
                 logger.error("KERI_BASER_MAP_SIZE must be an integer value >1!")
                 raise
 
+        if (cacheSize := os.getenv(KERIBaserEvtsCacheSizeKey)) is not None:
+            try:
+                self.EvtsCacheSize = int(cacheSize)
+            except ValueError:
+                logger.error("KERI_BASER_EVTS_CACHE_SIZE must be an integer value >=0!")
+                raise
+
+        if (cacheSize := os.getenv(KERIBaserKeversCacheSizeKey)) is not None:
+            try:
+                self.KeversCacheSize = int(cacheSize)
+            except ValueError:
+                logger.error("KERI_BASER_KEVERS_CACHE_SIZE must be an integer value >=0!")
+                raise
+        self._kevers.size = self.KeversCacheSize
+
+        if (cacheSize := os.getenv(KERIBaserVerifiersCacheSizeKey)) is not None:
+            try:
+                self.VerifiersCacheSize = int(cacheSize)
+            except ValueError:
+                logger.error("KERI_BASER_VERIFIERS_CACHE_SIZE must be an integer value >=0!")
+                raise
+        self.verifiers = verifierdict(size=self.VerifiersCacheSize)
+
         super(Baser, self).__init__(headDirPath=headDirPath, reopen=reopen, **kwa)
 
     @property
@@ -901,6 +1131,17 @@ class Baser(LMDBer):
         """
         return self._kevers
 
+    @property
+    def sealIndexed(self):
+        """
+        Returns True when .ancs anchored seal index holds the seals of every
+        event in .kels as marked by completion of migration add_seal_index.
+        Databases created before the index remain unindexed until then.
+        """
+        if not self._sealIndexed:
+            self._sealIndexed = self.migs.get(keys=("add_seal_index",)) is not None
+        return self._sealIndexed
+
     def reopen(self, **kwa):
         """
         Open sub databases
@@ -926,12 +1167,14 @@ class Baser(LMDBer):
         # Names end with "." as sub DB name must include a non Base64 character
         # to avoid namespace collisions with Base64 identifier prefixes.
 
-        self.evts = subing.SerderSuber(db=self, subkey='evts.')
+        self.evts = subing.SerderSuber(db=self, subkey='evts.',
+                                       cacheSize=self.EvtsCacheSize)
         self.fels = subing.OnSuber(db=self, subkey='fels.')
         self.kels = subing.OnIoDupSuber(db=self, subkey='kels.')
         self.dtss = subing.CesrSuber(db=self, subkey='dtss.', klas=coring.Dater)
         self.aess = subing.CatCesrSuber(db=self, subkey='aess.',
                                         klas=(coring.Number, coring.Diger))
+        self.ancs = subing.IoSetSuber(db=self, subkey='ancs.')
         self.sigs = subing.CesrIoSetSuber(db=self, subkey='sigs.',
                                         klas=(indexing.Siger))
         self.wigs = subing.CesrIoSetSuber(db=self, subkey='wigs.', klas=indexing.Siger)
@@ -1272,6 +1515,12 @@ class Baser(LMDBer):
         self.kramTMSC = koming.Komer(db=self, subkey='tmsc.',
                                  klas=TxnMsgCacheRecord)
 
+        # KRAM message cache expiry index — key: (expiry, AID, MID), value: msg datetime
+        self.kramMSGX = subing.Suber(db=self, subkey='msgx.')
+
+        # KRAM transactioned message cache expiry index — key: (expiry, AID, XID, MID), value: xchg datetime
+        self.kramTMSX = subing.Suber(db=self, subkey='tmsx.')
+
         # KRAM partially signed multi-key message key (AID.MID) mapped to associated message (SerderKERI)
         self.kramPMKM = subing.SerderSuber(db=self, subkey='pmkm.')
 
@@ -1329,6 +1578,12 @@ class Baser(LMDBer):
                                                   klas=(coring.Diger, coring.Noncer,
                                                         coring.Labeler, coring.Texter))
 
+        self._sealIndexed = False
+        if (not self.readonly and self.version == __version__ and
+                next(self.kels.getTopItemIter(), None) is None):  # new so index complete
+            if self.migs.get(keys=("add_seal_index",)) is None:
+                self.migs.pin(keys=("add_seal_index",), val=coring.Dater())
+
         self.reload()
 
         return self.env
@@ -1338,6 +1593,9 @@ class Baser(LMDBer):
         """
         Reload stored prefixes and Kevers from .habs
 
+        When .lazy only reloads prefixes and groups of .habs that have key
+        state. Their Kevers are then read through into .kevers on first access.
+
         """
         # Check migrations to see if this database is up to date.  Error otherwise
         if not self.current:
@@ -1345,7 +1603,13 @@ class Baser(LMDBer):
 
         removes = []
         for keys, data in self.habs.getTopItemIter():
-            if (ksr := self.states.get(keys=data.hid)) is not None:
+            ksr = self.states.get(keys=data.hid)
+            if self.lazy and ksr is not None:
+                self.prefixes.add(data.hid)
+                if data.mid:  # group hab
+                    self.groups.add(data.hid)
+
+            elif ksr is not None:
                 try:
                     from ..core.eventing import Kever
                     kever = Kever(state=ksr,
@@ -1418,6 +1682,22 @@ class Baser(LMDBer):
             # update database version after successful migration
             self.version = version
 
+        # derived indexes are rebuilt whenever incomplete even when the version
+        # is current such as dev databases created before the index existed
+        for migration in INDEX_MIGRATIONS:
+            if self.migs.get(keys=(migration,)) is not None:
+                continue
+
+            mod = importlib.import_module(f"keri.db.migrations.{migration}")
+            try:
+                print(f"running migration {mod.__name__}")
+                mod.migrate(self)
+            except Exception as e:
+                print(f"\nAbandoning migration {migration} with error: {e}")
+                return
+
+            self.migs.pin(keys=(migration,), val=coring.Dater())
+
         self.version = __version__
 
     def _trimAllEscrows(self):
@@ -1444,6 +1724,80 @@ class Baser(LMDBer):
         if total > 0:
             print(f"Cleared {total} escrow entries before migration")
 
+    def wake(self, pre, sn=None):
+        """Marks escrowed entries of pre and of all prefixes waiting on pre as
+        woken so that Kevery.processEscrows reprocesses them without sweeping
+        every escrow table. Waiters are released once woken and re-register
+        if they escrow again.
+
+        Parameters:
+            pre (str|bytes): qb64 identifier prefix with new event or receipt
+            sn (int|None): sequence number of first seen accepted event of pre.
+                None means no event was accepted such as new receipt or sig.
+        """
+        pre = pre.decode() if hasattr(pre, "decode") else pre
+        last = self.wakes.get(pre)
+        if sn is None or (last is not None and last > sn):
+            sn = last  # keep latest accepted sn
+        self.wakes[pre] = sn
+        for waiter in self.waiters.pop(pre, ()):
+            self.wakes.setdefault(waiter, None)
+
+    def wait(self, pre, on):
+        """Registers that escrowed entries of pre wait on events of prefix on
+        so that wake of on also wakes pre.
+
+        Parameters:
+            pre (str|bytes): qb64 identifier prefix of escrowed entries
+            on (str|bytes|None): qb64 identifier prefix waited on such as
+                delegator or receiptor. None means nothing to wait on.
+        """
+        if not on:
+            return
+        pre = pre.decode() if hasattr(pre, "decode") else pre
+        on = on.decode() if hasattr(on, "decode") else on
+        if on != pre:
+            self.waiters.setdefault(on, oset()).add(pre)
+
+    def expire(self, pre, dater=None, timeout=0):
+        """Indexes when escrowed entries of pre may go stale so that
+        .expired returns pre at that time without sweeping every escrow table.
+        Only the earliest pending deadline of pre is kept. Reprocessing an
+        entry that is still escrowed indexes its next deadline.
+
+        Parameters:
+            pre (str|bytes): qb64 identifier prefix of escrowed entries
+            dater (Dater|None): escrow datetime of entry. None means now.
+            timeout (int|float): seconds after escrow datetime that entry
+                goes stale
+        """
+        pre = pre.decode() if hasattr(pre, "decode") else pre
+        start = dater.datetime if dater is not None else helping.nowUTC()
+        deadline = start + datetime.timedelta(seconds=timeout)
+        last = self.deadlines.get(pre)
+        if last is None or deadline < last:
+            self.deadlines[pre] = deadline
+            heapq.heappush(self.expiries, (deadline, pre))
+
+    def expired(self, now=None):
+        """Pops each prefix in .deadlines whose deadline is past so that
+        Kevery.processEscrows times out its stale escrowed entries.
+
+        Returns:
+            due (list): qb64 identifier prefixes whose deadline is past
+
+        Parameters:
+            now (datetime.datetime|None): current time. None means now.
+        """
+        now = now if now is not None else helping.nowUTC()
+        due = []
+        while self.expiries and self.expiries[0][0] < now:
+            deadline, pre = heapq.heappop(self.expiries)
+            if self.deadlines.get(pre) == deadline:  # else superseded
+                del self.deadlines[pre]
+                due.append(pre)
+        return due
+
     def clearEscrows(self):
         """
         Clear all escrows
@@ -1457,6 +1811,10 @@ class Baser(LMDBer):
             count = escrow.cntAll()
             escrow.trim()
             logger.info(f"KEL: Cleared {count} escrows from ({escrow}")
+        self.wakes.clear()
+        self.waiters.clear()
+        self.deadlines.clear()
+        self.expiries.clear()
 
     @property
     def current(self):
@@ -1518,7 +1876,7 @@ class Baser(LMDBer):
         return migrations
 
 
-    def clean(self, gvrsn=Version, *, version=None):
+    def clean(self, gvrsn=Version, *, version=None, objs=True):
         """
         Clean database by creating re-verified cleaned cloned copy
         and then replacing original with cleaned cloned copy
@@ -1528,7 +1886,17 @@ class Baser(LMDBer):
 
         Parameters:
             gvrsn (Versionage): CESR genus version for clone attachments and parser
+                when objs is False
             version (Versionage): legacy alias for gvrsn
+            objs (bool): True means clone events by passing the event objects
+                from .cloneAllPreObjIter directly to Kevery with the events of
+                each prefix written to the copy in one transaction.
+                False means clone by serializing each event as a CESR message
+                and parsing it back with Parser.
+
+        Raises:
+            ValueError: If objs and any event failed to clone. The original is
+                left in place and the copy is discarded
 
         """
         from ..core import parsing
@@ -1541,7 +1909,8 @@ class Baser(LMDBer):
                     temp=False,
                     headDirPath=self.headDirPath,
                     perm=self.perm,
-                    clean=True) as copy:  # copy is Baser instance
+                    clean=True,
+                    profile=self.profile) as copy:  # copy is Baser instance
 
             with reopenDB(db=self, reuse=True, readonly=True):  # reopen as readonly
                 if not os.path.exists(self.path):
@@ -1550,14 +1919,17 @@ class Baser(LMDBer):
                 from ..core.eventing import Kevery
                 kvy = Kevery(db=copy)  # promiscuous mode
 
-                # Revise in future to NOT parse msgs but to extract the processed
-                # objects so can pass directly to kvy.processEvent()
-                # need new method cloneObjAllPreIter()
-                # process event doesn't capture exceptions so we can more easily
-                # detect in the cloning that some events did not make it through
-                psr = parsing.Parser(kvy=kvy, version=gvrsn)
-                for msg in self.cloneAllPreIter(gvrsn=gvrsn):  # clone into copy
-                    psr.parseOne(ims=msg)
+                if objs:  # extract objects and pass directly to kvy
+                    count, failed = self.cloneObjsInto(kvy)
+                    if failed:  # keep original untouched and discard copy
+                        copy.close(clear=True)
+                        raise ValueError(f"Error while cleaning, {failed} of "
+                                         f"{count} events failed to clone "
+                                         f"from {self.path}.")
+                else:
+                    psr = parsing.Parser(kvy=kvy, version=gvrsn)
+                    for msg in self.cloneAllPreIter(gvrsn=gvrsn):  # clone into copy
+                        psr.parseOne(ims=msg)
 
                 # This is the list of non-set based databases that are not created as part of event processing.
                 # for now we are just copying them from self to copy without worrying about being able to
@@ -1708,6 +2080,149 @@ class Baser(LMDBer):
 
 
 
+    def cloneObjsInto(self, kvy):
+        """
+        Clones all first seen events of all KELs into kvy.db by processing the
+        event objects from .cloneAllPreObjIter directly with kvy without
+        serializing and reparsing them. The events of each prefix are written in
+        one transaction on kvy.db. Like Parser, errors from processing an event
+        are logged and cloning continues with the next event. The writes of a
+        failed event are rolled back in its own savepoint so the rest of its
+        prefix still commits. When kvy.db is not .nestable, such as with the
+        writemap of the throughput and volatile profiles, each event is written
+        in its own transaction instead. lmdb.MapFullError is not caught so the
+        caller may clone again once the map of kvy.db has grown.
+        Logs progress every .CloneLogCount events.
+
+        Parameters:
+            kvy (Kevery): instance whose .db receives the cloned events
+
+        Returns:
+            tuple: (count, failed) number of events cloned and number that
+                raised errors while processing
+        """
+        count = failed = 0
+        start = time.perf_counter()
+        for pre, group in itertools.groupby(self.cloneAllPreObjIter(),
+                                            key=lambda item: item[0]):
+            # without child transactions each savepoint is its own transaction
+            with kvy.db.transact() if kvy.db.nestable else nullcontext():
+                for _, exts in group:
+                    try:
+                        with kvy.db.savepoint():  # failed event rolls back alone
+                            kvy.processEvent(**exts)
+                            if exts['cigars']:
+                                kvy.processAttachedReceiptCouples(**exts)
+                            if exts['rsgs']:
+                                kvy.processAttachedReceiptSigGroups(**exts)
+                    except lmdb.MapFullError:
+                        raise  # unit of work rolled back so clone again once grown
+                    except Exception as ex:
+                        failed += 1
+                        logger.error("Clone of event said=%s of pre=%s failed: %s",
+                                     exts['serder'].said, pre, ex)
+                    count += 1
+                    if count % self.CloneLogCount == 0:
+                        elapsed = time.perf_counter() - start
+                        logger.info("Cloned %d events (%d failed) in %.1f s at %.1f events/s",
+                                    count, failed, elapsed, count / elapsed)
+
+        elapsed = time.perf_counter() - start
+        logger.info("Cloned %d events (%d failed) in %.1f s at %.1f events/s",
+                    count, failed, elapsed, count / elapsed if elapsed else 0.0)
+        return (count, failed)
+
+
+    def cloneAllPreObjIter(self):
+        """
+        Returns iterator of (pre, exts) duples of the first seen events of all
+        identifier prefixes in first seen order where exts is the dict of event
+        objects from .cloneEvtObjs. Events missing any required part are skipped.
+        Object level analog of .cloneAllPreIter
+
+        Returns:
+           objs (Iterator): over (pre, exts) of all events in db
+        """
+        for keys, fn, dig in self.fels.getAllItemIter(keys=b'', on=0):
+            pre = keys[0]
+            try:
+                exts = self.cloneEvtObjs(pre=pre, fn=fn, dig=dig)
+            except MissingEntryError as ex:
+                continue  # skip this event
+            yield (pre, exts)
+
+
+    def cloneEvtObjs(self, pre, fn, dig):
+        """
+        Clones Event as dict of the objects of its body and attachments with
+        the keyword argument names of Kevery.processEvent,
+        .processAttachedReceiptCouples and .processAttachedReceiptSigGroups
+
+        Parameters:
+            pre (str | bytes): identifier prefix of event
+            fn (int): first seen number (ordinal) of event
+            dig (str | bytes): digest of event
+
+        Returns:
+            exts (dict): with items
+                serder (SerderKERI): event
+                sigers (list[Siger]): controller indexed signatures
+                wigers (list[Siger]): witness indexed signatures
+                cigars (list[Cigar]): nontrans endorsements with .verfer
+                rsgs (list[tuple]): trans endorsements as
+                    (prefixer, number, diger, sigers)
+                delsner (Number | None): delegating event sequence number
+                delsger (Diger | None): delegating event SAID
+                firner (Number): first seen ordinal
+                dater (Dater): first seen datetime
+        """
+        from ..core import Prefixer, Number, Diger, Verfer
+
+        keys = (pre, dig)
+
+        # get serder
+        if not (serder := self.evts.get(keys=keys)):
+            raise MissingEntryError("Missing event for dig={}.".format(dig))
+
+        # get indexed signatures
+        if not (sigers := self.sigs.get(keys=keys)):
+            raise MissingEntryError("Missing sigs for dig={}.".format(dig))
+
+        # get indexed witness signatures if any
+        wigers = self.wigs.get(keys=keys)
+
+        # get nontrans endorsement couples not witnesses
+        # may have been originally key event attachments or receipted endorsements
+        cigars = []
+        if coups := self.rcts.get(keys=keys):
+            for prefixer, cigar in coups:
+                cigar.verfer = Verfer(qb64b=prefixer.qb64b)  # assign verfer
+                cigars.append(cigar)
+
+        # get trans receipt/endorsement attachments not controller
+        # may have been originally non-controller sigs or receipted endorsements
+        rsets = dict()  # collate  by triple of rpre,rsnh,rdig
+        for quintkeys, siger in self.vrcs.getTopItemIter(keys=keys):
+            epre, edig, rpre, rsnh, rdig = quintkeys  # expand quintkeys tuple
+            rsets.setdefault((rpre, rsnh, rdig), []).append(siger)
+
+        rsgs = [(Prefixer(qb64=rpre), Number(snh=rsnh), Diger(qb64=rdig), rigers)
+                for (rpre, rsnh, rdig), rigers in rsets.items()]
+
+        # get authorizer (delegator/issuer) source seal event couple if any
+        delsner = delsger = None
+        if couple := self.aess.get(keys=keys):
+            delsner, delsger = couple
+
+        # get first seen replay couple
+        if not (dater := self.dtss.get(keys=keys)):
+            raise MissingEntryError("Missing datetime for dig={}.".format(dig))
+
+        return dict(serder=serder, sigers=sigers, wigers=wigers, cigars=cigars,
+                    rsgs=rsgs, delsner=delsner, delsger=delsger,
+                    firner=Number(num=fn), dater=dater)
+
+
     def cloneEvtMsg(self, pre, fn, dig, gvrsn=Version, *, version=None):
         """
         Clones Event as Serialized CESR Message with Body and attached Foot
@@ -1930,6 +2445,56 @@ class Baser(LMDBer):
             for dmsg in self.clonePreIter(pre=kever.delpre, fn=0, gvrsn=gvrsn):
                 yield dmsg
 
+    def indexSeals(self, serder):
+        """Adds SAID of key event serder to .ancs anchored seal index at each
+        seal dict anchored in its seals list.
+
+        Parameters:
+            serder (SerderKERI): key event added to KEL
+        """
+        for seal in serder.seals or []:  # or [] for seals 'a' field missing
+            if isinstance(seal, dict):
+                self.ancs.add(keys=(serder.pre, _sealDigest(seal)), val=serder.said)
+
+    def getSealingEvtIter(self, pre, seal, sn=0, last=False):
+        """
+        Returns iterator of events in sn order from the KEL of pre that anchor
+        the provided seal using .ancs anchored seal index instead of walking
+        the KEL. Events at same sn are in KEL insertion order. Walks the KEL
+        when the index is not yet complete, see .sealIndexed.
+
+        Parameters:
+            pre (bytes|str): identifier of the KEL to search
+            seal (dict): dict form of Seal of any type
+            sn (int): beginning sn to search
+            last (bool): True means only last event at each sn so does not
+                include disputed and/or superseded events.
+                False means includes disputed and/or superseded events.
+        """
+        if hasattr(pre, 'decode'):
+            pre = pre.decode("utf-8")
+
+        digest = _sealDigest(seal)
+        if not self.sealIndexed:  # index incomplete so walk the KEL
+            srdrs = self.getEvtLastPreIter(pre=pre, sn=sn) if last else self.getEvtPreIter(pre=pre, sn=sn)
+            for srdr in srdrs:
+                for eseal in srdr.seals or []:  # or [] for seals 'a' field missing
+                    if isinstance(eseal, dict) and _sealDigest(eseal) == digest:
+                        yield srdr
+                        break
+            return
+
+        srdrs = []
+        for said in self.ancs.getIter(keys=(pre, digest)):
+            if not (srdr := self.evts.get(keys=(pre, said))) or srdr.sn < sn:
+                continue  # skip missing or earlier event
+            if last and self.kels.getLast(keys=pre, on=srdr.sn) != srdr.said:
+                continue  # skip disputed or superseded event
+            srdrs.append(srdr)
+
+        srdrs.sort(key=lambda srdr: srdr.sn)  # stable so insertion order at sn
+        yield from srdrs
+
     def fetchAllSealingEventByEventSeal(self, pre, seal, sn=0):
         """
         Search through a KEL for the event that contains a specific anchored
@@ -1940,6 +2505,9 @@ class Baser(LMDBer):
 
             None if not found
 
+        Uses .ancs anchored seal index so does not walk the KEL once
+        .sealIndexed.
+
         Parameters:
             pre (bytes|str): identifier of the KEL to search
             seal (dict): dict form of Seal of any type SealEvent to find in anchored
@@ -1952,14 +2520,9 @@ class Baser(LMDBer):
         if tuple(seal) != SealEvent._fields:  # wrong type of seal
             return None
 
-        seal = SealEvent(**seal)  #convert to namedtuple
-
-        for srdr in self.getEvtPreIter(pre=pre, sn=sn):  # includes disputed & superseded
-            for eseal in srdr.seals or []:  # or [] for seals 'a' field missing
-                if tuple(eseal) == SealEvent._fields:
-                    eseal = SealEvent(**eseal)  # convert to namedtuple
-                    if seal == eseal and self.fullyWitnessed(srdr):
-                        return srdr
+        for srdr in self.getSealingEvtIter(pre=pre, seal=seal, sn=sn):  # includes disputed & superseded
+            if self.fullyWitnessed(srdr):
+                return srdr
         return None
 
     # use alias here until can change everywhere for  backwards compatibility
@@ -1974,6 +2537,9 @@ class Baser(LMDBer):
         Searches only last events in KEL of pre so does not include disputed
         and/or superseded events.
 
+        Uses .ancs anchored seal index so does not walk the KEL once
+        .sealIndexed.
+
         Returns:
             srdr (Serder): instance of the first event with the matching
                 anchoring SealEvent seal,
@@ -1991,18 +2557,11 @@ class Baser(LMDBer):
         if tuple(seal) != SealEvent._fields:  # wrong type of seal
             return None
 
-        seal = SealEvent(**seal)  #convert to namedtuple
-
-        for srdr in self.getEvtLastPreIter(pre=pre, sn=sn):  # no disputed or superseded
-            for eseal in srdr.seals or []:  # or [] for seals 'a' field missing
-                if tuple(eseal) == SealEvent._fields:
-                    eseal = SealEvent(**eseal)  # convert to namedtuple
-                    if seal == eseal and self.fullyWitnessed(srdr):
-                        return srdr
+        for srdr in self.getSealingEvtIter(pre=pre, seal=seal, sn=sn, last=True):  # no disputed or superseded
+            if self.fullyWitnessed(srdr):
+                return srdr
         return None
 
-
-
     def fetchLastSealingEventBySeal(self, pre, seal, sn=0):
         """Only searches last event at any sn therefore does not search
         any disputed or superseded events.
@@ -2013,6 +2572,9 @@ class Baser(LMDBer):
 
             None if not found
 
+        Uses .ancs anchored seal index so does not walk the KEL once
+        .sealIndexed.
+
         Parameters:
             pre (bytes|str): identifier of the KEL to search
             seal (dict): dict form of Seal of any type to find in anchored
@@ -2020,15 +2582,9 @@ class Baser(LMDBer):
             sn (int): beginning sn to search
 
         """
-        # create generic Seal namedtuple class using keys from provided seal dict
-        Seal = namedtuple('Seal', list(seal))  # matching type
-
-        for srdr in self.getEvtLastPreIter(pre=pre, sn=sn):  # only last evt at sn
-            for eseal in srdr.seals or []:  # or [] for seals 'a' field missing
-                if tuple(eseal) == Seal._fields:  # same type of seal
-                    eseal = Seal(**eseal)  #convert to namedtuple
-                    if seal == eseal and self.fullyWitnessed(srdr):
-                        return srdr
+        for srdr in self.getSealingEvtIter(pre=pre, seal=seal, sn=sn, last=True):  # only last evt at sn
+            if self.fullyWitnessed(srdr):
+                return srdr
         return None
 
     def signingMembers(self, pre: str):
@@ -2092,11 +2648,18 @@ class Baser(LMDBer):
             sn(int) is the sequence number of the est event
             dig(str) is qb64 str of digest of est event
 
+        Transferable results are read through .verifiers so that repeat
+        lookups do not load and parse the establishment event.
+
         """
         from ..core import coring
 
         prefixer = coring.Prefixer(qb64=pre)
         if prefixer.transferable:
+            if self.verifiers.size and \
+                    (cached := self.verifiers.fetch(prefixer.qb64, sn, dig)) is not None:
+                return cached
+
             # receipted event and receipter in database so get receipter est evt
             # retrieve dig of last event at sn of est evt of receipter.
             sdig = self.kels.getLast(keys=prefixer.qb64b, on=sn)
@@ -2115,6 +2678,10 @@ class Baser(LMDBer):
 
             verfers = sserder.verfers
             tholder = sserder.tholder
+            if self.verifiers.size and sserder.estive:
+                self.afterCommit(lambda: self.verifiers.pin(prefixer.qb64, sn,
+                                                            sserder.said,
+                                                            tholder, verfers))
 
         else:
             verfers = [coring.Verfer(qb64=pre)]
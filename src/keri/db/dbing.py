@@ -44,6 +44,7 @@ l
 ['a', 'aa', 'aaa', 'b', 'ba', 'baa']
 """
 
+import functools
 import os
 import platform
 import shutil
@@ -55,16 +56,43 @@ from typing import Union
 import lmdb
 from ordered_set import OrderedSet as oset
 from hio.base import filing
+from hio.help import ogler
 
 from keri import __version__
 from ..kering import MaxON  # maximum ordinal number for seqence or first seen
+from ..kering import ConfigurationError, DatabaseError
 from ..help import helping
 
+logger = ogler.getLogger()
+
 ProemSize = 32  # does not include trailing separator
 MaxProem = int("f"*(ProemSize), 16)
 SuffixSize = 32  # does not include trailing separator
 MaxSuffix = int("f"*(SuffixSize), 16)
 
+KERILMDBProfileKey = "KERI_LMDB_PROFILE"
+
+# LMDB environment tuning profiles as lmdb.open keyword arguments
+# durable syncs data and meta pages on every commit, survives os crash
+# throughput writes through a writable memory map with asynchronous flushes
+#     and no meta page sync so a crash may lose the last commits but never
+#     corrupts the database
+# volatile does not sync at all, for tests and rebuildable caches only
+# Measured one 256 byte put per commit on local ssd, see tools/bench_lmdb.py
+#     durable ~5,700 commits/s, throughput ~197,000, volatile ~168,000
+#     throughput is close to volatile as map_async defers the msync
+# throughput and volatile use writemap with which LMDB does not support nested
+#     child transactions so LMDBer.savepoint inside LMDBer.transact raises
+#     DatabaseError for them, see LMDBer.nestable
+Profiles = dict(
+    durable=dict(sync=True, metasync=True, writemap=False, map_async=False,
+                 readahead=True),
+    throughput=dict(sync=True, metasync=False, writemap=True, map_async=True,
+                    readahead=False),
+    volatile=dict(sync=False, metasync=False, writemap=True, map_async=True,
+                  readahead=False),
+)
+
 
 def fetchTsgs(db, diger, snh=None):
     """
@@ -317,6 +345,105 @@ def openLMDB(*, cls=None, name="test", temp=True, **kwa):
             lmdber.close(clear=lmdber.temp)  # clears if lmdber.temp
 
 
+def remapping(f):
+    """Decorator of LMDBer write method that on lmdb.MapFullError grows the
+    map of .env with LMDBer.grow and retries the method until it succeeds or
+    the map can not grow. The failed write transaction is aborted before the
+    retry so none of its writes persist.
+
+    Inside a .transact unit of work the enclosing transaction can not be
+    retried here so the error propagates to .transact which grows the map
+    before reraising. Likewise when other transactions are open, such as while
+    iterating over items of a sub db, the grow is deferred until they close
+    so the error propagates.
+    """
+    @functools.wraps(f)
+    def wrapper(self, *pa, **kwa):
+        while True:
+            try:
+                return f(self, *pa, **kwa)
+            except lmdb.MapFullError:
+                if self._txn is not None or not self.grow():
+                    raise
+
+    return wrapper
+
+
+class Txner:
+    """
+    Txner binds the enclosing write transaction of an LMDBer.transact unit of
+    work to a named sub db so that the LMDBer methods use it exactly as they
+    would use their own transaction from env.begin(db=db).
+    Exiting the context does not commit or abort. Only LMDBer.transact or
+    LMDBer.savepoint does.
+
+    Attributes:
+        txn (lmdb.Transaction): enclosing write transaction
+        db (lmdb._Database | None): named sub db. None means main db
+    """
+
+    def __init__(self, txn, db=None):
+        """
+        Parameters:
+            txn (lmdb.Transaction): enclosing write transaction
+            db (lmdb._Database | None): named sub db. None means main db
+        """
+        self.txn = txn
+        self.db = db
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exType, exValue, exTraceback):
+        return False  # enclosing unit of work commits or aborts
+
+    def cursor(self):
+        return self.txn.cursor(db=self.db)
+
+    def get(self, key, default=None):
+        return self.txn.get(key, default, db=self.db)
+
+    def put(self, key, value, **kwa):
+        return self.txn.put(key, value, db=self.db, **kwa)
+
+    def delete(self, key, value=b''):
+        return self.txn.delete(key, value, db=self.db)
+
+
+class Opener:
+    """
+    Opener counts a transaction begun on the .env of an LMDBer in its ._opens
+    while its context is open so that LMDBer.grow may defer growing the map
+    until no transaction is open in this process as LMDB requires.
+
+    Attributes:
+        dber (LMDBer): instance whose .env began .txn
+        txn (lmdb.Transaction): transaction begun on dber.env
+    """
+    __slots__ = ("dber", "txn")
+
+    def __init__(self, dber, txn):
+        """
+        Parameters:
+            dber (LMDBer): instance whose .env began txn
+            txn (lmdb.Transaction): transaction begun on dber.env
+        """
+        self.dber = dber
+        self.txn = txn
+
+    def __enter__(self):
+        self.dber._opens += 1
+        return self.txn.__enter__()
+
+    def __exit__(self, exType, exValue, exTraceback):
+        try:
+            return self.txn.__exit__(exType, exValue, exTraceback)
+        finally:
+            self.dber._opens -= 1
+            if not self.dber._opens and self.dber._growing:
+                self.dber.grow()  # deferred until no transaction is open
+
+
 class LMDBer(filing.Filer):
     """
     LBDBer base class for LMDB manager instances.
@@ -342,8 +469,17 @@ class LMDBer(filing.Filer):
     Attributes:
         env (lmdb.env): LMDB main (super) database environment
         readonly (bool): True means open LMDB env as readonly
+        profile (str): name of environment tuning profile in Profiles
+        mapSize (int): current map size in bytes of .env
 
     Properties:
+        transacting (bool): True means inside .transact unit of work
+
+    Hidden:
+        _txn (lmdb.Transaction | None): enclosing write transaction of
+            .transact unit of work. None means not transacting
+        _opens (int): count of transactions open on .env in this process
+        _growing (bool): True means .grow is deferred until ._opens is zero
 
     File/Directory Creation Mode Notes:
         .Perm provides default restricted access permissions to directory and/or files
@@ -369,8 +505,11 @@ class LMDBer(filing.Filer):
     Perm = stat.S_ISVTX | stat.S_IRUSR | stat.S_IWUSR | stat.S_IXUSR  # 0o1700==960
     MaxNamedDBs = 100
     MapSize = 104857600
+    MaxMapSize = 0  # max bytes .grow may grow map to, 0 means unlimited
+    MaxReaders = 126  # max concurrent read transactions of .env
+    Profile = "durable"  # default tuning profile name in Profiles
 
-    def __init__(self, readonly=False, **kwa):
+    def __init__(self, readonly=False, profile=None, mapSize=None, **kwa):
         """
         Setup main database directory at .dirpath.
         Create main database environment at .env using .path.
@@ -403,10 +542,29 @@ class LMDBer(filing.Filer):
             fext (str): File extension when filed
 
             readonly (bool): True means open database in readonly mode
-                False means open database in read/write mode"""
+                False means open database in read/write mode
+            profile (str | None): name of environment tuning profile in
+                Profiles. None means env var KERI_LMDB_PROFILE if any
+                else .Profile
+            mapSize (int | None): initial map size in bytes. None means
+                .MapSize
+
+        Raises:
+            ConfigurationError: If profile is not in Profiles"""
+        if profile is None:
+            profile = os.getenv(KERILMDBProfileKey, self.Profile)
+        if profile not in Profiles:
+            raise ConfigurationError(f"Invalid LMDB profile={profile}, "
+                                     f"expected one of {list(Profiles)}.")
+        self.profile = profile
+        self.mapSize = mapSize if mapSize is not None else self.MapSize
 
         self.env = None
         self._version = None
+        self._txn = None
+        self._commits = None  # callbacks deferred until .transact commits
+        self._opens = 0  # transactions open on .env
+        self._growing = False  # grow deferred until no transaction open
         self.readonly = True if readonly else False
         super(LMDBer, self).__init__(**kwa)
 
@@ -450,8 +608,11 @@ class LMDBer(filing.Filer):
         self.env = None
         # open lmdb major database instance
         # creates files data.mdb and lock.mdb in .dbDirPath
-        self.env = lmdb.open(self.path, max_dbs=self.MaxNamedDBs, map_size=self.MapSize,
-                             mode=self.perm, readonly=self.readonly)
+        self.env = lmdb.open(self.path, max_dbs=self.MaxNamedDBs,
+                             map_size=self.mapSize,
+                             max_readers=self.MaxReaders, mode=self.perm,
+                             readonly=self.readonly, **Profiles[self.profile])
+        self.mapSize = self.env.info()["map_size"]  # may be larger if existing
 
         self.opened = True if opened and self.env else False
 
@@ -505,17 +666,252 @@ class LMDBer(filing.Filer):
         return super(LMDBer, self).close(clear=clear)
 
 
+    def grow(self):
+        """Doubles map size of .env up to .MaxMapSize when non zero so that
+        a write that failed with lmdb.MapFullError may be retried.
+
+        LMDB forbids growing the map while any transaction on .env is open
+        in this process such as while iterating over items of a sub db. In
+        that case the grow is deferred until the last open transaction closes.
+
+        Returns:
+            grown (bool): True means map size of .env grew.
+                False means deferred or at .MaxMapSize so can not grow
+        """
+        if self._opens:  # transaction open so grow when last one closes
+            self._growing = True
+            return False
+
+        self._growing = False
+        size = self.mapSize * 2
+        if self.MaxMapSize:
+            size = min(size, self.MaxMapSize)
+        if size <= self.mapSize:
+            logger.error("LMDB map of %s full at max size %d.", self.path,
+                         self.mapSize)
+            return False
+
+        self.env.set_mapsize(size)
+        logger.info("LMDB map of %s grown from %d to %d.", self.path,
+                    self.mapSize, size)
+        self.mapSize = size
+        return True
+
+
+    @property
+    def transacting(self):
+        """
+        Returns:
+            transacting (bool): True means inside .transact unit of work
+        """
+        return self._txn is not None
+
+
+    @contextmanager
+    def transact(self):
+        """Context manager for a unit of work that commits all the writes made
+        within its context to any of the sub dbs of .env as one LMDB write
+        transaction, i.e. one disk sync. When the context exits with an
+        exception all of its writes are rolled back. Reads inside the context
+        see its uncommitted writes.
+
+        Nested use joins the outermost unit of work so that helpers which
+        transact on their own may be composed into a larger one.
+
+        On lmdb.MapFullError the map of .env is grown by .grow after the unit
+        of work is rolled back and the error is reraised so that the caller
+        may retry the whole unit of work.
+
+        Uses buffers=False so that values read inside the context are copies
+        that stay valid across subsequent writes in the same transaction.
+
+        Usage:
+            with db.transact():
+                db.evts.put(keys=keys, val=serder)
+                db.sigs.put(keys=keys, vals=sigers)
+
+        Yields:
+            txn (lmdb.Transaction): write transaction of unit of work
+        """
+        if self._txn is not None:  # nested so join enclosing unit of work
+            yield self._txn
+            return
+
+        commits = self._commits = []
+        try:
+            with Opener(self, self.env.begin(write=True, buffers=False)) as txn:  # abort on raise
+                self._txn = txn
+                try:
+                    yield txn
+                finally:
+                    self._txn = None
+        except lmdb.MapFullError:
+            self.grow()  # rolled back so grow for retry by caller
+            raise
+        finally:
+            self._commits = None
+
+        for fn in commits:  # only reached when committed
+            fn()
+
+
+    @property
+    def nestable(self):
+        """
+        Returns:
+            nestable (bool): True means .savepoint may nest a child transaction
+                inside .transact. False when .env uses writemap
+        """
+        return not self.env.flags()["writemap"]
+
+
+    @contextmanager
+    def savepoint(self):
+        """Context manager for a nested unit of work inside the enclosing
+        .transact unit of work. Its writes are made in a child write
+        transaction of the enclosing one. When the context exits with an
+        exception only the writes and .afterCommit callbacks of the savepoint
+        are rolled back and the exception propagates. The enclosing unit of
+        work may then catch it and continue. Outside .transact it is
+        .transact.
+
+        LMDB does not support child transactions when .env uses writemap as in
+        the throughput and volatile profiles, see .nestable.
+
+        Usage:
+            with db.transact():
+                for serder in serders:
+                    try:
+                        with db.savepoint():
+                            db.evts.put(keys=(serder.pre, serder.said), val=serder)
+                    except ValueError:
+                        continue  # only this event rolled back
+
+        Yields:
+            txn (lmdb.Transaction): child write transaction of savepoint
+
+        Raises:
+            DatabaseError: If inside .transact when not .nestable
+        """
+        if self._txn is None:  # not nested so own unit of work
+            with self.transact() as txn:
+                yield txn
+            return
+
+        if not self.nestable:  # LMDB has no child transactions with writemap
+            raise DatabaseError(f"Unsupported savepoint with writemap of "
+                                f"profile={self.profile}.")
+
+        parent = self._txn
+        mark = len(self._commits)
+        try:
+            with self.env.begin(write=True, buffers=False, parent=parent) as txn:  # abort on raise
+                self._txn = txn
+                try:
+                    yield txn
+                finally:
+                    self._txn = parent
+        except BaseException:
+            del self._commits[mark:]  # callbacks of rolled back savepoint
+            raise
+
+
+    def replay(self, fn, *pa, **kwa):
+        """Returns result of fn(*pa, **kwa) where fn is a unit of work that
+        writes through .transact. When the unit of work failed with
+        lmdb.MapFullError and .transact grew the map then replays fn until it
+        succeeds or the map can not grow. Its writes were rolled back so none
+        persist twice.
+
+        Inside an enclosing .transact unit of work fn can not be replayed so
+        the error propagates for the enclosing unit of work to be replayed.
+
+        Parameters:
+            fn (Callable): unit of work to replay
+            pa (tuple): positional arguments of fn
+            kwa (dict): keyword arguments of fn
+
+        Usage:
+            kever = db.replay(Kever, serder=serder, sigers=sigers, db=db)
+        """
+        while True:
+            size = self.mapSize
+            try:
+                return fn(*pa, **kwa)
+            except lmdb.MapFullError:
+                if self._txn is not None or self.mapSize == size:
+                    raise  # enclosed, deferred or can not grow
+
+
+    def afterCommit(self, fn):
+        """Calls fn once the enclosing .transact unit of work commits or at
+        once when not inside one. fn is never called when the unit of work
+        is rolled back. Use to update in memory caches of db content so that
+        they never hold uncommitted writes.
+
+        Parameters:
+            fn (Callable): callable without arguments
+        """
+        if self._commits is not None:
+            self._commits.append(fn)
+        else:
+            fn()
+
+
+    @contextmanager
+    def reading(self):
+        """Context manager for a unit of reads that all read one consistent
+        snapshot of .env in one LMDB read transaction instead of beginning a
+        transaction per read. No writes are allowed within its context.
+
+        Nested use joins the enclosing .transact or .reading unit.
+
+        Usage:
+            with db.reading():
+                states = [db.states.get(keys=key) for key in keys]
+
+        Yields:
+            txn (lmdb.Transaction): read transaction of unit of reads
+        """
+        if self._txn is not None:  # nested so join enclosing unit
+            yield self._txn
+            return
+
+        with Opener(self, self.env.begin(write=False, buffers=False)) as txn:
+            self._txn = txn
+            try:
+                yield txn
+            finally:
+                self._txn = None
+
+
+    def _begin(self, db=None, write=False, buffers=False):
+        """Returns context manager of transaction on db. Uses the enclosing
+        transaction when inside .transact or .reading unit otherwise begins
+        new transaction on .env.
+
+        Parameters:
+            db (lmdb._Database | None): named sub db. None means main db
+            write (bool): True means write transaction. False means read only
+            buffers (bool): True means return buffers not copies of values
+        """
+        if self._txn is not None:
+            return Txner(txn=self._txn, db=db)
+        return Opener(self, self.env.begin(db=db, write=write, buffers=buffers))
+
+
     def getVer(self):
         """ Returns the value of the the semver formatted version in the __version__ key in this database
 
         Returns:
             str: semver formatted version of the database"""
-        with self.env.begin() as txn:
+        with self._begin() as txn:
             cursor = txn.cursor()
             version = cursor.get(b'__version__')
             return version.decode("utf-8") if version is not None else None
 
 
+    @remapping
     def setVer(self, val):
         """  Set the version of the database in the __version__ key
 
@@ -524,12 +920,13 @@ class LMDBer(filing.Filer):
         if hasattr(val, "encode"):
             val = val.encode("utf-8")  # convert str to bytes
 
-        with self.env.begin(write=True) as txn:
+        with self._begin(write=True) as txn:
             cursor = txn.cursor()
             cursor.replace(b'__version__', val)
 
     # Universal methods for all dbs
 
+    @remapping
     def remTop(self, db, top=b''):
         """Deletes all values in branch of db given top key. Top empty deletes
         whole db.
@@ -549,7 +946,7 @@ class LMDBer(filing.Filer):
         to delete the item within the iteration loop."""
         # when deleting can't use cursor.iternext() because the cursor advances
         # twice (skips one) once for iternext and once for delete.
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True, buffers=True) as txn:
             result = False
             cursor = txn.cursor()
             if cursor.set_range(top):  # move to val at key >= key if any
@@ -581,7 +978,7 @@ class LMDBer(filing.Filer):
         Works for both dupsort==False and dupsort==True"""
         # when deleting can't use cursor.iternext() because the cursor advances
         # twice (skips one) once for iternext and once for delete.
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True, buffers=True) as txn:
             count = 0
             cursor = txn.cursor()
             if cursor.set_range(top):  # move to entry at key >= key if any
@@ -599,7 +996,7 @@ class LMDBer(filing.Filer):
 
         Parameters:
             db: opened named sub db with either dupsort=True or False"""
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False, buffers=True) as txn:
             cursor = txn.cursor()
             count = 0
             for _, _ in cursor:  # iter(cursor) same as cursor.iternext()
@@ -607,9 +1004,11 @@ class LMDBer(filing.Filer):
             return count
 
 
-    def getTopItemIter(self, db, top=b''):
+    def getTopItemIter(self, db, top=b'', *, after=b''):
         """Iterates over branch of db given by top key. When top is empty then
-        iterates over whole db.
+        iterates over whole db. When after is provided the iteration starts
+        with the first key in the branch greater than after so that a branch
+        may be paged through by key instead of by offset.
 
         Works for both dupsort==False and dupsort==True
         Because cursor.iternext() advances cursor after returning item its safe
@@ -627,6 +1026,9 @@ class LMDBer(filing.Filer):
             top (bytes): truncated top key, a key space prefix to get all the items
                 from multiple branches of the key space. If top key is
                 empty then gets all items in database.
+            after (bytes): full or truncated key after which to start. Keys
+                that start with after are skipped so a truncated key skips its
+                whole branch. Empty means start at top
 
         Uses python .startswith to match which always returns True if top is
         empty string so empty will matches all keys in db .
@@ -634,17 +1036,20 @@ class LMDBer(filing.Filer):
         Works for both dupsort==False and dupsort==True
         Because cursor.iternext() advances cursor after returning item its safe
         to delete the item within the iteration loop."""
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False, buffers=True) as txn:
             cursor = txn.cursor()
-            if cursor.set_range(top):  # move to val at key >= key if any
+            if cursor.set_range(max(top, after)):  # move to val at key >= key if any
                 for ckey, cval in cursor.iternext():  # get key, val at cursor
                     ckey = bytes(ckey)
                     if not ckey.startswith(top): #  prev entry if any last in branch
                         break  # done
+                    if after and (ckey <= after or ckey.startswith(after)):
+                        continue  # at or in branch of after
                     yield (ckey, cval)  # another entry in branch startswith key
             return  # done raises StopIteration
 
     # For subdbs with no duplicate values allowed at each key. (dupsort==False)
+    @remapping
     def putVal(self, db, key, val):
         """
         Write serialized bytes val to location key in db
@@ -659,7 +1064,7 @@ class LMDBer(filing.Filer):
         if not key:
             return False
 
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True, buffers=True) as txn:
             try:
                 return (txn.put(key, val, overwrite=False))
             except lmdb.BadValsizeError as ex:
@@ -667,6 +1072,7 @@ class LMDBer(filing.Filer):
                                " or wrong DUPFIXED size. ref) lmdb.BadValsizeError")
 
 
+    @remapping
     def setVal(self, db, key, val):
         """
         Write serialized bytes val to location key in db
@@ -682,7 +1088,7 @@ class LMDBer(filing.Filer):
             val: bytes of value to be written"""
         if not key:
             return False
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True, buffers=True) as txn:
             try:
                 return (txn.put(key, val))
             except lmdb.BadValsizeError as ex:
@@ -700,7 +1106,7 @@ class LMDBer(filing.Filer):
             key: bytes of key within sub db's keyspace"""
         if not key:
             return False
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False, buffers=True) as txn:
             try:
                 return(txn.get(key))
             except lmdb.BadValsizeError as ex:
@@ -708,6 +1114,7 @@ class LMDBer(filing.Filer):
                                " or wrong DUPFIXED size. ref) lmdb.BadValsizeError")
 
 
+    @remapping
     def remVal(self, db, key):
         """Removes value at key in db.
 
@@ -723,7 +1130,7 @@ class LMDBer(filing.Filer):
         if not key:
             return False
 
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True, buffers=True) as txn:
             try:
                 return (txn.delete(key))
             except lmdb.BadValsizeError as ex:
@@ -736,6 +1143,7 @@ class LMDBer(filing.Filer):
     # ordinal number serialized as 32 hex bytes
 
     # used in OnSuberBase
+    @remapping
     def putOnVal(self, db, key,  on=0, val=None, *, sep=b'.'):
         """Write serialized bytes val to location at onkey consisting of
         key + sep + serialized on in db.
@@ -755,7 +1163,7 @@ class LMDBer(filing.Filer):
         if val is None or not key:
             return False
 
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True, buffers=True) as txn:
             onkey = onKey(key, on, sep=sep)
             try:
                 return (txn.put(onkey, val, overwrite=False))
@@ -765,6 +1173,7 @@ class LMDBer(filing.Filer):
 
 
     # used in OnSuberBase
+    @remapping
     def pinOnVal(self, db, key, on=0, val=None,  *, sep=b'.'):
         """Replace value if any at location onkey = key + sep + on with val
         Replaces pre-existing value at onkey if any or different.
@@ -784,7 +1193,7 @@ class LMDBer(filing.Filer):
         if val is None or not key:
             return False
 
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True, buffers=True) as txn:
             onkey = onKey(key, on, sep=sep)  # start replay at this enty 0 is earliest
             try:
                 return (txn.put(onkey, val))
@@ -794,6 +1203,7 @@ class LMDBer(filing.Filer):
 
 
     # used in OnSuberBase
+    @remapping
     def appendOnVal(self, db, key, val, *, sep=b'.'):
         """Appends val in order after last previous onkey = key + sep + on
         as new entry at at new onkey. New on for new onkey is one greater than
@@ -817,7 +1227,7 @@ class LMDBer(filing.Filer):
         if not key or val is None:
             raise ValueError(f"Bad append parameter: {key=} or {val=}")
 
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True, buffers=True) as txn:
             onkey = onKey(key, MaxON, sep=sep)
             on = 0  # unless other cases match then zeroth entry at key
             cursor = txn.cursor()
@@ -870,7 +1280,7 @@ class LMDBer(filing.Filer):
         if not key:
             return None
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False, buffers=True) as txn:
             onkey = onKey(key, on, sep=sep)  # start replay at this enty 0 is earliest
             try:
                 if val := txn.get(onkey):
@@ -900,7 +1310,7 @@ class LMDBer(filing.Filer):
         if not key:
             return None
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False, buffers=True) as txn:
             onkey = onKey(key, on, sep=sep)  # start replay at this enty 0 is earliest
             try:
                 return(txn.get(onkey))
@@ -909,6 +1319,7 @@ class LMDBer(filing.Filer):
 
 
     # used in OnSuberBase
+    @remapping
     def remOn(self, db, key, on=0, *, sep=b'.'):
         """Removes entry if any at onkey = key + sep + on.
         When key is missing or empty or None returns False.
@@ -925,7 +1336,7 @@ class LMDBer(filing.Filer):
         if not key:
             return False
 
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True, buffers=True) as txn:
             onkey = onKey(key, on, sep=sep)  # start replay at this enty 0 is earliest
             try:
                 return (txn.delete(onkey))  # when empty deletes whole db
@@ -933,6 +1344,7 @@ class LMDBer(filing.Filer):
                 raise KeyError(f"Invalid: {onkey=} for removal from db") from ex
 
 
+    @remapping
     def remOnAll(self, db, key=b"", on=0, *, sep=b'.'):
         """Removes entry at each onkey for all on >= on where for each on,
         onkey = key + sep + on
@@ -957,7 +1369,7 @@ class LMDBer(filing.Filer):
             return self.remTop(db=db, top=b'')
 
         # del all on >= on for key
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True, buffers=True) as txn:
             result = False
             onkey = onKey(key, on, sep=sep)
             cursor = txn.cursor()
@@ -995,7 +1407,7 @@ class LMDBer(filing.Filer):
                 when key is empty then retrieves whole db
             on (int): ordinal number at which to initiate count
             sep (bytes): separator character for split"""
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False, buffers=True) as txn:
             cursor = txn.cursor()
             if key:  # not empty
                 onkey = onKey(key, on, sep=sep)  # start replay at this enty 0 is earliest
@@ -1065,7 +1477,7 @@ class LMDBer(filing.Filer):
                 when key is empty then retrieves whole db
             on (int): ordinal number at which to initiate retrieval
             sep (bytes): separator character for split"""
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False, buffers=True) as txn:
             cursor = txn.cursor()
             if key:  # not empty
                 onkey = onKey(key, on, sep=sep)  # start replay at this enty 0 is earliest
@@ -1096,6 +1508,7 @@ class LMDBer(filing.Filer):
     # size limitation of 511 bytes.
 
 
+    @remapping
     def putIoSetVals(self, db, key, vals, *, sep=b'.'):
         """Add each val in vals to insertion ordered set of values all with the
         same apparent effective key for each val that is not already in set of
@@ -1113,7 +1526,7 @@ class LMDBer(filing.Filer):
             key (bytes|None): Apparent effective key
             vals (NonStrIterable|None): serialized values to add to set of vals at key
             sep (bytes): separator character for split"""
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True, buffers=True) as txn:
             result = False
             if not key or not vals:  # empty key or empty vals or vals None
                 return result
@@ -1141,6 +1554,7 @@ class LMDBer(filing.Filer):
             return result
 
 
+    @remapping
     def pinIoSetVals(self, db, key, vals, *, sep=b'.'):
         """Replace all vals at key with vals as insertion ordered set of
         values all with the same apparent effective key. Does not replace if
@@ -1164,7 +1578,7 @@ class LMDBer(filing.Filer):
             return result  # do not delete
 
         self.remIoSet(db=db, key=key, sep=sep)
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True, buffers=True) as txn:
             vals = oset(vals)  # make set
 
             for i, val in enumerate(vals):
@@ -1173,6 +1587,7 @@ class LMDBer(filing.Filer):
             return result
 
 
+    @remapping
     def addIoSetVal(self, db, key, val, *, sep=b'.'):
         """Add val to insertion ordered set of values all with the
         same apparent effective key if val not already in set of vals at key.
@@ -1191,7 +1606,7 @@ class LMDBer(filing.Filer):
             key (bytes|None): Apparent effective key
             val (bytes|None): serialized value to add
             sep (bytes): separator character for split"""
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True, buffers=True) as txn:
             if not key or val is None:  # empty key or val is missing
                 return False
             vals = oset()
@@ -1234,7 +1649,7 @@ class LMDBer(filing.Filer):
                 key is empty
             ion (int): starting ordinal value, default 0
             sep (bytes): separator character for split"""
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False, buffers=True) as txn:
             if not key:  # empty key
                 return  # raises StopIterationError
             iokey = suffix(key, ion, sep=sep)  # start ion th value for key zeroth default
@@ -1265,7 +1680,7 @@ class LMDBer(filing.Filer):
             key (bytes): Apparent effective key (unsuffixed)
             sep (bytes): separator character for split"""
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False, buffers=True) as txn:
             last = ()
             if not key:
                 return last
@@ -1281,6 +1696,7 @@ class LMDBer(filing.Filer):
             return last  # iokey past end of database
 
 
+    @remapping
     def remIoSet(self, db, key, *, sep=b'.'):
         """Removes all set values at apparent effective key.
         When key is empty or None or missing returns False.
@@ -1300,7 +1716,7 @@ class LMDBer(filing.Filer):
         if not key:
             return result
 
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True, buffers=True) as txn:
             iokey = suffix(key, 0, sep=sep)  # start at zeroth value for key
             cursor = txn.cursor()
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
@@ -1314,6 +1730,7 @@ class LMDBer(filing.Filer):
             return result
 
 
+    @remapping
     def remIoSetVal(self, db, key, val=None, *, sep=b'.'):
         """Removes val if any as member of set at key if any.
         When value is None then removes all set members at key
@@ -1353,7 +1770,7 @@ class LMDBer(filing.Filer):
         if not key:
             return False
 
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True, buffers=True) as txn:
             iokey = suffix(key, 0, sep=sep)  # start zeroth value for key
             cursor = txn.cursor()
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
@@ -1382,7 +1799,7 @@ class LMDBer(filing.Filer):
             key (bytes): Apparent effective key
             ion (int): starting ordinal value, default 0
             sep (bytes): separator character for split"""
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False, buffers=True) as txn:
             count = 0
             if not key:  # empty key
                 return count
@@ -1445,7 +1862,7 @@ class LMDBer(filing.Filer):
             db (lmdb._Database): instance of named sub db with dupsort==False
             key (bytes): Apparent effective key
             sep (bytes): separator character for split"""
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False, buffers=True) as txn:
             cursor = txn.cursor()  # create cursor to walk back
             if not key:  # start at first key if any
                 if not cursor.first():
@@ -1579,6 +1996,7 @@ class LMDBer(filing.Filer):
         return self.pinIoSetVals(db=db, key=onKey(key, on, sep=sep), vals=vals, sep=sep)
 
 
+    @remapping
     def appendOnIoSetVals(self, db, key, vals, *, sep=b'.'):
         """Appends set vals in order after last previous onkey = key + sep + on
         as new entry at at new onkey. New on for new onkey is one greater than
@@ -1607,7 +2025,7 @@ class LMDBer(filing.Filer):
         if not key or not vals or not helping.isNonStringIterable(vals):
             raise ValueError(f"Bad append parameter: {key=} or {vals=}")
 
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True, buffers=True) as txn:
             onkey = onKey(key, on=MaxON, sep=sep)  # start at max and walk back
             iokey = suffix(onkey, ion=MaxON, sep=sep)
             on = 0  # unless other cases match then zeroth entry at key
@@ -1784,6 +2202,7 @@ class LMDBer(filing.Filer):
         return self.remIoSetVal(db, key=onKey(key, on, sep=sep), val=val, sep=sep)
 
 
+    @remapping
     def remOnAllIoSet(self, db, key=b"", on=0, *, sep=b'.'):
         """Removes all set members at onkey for all on >= on where for each on,
         onkey = key + sep + on
@@ -1808,7 +2227,7 @@ class LMDBer(filing.Filer):
             return self.remTop(db=db, top=b'')
 
         # del all on >= on for key
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True, buffers=True) as txn:
             result = False
             onkey = onKey(key, on, sep=sep)
             cursor = txn.cursor()
@@ -1872,7 +2291,7 @@ class LMDBer(filing.Filer):
             return self.cntAll(db)
 
         # count all on >= on for key
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True, buffers=True) as txn:
             count = 0
             onkey = onKey(key, on, sep=sep)
             cursor = txn.cursor()
@@ -1957,7 +2376,7 @@ class LMDBer(filing.Filer):
             yield from self.getOnTopIoSetItemIter(db=db, top=b'', sep=sep)
             return
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False, buffers=True) as txn:
             onkey = onKey(key, on, sep=sep)  # starting on
             iokey = suffix(onkey, ion=0, sep=sep)  # start ion th value for key zeroth default
             cursor = txn.cursor()
@@ -2008,7 +2427,7 @@ class LMDBer(filing.Filer):
                 yield (key, on, val)
             return
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False, buffers=True) as txn:
             cursor = txn.cursor()  # create cursor to walk
             # iterate all on >= on at key
             if not key:  # start at first key if any
@@ -2068,7 +2487,7 @@ class LMDBer(filing.Filer):
         Uses hidden ordinal key suffix for insertion ordering which is
         transparently suffixed and unsuffixed
         Assumes DB opened with dupsort=False"""
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False, buffers=True) as txn:
             cursor = txn.cursor()
             if not cursor.last():  # position cursor at last entry of set of last key
                 return  # empty database so raise StopIteration
@@ -2133,7 +2552,7 @@ class LMDBer(filing.Filer):
         Uses hidden ordinal key suffix for insertion ordering which is
         transparently suffixed and unsuffixed
         Assumes DB opened with dupsort=False"""
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False, buffers=True) as txn:
             cursor = txn.cursor()
 
             if key:  # not empty so attempt to position at starting key not last
@@ -2197,6 +2616,7 @@ class LMDBer(filing.Filer):
 
 
     # For subdbs that support duplicates at each key (dupsort==True)
+    @remapping
     def putVals(self, db, key, vals):
         """
         Write each entry from list of bytes vals to key in db
@@ -2215,7 +2635,7 @@ class LMDBer(filing.Filer):
         if not key:
             return False
 
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True, buffers=True) as txn:
             result = True
             try:
                 for val in vals:
@@ -2226,6 +2646,7 @@ class LMDBer(filing.Filer):
             return result
 
 
+    @remapping
     def addVal(self, db, key, val):
         """
         Add val bytes as dup to key in db
@@ -2250,7 +2671,7 @@ class LMDBer(filing.Filer):
         dups = set(self.getVals(db, key))  #get preexisting dups if any
         result = False
         if val not in dups:
-            with self.env.begin(db=db, write=True, buffers=True) as txn:
+            with self._begin(db=db, write=True, buffers=True) as txn:
                 try:
                     result = txn.put(key, val, dupdata=True)
                 except lmdb.BadValsizeError as ex:
@@ -2272,7 +2693,7 @@ class LMDBer(filing.Filer):
         if not key:
             return False
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False, buffers=True) as txn:
             cursor = txn.cursor()
             vals = []
             try:
@@ -2296,7 +2717,7 @@ class LMDBer(filing.Filer):
         if not key:
             return False
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False, buffers=True) as txn:
             cursor = txn.cursor()
             val = None
             try:
@@ -2319,7 +2740,7 @@ class LMDBer(filing.Filer):
         Parameters:
             db (lmdb._Database): instance of named sub db with dupsort=True
             key: bytes of key within sub db's keyspace"""
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False, buffers=True) as txn:
             cursor = txn.cursor()
             vals = []
             try:
@@ -2342,7 +2763,7 @@ class LMDBer(filing.Filer):
         if not key:
             return 0
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False, buffers=True) as txn:
             cursor = txn.cursor()
             count = 0
             try:
@@ -2354,6 +2775,7 @@ class LMDBer(filing.Filer):
             return count
 
 
+    @remapping
     def delVals(self, db, key, val=b''):
         """
         Deletes all values at key in db if val=b'' else deletes the dup
@@ -2367,7 +2789,7 @@ class LMDBer(filing.Filer):
         if not key:
             return False
 
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True, buffers=True) as txn:
             try:
                 return (txn.delete(key, val))
             except lmdb.BadValsizeError as ex:
@@ -2379,6 +2801,7 @@ class LMDBer(filing.Filer):
     # IoDup class IoVals IoItems
     # dupsort==True and prepends and strips io val proem to each value.
     # because dupsort==True values are limited to 511 bytes including proem
+    @remapping
     def putIoDupVals(self, db, key, vals):
         """
         Write each entry from list of bytes vals to key in db in insertion order
@@ -2409,7 +2832,7 @@ class LMDBer(filing.Filer):
         if not key or not vals or key[:1] == b'.':
             return result
         dups = set(self.getIoDupVals(db, key))  # get preexisting dups if any
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True, buffers=True) as txn:
             idx = 0
             cursor = txn.cursor()
             try:
@@ -2479,7 +2902,7 @@ class LMDBer(filing.Filer):
         Parameters:
             db (lmdb._Database): instance of named sub db with dupsort=True
             key (bytes): within sub db's keyspace"""
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False, buffers=True) as txn:
             vals = []  # list
             if not key:
                 return vals
@@ -2525,7 +2948,7 @@ class LMDBer(filing.Filer):
             key (bytes): within sub db's keyspace
             ion (int): starting ordinal value, default 0"""
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False, buffers=True) as txn:
             if not key:  # empty key
                 return  # raise StopIterationError
 
@@ -2570,7 +2993,7 @@ class LMDBer(filing.Filer):
         if not key:
             return None
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False, buffers=True) as txn:
             cursor = txn.cursor()
             val = None
             try:
@@ -2583,6 +3006,7 @@ class LMDBer(filing.Filer):
                                " or wrong DUPFIXED size. ref) lmdb.BadValsizeError")
 
 
+    @remapping
     def delIoDupVals(self, db, key):
         """Deletes all values at key in db if key present.
         Returns True If key exists
@@ -2610,7 +3034,7 @@ class LMDBer(filing.Filer):
         if not key:
             return False
 
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True, buffers=True) as txn:
             try:
                 return (txn.delete(key))
             except lmdb.BadValsizeError as ex:
@@ -2618,6 +3042,7 @@ class LMDBer(filing.Filer):
                                " or wrong DUPFIXED size. ref) lmdb.BadValsizeError")
 
 
+    @remapping
     def delIoDupVal(self, db, key, val):
         """Deletes dup io val at key in db. Performs strip search to find match.
         Strips proems and then searches.
@@ -2650,7 +3075,7 @@ class LMDBer(filing.Filer):
         if not key:
             return False
 
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True, buffers=True) as txn:
             cursor = txn.cursor()
             try:
                 if cursor.set_key(key):  # move to first_dup
@@ -2689,7 +3114,7 @@ class LMDBer(filing.Filer):
             key (bytes): within sub db's keyspace"""
         if not key:
             return 0
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False, buffers=True) as txn:
             cursor = txn.cursor()
             count = 0
             try:
@@ -2753,6 +3178,7 @@ class LMDBer(filing.Filer):
     # this is so we do the proem add and strip here not in some higher level class
     # like suber
 
+    @remapping
     def putOnIoDupVals(self, db, key, on=0, vals=b'', *, sep=b'.'):
         """Write each entry from list of bytes vals to key made from key + sep + on
         where on is serialized in db in insertion order using IO proem prepended
@@ -2783,7 +3209,7 @@ class LMDBer(filing.Filer):
 
         result = False
         dups = set(self.getOnIoDupVals(db, key))  #get preexisting dups if any
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True, buffers=True) as txn:
             idx = 0
             cursor = txn.cursor()
             onkey = onKey(key, on, sep=sep)
@@ -2894,7 +3320,7 @@ class LMDBer(filing.Filer):
             key: bytes of key within sub db's keyspace
             on (int): ordinal number at which to retrieve
             sep (bytes): separator character for split"""
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False, buffers=True) as txn:
             cursor = txn.cursor()
             vals = []
             if not key: # empty key so no dups
@@ -3038,7 +3464,7 @@ class LMDBer(filing.Filer):
                 when key is empty then retrieves whole db
             on (int): ordinal number at which to initiate retrieval
             sep (bytes): separator character for split"""
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False, buffers=True) as txn:
             cursor = txn.cursor()
             if key:  # not empty
                 onkey = onKey(key, on, sep=sep)  # start replay at this enty 0 is earliest
@@ -3200,7 +3626,7 @@ class LMDBer(filing.Filer):
                 when key is empty then retrieves whole db
             on (int): ordinal number at which to initiate retrieval
             sep (bytes): separator character for split"""
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False, buffers=True) as txn:
             cursor = txn.cursor()
             if not cursor.last():  # pre-position cursor at last dup of last key
                 return  # empty database so raise StopIteration
@@ -64,10 +64,18 @@ class KomerBase:
         self.klas = klas
         self.sep = sep if sep is not None else self.Sep
         self.kind = kind
+        self._datify = helping.datifier(klas)  # compiled once per klas
         self._ser = self._serializer(kind)
         self._des = self._deserializer(kind)
 
 
+    def transact(self):
+        """Returns context manager for unit of work that commits all writes to
+        any sub db of .db within its context as one transaction.
+        See LMDBer.transact"""
+        return self.db.transact()
+
+
     def _tokey(self, keys: str|bytes|memoryview|Iterable, topive: bool=False):
         """Converts keys Iterable to key bytes with proper separators and returns key bytes.
         If keys is already str or bytes or memoryview then returns key bytes.
@@ -146,7 +154,7 @@ class KomerBase:
 
     def __deserializeJSON(self, val):
         if val is not None:
-            val = helping.datify(self.klas, json.loads(bytes(val).decode("utf-8")))
+            val = self._datify(json.loads(bytes(val).decode("utf-8")))
             if not isinstance(val, self.klas):
                 raise ValueError("Invalid schema type={} of value={}, expected {}."
                                  "".format(type(val), val, self.klas))
@@ -155,7 +163,7 @@ class KomerBase:
 
     def __deserializeMGPK(self, val):
         if val is not None:
-            val = helping.datify(self.klas, msgpack.loads(bytes(val)))
+            val = self._datify(msgpack.loads(bytes(val)))
             if not isinstance(val, self.klas):
                 raise ValueError("Invalid schema type={} of value={}, expected {}."
                                  "".format(type(val), val, self.klas))
@@ -164,7 +172,7 @@ class KomerBase:
 
     def __deserializeCBOR(self, val):
         if val is not None:
-            val = helping.datify(self.klas, cbor2.loads(bytes(val)))
+            val = self._datify(cbor2.loads(bytes(val)))
             if not isinstance(val, self.klas):
                 raise ValueError("Invalid schema type={} of value={}, expected {}."
                                  "".format(type(val), val, self.klas))
@@ -176,7 +184,7 @@ class KomerBase:
             if not isinstance(val, self.klas):
                 raise ValueError("Invalid schema type={} of value={}, expected {}."
                                  "".format(type(val), val, self.klas))
-            val = json.dumps(helping.dictify(val),
+            val = json.dumps(helping.dictifier(type(val))(val),
                           separators=(",", ":"),
                           ensure_ascii=False).encode("utf-8")
         return val
@@ -187,7 +195,7 @@ class KomerBase:
             if not isinstance(val, self.klas):
                 raise ValueError("Invalid schema type={} of value={}, expected {}."
                                  "".format(type(val), val, self.klas))
-            val = msgpack.dumps(helping.dictify(val))
+            val = msgpack.dumps(helping.dictifier(type(val))(val))
         return val
 
 
@@ -196,7 +204,7 @@ class KomerBase:
             if not isinstance(val, self.klas):
                 raise ValueError("Invalid schema type={} of value={}, expected {}."
                                  "".format(type(val), val, self.klas))
-            val = cbor2.dumps(helping.dictify(val))
+            val = cbor2.dumps(helping.dictifier(type(val))(val))
         return val
 
 
@@ -0,0 +1,36 @@
+from keri import help
+
+logger = help.ogler.getLogger()
+
+
+def _check_if_needed(db):
+    if db.migs.get(keys=("add_seal_index",)) is not None:
+        return False  # index marked complete
+    return next(db.kels.getTopItemIter(), None) is not None
+
+
+def migrate(db):
+    """ Adds .ancs anchored seal index for the events of every KEL in .kels
+
+    This migration performs the following:
+    1.  For each event in .kels including disputed and superseded events add
+        the SAID of the event to .ancs at each seal anchored in the event
+
+    Parameters:
+        db(Baser): Baser database object on which to run the migration
+    """
+    # May be running on a database that is already in the right state yet has no migrations run
+    # so we need to check if the migration is needed
+    if not _check_if_needed(db):
+        print(f"{__name__} migration not needed, database already in correct state")
+        return
+
+    logger.debug(f"Migrating anchored seal index for {db.path}")
+    count = 0
+    for (pre, ), sn, said in db.kels.getTopItemIter():
+        if (serder := db.evts.get(keys=(pre, said))) is None:
+            continue  # skip missing event
+        db.indexSeals(serder)
+        count += 1
+
+    print(f"Indexed anchored seals of {count} events")
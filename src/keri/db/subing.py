@@ -95,6 +95,7 @@ etc.
 from __future__ import annotations
 
 from typing import TYPE_CHECKING, Type, Union
+from collections import OrderedDict
 from collections.abc import Iterable
 
 from hio.help import ogler
@@ -146,6 +147,13 @@ class SuberBase():
         self.verify = True if verify else False
 
 
+    def transact(self):
+        """Returns context manager for unit of work that commits all writes to
+        any sub db of .db within its context as one transaction.
+        See LMDBer.transact"""
+        return self.db.transact()
+
+
     def _tokey(self, keys: str|bytes|memoryview|Iterable, topive: bool=False):
         """
         Converts keys to key bytes with proper separators and returns key bytes.
@@ -1884,10 +1892,22 @@ class SerderSuberBase(SuberBase):
     """
     Sub class of SuberBase where data is serialized Serder Subclass instance
     given by .klas
-    Automatically serializes and deserializes using .klas Serder methods"""
+    Automatically serializes and deserializes using .klas Serder methods
+
+    Optional size bounded LRU cache of deserialized Serder instances keyed by
+    serialized raw val. Because the same raw always deserializes to the same
+    Serder no invalidation is needed when vals are pinned or removed.
+    Cached instances are shared so must be treated as immutable.
+
+    Attributes:
+        klas (Type[serdering.Serder]): Class reference to subclass of Serder
+        cacheSize (int): max number of cached Serder instances. 0 means no cache
+        cacheHits (int): count of ._des served from cache
+        cacheMisses (int): count of ._des that deserialized when caching"""
 
     def __init__(self, *pa,
                  klas: Type[serdering.Serder] | None = None,
+                 cacheSize: int = 0,
                  **kwa):
         """
         Inherited Parameters:
@@ -1902,13 +1922,19 @@ class SerderSuberBase(SuberBase):
                 False means do not reverify. Default False
 
             Overridden Parameters:
-            klas (Type[serdering.Serder]): Class reference to subclass of Serder"""
+            klas (Type[serdering.Serder]): Class reference to subclass of Serder
+            cacheSize (int): max number of deserialized Serder instances in
+                LRU cache. 0 (default) means no cache"""
         if klas is None:
             from ..core import serdering
             klas = serdering.SerderKERI
 
         super(SerderSuberBase, self).__init__(*pa, **kwa)
         self.klas = klas
+        self.cacheSize = max(0, int(cacheSize))
+        self.cacheHits = 0
+        self.cacheMisses = 0
+        self._cache = OrderedDict()  # raw: Serder in least recently used order
 
 
     def _ser(self, val: serdering.Serder):
@@ -1930,7 +1956,26 @@ class SerderSuberBase(SuberBase):
             val = bytes(val)  # convert to bytes
         elif hasattr(val, "encode"):  # str
             val = val.encode()  # convert to bytes
-        return self.klas(raw=val, verify=self.verify)
+        if not self.cacheSize:  # no cache
+            return self.klas(raw=val, verify=self.verify)
+
+        if (serder := self._cache.get(val)) is not None:
+            self._cache.move_to_end(val)  # most recently used
+            self.cacheHits += 1
+            return serder
+
+        self.cacheMisses += 1
+        serder = self.klas(raw=val, verify=self.verify)
+        self._cache[val] = serder
+        if len(self._cache) > self.cacheSize:
+            self._cache.popitem(last=False)  # evict least recently used
+        return serder
+
+    def clearCache(self):
+        """Empties cache of deserialized Serder instances and resets counters"""
+        self._cache.clear()
+        self.cacheHits = 0
+        self.cacheMisses = 0
 
 
 class SerderSuber(SerderSuberBase, Suber):
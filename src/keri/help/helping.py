@@ -78,6 +78,138 @@ def datify(cls, d):
         return d  # Not a dataclass.
 
 
+_Dictifiers = {}  # cache of compiled dictifiers keyed by dataclass class
+_Datifiers = {}  # cache of compiled datifiers keyed by dataclass class
+
+
+def _plainify(val):
+    """
+    Returns plain value of val in the same way as dataclasses.asdict converts
+    field values, that is, nested dataclass instances become dicts recursively
+    and containers are rebuilt. Unlike asdict leaf values are not deep copied
+    because the result is meant to be serialized right away.
+
+    Parameters:
+        val: field value of dataclass instance"""
+    if val is None or type(val) in (str, int, float, bool, bytes):
+        return val
+    if dataclasses.is_dataclass(val) and not isinstance(val, type):
+        return {f.name: _plainify(getattr(val, f.name))
+                for f in dataclasses.fields(val)}
+    if isinstance(val, tuple) and hasattr(val, "_fields"):  # namedtuple
+        return type(val)(*[_plainify(v) for v in val])
+    if isinstance(val, (list, tuple)):
+        return type(val)(_plainify(v) for v in val)
+    if isinstance(val, dict):
+        return type(val)((_plainify(k), _plainify(v)) for k, v in val.items())
+    return val
+
+
+def dictifier(cls):
+    """
+    Returns function that converts an instance of dataclass cls into a
+    serializable dict equivalent to dictify. The function is generated once per
+    class and cached so that serializing many records of the same class does
+    not rediscover its fields on each call.
+
+    Parameters:
+        cls: dataclass class"""
+    try:
+        return _Dictifiers[cls]
+    except KeyError:
+        pass
+
+    if callable(getattr(cls, "_ser", None)):
+        def convert(val):
+            return val._ser()
+    else:
+        names = tuple(f.name for f in dataclasses.fields(cls))
+
+        def convert(val):
+            return {name: _plainify(getattr(val, name)) for name in names}
+
+    _Dictifiers[cls] = convert
+    return convert
+
+
+def datifier(cls):
+    """
+    Returns function that converts dict into an instance of dataclass cls
+    equivalent to datify. The field types of cls are resolved once when the
+    function is generated and the function is cached per class. Only fields
+    whose type is itself a dataclass or provides a `_der` method are converted
+    recursively so leaf fields are not put through failing conversions.
+
+    When the dict does not fit cls the function returns the dict unchanged as
+    datify does.
+
+    Parameters:
+        cls: dataclass class"""
+    try:
+        return _Datifiers[cls]
+    except (KeyError, TypeError):  # TypeError when cls is not hashable
+        pass
+
+    der = getattr(cls, "_der", None)
+    if callable(der):
+        def convert(d):
+            try:
+                return der(d)
+            except Exception:
+                return d
+
+    elif isinstance(cls, type) and dataclasses.is_dataclass(cls):
+        convert = _compileDatifier(cls)
+
+    else:  # not a dataclass so leave value as is
+        def convert(d):
+            return d
+
+    try:
+        _Datifiers[cls] = convert
+    except TypeError:  # not hashable
+        pass
+    return convert
+
+
+def _compileDatifier(cls):
+    """
+    Returns datifier function for dataclass cls. Converters of nested dataclass
+    fields are looked up lazily on first use so self referential classes work.
+
+    Parameters:
+        cls: dataclass class"""
+    nesteds = {}  # field name to field type that need nested conversion
+    names = set()
+    for f in dataclasses.fields(cls):
+        names.add(f.name)
+        if (callable(getattr(f.type, "_der", None)) or
+                (isinstance(f.type, type) and dataclasses.is_dataclass(f.type))):
+            nesteds[f.name] = f.type
+
+    def convert(d):
+        if not isinstance(d, dict):
+            return d
+        try:
+            if nesteds:
+                kwa = {}
+                for k, v in d.items():
+                    if k in nesteds:
+                        v = datifier(nesteds[k])(v)
+                    elif k not in names:
+                        return d
+                    kwa[k] = v
+            else:
+                if not names.issuperset(d):
+                    return d
+                kwa = d
+            return cls(**kwa)
+        except Exception:
+            return d
+
+    return convert
+
+
 def klasify(sers: Iterable, klases: Iterable, args: Iterable = None):
     """
     Convert each qb64 serialization ser in sers to instance of corresponding
@@ -307,8 +439,8 @@ def b64ToInt(s):
     if hasattr(s, 'decode'):
         s = s.decode("utf-8")
     i = 0
-    for e, c in enumerate(reversed(s)):
-        i |= B64IdxByChr[c] << (e * 6)  # same as i += B64IdxByChr[c] * (64 ** e)
+    for c in s:  # most significant char first
+        i = (i << 6) | B64IdxByChr[c]
     return i
 
 
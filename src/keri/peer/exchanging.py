@@ -84,7 +84,7 @@ class Exchanger:
         nests = kwa.get("nests")
 
 
-        behavior = self.routes[route] if route in self.routes else None
+        behavior = self.routes.get(route)
         if tsgs:
             for prefixer, snumber, sdiger, sigers in tsgs:  # iterate over each tsg
                 if sender != prefixer.qb64:  # sig not by aid
@@ -26,7 +26,7 @@ class RawRecord:
     @classmethod
     def _fromdict(cls, d: dict):
         """returns instance of clas initialized from dict d """
-        return helping.datify(cls, d)
+        return helping.datifier(cls)(d)
 
 
     def __iter__(self):
@@ -35,7 +35,7 @@ class RawRecord:
 
     def _asdict(self):
         """Returns dict version of record"""
-        return helping.dictify(self)
+        return helping.dictifier(type(self))(self)
 
 
     def _asjson(self):
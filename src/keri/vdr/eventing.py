@@ -1142,7 +1142,10 @@ class Tever:
             raise ValidationError("Unsupported ilk = {} for evt = {}.".format(ilk, ked))
 
     def vcState(self, vci):
-        """ Calculate state (issued/revoked) of VC from db.
+        """ State (issued/revoked) of VC from its status record in .reger.vcss
+        maintained by .logEvent. Calculates the state from the TEL of VC and
+        saves its status record when missing such as for a VC logged before
+        status records.
 
         Returns None if never issued from this Registry
 
@@ -1150,7 +1153,54 @@ class Tever:
             vci (str):  qb64 VC identifier
 
         Returns:
-            status (Serder): transaction event state notification message"""
+            status (VcStateRecord): transaction event state notification message"""
+        if (vsr := self.reger.vcss.get(keys=vci)) is not None:
+            return vsr
+
+        if (vsr := self.calcVcState(vci)) is not None and not self.reger.readonly:
+            self.reger.vcss.pin(keys=vci, val=vsr)
+        return vsr
+
+    def makeVcState(self, vci, sn, serder, seqner, saider):
+        """ Returns state of VC at its latest TEL event serder
+
+        Parameters:
+            vci (str):  qb64 VC identifier
+            sn (int): sequence number of serder in TEL of VC
+            serder (SerderKERI): latest TEL event of VC
+            seqner (Seqner): sequence number of anchoring event in KEL
+            saider (Saider): SAID of anchoring event in KEL
+
+        Returns:
+            status (VcStateRecord): transaction event state notification message"""
+        if self.noBackers:
+            vcilk = Ilks.iss if sn == 0 else Ilks.rev
+            ra = dict()
+        else:
+            vcilk = Ilks.bis if sn == 0 else Ilks.brv
+            ra = serder.ked["ra"]
+
+        return vcstate(vcpre=vci,
+                       said=serder.said,
+                       sn=sn,
+                       ri=self.prefixer.qb64,
+                       dts=serder.ked['dt'],
+                       eilk=vcilk,
+                       ra=ra,
+                       a=dict(s=seqner.sn, d=saider.qb64),
+                       version=self.version,
+                       )
+
+    def calcVcState(self, vci):
+        """ Calculate state (issued/revoked) of VC from its TEL in db.
+
+        Returns None if never issued from this Registry
+
+        Parameters:
+            vci (str):  qb64 VC identifier
+
+        Returns:
+            status (VcStateRecord): transaction event state notification message"""
         digs = []
         for _, _, dig in self.reger.tels.getAllItemIter(keys=vci.encode("utf-8")):
             digs.append(dig)
@@ -1165,14 +1215,6 @@ class Tever:
         raw = self.reger.tvts.get(keys=dgkey)
         serder = SerderKERI(raw=raw.encode("utf-8"))
 
-        if self.noBackers:
-            vcilk = Ilks.iss if len(digs) == 1 else Ilks.rev
-            ra = dict()
-        else:
-            vcilk = Ilks.bis if len(digs) == 1 else Ilks.brv
-            ra = serder.ked["ra"]
-
-        dgkey = dgKey(vci, vcdig)
         couple = self.reger.ancs.get(keys=dgkey)
         if couple is None:
             raise MissingEntryError(f"Missing anchor couple at key={dgkey!r}.")
@@ -1180,16 +1222,8 @@ class Tever:
         seqner = Seqner(sn=number.num)
         saider = Saider(qb64=diger.qb64)
 
-        return vcstate(vcpre=vci,
-                       said=vcdig.decode("utf-8"),
-                       sn=vcsn,
-                       ri=self.prefixer.qb64,
-                       dts=serder.ked['dt'],
-                       eilk=vcilk,
-                       ra=ra,
-                       a=dict(s=seqner.sn, d=saider.qb64),
-                       version=self.version,
-                       )
+        return self.makeVcState(vci=vci, sn=vcsn, serder=serder,
+                                seqner=seqner, saider=saider)
 
     def vcSn(self, vci):
         """ Calculates the current seq no of VC from db.
@@ -1234,6 +1268,15 @@ class Tever:
         self.reger.tets.pin(keys=(pre.decode("utf-8"), dig.decode("utf-8")), val=Dater())
         self.reger.tvts.put(keys=key, val=serder.raw)
         self.reger.tels.put(keys=pre, on=sn, val=dig)
+        if pre != self.prefixer.qb64b:  # credential TEL event so update its status
+            vci = pre.decode("utf-8")
+            vsr = self.reger.vcss.get(keys=vci)
+            if vsr is None or int(vsr.s, 16) <= sn:
+                self.reger.vcss.pin(keys=vci, val=self.makeVcState(vci=vci,
+                                                                   sn=sn,
+                                                                   serder=serder,
+                                                                   seqner=seqner,
+                                                                   saider=saider))
         logger.info("Tever: Added to TEL valid %s event %s said=%s reg=%.8s iss=%.8s",
                     serder.ilk, pre.decode(), serder.said, self.regk, self.pre)
         logger.debug("TEL Event Body=\n%s\n", serder.pretty())
@@ -2312,6 +2355,12 @@ class Reger(LMDBer):
                                    subkey='stts.')
         #self.states = SerderSuber(db=self, subkey='stts.')  # registry event state
 
+        # Credential state made of VcStateRecord keyed by credential SAID.
+        # Updated by Tever.logEvent with each TEL event of the credential
+        self.vcss = Komer(db=self,
+                          klas=VcStateRecord,
+                          subkey='vcss.')
+
         # Holds the credential
         self.creds = SerderSuber(db=self, subkey="creds.", klas=SerderACDC)
 
@@ -2378,102 +2427,221 @@ class Reger(LMDBer):
 
         return self.env
 
-    def cloneCreds(self, saids, db, gvrsn=Version, *, version=None):
+    def vcStates(self, saids):
+        """ Returns states of credentials read from their status records in
+        one read transaction. States missing a status record, such as for
+        credentials logged before status records, are calculated from the
+        TEL of the credential by the Tever of its registry.
+
+        Parameters:
+            saids (Iterable): qb64 SAIDs of credentials as str or Saider
+
+        Returns:
+            dict: VcStateRecord or None when not issued keyed by str SAID
+        """
+        saids = [said.qb64 if hasattr(said, "qb64") else said for said in saids]
+        with self.reading():
+            states = {said: self.vcss.get(keys=said) for said in saids}
+            missing = {said: creder for said, vsr in states.items()
+                       if vsr is None and (creder := self.creds.get(keys=said)) is not None}
+
+        for said, creder in missing.items():  # outside read txn as may write
+            if (regk := creder.regid) and regk in self.tevers:
+                states[said] = self.tevers[regk].vcState(said)
+
+        return states
+
+    def cloneCreds(self, saids, db, gvrsn=Version, *, version=None, depth=None):
         """ Returns fully expanded credential with chained credentials attached.
 
+        Each distinct credential is expanded once per call so that credentials
+        chained to by several others, such as a QVI credential shared by many
+        LE and ECR credentials, share one expanded dict in every chains list
+        where they appear. A credential chained to by one of its own chained
+        credentials is not expanded again so cycles terminate.
+
         Parameters:
             saids (list): of Saider objects:
             db (Baser): baser object to load schema
             gvrsn (Versionage): CESR genus version for TEL attachments
             version (Versionage): legacy alias for gvrsn
+            depth (int | None): max depth of chains expanded below saids.
+                0 means chains are not expanded. None means no limit
 
         Returns:
             list: fully hydrated credentials with full chains provided"""
-        from ..app import serialize
         if version is not None:
             gvrsn = version
+        depth = depth if depth is not None else float("inf")
+        return self._cloneCreds(saids, db, gvrsn, depth=depth, memo=dict(),
+                                path=set(), schemas=dict())
+
+    def _cloneCreds(self, saids, db, gvrsn, depth, memo, path, schemas):
+        """ Returns list of expanded credentials of saids for .cloneCreds
+
+        Parameters:
+            saids (list): of Saider objects
+            db (Baser): baser object to load schema
+            gvrsn (Versionage): CESR genus version for TEL attachments
+            depth (int | float): max depth of chains expanded below saids
+            memo (dict): triples (cred, depth, chainSaids) of credentials
+                expanded by this call keyed by SAID where depth is the depth
+                of its chains expanded
+            path (set): SAIDs of credentials being expanded above saids
+            schemas (dict): schema seds loaded by this call keyed by schema SAID
+        """
+        states = self.vcStates(saider for saider in saids
+                               if saider.qb64 not in memo and saider.qb64 not in path)
         creds = []
         for saider in saids:
-            key = saider.qb64
-            creder, prefixer, number, asaider = self.cloneCred(said=key)
-            atc = bytearray(serialize(creder, prefixer, number, saider))
-            del atc[0:creder.size]
-
-            regk = creder.regid
-            status = self.tevers[regk].vcState(saider.qb64)
-            schemer = db.schema.get(creder.schema)
-
-            iss = bytearray(self.cloneTvtAt(creder.said, sn=0, gvrsn=gvrsn))
-            iserder = SerderKERI(raw=iss)
-            issatc = bytes(iss[iserder.size:])
-            del iss[0:iserder.size]
-            if status.et in [Ilks.rev, Ilks.brv]:
-                rev = bytearray(self.cloneTvtAt(creder.said, sn=1, gvrsn=gvrsn))
-                rserder = SerderKERI(raw=rev)
-                revatc = bytes(rev[rserder.size:])
-                del rev[0:rserder.size]
-
-            chainSaids = []
-            for k, p in (creder.edge.items() if creder.edge is not None else {}):
-                if k == "d":
-                    continue
+            said = saider.qb64
+            if said in path:  # cycle so already being expanded above
+                continue
+
+            if said not in memo or memo[said][1] < depth:
+                if said in memo:  # expanded with fewer levels of chains
+                    cred, _, chainSaids = memo[said]
+                else:
+                    cred, chainSaids = self._cloneCred(saider, db, gvrsn,
+                                                       states[said], schemas)
 
-                if not isinstance(p, dict):
+                if depth > 0:
+                    path.add(said)
+                    cred["chains"] = self._cloneCreds(chainSaids, db, gvrsn, depth - 1,
+                                                      memo, path, schemas)
+                    path.discard(said)
+                memo[said] = (cred, depth, chainSaids)
+
+            creds.append(memo[said][0])
+
+        return creds
+
+    def cloneCredIter(self, saids, db, gvrsn=Version, *, depth=None):
+        """ Iterator of expanded credentials of saids and of their chained
+        credentials for streaming large wallets. Each distinct credential is
+        yielded once and after every credential it chains to. The chains of
+        each credential are the SAIDs of its chained credentials, which have
+        already been yielded, instead of expanded credentials.
+
+        Parameters:
+            saids (list): of Saider objects
+            db (Baser): baser object to load schema
+            gvrsn (Versionage): CESR genus version for TEL attachments
+            depth (int | None): max depth of chains yielded below saids.
+                0 means only saids. None means no limit
+
+        Yields:
+            cred (dict): fully hydrated credential with chains as SAIDs"""
+        depth = depth if depth is not None else float("inf")
+        seen = set()
+        schemas = dict()
+
+        def expand(saids, depth, path):
+            states = self.vcStates(saider for saider in saids if saider.qb64 not in seen)
+            for saider in saids:
+                said = saider.qb64
+                if said in seen or said in path:
                     continue
 
-                chainSaids.append(Saider(qb64=p["n"]))
-            chains = self.cloneCreds(chainSaids, db, gvrsn=gvrsn)
-
-            cred = dict(
-                sad=creder.sad,
-                atc=atc.decode("utf-8"),
-                iss=iserder.sad,
-                issatc=issatc.decode("utf-8"),
-                rev=rserder.sad if status.et in [Ilks.rev, Ilks.brv] else None,
-                revatc=revatc.decode("utf-8") if status.et in [Ilks.rev, Ilks.brv] else None,
-                pre=creder.israid,
-                schema=schemer.sed,
-                chains=chains,
-                status=asdict(status),
-                anchor=dict(
-                    pre=prefixer.qb64,
-                    sn=number.sn,
-                    d=asaider.qb64
-                )
+                cred, chainSaids = self._cloneCred(saider, db, gvrsn, states[said], schemas)
+                if depth > 0:
+                    path.add(said)
+                    yield from expand(chainSaids, depth - 1, path)
+                    path.discard(said)
+                    cred["chains"] = [chain.qb64 for chain in chainSaids if chain.qb64 in seen]
+                seen.add(said)
+                yield cred
+
+        yield from expand(saids, depth, set())
+
+    def _cloneCred(self, saider, db, gvrsn, status, schemas):
+        """ Returns couple (cred, chainSaids) of expanded credential at saider
+        without chains expanded and Saiders of the credentials it chains to.
+
+        Parameters:
+            saider (Saider): SAID of credential
+            db (Baser): baser object to load schema
+            gvrsn (Versionage): CESR genus version for TEL attachments
+            status (VcStateRecord): state of credential
+            schemas (dict): schema seds loaded keyed by schema SAID
+        """
+        from ..app import serialize
+        key = saider.qb64
+        creder, prefixer, number, asaider = self.cloneCred(said=key)
+        atc = bytearray(serialize(creder, prefixer, number, saider))
+        del atc[0:creder.size]
+
+        if creder.schema not in schemas:
+            schemas[creder.schema] = db.schema.get(creder.schema).sed
+
+        iss = bytearray(self.cloneTvtAt(creder.said, sn=0, gvrsn=gvrsn))
+        iserder = SerderKERI(raw=iss)
+        issatc = bytes(iss[iserder.size:])
+        del iss[0:iserder.size]
+        if status.et in [Ilks.rev, Ilks.brv]:
+            rev = bytearray(self.cloneTvtAt(creder.said, sn=1, gvrsn=gvrsn))
+            rserder = SerderKERI(raw=rev)
+            revatc = bytes(rev[rserder.size:])
+            del rev[0:rserder.size]
+
+        chainSaids = []
+        for k, p in (creder.edge.items() if creder.edge is not None else {}):
+            if k == "d":
+                continue
+
+            if not isinstance(p, dict):
+                continue
+
+            chainSaids.append(Saider(qb64=p["n"]))
+
+        cred = dict(
+            sad=creder.sad,
+            atc=atc.decode("utf-8"),
+            iss=iserder.sad,
+            issatc=issatc.decode("utf-8"),
+            rev=rserder.sad if status.et in [Ilks.rev, Ilks.brv] else None,
+            revatc=revatc.decode("utf-8") if status.et in [Ilks.rev, Ilks.brv] else None,
+            pre=creder.israid,
+            schema=schemas[creder.schema],
+            chains=[],
+            status=asdict(status),
+            anchor=dict(
+                pre=prefixer.qb64,
+                sn=number.sn,
+                d=asaider.qb64
             )
+        )
 
+        ctr = Counter(qb64b=iss, strip=True, version=gvrsn)
+        if ctr.name == Codens.AttachmentGroup:
             ctr = Counter(qb64b=iss, strip=True, version=gvrsn)
+
+        if ctr.name == Codens.SealSourceCouples:
+            Number(qb64b=iss, strip=True)
+            saider = Saider(qb64b=iss)
+
+            anc = db.cloneEvtMsg(pre=creder.israid, fn=0, dig=saider.qb64b)
+            aserder = SerderKERI(raw=anc)
+            ancatc = bytes(anc[aserder.size:])
+            cred['anc'] = aserder.sad
+            cred['ancatc'] = ancatc.decode("utf-8"),
+
+        if status.et in [Ilks.rev, Ilks.brv]:
+            ctr = Counter(qb64b=rev, strip=True, version=gvrsn)
             if ctr.name == Codens.AttachmentGroup:
-                ctr = Counter(qb64b=iss, strip=True, version=gvrsn)
+                ctr = Counter(qb64b=rev, strip=True, version=gvrsn)
 
             if ctr.name == Codens.SealSourceCouples:
-                Number(qb64b=iss, strip=True)
-                saider = Saider(qb64b=iss)
+                Number(qb64b=rev, strip=True)
+                saider = Saider(qb64b=rev)
 
                 anc = db.cloneEvtMsg(pre=creder.israid, fn=0, dig=saider.qb64b)
                 aserder = SerderKERI(raw=anc)
                 ancatc = bytes(anc[aserder.size:])
-                cred['anc'] = aserder.sad
-                cred['ancatc'] = ancatc.decode("utf-8"),
+                cred['revanc'] = aserder.sad
+                cred['revancatc'] = ancatc.decode("utf-8"),
 
-            if status.et in [Ilks.rev, Ilks.brv]:
-                ctr = Counter(qb64b=rev, strip=True, version=gvrsn)
-                if ctr.name == Codens.AttachmentGroup:
-                    ctr = Counter(qb64b=rev, strip=True, version=gvrsn)
-
-                if ctr.name == Codens.SealSourceCouples:
-                    Number(qb64b=rev, strip=True)
-                    saider = Saider(qb64b=rev)
-
-                    anc = db.cloneEvtMsg(pre=creder.israid, fn=0, dig=saider.qb64b)
-                    aserder = SerderKERI(raw=anc)
-                    ancatc = bytes(anc[aserder.size:])
-                    cred['revanc'] = aserder.sad
-                    cred['revancatc'] = ancatc.decode("utf-8"),
-
-            creds.append(cred)
-
-        return creds
+        return cred, chainSaids
 
     def logCred(self, creder, prefixer, number, diger):
         """ Save the base credential and seals (est evt+sigs quad) with no indices.
@@ -8,6 +8,7 @@ from types import SimpleNamespace
 
 import pytest
 from hio.base import doing, tyming
+from hio.help import decking
 
 from keri.kering import Schemes, Vrsn_1_0, Vrsn_2_0, Kinds
 from keri.core import Counter, Codens, Salter, SerderKERI, Siger
@@ -139,8 +140,8 @@ def test_receiptor_propagates_only_verified_receipts(monkeypatch, version):
         clients = {witHab.pre: FakeClient(receipt)
                    for witHab, receipt in zip(witHabs, receipts)}
 
-        def fakeHttpClient(hab, wit):
-            return clients[wit], doing.Doer()
+        def fakeHttpClient(hab, wit, clienter=None):
+            return clients[wit], None
 
         def capturePropagation(client, ims, dest, path=None, headers=None):
             if path != "/receipts":
@@ -224,6 +225,118 @@ def test_witness_receiptor(seeder, witnessPorter):
         assert rctDoer.done is True
 
 
+def test_witness_receiptor_pipelines(monkeypatch):
+    class FakeMessenger(doing.Doer):
+        def __init__(self, hab, wit, auth=None):
+            self.hab = hab
+            self.wit = wit
+            self.msgs = decking.Deck()
+            self.sent = sents.setdefault(wit, [])  # across messengers of wit
+            super(FakeMessenger, self).__init__()
+
+        def recur(self, tyme):
+            while self.msgs:
+                self.sent.append(SerderKERI(raw=self.msgs.popleft()))
+            return False
+
+        @property
+        def idle(self):
+            return len(self.msgs) == 0
+
+    witers = dict()
+    sents = dict()
+
+    def fakeMessenger(hab, wit, auth=None):
+        witers[wit] = FakeMessenger(hab, wit, auth=auth)
+        return witers[wit]
+
+    monkeypatch.setattr(agenting, "messenger", fakeMessenger)
+
+    with openHby(name="wan-pipe", salt=Salter(raw=b'wann-the-witness').qb64) as wanHby, \
+            openHby(name="wil-pipe", salt=Salter(raw=b'will-the-witness').qb64) as wilHby, \
+            openHby(name="wes-pipe", salt=Salter(raw=b'wess-the-witness').qb64) as wesHby, \
+            openHby(name="pal-pipe", salt=Salter(raw=b'0123456789abcdef').qb64) as palHby:
+        wanHab = wanHby.makeHab(name="wan", transferable=False)
+        wilHab = wilHby.makeHab(name="wil", transferable=False)
+        wesHab = wesHby.makeHab(name="wes", transferable=False)
+        palHab = palHby.makeHab(name="pal", wits=[wanHab.pre, wilHab.pre], transferable=True)
+
+        def receipt(sn):
+            serder, _, _ = palHab.getOwnEvent(sn=sn)
+            for witHab in (wanHab, wilHab, wesHab):
+                if witHab.pre in palHab.kever.wits:
+                    palHab.psr.parseOne(witHab.receipt(serder=serder, framed=True))
+            return serder
+
+        def sent(wit):
+            return [(serder.ilk, serder.sn) for serder in witers[wit].sent]
+
+        def run():  # messengers send on the pass after a message is queued
+            for _ in range(3):
+                doist.recur()
+
+        witDoer = WitnessReceiptor(hby=palHby)
+        doist = doing.Doist(limit=1.0, tock=0.03125, doers=[witDoer])
+        doist.enter()
+
+        # many events in flight at once over one messenger per witness
+        palHab.interact()
+        witDoer.msgs.extend([dict(pre=palHab.pre, sn=0), dict(pre=palHab.pre, sn=1)])
+        run()
+        assert len(witDoer.pending) == 2
+        assert set(witDoer.witers) == {(palHab.pre, wanHab.pre), (palHab.pre, wilHab.pre)}
+        assert sent(wanHab.pre) == [("icp", 0), ("ixn", 1)]
+        assert sent(wilHab.pre) == [("icp", 0), ("ixn", 1)]
+        assert not witDoer.cues
+
+        receipt(1)
+        run()
+        assert witDoer.cues.popleft() == dict(pre=palHab.pre, sn=1)
+        assert sent(wanHab.pre)[-1] == ("rct", 1)
+        assert len(witDoer.witers) == 2  # still in use by event 0
+        receipt(0)
+        run()
+        assert witDoer.cues.popleft() == dict(pre=palHab.pre, sn=0)
+        assert not witDoer.pending
+
+        # idle messengers of witnesses with no event in flight are removed
+        assert witDoer.witers == {} and witDoer.queued == {}
+        assert not any(witer in witDoer.doers for witer in witers.values())
+
+        # added witness is caught up from the start and others are not
+        palHab.rotate(adds=[wesHab.pre], framed=True)
+        witDoer.msgs.append(dict(pre=palHab.pre, sn=2))
+        run()
+        assert sent(wanHab.pre)[-1] == ("rot", 2)
+        assert sent(wesHab.pre) == [("icp", 0), ("ixn", 1), ("rot", 2)]
+        receipt(2)
+        run()
+        assert witDoer.cues.popleft() == dict(pre=palHab.pre, sn=2)
+        assert sent(wesHab.pre)[-1] == ("rct", 2)
+
+        # fresh receiptor catches up witness from its last receipted event
+        witDoer = WitnessReceiptor(hby=palHby)
+        doist.extend([witDoer])
+        witers.clear()
+        sents.clear()
+        palHab.interact()
+        palHab.interact()
+        witDoer.msgs.append(dict(pre=palHab.pre, sn=4))
+        run()
+        assert sent(wesHab.pre) == [("ixn", 3), ("ixn", 4)]
+        assert witDoer.lastSn(palHab, wesHab.pre, 4) == 2
+        assert witDoer.lastSn(palHab, wesHab.pre, 2) == -1
+
+        # each controller sharing a witness sends over its own messenger
+        othHab = palHby.makeHab(name="oth", wits=[wanHab.pre], transferable=True)
+        witDoer.msgs.append(dict(pre=othHab.pre, sn=0))
+        run()
+        assert witDoer.witers[(othHab.pre, wanHab.pre)].hab is othHab
+        assert witDoer.witers[(palHab.pre, wanHab.pre)].hab is palHab
+
+        doist.exit()
+
+
 class ReceiptDoer(doing.DoDoer):
     """ Test scenario of witness receipts. """
 
@@ -586,6 +699,39 @@ def test_messenger_prefers_https():
         assert call_url == "https://example.com:5643"
 
 
+def test_http_messenger_clienter():
+    """Verify HTTPMessenger takes its client from a Clienter pool and releases
+    it back on exit instead of running its own client."""
+    from unittest.mock import MagicMock
+    from hio.core import http
+    from keri.app.httping import Clienter
+
+    pre = "EtyPSuUjLyLdXAtGMrsTt0-ELyWeU8fJcymHiGOfuaSA"
+    clienter = Clienter()
+    doist = doing.Doist(tock=0.03125, limit=1.0, doers=[clienter])
+    doist.enter()
+
+    witer = agenting.HTTPMessenger(hab=MagicMock(), wit=pre, url="http://127.0.0.1:5632",
+                                   clienter=clienter)
+    client = witer.client
+    assert [c for (c, _, _) in clienter.clients] == [client]
+    assert not [d for d in witer.doers if isinstance(d, http.clienting.ClientDoer)]
+    assert clienter.poolStats["created"] == 1
+
+    witer.exit()
+    assert witer.client is None
+    assert clienter.clients == []  # never connected so closed not pooled
+    assert clienter.poolStats["closed"] == 1
+
+    # without clienter messenger runs its own client
+    witer = agenting.HTTPMessenger(hab=MagicMock(), wit=pre, url="http://127.0.0.1:5632")
+    assert [d for d in witer.doers if isinstance(d, http.clienting.ClientDoer)]
+    witer.exit()
+    assert witer.client is not None
+
+    doist.exit()
+
+
 def test_telquery_uses_pre_not_wits():
     """Test that WitnessInquisitor.telquery queues a message with `pre` parameter
     for endpoint resolution instead of `wits`, matching KERIA behavior.
@@ -21,7 +21,7 @@ from keri.core import (Kramer, Kevery, Salter, Seqner, Number,
 
 from keri.app import (Configer, ConfigerDoer, Habery,
                       Hab, HaberyDoer, Keeper, KeeperDoer,
-                      openHab, openHby, Algos)
+                      HabCache, openHab, openHby, Algos)
 
 from keri.db import Baser, BaserDoer
 
@@ -603,6 +603,85 @@ def test_habery_signatory():
         assert len(hby.habs) == 0
         assert len(hby.prefixes) == 0
 
+
+def test_habery_signer_cache():
+    with openHby() as hby:
+        assert hby.mgr.signerCacheSize == 0  # disabled by default
+
+    with openHby(salt=Salter(raw=b'0123456789abcdef').qb64,
+                 signerCacheSize=8, signerCacheTTL=30.0) as hby:
+        assert hby.mgr.signerCacheSize == 8
+        assert hby.mgr.signerCacheTTL == 30.0
+        hab = hby.makeHab(name="test")
+        pub = hab.kever.verfers[0].qb64
+        assert pub in hby.mgr._signers  # signed inception
+        signer = hby.mgr._signers[pub][0]
+        msg = hab.interact()
+        assert hby.mgr._signers[pub][0] is signer  # cache hit
+        msg = hab.rotate()
+        assert pub not in hby.mgr._signers  # rotation clears cache
+        assert hab.kever.sn == 2
+
+def test_habery_lazy_habs():
+    """Test lazy hab materialization into bounded HabCache"""
+    name = f"lazy-test-v2-{uuid.uuid4().hex}"
+    base = f"test-v2-{uuid.uuid4().hex}"
+    salt = Salter(raw=b'0123456789abcdef').qb64
+
+    with openHby(name=name, base=base, temp=False, clear=True, salt=salt) as hby:
+        assert hby.habCacheSize == 0  # eager by default
+        assert isinstance(hby.habs, dict)
+        pres = [hby.makeHab(name=f"hab{i}", icount=1, kind=Kinds.cesr).pre
+                for i in range(3)]
+
+    with openHby(name=name, base=base, temp=False, salt=salt,
+                 habCacheSize=2) as hby:
+        assert hby.db.lazy
+        assert isinstance(hby.habs, HabCache)
+        assert list(hby.db.prefixes) == sorted(pres)  # prefixes still reloaded
+        assert not dict.__len__(hby.db.kevers)  # no kever built on open
+        assert not hby.habs.loaded
+        assert len(hby.habs) == 3
+        assert set(hby.habs) == set(pres)
+        assert pres[0] in hby.habs
+        assert not hby.habs.loaded  # contains does not materialize
+
+        hab = hby.habByName("hab0")
+        assert hab.pre == pres[0] and hab.name == "hab0" and hab.inited
+        assert hab.kever.sn == 0
+        assert hby.habByPre(pres[0]) is hab  # cached
+        hby.habByPre(pres[1])
+        hby.habByPre(pres[2])
+        assert list(hby.habs.loaded) == pres[1:]  # least recently used evicted
+        assert hby.habByPre(pres[0]) is not hab  # rematerialized
+        assert hby.habByPre("ENotAHab") is None
+        assert hby.habByName("nope") is None
+
+        hab = hby.makeHab(name="hab3", icount=1, kind=Kinds.cesr)
+        assert list(hby.habs.loaded) == [pres[0], hab.pre]
+        assert len(hby.habs) == 4
+        assert hby.deleteHab("hab1")
+        assert pres[1] not in hby.habs
+        assert len(hby.habs) == 3
+        assert {h.name for h in hby.habs.values()} == {"hab0", "hab2", "hab3"}
+        assert len(hby.habs.loaded) == 2
+
+        # hab whose own KEL can not be loaded raises and keeps its record
+        hab = hby.makeHab(name="hab4", icount=1, kind=Kinds.cesr)
+        hby.db.evts.rem(keys=(hab.pre, hab.kever.serder.said))
+        del hby.db.kevers[hab.pre]
+        del hby.habs[hab.pre]
+        with pytest.raises(ConfigurationError):
+            hby.habByPre(hab.pre)
+        assert hby.db.habs.get(keys=(hab.pre,)) is not None
+        assert hab.pre in hby.db.prefixes
+
+    hby.close(clear=True)
+    hby.cf.close(clear=True)
+
+    """End Test"""
+
+
 def test_namespaced_habs(tmp_path):
     with openHby(salt=Salter(raw=b'0123456789abcdef').qb64) as hby:
         hab = hby.makeHab(name="test", kind=Kinds.cesr)
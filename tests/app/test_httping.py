@@ -4,13 +4,17 @@ tests.peer.httping module
 
 """
 
+import time
+
 import falcon
 import pytest
 from falcon.testing import helpers
+from hio.base import doing, tyming
+from hio.core import http
 
 from keri.app import (openHab, parseCesrHttpRequest,
                       createCESRRequest, streamCESRRequests,
-                      CESR_CONTENT_TYPE)
+                      CESR_CONTENT_TYPE, Clienter)
 from keri.kering import Ilks, Vrsn_1_0, Vrsn_2_0, Kinds
 from keri.core import Kevery, Parser, SerderKERI
 from keri.vdr import Regery, Tevery, Verifier
@@ -448,3 +452,64 @@ def test_stream_cesr_request_v2(mockHelpingNowUTC):
 
 if __name__ == '__main__':
     test_parse_cesr_request()
+
+
+def test_clienter_pool(unused_tcp_port):
+    """
+    Test Clienter reuses keep-alive clients per host and limits running clients per host
+    """
+    class PingEnd:
+        def on_get(self, req, rep):
+            rep.status = falcon.HTTP_200
+            rep.text = "pong"
+
+    app = falcon.App()
+    app.add_route("/ping", PingEnd())
+    server = http.Server(port=unused_tcp_port, app=app)
+    serverDoer = http.ServerDoer(server=server)
+
+    clienter = Clienter()
+    clienter.HostLimit = 1
+    url = f"http://127.0.0.1:{unused_tcp_port}/ping"
+    assert clienter.hostKey("HTTP", "LocalHost") == ("http", "localhost", 80)
+    assert clienter.hostKey("https", "localhost") == ("https", "localhost", 443)
+
+    doist = doing.Doist(limit=2.0, tock=0.03125, doers=[serverDoer, clienter])
+    doist.enter()
+
+    def service(client):
+        tymer = tyming.Tymer(tymth=doist.tymen(), duration=doist.limit)
+        while not (client.responses or tymer.expired):
+            doist.recur()
+            time.sleep(doist.tock)
+        return client.respond()
+
+    client = clienter.request("GET", url)
+    waiter = clienter.request("GET", url)  # host at limit so waits
+    assert clienter.poolStats == dict(created=2, reused=0, waited=1, closed=0,
+                                      active=1, idle=0, waiting=1)
+    assert service(client).status == 200
+    assert not waiter.responses  # still waiting
+
+    clienter.remove(client)  # keep-alive so pooled as idle not closed
+    assert clienter.poolStats["idle"] == 1
+    reused = clienter.request("GET", url)
+    assert reused is client
+    assert clienter.poolStats["reused"] == 1
+    assert service(reused).status == 200
+
+    clienter.remove(reused)
+    clienter.remove(waiter)  # never started so dropped
+    assert clienter.poolStats == dict(created=2, reused=1, waited=1, closed=0,
+                                      active=0, idle=1, waiting=0)
+
+    clienter.IdleTimeout = 0.0  # expire idle clients on next clientDo pass
+    tymer = tyming.Tymer(tymth=doist.tymen(), duration=doist.limit)
+    while clienter.poolStats["idle"] and not tymer.expired:
+        doist.recur()
+        time.sleep(doist.tock)
+    assert clienter.poolStats["idle"] == 0
+    assert clienter.poolStats["closed"] == 1
+
+    doist.exit()
+    """Done Test"""
@@ -2006,5 +2006,73 @@ def test_manager_sign_dual_indices():
     assert not manager.ks.opened
     """End Test"""
 
+def test_manager_signer_cache():
+    """
+    test Manager decrypted signer cache used by .sign
+    """
+    salt = Salter(raw=b'0123456789abcdef').qb64
+    cryptseed = b'h,#|\x8ap"\x12\xc43t2\xa6\xe1\x18\x19\xf0f2,y\xc4\xc21@\xf5@\x15.\xa2\x1a\xcf'
+    cryptsigner = Signer(raw=cryptseed, code=MtrDex.Ed25519_Seed,
+                         transferable=False)
+    seed = cryptsigner.qb64
+    aeid = cryptsigner.verfer.qb64
+    ser = b'abcdefghijklmnopqrstuvwxyz0123456789'
+
+    with openKS() as keeper:
+        manager = Manager(ks=keeper, seed=seed, salt=salt, aeid=aeid)
+        assert manager.signerCacheSize == Manager.SignerCacheSize == 0
+        assert manager.signerCacheTTL == Manager.SignerCacheTTL
+        verfers, digers = manager.incept(icount=3, salt=salt, temp=True)
+        pubs = [verfer.qb64 for verfer in verfers]
+        sigers = manager.sign(ser, pubs=pubs)
+        assert not manager._signers  # disabled by default
+
+    with openKS() as keeper:
+        manager = Manager(ks=keeper, seed=seed, salt=salt, aeid=aeid,
+                          signerCacheSize=2, signerCacheTTL=60.0)
+        assert manager.signerCacheSize == 2
+        assert manager.signerCacheTTL == 60.0
+        verfers, digers = manager.incept(icount=3, salt=salt, temp=True)
+        pubs = [verfer.qb64 for verfer in verfers]
+
+        # batch larger than cache keeps all of its signers usable
+        csigers = manager.sign(ser, pubs=pubs)
+        assert [siger.qb64 for siger in csigers] == [siger.qb64 for siger in sigers]
+        assert list(manager._signers) == pubs
+
+        # next fetch trims least recently used and zeroizes evicted signer
+        evicted = manager._signers[pubs[0]][0]
+        cigars = manager.sign(ser, verfers=verfers[2:], indexed=False)
+        assert cigars[0].verfer.verify(cigars[0].raw, ser)
+        assert list(manager._signers) == pubs[1:]
+        assert evicted.raw == b''
+
+        # cache hit returns same signer instance
+        cached = manager._signers[pubs[1]][0]
+        assert manager._fetchSigners([pubs[1]])[0] is cached
+        assert list(manager._signers) == [pubs[2], pubs[1]]
+
+        # expired signers are evicted and decrypted again
+        pub, (signer, dt) = next(iter(manager._signers.items()))
+        manager._signers[pub] = (signer, dt - 61.0)
+        assert manager._fetchSigners([pub])[0] is not signer
+        assert signer.raw == b''
+
+        # rotate clears cache
+        assert manager._signers
+        manager.rotate(pre=verfers[0].qb64, ncount=3, temp=True)
+        assert not manager._signers
+        assert cached.raw == b''
+
+        # updateAeid clears cache
+        verfers, digers = manager.incept(icount=1, salt=salt, temp=True)
+        manager.sign(ser, verfers=verfers)
+        assert len(manager._signers) == 1
+        manager.updateAeid(aeid, seed)
+        assert not manager._signers
+
+    """End Test"""
+
+
 if __name__ == "__main__":
     test_manager_sign_dual_indices()
@@ -182,6 +182,64 @@ def test_noter(mockHelpingNowUTC):
     assert cnt == 13
 
 
+def test_noter_pages():
+    noter = Noter(temp=True)
+    cig = Cigar(qb64="AABr1EJXI1sTuI51TXo4F1JjxIJzwPeCxa-Cfbboi7F4Y4GatPEvK629M7G_5c86_Ssvwg8POZWNMV-WreVqBECw")
+
+    rids = []
+    for i in range(7):
+        note = notice(attrs=dict(a=i), dt=f"2022-07-08T15:01:0{i}.453632+00:00")
+        assert noter.add(note, cig) is True
+        rids.append(note.rid)
+
+    notes, cursor = noter.getNotePage(limit=3)
+    assert [note.attrs['a'] for note, _ in notes] == [0, 1, 2]
+    assert notes[0][1].qb64 == cig.qb64
+    assert cursor == ("2022-07-08T15:01:02.453632+00:00", rids[2])
+
+    notes, cursor = noter.getNotePage(after=cursor, limit=3)
+    assert [note.attrs['a'] for note, _ in notes] == [3, 4, 5]
+    notes, cursor = noter.getNotePage(after=cursor, limit=3)
+    assert [note.attrs['a'] for note, _ in notes] == [6]
+    assert cursor is None
+
+    notes, cursor = noter.getNotePage(after="2022-07-08T15:01:04.453632+00:00")
+    assert [note.attrs['a'] for note, _ in notes] == [5, 6]
+    assert cursor is None
+
+    # mark odd notes read and page by read status
+    for i in (1, 3, 5):
+        note, _ = noter.get(rids[i])
+        note.read = True
+        assert noter.update(note, cig) is True
+
+    assert noter.getNoteCnt() == 7
+    assert noter.getNoteCnt(read=True) == 3
+    assert noter.getNoteCnt(read=False) == 4
+
+    notes, cursor = noter.getNotePage(limit=2, read=False)
+    assert [note.attrs['a'] for note, _ in notes] == [0, 2]
+    notes, cursor = noter.getNotePage(after=cursor, limit=2, read=False)
+    assert [note.attrs['a'] for note, _ in notes] == [4, 6]
+    assert cursor is None
+    notes, cursor = noter.getNotePage(read=True)
+    assert [note.attrs['a'] for note, _ in notes] == [1, 3, 5]
+    assert all(note.read for note, _ in notes)
+
+    assert noter.rem(rids[3]) is True
+    assert noter.getNoteCnt(read=True) == 2
+    notes, cursor = noter.getNotePage(read=True)
+    assert [note.attrs['a'] for note, _ in notes] == [1, 5]
+
+    # index rebuilt for notes stored before it existed
+    noter.nrdx.trim()
+    noter.reopen(reuse=True)
+    assert noter.getNoteCnt(read=True) == 2
+    assert noter.getNoteCnt(read=False) == 4
+
+    noter.close(clear=True)
+
+
 def test_notifier(mockHelpingNowUTC):
     with openHby(name="test") as hby:
         notifier = Notifier(hby=hby)
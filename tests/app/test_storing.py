@@ -3,13 +3,14 @@
 tests.app.storing
 
 """
+import datetime
 import os
 
 import lmdb
 
 from keri.app import Mailboxer, openKS
 from keri.kering import Kinds
-from keri.core import Prefixer, SerderKERI, exchange
+from keri.core import Prefixer, SerderKERI, Diger, MtrDex, exchange
 from keri.db import OnSuber, openLMDB, openDB
 
 
@@ -115,6 +116,75 @@ def test_mailboxing():
         #assert msgs[0][0] == 4
 
 
+def test_mailboxer_retention():
+    """
+    Test Mailboxer subscribers and pruning of topics by retention policy
+    """
+    class Subscriber:
+        def __init__(self):
+            self.notices = []
+
+        def notify(self, topic, on):
+            self.notices.append((topic, on))
+
+    with openLMDB(cls=Mailboxer) as mber:
+        assert mber.retainCount == 0
+        assert mber.retainAge == 0.0
+        assert mber.prune() == (0, 0)  # unlimited retention
+
+        sub = Subscriber()
+        mber.subscribe("EAD919wF4oiG7ck6mnBWTRD_Z-Io0wZKCxL0zjx5je9I/receipt", sub)
+        for idx in range(5):
+            mber.storeMsg(topic=b"EAD919wF4oiG7ck6mnBWTRD_Z-Io0wZKCxL0zjx5je9I/receipt",
+                          msg=b'{"i":%d}' % idx)
+        mber.storeMsg(topic="EAD919wF4oiG7ck6mnBWTRD_Z-Io0wZKCxL0zjx5je9I/multisig",
+                      msg=b'{"i":0}')  # same msg as first receipt
+        assert sub.notices == [("EAD919wF4oiG7ck6mnBWTRD_Z-Io0wZKCxL0zjx5je9I/receipt", on)
+                               for on in range(5)]
+        assert mber.marks == {"EAD919wF4oiG7ck6mnBWTRD_Z-Io0wZKCxL0zjx5je9I/receipt": 4,
+                              "EAD919wF4oiG7ck6mnBWTRD_Z-Io0wZKCxL0zjx5je9I/multisig": 0}
+        mber.unsubscribe("EAD919wF4oiG7ck6mnBWTRD_Z-Io0wZKCxL0zjx5je9I/receipt", sub)
+        assert mber.subscribers == {}
+
+        first = Diger(ser=b'{"i":0}', code=MtrDex.Blake3_256).qb64
+        assert mber.refs.get(keys=first).num == 2  # indexed at both topics
+
+        mber.retainCount = 2
+        assert mber.prune() == (3, 2)  # first msg still indexed by multisig
+        assert mber.refs.get(keys=first).num == 1
+        assert mber.refs.cntAll() == 3
+        msgs = list(mber.cloneTopicIter(
+            topic="EAD919wF4oiG7ck6mnBWTRD_Z-Io0wZKCxL0zjx5je9I/receipt"))
+        assert [fn for fn, _, _ in msgs] == [3, 4]
+        assert mber.msgs.cntAll() == 3
+        assert mber.dts.cntAll() == 3
+
+        # ordinals are not reused after pruning
+        mber.storeMsg(topic="EAD919wF4oiG7ck6mnBWTRD_Z-Io0wZKCxL0zjx5je9I/receipt",
+                      msg=b'{"i":5}')
+        assert mber.marks["EAD919wF4oiG7ck6mnBWTRD_Z-Io0wZKCxL0zjx5je9I/receipt"] == 5
+
+        mber.retainCount = 0
+        mber.retainAge = 60.0
+        later = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(hours=1)
+        assert mber.prune(now=later) == (2, 2)  # newest msg of each topic kept
+        assert mber.getTopicMsgs(
+            topic="EAD919wF4oiG7ck6mnBWTRD_Z-Io0wZKCxL0zjx5je9I/receipt") == [b'{"i":5}']
+        assert mber.getTopicMsgs(
+            topic="EAD919wF4oiG7ck6mnBWTRD_Z-Io0wZKCxL0zjx5je9I/multisig") == [b'{"i":0}']
+        assert mber.refs.cntAll() == mber.msgs.cntAll() == 2
+
+        # removed index entry releases its message to next prune
+        assert mber.delTopic(key="EAD919wF4oiG7ck6mnBWTRD_Z-Io0wZKCxL0zjx5je9I/multisig")
+        assert not mber.delTopic(key="EAD919wF4oiG7ck6mnBWTRD_Z-Io0wZKCxL0zjx5je9I/multisig")
+        assert mber.refs.get(keys=first) is None
+
+        # counts of mailbox stored before .refs are indexed on reopen
+        mber.refs.trim()
+        mber.reopen(reuse=True)
+        assert mber.refs.get(keys=first) is None
+        assert mber.refs.cntAll() == 1
+
 
 if __name__ == '__main__':
     test_mailboxing()
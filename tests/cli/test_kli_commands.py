@@ -1,5 +1,7 @@
 import logging
 import os
+import subprocess
+import sys
 from collections import deque
 from types import SimpleNamespace
 import multicommand
@@ -18,6 +20,7 @@ from keri.cli.commands.delegate import request as delegate_request_command
 from keri.cli.commands.multisig import continue_ as multisig_continue_command
 
 from keri.cli import commands
+from keri.cli.kli import loadParser, _loadPackageParser
 from keri.cli.common import existingHab, existingHby
 
 
@@ -653,6 +656,47 @@ def test_witness_start_arg_parsing():
     assert args.logfile is None
 
 
+def test_load_parser_lazy():
+    """loadParser only imports the command selected by argv"""
+    argv = ["witness", "start", "--alias", "wit", "--loglevel", "debug"]
+    args = loadParser(argv).parse_args(argv)
+    assert args.alias == "wit" and args.loglevel == "debug"
+    assert args.handler is not None
+
+    argv = ["escrow", "list", "--name", "test"]  # package with own parser
+    for _ in range(2):  # does not mutate module level parsers
+        args = loadParser(argv).parse_args(argv)
+        assert args.name == "test"
+        assert args.handler is not None
+
+    for argv in ([], ["vc"], ["nosuchcommand"]):  # falls back to full parser
+        assert _loadPackageParser(commands, argv, ["kli"]) is None
+
+    # fresh interpreter so modules imported by other tests do not count
+    code = ("import sys; from keri.cli.kli import loadParser; "
+            "loadParser(['version']).parse_args(['version']); "
+            "print(' '.join(sorted(sys.modules)))")
+    mods = subprocess.run([sys.executable, "-c", code], check=True,
+                          capture_output=True, text=True).stdout.split()
+    assert "keri.cli.commands.version" in mods
+    assert "keri.cli.commands.vc" not in mods
+    assert "keri.app.habbing" not in mods
+    assert "falcon" not in mods
+
+    # package re-exports are kept and resolve on first access
+    from keri.cli.commands import multisig
+    from keri.cli.commands.multisig import GroupMultisigIncept
+    from keri.cli.commands import InceptDoer, emptyOptions
+    from keri.cli.commands.incept import InceptDoer as Doer
+    from keri.cli.commands.rotate import emptyOptions as options
+    assert GroupMultisigIncept.__module__ == "keri.cli.commands.multisig.incept"
+    assert InceptDoer is Doer
+    assert emptyOptions is options  # last import of package wins as before
+    assert "GroupMultisigIncept" in dir(multisig)
+    with pytest.raises(AttributeError):
+        _ = multisig.NoSuchDoer
+
+
 def test_launch_normalizes_loglevel_and_logdir(monkeypatch, tmp_path):
     """launch() must turn a lowercase --loglevel into a numeric level (the .upper()
     fix) and route --logdir straight to ogler.headDirPath."""
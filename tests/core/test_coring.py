@@ -2315,6 +2315,40 @@ def test_matter_special():
     """ Done Test """
 
 
+def test_matter_fast_exfil():
+    """
+    Test Matter._exfil fast path tables agree with general path
+    """
+    hards, sizes = Matter._fastTables()
+    assert Matter._fastTables() is Matter._FastTables  # built once
+    assert hards[ord('A')] == 1 and hards[ord('0')] == 2 and hards[ord('1')] == 4
+    assert hards[ord('-')] == 0 and hards[ord('_')] == 0
+    assert sizes[MtrDex.Ed25519] is sizes[MtrDex.Ed25519.encode()]
+    assert MtrDex.Bytes_L0 not in sizes  # variable size uses general path
+    assert MtrDex.Tag3 not in sizes  # soft uses general path
+
+    for code, (hs, ss, xs, fs, ls) in Matter.Sizes.items():
+        if code not in sizes:
+            continue
+        raw = bytes(range(1, (fs - hs) * 3 // 4 - ls + 1))
+        matter = Matter(raw=raw, code=code)
+        for qb64b in (matter.qb64b, matter.qb64, bytearray(matter.qb64b) + b'AAAA',
+                      memoryview(matter.qb64b + b'-AAB')):
+            fast = Matter(qb64b=qb64b)
+            assert fast.code == code
+            assert fast.soft == ''
+            assert fast.raw == raw
+            assert fast.qb64b == matter.qb64b
+
+    # errors still reported by general path
+    qb64b = Verfer(raw=bytes(32), code=MtrDex.Ed25519).qb64b
+    with pytest.raises(ShortageError):
+        Matter(qb64b=qb64b[:-1])
+    with pytest.raises(ConversionError):  # nonzero midpad bits
+        Matter(qb64b=qb64b[:1] + b'w' + qb64b[2:])
+    """ Done Test """
+
+
 def test_seqner():
     """
     Test Seqner sequence number subclass Matter
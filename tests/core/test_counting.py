@@ -9,7 +9,8 @@ from base64 import urlsafe_b64decode as decodeB64
 import pytest
 
 from keri.kering import (ShortageError, InvalidCodeError, EmptyMaterialError,
-                         InvalidVersionError, Colds, Protocols, Versionage,
+                         InvalidVersionError, UnexpectedCodeError,
+                         Colds, Protocols, Versionage,
                          Vrsn_1_0, Vrsn_2_0, GVC_1_0, GVC_2_0)
 
 from keri.help import intToB64, b64ToInt, codeB64ToB2
@@ -1334,8 +1335,47 @@ def test_counter_v1():
     with pytest.raises(ValueError):
         counter.byteCount(cold=Colds.msg)
 
+    # test from memoryview offset into stream without copying stream tail
+    qscb = counter.qb64b
+    qscb2 = counter.qb2
+    stream = bytearray(b'ABCD' + qscb + b'EFGH')
+    with memoryview(stream) as view:
+        counter = Counter(qb64b=view[4:], version=Vrsn_1_0)
+        assert counter.code == CtrDex.AttachmentGroup
+        assert counter.count == count
+        assert counter.qb64b == qscb
+    stream = bytearray(b'\x00\x01\x02' + qscb2)
+    with memoryview(stream) as view:
+        counter = Counter(qb2=view[3:], version=Vrsn_1_0)
+        assert counter.code == CtrDex.AttachmentGroup
+        assert counter.count == count
+        assert counter.qb2 == qscb2
+
     """End Test"""
 
+def test_counter_fast_exfil():
+    """
+    Test Counter._exfil fast path tables agree with general path
+    """
+    for version, code in ((Vrsn_1_0, CtrDex_1_0.ControllerIdxSigs),
+                          (Vrsn_2_0, CtrDex_2_0.ControllerIdxSigs),
+                          (Vrsn_2_0, CtrDex_2_0.BigAttachmentGroup)):
+        counter = Counter(code=code, count=70, version=version)
+        for qb64b in (counter.qb64b, counter.qb64, bytearray(counter.qb64b) + b'AAAA',
+                      memoryview(counter.qb64b)):
+            fast = Counter(qb64b=qb64b, version=version)
+            assert fast.code == code
+            assert fast.count == 70
+        assert id(counter._sizes) in Counter.FastSizes
+
+    assert Counter.FastHards['-A'] == Counter.FastHards[b'-A'] == 2
+    with pytest.raises(ShortageError):
+        Counter(qb64b=counter.qb64b[:-1], version=Vrsn_2_0)
+    with pytest.raises(UnexpectedCodeError):
+        Counter(qb64b=b'-zAB', version=Vrsn_1_0)
+    """ Done Test """
+
+
 def test_counter_v2():
     """
     test Counter instances for verision 2.0 code tables
@@ -1274,6 +1274,218 @@ def test_out_of_order_escrow():
     """End Test"""
 
 
+def test_escrow_wakes():
+    """
+    Test event driven processing of woken escrows without full sweep
+    """
+    salt = Salter(raw=b'0123456789abcdef').qb64
+    psr = parsing.Parser(version=Vrsn_1_0)
+
+    with openDB(name="edy", temp=True) as db, keeping.openKS(name="edy") as ks:
+        mgr = keeping.Manager(ks=ks, salt=salt)
+        kvy = Kevery(db=db)
+
+        verfers, digers = mgr.incept(icount=1, ncount=1, stem='wes', temp=True)
+        srdr = incept(keys=[verfer.qb64 for verfer in verfers],
+                      ndigs=[diger.qb64 for diger in digers],
+                      code=MtrDex.Blake3_256, version=Vrsn_1_0, kind=Kinds.json)
+        pre = srdr.pre
+        mgr.move(old=verfers[0].qb64, new=pre)
+
+        msgs = []
+        dig = srdr.said
+        for sn in range(0, 4):
+            if sn:
+                srdr = interact(pre=pre, dig=dig, sn=sn, version=Vrsn_1_0,
+                                kind=Kinds.json)
+                dig = srdr.said
+            sigers = mgr.sign(ser=srdr.raw, verfers=verfers)
+            msg = bytearray(srdr.raw)
+            msg.extend(Counter(Codens.ControllerIdxSigs, count=len(sigers),
+                               version=Vrsn_1_0).qb64b)
+            for siger in sigers:
+                msg.extend(siger.qb64b)
+            msgs.append(msg)
+
+        kvy.processEscrows()  # first call sweeps all
+        assert kvy.swept is not None
+        swept = kvy.swept
+
+        # escrow out of order events does not wake
+        for msg in reversed(msgs[1:]):
+            psr.parse(ims=bytearray(msg), kvy=kvy)
+        assert pre not in kvy.kevers
+        assert len(db.ooes.get(keys=pre, on=3)) == 1
+        assert db.wakes == {}
+
+        # nothing woken and not time to sweep so escrows untouched
+        kvy.TimeoutOOE = 0  # would make all stale if swept
+        kvy.processEscrows()
+        assert kvy.swept == swept
+        assert len(db.ooes.get(keys=pre, on=1)) == 1
+        kvy.TimeoutOOE = 3600
+
+        # accepted inception wakes its escrows at next sn
+        psr.parse(ims=bytearray(msgs[0]), kvy=kvy)
+        assert kvy.kevers[pre].sn == 0
+        assert db.wakes == {pre: 0}
+
+        # each unescrowed event wakes the next so all done in one call
+        kvy.processEscrows()
+        assert kvy.swept == swept
+        assert kvy.kevers[pre].sn == 3
+        for sn in range(1, 4):
+            assert db.ooes.get(keys=pre, on=sn) == []
+        assert db.wakes == {}
+
+    assert not os.path.exists(db.path)
+
+    """End Test"""
+
+
+def test_escrow_preverify(monkeypatch):
+    """
+    Test signatures of escrowed events verified as one batch across events
+    of an escrow pass
+    """
+    salt = Salter(raw=b'0123456789abcdef').qb64
+    psr = parsing.Parser(version=Vrsn_1_0)
+
+    with openDB(name="edy", temp=True) as db, keeping.openKS(name="edy") as ks:
+        mgr = keeping.Manager(ks=ks, salt=salt)
+        kvy = Kevery(db=db)
+        kvy.processEscrows()  # first call sweeps all
+
+        verfers, digers = mgr.incept(icount=1, ncount=1, stem='wes', temp=True)
+        srdr = incept(keys=[verfer.qb64 for verfer in verfers],
+                      ndigs=[diger.qb64 for diger in digers],
+                      code=MtrDex.Blake3_256, version=Vrsn_1_0, kind=Kinds.json)
+        pre = srdr.pre
+        mgr.move(old=verfers[0].qb64, new=pre)
+
+        msgs = []
+        dig = srdr.said
+        for sn in range(0, 4):
+            if sn:
+                srdr = interact(pre=pre, dig=dig, sn=sn, version=Vrsn_1_0,
+                                kind=Kinds.json)
+                dig = srdr.said
+            sigers = mgr.sign(ser=srdr.raw, verfers=verfers)
+            msgs.append(eventing.messagize(serder=srdr, sigers=sigers, framed=True,
+                                           gvrsn=Vrsn_1_0))
+
+        for msg in reversed(msgs[1:]):  # out of order
+            psr.parse(ims=bytearray(msg), kvy=kvy)
+        assert kvy.escrowTriples() == []  # interaction keys not yet known
+
+        psr.parse(ims=bytearray(msgs[0]), kvy=kvy)
+        triples = kvy.escrowTriples(pres=[pre])
+        assert len(triples) == 3
+        assert all(verfer.qb64 == verfers[0].qb64 for _, _, verfer in triples)
+        assert all(verfer.verify(sig, ser) for sig, ser, verfer in triples)
+
+        batches = []
+        verifyTriples = eventing._verifyTriples
+
+        def batch(triples, workers):
+            batches.append(len(triples))
+            return verifyTriples(triples, workers)
+
+        monkeypatch.setattr(eventing, "_verifyTriples", batch)
+        monkeypatch.setattr(eventing, "VerifyWorkers", 4)
+        kvy.processEscrows()
+        assert kvy.kevers[pre].sn == 3
+        assert batches == [3]  # all three events in one batch none again
+
+    assert not os.path.exists(db.path)
+
+    """End Test"""
+
+
+def test_escrow_rewait():
+    """
+    Test escrowed entries left in escrow after a wake wait again on their
+    dependency and time out at their deadline without full sweep
+    """
+    salt = Salter(raw=b'0123456789abcdef').qb64
+    psr = parsing.Parser(version=Vrsn_1_0)
+
+    with openDB(name="edy", temp=True) as db, keeping.openKS(name="edy") as ks:
+        mgr = keeping.Manager(ks=ks, salt=salt)
+        kvy = Kevery(db=db)
+
+        msgs = []
+        srdrs = []
+        for stem in ('edy', 'ray'):  # receipted controller and receiptor
+            verfers, digers = mgr.incept(icount=1, ncount=1, stem=stem, temp=True)
+            srdr = incept(keys=[verfer.qb64 for verfer in verfers],
+                          ndigs=[diger.qb64 for diger in digers],
+                          code=MtrDex.Blake3_256, version=Vrsn_1_0, kind=Kinds.json)
+            mgr.move(old=verfers[0].qb64, new=srdr.pre)
+            sigers = mgr.sign(ser=srdr.raw, verfers=verfers)
+            msgs.append(eventing.messagize(serder=srdr, sigers=sigers, framed=True,
+                                           gvrsn=Vrsn_1_0))
+            srdrs.append((srdr, verfers))
+
+        (srdr, verfers), (rsrdr, rverfers) = srdrs
+        pre, rpre = srdr.pre, rsrdr.pre
+
+        kvy.processEscrows()  # first call sweeps all
+        swept = kvy.swept
+
+        psr.parse(ims=bytearray(msgs[0]), kvy=kvy)
+        assert kvy.kevers[pre].sn == 0
+
+        # receipt of inception by receiptor not yet accepted so escrowed
+        reserder = eventing.receipt(pre=pre, sn=0, said=srdr.said,
+                                    version=Vrsn_1_0, kind=Kinds.json)
+        tsgs = [(Prefixer(qb64=rpre), rsrdr.sner, Diger(qb64=rsrdr.said),
+                 mgr.sign(ser=srdr.raw, verfers=rverfers))]
+        msg = eventing.messagize(serder=reserder, tsgs=tsgs, framed=True,
+                                 gvrsn=Vrsn_1_0)
+        psr.parse(ims=bytearray(msg), kvy=kvy)
+        assert len(db.vres.get(snKey(pre, 0))) == 1
+        assert pre in db.waiters[rpre]
+        assert pre in db.deadlines
+
+        # wake of receiptor without its event releases waiter that waits again
+        db.wake(rpre)
+        assert rpre not in db.waiters
+        kvy.processEscrows()
+        assert kvy.swept == swept
+        assert len(db.vres.get(snKey(pre, 0))) == 1
+        assert pre in db.waiters[rpre]
+
+        # receiptor event arrives after no-op wake so receipt accepted in one call
+        psr.parse(ims=bytearray(msgs[1]), kvy=kvy)
+        kvy.processEscrows()
+        assert kvy.swept == swept
+        assert db.vres.get(snKey(pre, 0)) == []
+        receipts = list(db.vrcs.getTopItemIter(keys=(pre, srdr.said)))
+        assert len(receipts) == 1
+        assert receipts[0][0][2] == rpre
+
+        # out of order event times out at its deadline without full sweep
+        kvy.TimeoutOOE = 0
+        srdr = interact(pre=pre, dig=srdr.said, sn=2, version=Vrsn_1_0,
+                        kind=Kinds.json)
+        sigers = mgr.sign(ser=srdr.raw, verfers=verfers)
+        msg = eventing.messagize(serder=srdr, sigers=sigers, framed=True,
+                                 gvrsn=Vrsn_1_0)
+        psr.parse(ims=bytearray(msg), kvy=kvy)
+        assert len(db.ooes.get(keys=pre, on=2)) == 1
+        assert pre not in db.wakes
+        time.sleep(0.01)
+        kvy.processEscrows()
+        assert kvy.swept == swept
+        assert db.ooes.get(keys=pre, on=2) == []
+        assert pre not in db.deadlines
+
+    assert not os.path.exists(db.path)
+
+    """End Test"""
+
+
 def test_ooes_missing_db_entries_escrow_cleanup():
     """
     Test missing records (evt, sigs, dts) of out of
@@ -2067,6 +2279,8 @@ if __name__ == "__main__":
     test_misfit_escrow_kevery()
     test_delegated_partial_signed_escrow_udes()
     test_out_of_order_escrow()
+    test_escrow_wakes()
+    test_escrow_rewait()
     test_ooes_missing_db_entries_escrow_cleanup()
     test_unverified_receipt_escrow()
     test_unverified_trans_receipt_escrow()
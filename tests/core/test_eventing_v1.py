@@ -26,8 +26,10 @@ from keri.core import (Signer, Counter, Codens, Kever, Parser,
                        deReceiptCouple, deSourceCouple, deReceiptTriple,
                        deTransReceiptQuadruple, deTransReceiptQuintuple,
                        incept, rotate, interact, receipt, query, delcept,
-                       deltate, state, messagize, loadEvent)
+                       deltate, state, messagize, loadEvent, verifyBatch,
+                       verifySigs, preverify)
 
+from keri.core import eventing
 from keri.db import openDB, dgKey, snKey
 from keri.help import helping, ogler
 
@@ -133,6 +135,69 @@ def test_ample():
     assert ample(13, f=4, weak=False) == 9
 
 
+def test_verify_batch():
+    """
+    Test verifyBatch and verifySigs
+    """
+    signers = Salter(raw=b'ABCDEFGH01234567').signers(count=10, path="vb", temp=True)
+    verfers = [signer.verfer for signer in signers]
+    ser = b'abcdefghijklmnopqrstuvwxyz0123456789'
+    bad = b'ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789'
+
+    triples = []
+    for i, signer in enumerate(signers):  # odd sigs are on wrong ser
+        triples.append((signer.sign(ser).raw, bad if i % 2 else ser, signer.verfer))
+    expect = [not i % 2 for i in range(len(signers))]
+
+    assert verifyBatch([]) == []
+    assert verifyBatch(triples) == expect  # serial
+    assert verifyBatch(iter(triples), workers=4) == expect  # thread pool
+    assert verifyBatch(triples[:3], workers=4) == expect[:3]  # too small for pool
+    assert verifyBatch(triples, workers=2) == expect  # own pool per size
+    assert eventing._verifyPools[4] is not eventing._verifyPools[2]
+    assert verifyBatch(triples, workers=4) == expect  # reuses pool of size
+
+    # preverify verifies batch across events up front and later calls look up
+    calls = []
+
+    class CountVerfer:
+        def __init__(self, verfer):
+            self.verfer = verfer
+            self.qb64b = verfer.qb64b
+
+        def verify(self, sig, ser):
+            calls.append(sig)
+            return self.verfer.verify(sig, ser)
+
+    counted = [(sig, ser, CountVerfer(verfer)) for sig, ser, verfer in triples]
+    with preverify(counted[:6], workers=4):
+        assert len(calls) == 6
+        assert verifyBatch(counted) == expect  # only last 4 verified again
+        assert len(calls) == 10
+        with preverify(counted):  # nested only verifies those not yet verified
+            assert len(calls) == 14
+            assert verifyBatch(counted) == expect
+            assert len(calls) == 14
+        assert verifyBatch(counted) == expect  # nested results kept
+        assert len(calls) == 14
+    assert eventing._preverified is None
+    assert verifyBatch(counted) == expect  # verified again outside
+    assert len(calls) == 24
+
+    # verifySigs dedups without reparsing and does not mutate provided sigers
+    sigers = [signer.sign(ser, index=i) for i, signer in enumerate(signers)]
+    sigers.append(sigers[0])  # duplicate
+    sigers.append(signers[1].sign(bad, index=1))  # bad sig
+    sigers.append(signers[1].sign(ser, index=len(signers)))  # index too large
+    sigers = [Siger(qb64=siger.qb64) for siger in sigers]  # no verfers
+    vsigers, vindices = verifySigs(raw=ser, sigers=sigers, verfers=verfers)
+    assert vindices == list(range(len(signers)))
+    assert [siger.qb64 for siger in vsigers] == [siger.qb64 for siger in sigers[:10]]
+    assert [siger.verfer.qb64 for siger in vsigers] == [verfer.qb64 for verfer in verfers]
+    assert all(siger.verfer is None for siger in sigers)
+    """ Done Test """
+
+
 def test_dewitnesscouple():
     """
     test deWitnessCouple function
@@ -734,11 +734,59 @@ def test_indexer():
     assert indexer.qb64b == b'0zAA'
     assert indexer.qb64 == '0zAA'
     assert indexer.qb2 == b'\xd30\x00'
+
+    # from memoryview offset into stream without copying stream tail
+    stream = bytearray(b'ABCD' + lq64b + b'-AAB')
+    view = memoryview(stream)
+    indexer = Indexer(qb64b=view[4:])
+    assert indexer.code == IdrDex.TBD0
+    assert indexer.index == 4
+    assert indexer.raw == lraw
+    assert indexer.qb64b == lq64b
+    lq2 = indexer.qb2
+    indexer = Indexer(qb2=memoryview(bytearray(b'\x00\x01\x02' + lq2))[3:])
+    assert indexer.qb64b == lq64b
+    assert isinstance(indexer.raw, bytes)
+    view.release()
+    del stream[:4]  # released view so can strip
     """ Done Test """
 
 
 
 
+def test_indexer_fast_exfil():
+    """
+    Test Indexer._exfil fast path tables agree with general path
+    """
+    hards, sizes = Indexer._fastTables()
+    assert sizes[IdrDex.Ed25519_Sig] is sizes[IdrDex.Ed25519_Sig.encode()]
+    assert sizes[IdrDex.Ed25519_Crt_Sig][-1]  # current only
+    assert not sizes[IdrDex.Ed25519_Sig][-1]
+    assert IdrDex.TBD0 not in sizes  # variable size uses general path
+
+    sig = bytes(range(64))
+    for code, index, ondex in ((IdrDex.Ed25519_Sig, 5, None),
+                               (IdrDex.Ed25519_Crt_Sig, 5, None),
+                               (IdrDex.Ed25519_Big_Sig, 67, 90),
+                               (IdrDex.Ed25519_Big_Crt_Sig, 67, None)):
+        indexer = Indexer(raw=sig, code=code, index=index, ondex=ondex)
+        for qb64b in (indexer.qb64b, indexer.qb64, bytearray(indexer.qb64b) + b'AAAA',
+                      memoryview(indexer.qb64b)):
+            fast = Indexer(qb64b=qb64b)
+            assert fast.code == indexer.code
+            assert fast.index == indexer.index
+            assert fast.ondex == indexer.ondex
+            assert fast.raw == sig
+
+    # errors still reported by general path
+    qb64b = Indexer(raw=sig, code=IdrDex.Ed25519_Big_Crt_Sig, index=3).qb64b
+    with pytest.raises(ValueError):  # nonzero ondex for current only
+        Indexer(qb64b=qb64b[:4] + b'AB' + qb64b[6:])
+    with pytest.raises(ShortageError):
+        Indexer(qb64b=qb64b[:-1])
+    """ Done Test """
+
+
 def test_siger():
     """
     Test Siger subclass of Indexer
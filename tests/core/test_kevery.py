@@ -1,10 +1,12 @@
 import os
 
+import lmdb
 import pytest
 
 from hio.help import ogler
 
-from keri.kering import Vrsn_1_0, ValidationError, Kinds
+from keri.kering import (Vrsn_1_0, ValidationError, Kinds,
+                          MissingWitnessSignatureError)
 from keri.core import (Salter, Parser, Diger, SerderKERI,
                        Counter, Kever, Kevery, Codens,
                        incept, rotate, interact)
@@ -427,6 +429,149 @@ def test_stale_event_receipts():
         """ Done Test """
 
 
+def test_kevery_accept_atomic():
+    """
+    Test that a failure after Kever.logEvent rolls back the logged event so
+    that nothing of a partially accepted event is persisted
+    """
+    logger.setLevel("ERROR")
+
+    kwa = dict(version=Vrsn_1_0, kind=Kinds.json)
+    signers = Salter(raw=b"ABCDEFGH01234567").signers(count=3, path='kev', temp=True)
+
+    with openDB(name="validator") as vallgr:
+        kvy = Kevery(db=vallgr)
+
+        icp = incept(keys=[signers[0].verfer.qb64],
+                     ndigs=[Diger(ser=signers[1].verfer.qb64b).qb64], **kwa)
+        pre = icp.pre
+        icpSigers = [signers[0].sign(icp.raw, index=0)]
+
+        rot = rotate(pre=pre, keys=[signers[1].verfer.qb64], dig=icp.said,
+                     ndigs=[Diger(ser=signers[2].verfer.qb64b).qb64],
+                     sn=1, **kwa)
+        rotSigers = [signers[1].sign(rot.raw, index=0)]
+
+        pin = vallgr.states.pin
+
+        def fail(*pa, **kwa):
+            raise RuntimeError("Injected failure after logEvent.")
+
+        # inception fails after logEvent so no Kever and nothing logged
+        vallgr.states.pin = fail
+        with pytest.raises(RuntimeError):
+            kvy.processEvent(serder=icp, sigers=icpSigers)
+        assert pre not in kvy.kevers
+        assert vallgr.evts.get(keys=(pre, icp.said)) is None
+        assert vallgr.sigs.get(keys=(pre, icp.said)) == []
+        assert vallgr.kels.getLast(keys=pre, on=0) is None
+        assert vallgr.fons.get(keys=(pre, icp.said)) is None
+        assert vallgr.states.get(keys=pre) is None
+
+        vallgr.states.pin = pin
+        kvy.processEvent(serder=icp, sigers=icpSigers)
+        kever = kvy.kevers[pre]
+        assert kever.sn == 0
+        assert vallgr.states.get(keys=pre).s == "0"
+
+        # rotation fails after logEvent so key state and KEL are unchanged
+        vallgr.states.pin = fail
+        with pytest.raises(RuntimeError):
+            kvy.processEvent(serder=rot, sigers=rotSigers)
+        assert kever.sn == 0
+        assert kever.serder.said == icp.said
+        assert [verfer.qb64 for verfer in kever.verfers] == [signers[0].verfer.qb64]
+        assert vallgr.evts.get(keys=(pre, rot.said)) is None
+        assert vallgr.kels.getLast(keys=pre, on=1) is None
+        assert vallgr.fons.get(keys=(pre, rot.said)) is None
+        assert vallgr.states.get(keys=pre).s == "0"
+
+        vallgr.states.pin = pin
+        kvy.processEvent(serder=rot, sigers=rotSigers)
+        assert kever.sn == 1
+        assert vallgr.kels.getLast(keys=pre, on=1) == rot.said
+        assert vallgr.states.get(keys=pre).s == "1"
+
+    """ Done Test """
+
+
+def test_kevery_reloaded_kever_cues():
+    """
+    Test that a remote Kever evicted from memory and reloaded from its key
+    state still cues a query for a partially witnessed rotation
+    """
+    logger.setLevel("ERROR")
+
+    kwa = dict(version=Vrsn_1_0, kind=Kinds.json)
+    signers = Salter(raw=b"ABCDEFGH01234567").signers(count=3, path='kev', temp=True)
+    wit = Salter(raw=b"ABCDEFGH01234567").signers(count=1, path='wit',
+                                                  transferable=False, temp=True)[0]
+
+    with openDB(name="validator") as vallgr:
+        kvy = Kevery(db=vallgr)
+
+        icp = incept(keys=[signers[0].verfer.qb64],
+                     ndigs=[Diger(ser=signers[1].verfer.qb64b).qb64],
+                     wits=[wit.verfer.qb64], toad=1, **kwa)
+        pre = icp.pre
+        kvy.processEvent(serder=icp, sigers=[signers[0].sign(icp.raw, index=0)],
+                         wigers=[wit.sign(icp.raw, index=0)])
+        assert kvy.kevers[pre].sn == 0
+        kvy.cues.clear()
+
+        del vallgr.kevers[pre]  # evict so reloaded from key state
+        assert pre in vallgr.kevers  # reloads
+        assert vallgr.kevers.misses == 1
+
+        rot = rotate(pre=pre, keys=[signers[1].verfer.qb64], dig=icp.said,
+                     ndigs=[Diger(ser=signers[2].verfer.qb64b).qb64],
+                     wits=[wit.verfer.qb64], sn=1, **kwa)
+        with pytest.raises(MissingWitnessSignatureError):  # no wigs so escrows
+            kvy.processEvent(serder=rot, sigers=[signers[1].sign(rot.raw, index=0)])
+        assert vallgr.pwes.get(keys=pre, on=1) == [rot.said]
+        assert kvy.kevers[pre].cues is kvy.cues
+        assert kvy.cues.pull() == dict(kin="query", q=dict(pre=pre, sn=rot.snh))
+
+    """ Done Test """
+
+
+def test_kevery_replay_map_full():
+    """
+    Test that Kevery replays event acceptance when the LMDB map was full
+    and grew so that the event is not dropped
+    """
+    logger.setLevel("ERROR")
+
+    kwa = dict(version=Vrsn_1_0, kind=Kinds.json)
+    signers = Salter(raw=b"ABCDEFGH01234567").signers(count=2, path='kev', temp=True)
+
+    with openDB(name="validator", mapSize=2 ** 22) as vallgr:
+        kvy = Kevery(db=vallgr)
+        icp = incept(keys=[signers[0].verfer.qb64],
+                     ndigs=[Diger(ser=signers[1].verfer.qb64b).qb64], **kwa)
+        sigers = [signers[0].sign(icp.raw, index=0)]
+
+        # fill map so that accepting the event fails once with MapFullError
+        vallgr.MaxMapSize = vallgr.mapSize  # stop auto growth while filling
+        junk = vallgr.env.open_db(key=b'junk.')
+        i = 0
+        while True:
+            try:
+                vallgr.putVal(junk, b'%032x' % i, b'x' * 512)
+            except lmdb.MapFullError:
+                break
+            i += 1
+        vallgr.MaxMapSize = 0
+        size = vallgr.mapSize
+
+        kvy.processEvent(serder=icp, sigers=sigers)
+        assert vallgr.mapSize > size
+        assert kvy.kevers[icp.pre].sn == 0
+        assert vallgr.kels.getLast(keys=icp.pre, on=0) == icp.said
+
+    """ End Test """
+
+
 if __name__ == "__main__":
     test_kevery()
     test_stale_event_receipts()
@@ -5731,3 +5731,64 @@ def test_invalid_signature_attachments_rejected(mockHelpingNowUTC):
             assert receiverHby.db.kramPMKM.get(keys=partialKey) is None
             assert receiverHby.db.kramPMKS.get(keys=partialKey) == []
             assert receiverHby.db.kramPMSK.get(keys=partialKey) is None
+
+
+def test_pruning_expiry_index():
+    """Test expiry index of msgc and tmsc entries drives pruning"""
+    base = helping.fromIso8601("2021-01-01T00:00:00.000000+00:00")
+    ms = int(base.timestamp() * 1000)
+    stamp = helping.toIso8601(base)
+    later = helping.toIso8601(base + timedelta(seconds=10))
+
+    with openDB(name="test_expiry_index", temp=True) as db:
+        kramer = Kramer(db)
+
+        # entries pinned before first pass are indexed by full scan
+        db.kramMSGC.pin(keys=("A", "M0"),
+                        val=MsgCacheRecord(mdt=stamp, d=1000, pml=5000))
+        assert kramer._pruneMessages(ms) is False
+        assert kramer._msgHorizon == ms - 1000
+        assert [keys for keys, _ in db.kramMSGX.getTopItemIter()] == [
+            (f"{ms + 6000:016x}", "A", "M0")]
+
+        # re-pinning moves the index entry
+        kramer._pinMsgCache(("A", "M0"),
+                            MsgCacheRecord(mdt=later, d=1000, pml=5000))
+        kramer._pinMsgCache(("A", "M1"),
+                            MsgCacheRecord(mdt=stamp, d=1000, pml=5000))
+        db.kramPMSK.pin(keys=("A", "M1"), val=(Number(num=0), Diger(ser=b"x")))
+        assert [keys for keys, _ in db.kramMSGX.getTopItemIter()] == [
+            (f"{ms + 6000:016x}", "A", "M1"), (f"{ms + 16000:016x}", "A", "M0")]
+        assert kramer._msgHorizon == ms + 9000
+
+        # index pass prunes only expired entries and their partial state
+        assert kramer._pruneMessages(ms + 9000) is True
+        assert db.kramMSGC.get(keys=("A", "M1")) is None
+        assert db.kramPMSK.get(keys=("A", "M1")) is None
+        assert db.kramMSGC.get(keys=("A", "M0")) is not None
+        assert [keys for keys, _ in db.kramMSGX.getTopItemIter()] == [
+            (f"{ms + 16000:016x}", "A", "M0")]
+
+        # stale index entry is dropped without touching the cache entry
+        db.kramMSGX.pin(keys=(f"{ms:016x}", "A", "M0"), val=stamp)
+        assert kramer._pruneMessages(ms + 9000) is False
+        assert db.kramMSGC.get(keys=("A", "M0")) is not None
+        assert len(list(db.kramMSGX.getTopItemIter())) == 1
+
+        # clock went backwards so entry now in the future is pruned by scan
+        assert kramer._pruneMessages(ms) is True
+        assert db.kramMSGC.get(keys=("A", "M0")) is None
+        assert list(db.kramMSGX.getTopItemIter()) == []
+
+        # transactioned entries expire by xdt + pxl
+        kramer._pruneExchanges(ms)
+        assert kramer._txnHorizon == 0
+        kramer._pinTxnMsgCache(("A", "X", "X"),
+                               TxnMsgCacheRecord(mdt=stamp, xdt=stamp, pxl=5000))
+        kramer._pinTxnMsgCache(("A", "X", "M"),
+                               TxnMsgCacheRecord(mdt=later, xdt=stamp, pxl=5000))
+        assert kramer._txnHorizon == ms
+        assert kramer._pruneExchanges(ms + 5000) is False
+        assert kramer._pruneExchanges(ms + 5001) is True
+        assert list(db.kramTMSC.getTopItemIter()) == []
+        assert list(db.kramTMSX.getTopItemIter()) == []
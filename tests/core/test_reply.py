@@ -1457,5 +1457,51 @@ def test_watcher_add_cut():
         assert observed.enabled is True
 
 
+def test_router_find():
+    """
+    Test Router route table finds the first added matching route
+    """
+    rtr = Router()
+    rtr.addRoute("/end/role/{action}", "endrole", suffix="EndRole")
+    rtr.addRoute("/loc/scheme", "locscheme", suffix="LocScheme")
+    rtr.addRoute("/ksn/{aid}", "ksn", suffix="KeyStateNotice")
+    rtr.addRoute("/watcher/{aid}/{action}", "watcher", suffix="AddWatched")
+    rtr.addRoute("/end/role/cut", "shadowed")  # shadowed by /end/role/{action}
+    rtr.addRoute("/oobi/{aid}.json", "oobi")  # partial field segment
+    rtr.addRoute("/{kind}/scheme", "kind")
+
+    assert [r.resource for r in rtr.routes] == ["endrole", "locscheme", "ksn",
+                                                "watcher", "shadowed", "oobi",
+                                                "kind"]
+    assert set(rtr.exacts) == {"/loc/scheme"}
+    assert [r.resource for r in rtr.scans] == ["oobi"]
+
+    route, params = rtr._find("/loc/scheme")
+    assert route.resource == "locscheme" and params == {}
+    route, params = rtr._find("/LOC/Scheme")  # case insensitive as regex
+    assert route.resource == "locscheme"
+    route, params = rtr._find("/end/role/cut")
+    assert route.resource == "endrole" and params == {"action": "cut"}
+    route, params = rtr._find("/ksn/EAbc")
+    assert route.resource == "ksn" and params == {"aid": "EAbc"}
+    route, params = rtr._find("/watcher/EAbc/add")
+    assert route.resource == "watcher" and params == {"aid": "EAbc", "action": "add"}
+    route, params = rtr._find("/oobi/EAbc.json")
+    assert route.resource == "oobi" and params == {"aid": "EAbc"}
+    route, params = rtr._find("/tel/scheme")
+    assert route.resource == "kind" and params == {"kind": "tel"}
+
+    for r in ("/ksn", "/ksn/", "/ksn/EAbc/", "/watcher/EAbc", "/loc", "/"):
+        assert rtr._find(r)[0] is None
+
+    # results agree with linear regex scan of routes in order added
+    for r in ("/loc/scheme", "/end/role/add", "/ksn/E", "/oobi/E.json",
+              "/x/scheme", "/watcher/E/cut", "/nope"):
+        expect = next((route for route in rtr.routes if route.regex.search(r)), None)
+        assert rtr._find(r)[0] is expect
+
+    """End Test"""
+
+
 if __name__ == "__main__":
     pytest.main(['-vv', 'test_reply.py::test_reply'])
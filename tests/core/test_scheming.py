@@ -9,6 +9,7 @@ import pytest
 
 from keri import ValidationError
 from keri.core import Saider, Schemer, JSONSchema, CacheResolver, MtrDex, Saids, dumps
+from keri.core.scheming import ValidatorCache, validatorCache
 from keri.db import openDB
 
 
@@ -293,8 +294,73 @@ def test_resolution():
         with pytest.raises(ValidationError):
             schemer.verify(badload)
 
+        # validator bound to registry of resolver is compiled once
+        hits, misses = validatorCache.hits, validatorCache.misses
+        assert schemer.verify(payload) is True
+        assert (validatorCache.hits, validatorCache.misses) == (hits + 1, misses)
+        assert (said, id(cache.resolver())) in validatorCache.validators
+        assert refsaid in cache.resources
+
+        # resolver of other db only resolves schemas held by its own db
+        with openDB(name="ody") as odb:
+            other = Schemer(raw=sser)
+            other.typ = JSONSchema(resolver=CacheResolver(db=odb))
+            with pytest.raises(ValidationError):
+                other.verify(payload)
+
+
+def test_validator_cache():
+    """ Test compiled validators are cached by schema SAID """
+    ssad = \
+    {
+        "$id": "",
+        "$schema": "http://json-schema.org/draft-07/schema#",
+        "type": "object",
+        "properties":
+        {
+            "n":
+            {
+                "type": "number"
+            }
+        }
+    }
+    saider, ssad = Saider.saidify(ssad, label=Saids.dollar)
+    said = saider.qb64
+
+    cache = ValidatorCache(size=2)
+    assert cache.size == 2
+    validator = cache.validator(said, ssad)
+    assert (cache.hits, cache.misses) == (0, 1)
+    assert said in cache.checked
+    assert cache.validator(said, ssad) is validator
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert validator.is_valid({"n": 1})
+    assert not validator.is_valid({"n": "1"})
+
+    cache.validator("a", ssad)
+    cache.validator("b", ssad)  # evicts least recently used said
+    assert list(cache.validators) == ["a", "b"]
+    assert cache.check(said, ssad) is True
+    assert cache.check("bad", {"type": "foo"}) is False
+    assert "bad" not in cache.checked
+    cache.clear()
+    assert not cache.validators and not cache.checked
+
+    # Schemer verification reuses the process-wide validator of its SAID
+    validatorCache.clear()
+    schemer = Schemer(raw=dumps(ssad))
+    assert said in validatorCache.checked
+    hits = validatorCache.hits
+    assert schemer.verify(b'{"n": 1}') is True
+    assert said in validatorCache.validators
+    assert Schemer(raw=dumps(ssad)).verify(b'{"n": 2}') is True
+    assert validatorCache.hits == hits + 1
+    with pytest.raises(ValidationError):
+        schemer.verify(b'{"n": "2"}')
+
 
 if __name__ == '__main__':
     test_json_schema()
     test_json_schema_dict()
     test_resolution()
+    test_validator_cache()
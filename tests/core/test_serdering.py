@@ -1243,6 +1243,18 @@ def test_serderkeri():
     assert serder.delpre == None
     assert serder.delpreb == None
 
+    # derived primitives are memoized so materialized at most once
+    assert serder.sner is serder.sner
+    assert serder.tholder is serder.tholder
+    assert serder.ntholder is serder.ntholder
+    assert serder.bner is serder.bner
+    verfers = serder.verfers
+    assert verfers is not serder.verfers  # fresh list each access
+    assert verfers[0] is serder.verfers[0]  # of same instances
+    verfers.clear()  # so mutating list does not change memo
+    assert len(serder.verfers) == 1
+    assert serder.ndigers == [] and serder.berfers == []
+
 
 def test_serderkeri_icp():
     """Test SerderKERI icp msg"""
@@ -3,6 +3,7 @@
 tests.db.dbing module
 
 """
+import datetime
 import json
 import os
 import platform
@@ -14,9 +15,9 @@ import pytest
 import lmdb
 from hio.base import doing
 
-from keri.kering import Kinds, Ilks, versify
+from keri.kering import Kinds, Ilks, versify, ValidationError
 from keri.app import openHby
-from keri.core import (Seqner, Diger, Number, Kever, Serder,
+from keri.core import (Seqner, Diger, Number, Kever, Kevery, Serder,
                        Signer, Siger, Salter, Dater, Prefixer,
                        Cigar, Seqner, Saider, Noncer, Labeler,
                        Texter, SerderKERI, StateEstEvent,
@@ -26,8 +27,10 @@ from keri.core import (Seqner, Diger, Number, Kever, Serder,
 from keri.core import state as eventState
 from keri.db import (Baser, BaserDoer, Baser, SerderSuber,
                      CesrIoSetSuber, CesrSuber, CatCesrIoSetSuber,
-                     OnIoDupSuber, IoDupSuber, CatCesrSuber, statedict,
-                     openDB, dgKey, snKey, openLMDB, openDB, reopenDB)
+                     OnIoDupSuber, IoDupSuber, CatCesrSuber, statedict, verifierdict,
+                     openDB, dgKey, snKey, openLMDB, openDB, reopenDB,
+                     Profiles)
+from keri.db.dbing import KERILMDBProfileKey
 
 from keri.help import datify, dictify
 from keri.recording import (EventSourceRecord, KeyStateRecord,
@@ -1867,6 +1870,61 @@ def test_baser_clone_all_pre_iter():
         assert hab2.pre in pres
 
 
+def test_clone_evt_objs():
+    """
+    Test Baser object level event cloning used by .clean
+    """
+    with openHby(name="test", base="test", temp=True) as hby:
+        hab = hby.makeHab(name="alice", isith="1", icount=1)
+        other = hby.makeHab(name="bob", isith="1", icount=1)
+        hab.interact()
+        hab.rotate()
+
+        pres = [pre for pre, _ in hby.db.cloneAllPreObjIter()]
+        msgs = list(hby.db.cloneAllPreIter())
+        assert len(pres) == len(msgs) == 5
+        assert pres.count(hab.pre) == 3
+
+        exts = hby.db.cloneEvtObjs(pre=hab.pre, fn=1,
+                                   dig=hby.db.fels.get(keys=hab.pre, on=1))
+        assert exts["serder"].sn == 1
+        assert exts["sigers"][0].qb64 == hby.db.sigs.get(keys=(hab.pre, exts["serder"].said))[0].qb64
+        assert exts["firner"].num == 1
+        assert exts["dater"].qb64 == hby.db.dtss.get(keys=(hab.pre, exts["serder"].said)).qb64
+        assert exts["delsner"] is None and exts["delsger"] is None
+        assert exts["wigers"] == [] and exts["cigars"] == [] and exts["rsgs"] == []
+
+        with openDB(name="clone", temp=True) as copy:
+            kvy = Kevery(db=copy)
+            assert hby.db.cloneObjsInto(kvy) == (5, 0)
+            assert copy.kevers[hab.pre].sn == 2
+            assert copy.kevers[hab.pre].serder.said == hab.kever.serder.said
+            assert copy.kevers[other.pre].serder.said == other.kever.serder.said
+            for pre in (hab.pre, other.pre):  # same first seen log as original
+                assert ([dig for _, _, dig in copy.fels.getAllItemIter(keys=pre)] ==
+                        [dig for _, _, dig in hby.db.fels.getAllItemIter(keys=pre)])
+
+        # failed event rolls back alone and rest of its prefix still commits
+        with openDB(name="clone", temp=True) as copy:
+            kvy = Kevery(db=copy)
+            pin = copy.states.pin
+
+            def fail(keys, val):
+                if val.s == "1":
+                    raise RuntimeError("Injected failure after logEvent.")
+                return pin(keys=keys, val=val)
+
+            copy.states.pin = fail
+            assert hby.db.cloneObjsInto(kvy) == (5, 2)  # sn 2 then out of order
+            assert copy.kevers[hab.pre].sn == 0
+            assert copy.kels.getLast(keys=hab.pre, on=0) is not None
+            assert copy.kels.getLast(keys=hab.pre, on=1) is None  # rolled back
+            assert copy.evts.get(keys=(hab.pre, exts["serder"].said)) is None
+            assert copy.kevers[other.pre].serder.said == other.kever.serder.said
+
+    """End Test"""
+
+
 def test_clean_baser():
     """
     Test Baser db clean clone method
@@ -1908,7 +1966,7 @@ def test_clean_baser():
         state = natHab.db.states.get(keys=natHab.pre)  # Serder instance
         assert state.s == '6'
         assert state.f == '6'
-        assert natHab.db.env.stat()['entries'] <= 101 #68
+        assert natHab.db.env.stat()['entries'] <= 104 #68
 
         # test reopenDB with reuse  (because temp)
         with reopenDB(db=natHab.db, reuse=True):
@@ -1918,7 +1976,7 @@ def test_clean_baser():
             assert ldig == natHab.kever.serder.saidb
             serder = natHab.db.evts.get(keys=(natHab.pre, ldig))
             assert serder.said == natHab.kever.serder.said
-            assert natHab.db.env.stat()['entries'] <= 101 #68
+            assert natHab.db.env.stat()['entries'] <= 104 #68
 
             # verify name pre kom in db
             data = natHab.db.habs.get(keys=natHab.pre)
@@ -1991,6 +2049,52 @@ def test_clean_baser():
     """End Test"""
 
 
+@pytest.mark.parametrize("profile", list(Profiles))
+def test_clean_baser_profiles(profile, monkeypatch):
+    """
+    Test Baser db clean under each LMDB profile and that a failed clone
+    leaves the original in place
+    """
+    monkeypatch.setenv(KERILMDBProfileKey, profile)
+    with openHby(name="nat", salt=Salter(raw=b'0123456789abcdef').qb64) as hby:
+        hab = hby.makeHab(name="nat", isith='1', icount=1)
+        hab.interact()
+        hab.rotate()
+        hab.interact()
+        assert hby.db.profile == profile
+        said = hab.kever.serder.said
+
+        hby.db.clean()
+        assert hab.kever.sn == 3
+        assert hab.kever.serder.said == said
+        with reopenDB(db=hby.db, reuse=True):
+            assert hby.db.profile == profile
+            assert len(list(hby.db.kels.getAllIter(keys=hab.pre))) == 4
+            assert hby.db.habs.get(keys=hab.pre).hid == hab.pre
+            assert hby.db.states.get(keys=hab.pre).s == '3'
+
+        # failed clone raises and keeps original
+        processEvent = Kevery.processEvent
+
+        def fail(self, serder, **kwa):
+            if serder.sn == 2:
+                raise RuntimeError("Injected clone failure.")
+            return processEvent(self, serder=serder, **kwa)
+
+        monkeypatch.setattr(Kevery, "processEvent", fail)
+        with pytest.raises(ValueError):
+            hby.db.clean()
+        monkeypatch.undo()
+
+        assert hab.kever.serder.said == said
+        with reopenDB(db=hby.db, reuse=True):
+            assert len(list(hby.db.kels.getAllIter(keys=hab.pre))) == 4
+            assert hby.db.habs.get(keys=hab.pre).hid == hab.pre
+            assert hby.db.states.get(keys=hab.pre).s == '3'
+
+    """End Test"""
+
+
 def test_fetchkeldel():
     """
     Test fetching full KEL and full DEL from Baser
@@ -2375,6 +2479,105 @@ def test_statedict():
 
 
 
+    """End Test"""
+
+
+def test_statedict_bounded():
+    """
+    Test statedict LRU eviction with pinned local prefixes and metrics
+    """
+    dbd = statedict(size=2)  # in memory only so no read through
+    dbd['a'] = 1
+    dbd['b'] = 2
+    assert dbd['a'] == 1  # a now most recently used
+    dbd['c'] = 3
+    assert list(dbd.keys()) == ['a', 'c']  # b evicted
+    assert dbd.hits == 1
+    assert dbd.misses == 0
+    assert dbd.evictions == 1
+    assert dbd.get('b') is None
+
+    with openDB(name="nat") as db:
+        assert db.kevers.size == db.KeversCacheSize == 0  # unbounded default
+        db.kevers.size = 2
+        dbd = db.kevers
+
+        pre = 'DApYGFaqnrALTyejaJaGAVhNpSCtqyerPqWVK9ZBNZk0'
+        dig = 'EAskHI462CuIMS_gNkcl_QewzrRSKH2p9zHQIO132Z30'
+        serder = interact(pre=pre, dig=dig, sn=4)
+        eevt = StateEstEvent(s='3', d=dig, br=[], ba=[])
+        state = eventState(pre=pre, sn=4, pig=dig, dig=serder.said, fn=4,
+                           eilk=Ilks.ixn, keys=[pre], eevt=eevt)
+        db.evts.put(keys=(pre, serder.said), val=serder)
+        db.states.pin(keys=pre, val=state)
+
+        db.prefixes.add('p')  # local prefix is pinned
+        dbd['p'] = 0
+        assert dbd[pre].state() == state  # read through miss
+        assert dbd.misses == 1
+        dbd['x'] = 1
+        dbd['y'] = 2
+        assert list(dbd.keys()) == ['p', 'y']  # pinned p never evicted
+        assert dbd.evictions == 2
+
+        kever = dbd.get(pre)  # evicted kever reloaded from states
+        assert kever.state() == state
+        assert dbd.misses == 2
+        assert pre in dict.keys(dbd)
+
+    """End Test"""
+
+
+def test_verifierdict():
+    """
+    Test verifierdict cache of establishment event verifiers for resolveVerifiers
+    """
+    vd = verifierdict()  # size 0 caches nothing
+    vd.pin('a', 0, 'x', None, [])
+    assert len(vd) == 0
+
+    vd = verifierdict(size=2)
+    vd.pin('a', 0, 'x', 1, [1])
+    vd.pin('b', 0, 'y', 2, [2])
+    assert vd.fetch('a', 0) == (1, [1])  # a now most recently used
+    assert vd.fetch('a', 0, 'x') == (1, [1])
+    assert vd.fetch('a', 0, 'z') is None  # dig not match
+    vd.pin('c', 0, 'z', 3, [3])
+    assert list(vd.keys()) == [('a', 0), ('c', 0)]  # b evicted
+    vd.pin('a', 0, 'w', 4, [4])  # superseded
+    assert vd.fetch('a', 0, 'x') is None
+    assert (vd.hits, vd.misses, vd.evictions) == (2, 2, 1)
+    assert vd.hitRate == 0.5
+
+    with openHby(name="ver", temp=True) as hby:
+        db = hby.db
+        assert db.verifiers.size == db.VerifiersCacheSize == 4096
+        hab = hby.makeHab(name="ver", isith="1", icount=1)
+        icp = hab.kever.serder
+        hab.rotate()
+        rot = hab.kever.serder
+        assert db.verifiers[(hab.pre, 0)][0] == icp.said  # logged events cached
+        assert db.verifiers[(hab.pre, 1)][0] == rot.said
+
+        hits = db.verifiers.hits
+        tholder, verfers = db.resolveVerifiers(pre=hab.pre, sn=1, dig=rot.said)
+        assert [verfer.qb64 for verfer in verfers] == [verfer.qb64 for verfer in rot.verfers]
+        assert tholder.sith == rot.tholder.sith
+        assert db.verifiers.hits == hits + 1
+        with pytest.raises(ValidationError):  # dig mismatch misses and still fails
+            db.resolveVerifiers(pre=hab.pre, sn=1, dig=icp.said)
+
+        db.verifiers.clear()  # read through repopulates
+        db.resolveVerifiers(pre=hab.pre, sn=0, dig=icp.said)
+        assert db.verifiers[(hab.pre, 0)][0] == icp.said
+
+        db.verifiers.clear()  # rolled back lookups are not cached
+        with pytest.raises(ValueError):
+            with db.transact():
+                db.resolveVerifiers(pre=hab.pre, sn=0, dig=icp.said)
+                raise ValueError("rollback")
+        assert (hab.pre, 0) not in db.verifiers
+
     """End Test"""
 
 
@@ -2500,6 +2703,23 @@ def test_KERI_BASER_MAP_SIZE_handles_bad_values(caplog):
     os.environ.pop("KERI_BASER_MAP_SIZE")
 
 
+def test_KERI_BASER_EVTS_CACHE_SIZE():
+    with openDB() as db:
+        assert db.evts.cacheSize == 0  # default no cache
+
+    os.environ["KERI_BASER_EVTS_CACHE_SIZE"] = "256"
+    try:
+        with openDB() as db:
+            assert db.EvtsCacheSize == 256
+            assert db.evts.cacheSize == 256
+
+        os.environ["KERI_BASER_EVTS_CACHE_SIZE"] = "foo" # Not an int
+        with pytest.raises(ValueError):
+            Baser(reopen=False, temp=True)
+    finally:
+        os.environ.pop("KERI_BASER_EVTS_CACHE_SIZE")
+
+
 def test_clear_escrows():
     with openDB() as db:
         key = b'A'
@@ -2591,6 +2811,126 @@ def test_clear_escrows():
 
 
 
+def test_escrow_wakes():
+    """
+    Test Baser escrow wake and dependency indices
+    """
+    with openDB() as db:
+        assert db.wakes == {}
+        assert db.waiters == {}
+
+        dpre = "EBAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA"  # delegator
+        pre = "ECAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA"  # delegate
+
+        db.wake(pre)
+        assert db.wakes == {pre: None}
+        db.wake(pre.encode(), sn=2)
+        assert db.wakes == {pre: 2}
+        db.wake(pre, sn=1)  # keeps latest accepted sn
+        assert db.wakes == {pre: 2}
+        db.wake(pre)  # no accepted event keeps sn
+        assert db.wakes == {pre: 2}
+        db.wakes.clear()
+
+        db.wait(pre, on=None)  # nothing to wait on
+        db.wait(pre, on=pre)  # self not dependency
+        assert db.waiters == {}
+        db.wait(pre, on=dpre.encode())
+        assert list(db.waiters[dpre]) == [pre]
+
+        db.wake(dpre, sn=0)  # wakes waiters and releases them
+        assert db.wakes == {dpre: 0, pre: None}
+        assert db.waiters == {}
+
+        assert db.deadlines == {}
+        start = Dater(dts="2021-01-01T00:00:00.000000+00:00")
+        db.expire(pre, start, 60)
+        db.expire(pre.encode(), start, 120)  # keeps earliest deadline
+        db.expire(dpre, start, 30)
+        assert db.deadlines == {pre: start.datetime + datetime.timedelta(seconds=60),
+                                dpre: start.datetime + datetime.timedelta(seconds=30)}
+        assert db.expired(start.datetime) == []  # none due yet
+        assert db.expired(start.datetime + datetime.timedelta(seconds=90)) == [dpre, pre]
+        assert db.deadlines == {}
+        assert db.expiries == []
+
+        db.expire(pre, start, 60)
+        db.expire(pre, start, 10)  # earlier deadline supersedes
+        assert db.expired(start.datetime + datetime.timedelta(seconds=90)) == [pre]
+        assert db.expiries == []
+
+        db.wait(pre, on=dpre)
+        db.expire(pre)
+        db.clearEscrows()
+        assert db.wakes == {}
+        assert db.waiters == {}
+        assert db.deadlines == {}
+        assert db.expiries == []
+
+    assert not os.path.exists(db.path)
+
+
+def test_seal_index():
+    """
+    Test .ancs anchored seal index, sealing event lookups, and migration
+    """
+    from keri import __version__
+    from keri.db.basing import _sealDigest
+    from keri.db.migrations import add_seal_index
+
+    with openHby(name="test", base="test", temp=True) as hby:
+        hab = hby.makeHab(name="alice", isith="1", icount=1)
+        other = hby.makeHab(name="bob", isith="1", icount=1)
+
+        seal = dict(i=other.pre, s=other.kever.serder.snh, d=other.kever.serder.said)
+        dseal = dict(d=other.kever.serder.said)
+        hab.interact()
+        hab.interact(data=[seal, dseal])  # sn 2
+        hab.interact(data=[seal])  # sn 3
+
+        assert hby.db.ancs.cntAll() == 3
+        assert [srdr.sn for srdr in hby.db.getSealingEvtIter(pre=hab.pre, seal=seal)] == [2, 3]
+        assert [srdr.sn for srdr in hby.db.getSealingEvtIter(pre=hab.pre, seal=seal, sn=3)] == [3]
+
+        srdr = hby.db.fetchAllSealingEventByEventSeal(pre=hab.pre, seal=seal)
+        assert srdr.sn == 2
+        srdr = hby.db.fetchLastSealingEventByEventSeal(pre=hab.pre.encode(), seal=seal, sn=3)
+        assert srdr.sn == 3
+        srdr = hby.db.fetchLastSealingEventBySeal(pre=hab.pre, seal=dseal)
+        assert srdr.sn == 2
+        assert hby.db.fetchLastSealingEventByEventSeal(pre=hab.pre, seal=dseal) is None  # wrong type
+        assert hby.db.fetchLastSealingEventByEventSeal(pre=other.pre, seal=seal) is None
+        # same values different field order is different seal
+        assert hby.db.fetchLastSealingEventBySeal(pre=hab.pre,
+                seal=dict(d=seal["d"], s=seal["s"], i=seal["i"])) is None
+
+        # new database index is marked complete
+        assert hby.db.sealIndexed
+        assert not add_seal_index._check_if_needed(hby.db)
+
+        # database at current version created before the index, partially indexed
+        hby.db.ancs.trim()
+        hby.db.ancs.add(keys=(hab.pre, _sealDigest(seal)), val=hab.kever.serder.said)  # sn 3
+        hby.db.migs.rem(keys=("add_seal_index",))
+        hby.db._sealIndexed = False
+        assert not hby.db.sealIndexed
+        assert hby.db.version == __version__
+        # lookups walk the KEL until the index is complete
+        assert [srdr.sn for srdr in hby.db.getSealingEvtIter(pre=hab.pre, seal=seal)] == [2, 3]
+        srdr = hby.db.fetchAllSealingEventByEventSeal(pre=hab.pre, seal=seal)
+        assert srdr.sn == 2
+        srdr = hby.db.fetchLastSealingEventBySeal(pre=hab.pre, seal=dseal)
+        assert srdr.sn == 2
+
+        # migrate backfills index despite current version
+        assert add_seal_index._check_if_needed(hby.db)
+        hby.db.migrate()
+        assert hby.db.sealIndexed
+        assert hby.db.ancs.cntAll() == 3
+        srdr = hby.db.fetchAllSealingEventByEventSeal(pre=hab.pre, seal=seal)
+        assert srdr.sn == 2
+
+
 def test_trim_all_escrows_during_migration():
     """Regression test for issue #863: old qnfs key format crashes migration.
 
@@ -2803,7 +3143,10 @@ if __name__ == "__main__":
     test_fetchkeldel()
     test_usebaser()
     test_statedict()
+    test_statedict_bounded()
     test_baserdoer()
+    test_escrow_wakes()
+    test_seal_index()
     test_db_keyspace_end_to_end_migration()
     test_trim_all_escrows_during_migration()
     test_trim_all_escrows_old_key_format()
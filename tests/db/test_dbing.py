@@ -9,12 +9,12 @@ import pytest
 import os
 import lmdb
 
-from keri.kering import MaxON
+from keri.kering import MaxON, ConfigurationError, DatabaseError
 
 from keri.db import (LMDBer, dgKey, onKey, openLMDB,
                      snKey, dtKey, splitKey, suffix,
                      unsuffix, splitOnKey, splitKeyDT,
-                     splitSnKey, SuffixSize, MaxSuffix)
+                     splitSnKey, SuffixSize, MaxSuffix, Profiles)
 
 from keri.help import helping
 
@@ -2209,8 +2209,209 @@ def test_lmdber():
     """ End Test """
 
 
+@pytest.mark.parametrize("profile", list(Profiles))
+def test_lmdber_transact(profile):
+    """
+    Test LMDBer.transact unit of work, savepoint and replay for each profile
+    """
+    with openLMDB(profile=profile) as dber:
+        assert dber.nestable == (not Profiles[profile]["writemap"])
+        assert not dber.transacting
+        beta = dber.env.open_db(key=b'beta.')
+        gamma = dber.env.open_db(key=b'gamma.', dupsort=True)
+
+        # writes to multiple sub dbs commit together
+        with dber.transact() as txn:
+            assert dber.transacting
+            assert dber.putVal(beta, b'A', b'alpha')
+            assert dber.addVal(gamma, b'A', b'one')
+            assert dber.addVal(gamma, b'A', b'two')
+            # reads inside see uncommitted writes
+            assert dber.getVal(beta, b'A') == b'alpha'
+            assert dber.getVals(gamma, b'A') == [b'one', b'two']
+            # nested joins enclosing unit of work
+            with dber.transact() as ntxn:
+                assert ntxn is txn
+                assert dber.setVal(beta, b'B', b'bravo')
+            assert dber.transacting
+            # not visible outside unit of work until commit
+            with dber.env.begin(db=beta) as rtxn:
+                assert rtxn.get(b'A') is None
+
+        assert not dber.transacting
+        assert dber.getVal(beta, b'A') == b'alpha'
+        assert dber.getVal(beta, b'B') == b'bravo'
+        assert dber.getVals(gamma, b'A') == [b'one', b'two']
+
+        # exception rolls back all writes including nested ones
+        with pytest.raises(ValueError):
+            with dber.transact():
+                assert dber.setVal(beta, b'A', b'ack')
+                assert dber.remVal(beta, b'B')
+                with dber.transact():
+                    assert dber.addVal(gamma, b'A', b'three')
+                raise ValueError("abort")
+
+        assert not dber.transacting
+        assert dber.getVal(beta, b'A') == b'alpha'
+        assert dber.getVal(beta, b'B') == b'bravo'
+        assert dber.getVals(gamma, b'A') == [b'one', b'two']
+
+        # reads share one read transaction snapshot
+        with dber.reading() as txn:
+            assert dber.getVal(beta, b'A') == b'alpha'
+            assert dber.getVals(gamma, b'A') == [b'one', b'two']
+            with dber.reading() as ntxn:
+                assert ntxn is txn
+            with pytest.raises(lmdb.Error):  # no writes in read transaction
+                dber.setVal(beta, b'C', b'charlie')
+        assert not dber.transacting
+        assert dber.getVal(beta, b'C') is None
+
+        # callbacks run only once the unit of work commits
+        calls = []
+        dber.afterCommit(lambda: calls.append("now"))
+        assert calls == ["now"]
+        with dber.transact():
+            dber.afterCommit(lambda: calls.append("commit"))
+            with dber.transact():
+                dber.afterCommit(lambda: calls.append("nested"))
+            assert calls == ["now"]
+        assert calls == ["now", "commit", "nested"]
+        with pytest.raises(ValueError):
+            with dber.transact():
+                dber.afterCommit(lambda: calls.append("abort"))
+                raise ValueError("rollback")
+        assert calls == ["now", "commit", "nested"]
+
+        if dber.nestable:  # savepoint rolls back only its own writes and callbacks
+            with dber.transact() as txn:
+                assert dber.setVal(beta, b'C', b'charlie')
+                with pytest.raises(ValueError):
+                    with dber.savepoint() as stxn:
+                        assert stxn is not txn
+                        assert dber.setVal(beta, b'D', b'delta')
+                        assert dber.getVal(beta, b'D') == b'delta'
+                        dber.afterCommit(lambda: calls.append("savepoint"))
+                        raise ValueError("rollback savepoint")
+                assert dber.getVal(beta, b'D') is None
+                with dber.savepoint():
+                    assert dber.setVal(beta, b'E', b'echo')
+                    dber.afterCommit(lambda: calls.append("kept"))
+                assert dber.getVal(beta, b'E') == b'echo'
+        else:  # LMDB has no child transactions with writemap so unit of work fails
+            with pytest.raises(DatabaseError):
+                with dber.transact():
+                    assert dber.setVal(beta, b'C', b'charlie')
+                    with dber.savepoint():
+                        dber.afterCommit(lambda: calls.append("savepoint"))
+            assert dber.getVal(beta, b'C') is None  # rolled back
+            with dber.transact():
+                assert dber.setVal(beta, b'C', b'charlie')
+                assert dber.setVal(beta, b'E', b'echo')
+                dber.afterCommit(lambda: calls.append("kept"))
+        assert dber.getVal(beta, b'C') == b'charlie'
+        assert dber.getVal(beta, b'D') is None
+        assert dber.getVal(beta, b'E') == b'echo'
+        assert calls == ["now", "commit", "nested", "kept"]
+
+        with dber.savepoint():  # not nested so own unit of work
+            assert dber.transacting
+            assert dber.setVal(beta, b'F', b'foxtrot')
+        assert not dber.transacting
+        assert dber.getVal(beta, b'F') == b'foxtrot'
+
+        # replay returns result of unit of work that did not fail
+        def put(key, val):
+            with dber.transact():
+                return dber.setVal(beta, key, val)
+
+        assert dber.replay(put, b'G', b'golf')
+        assert dber.getVal(beta, b'G') == b'golf'
+
+    assert not os.path.exists(dber.path)
+
+    """ End Test """
+
+
+def test_lmdber_profile_grow():
+    """
+    Test LMDBer tuning profiles and map growth on MapFullError
+    """
+    with openLMDB() as dber:
+        assert dber.profile == LMDBer.Profile == "durable"
+        assert dber.mapSize == LMDBer.MapSize
+        assert not dber.env.flags()["writemap"]
+
+    with pytest.raises(ConfigurationError):
+        LMDBer(profile="fastest", reopen=False)
+
+    for profile in Profiles:
+        with openLMDB(profile=profile, mapSize=65536) as dber:
+            assert dber.profile == profile
+            assert dber.env.flags()["writemap"] == Profiles[profile]["writemap"]
+            start = dber.mapSize
+            beta = dber.env.open_db(key=b'beta.')
+            val = b'x' * 1024
+            for i in range(64):  # auto grows and retries each failed put
+                assert dber.putVal(beta, b'%032x' % i, val)
+            assert dber.mapSize > start
+            assert dber.env.info()["map_size"] == dber.mapSize
+            assert dber.cntAll(beta) == 64
+
+            # unit of work is rolled back but map grown for retry
+            dber.MaxMapSize = dber.mapSize  # stop auto growth
+            with pytest.raises(lmdb.MapFullError):
+                for i in range(64, 10000):
+                    dber.putVal(beta, b'%032x' % i, val)
+            assert not dber.grow()
+            dber.MaxMapSize = 0
+            count = dber.cntAll(beta)
+            with pytest.raises(lmdb.MapFullError):
+                with dber.transact():
+                    for i in range(10000, 100000):
+                        dber.putVal(beta, b'%032x' % i, val)
+            assert dber.cntAll(beta) == count  # rolled back
+            assert dber.env.info()["map_size"] == dber.mapSize
+
+            # grow deferred while a transaction is open such as an iterator
+            items = dber.getTopItemIter(beta)
+            next(items)  # read transaction open until exhausted or closed
+            assert dber._opens == 1
+            size = dber.mapSize
+            with pytest.raises(lmdb.MapFullError):
+                with dber.transact():
+                    for i in range(100000, 400000):
+                        dber.putVal(beta, b'%032x' % i, val)
+            assert dber._growing
+            assert dber.mapSize == size  # not grown while iterator open
+            items.close()
+            assert dber._opens == 0
+            assert not dber._growing
+            assert dber.mapSize > size  # grown once iterator closed
+            assert dber.env.info()["map_size"] == dber.mapSize
+
+            # replay unit of work that failed on full map once map has grown
+            def fill(start, stop):
+                with dber.transact():
+                    for i in range(start, stop):
+                        dber.putVal(beta, b'%032x' % i, val)
+                return stop - start
+
+            size = dber.mapSize
+            count = dber.cntAll(beta)
+            assert dber.replay(fill, 400000, 400000 + 2 * size // 1024) == 2 * size // 1024
+            assert dber.mapSize > size
+            assert dber.cntAll(beta) == count + 2 * size // 1024
+
+    """ End Test """
+
+
+
 if __name__ == "__main__":
     test_key_funcs()
     test_suffix()
     test_lmdber()
+    test_lmdber_transact("durable")
+    test_lmdber_profile_grow()
     test_opendatabaser()
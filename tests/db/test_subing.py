@@ -13,7 +13,7 @@ from keri.core import (SerderKERI, Siger, Schemer, Signer,
                        Salter, Decrypter, Encrypter, Cipher,
                        Saider, Seqner, Diger, Prefixer,
                        Matter, Dater, Number, MtrDex, Tiers,
-                       incept, rotate)
+                       incept, rotate, interact)
 
 from keri.db import (Suber, OnSuber, LMDBer, B64Suber, DupSuber,
                      IoDupSuber, B64IoDupSuber, OnIoDupSuber, B64OnIoDupSuber,
@@ -3451,6 +3451,41 @@ def test_serder_suber():
         assert items == [(('b', '1'), srdr0.said),
                          (('b', '2'), srdr1.said)]
 
+        # test LRU cache of deserialized serders
+        assert serber.cacheSize == 0  # no cache by default
+        assert serber.get(keys=("a", "1")) is not serber.get(keys=("a", "1"))
+        assert serber.cacheHits == serber.cacheMisses == 0
+
+        serber = SerderSuber(db=db, subkey='pugs.', cacheSize=2)
+        assert serber.cacheSize == 2
+        actual = serber.get(keys=("a", "1"))
+        assert actual.said == srdr0.said
+        assert (serber.cacheHits, serber.cacheMisses) == (0, 1)
+        assert serber.get(keys=("b", "1")) is actual  # same raw so same instance
+        assert (serber.cacheHits, serber.cacheMisses) == (1, 1)
+        assert serber.get(keys=("a", "2")).said == srdr1.said
+        assert (serber.cacheHits, serber.cacheMisses) == (1, 2)
+
+        # pin new val at key so cache is not stale
+        assert serber.pin(keys=("a", "1"), val=srdr1)
+        assert serber.get(keys=("a", "1")).said == srdr1.said
+        assert (serber.cacheHits, serber.cacheMisses) == (2, 2)
+
+        srdr2 = interact(pre=pre, dig=srdr1.said, sn=2, **kwa)
+        assert serber.put(keys=("c", "1"), val=srdr2)
+        assert serber.get(keys=("c", "1")).said == srdr2.said  # evicts srdr0
+        assert (serber.cacheHits, serber.cacheMisses) == (2, 3)
+        assert serber.get(keys=("b", "1")).said == srdr0.said
+        assert (serber.cacheHits, serber.cacheMisses) == (2, 4)
+        saids = [srdr.said for keys, srdr in serber.getTopItemIter(keys=topkeys)]
+        assert saids == [srdr0.said, srdr1.said]
+        assert (serber.cacheHits, serber.cacheMisses) == (3, 5)  # srdr1 was evicted
+
+        serber.clearCache()
+        assert (serber.cacheHits, serber.cacheMisses) == (0, 0)
+        assert serber.get(keys=("b", "1")).said == srdr0.said
+        assert (serber.cacheHits, serber.cacheMisses) == (0, 1)
+
     assert not os.path.exists(db.path)
     assert not db.opened
 
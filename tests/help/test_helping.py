@@ -9,9 +9,10 @@ import datetime
 import fractions
 import time
 
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 
-from keri.help import (isign, sceil, extractValues, dictify, datify, klasify,
+from keri.help import (isign, sceil, extractValues, dictify, datify, dictifier, datifier,
+                           klasify,
                         intToB64, intToB64b, b64ToInt, B64_CHARS, fromIso8601,
                         codeB64ToB2, codeB2ToB64, Reb64, nabSextets,
                         nowIso8601, toIso8601, Reatt, Repath)
@@ -131,6 +132,66 @@ def test_dictify():
     assert dictify(c) == {'area': 50.24, 'perimeter': 25.12}
 
 
+def test_dictifier_datifier():
+    """
+    Test compiled dataclass codecs match dictify and datify
+    """
+    @dataclass
+    class Point:
+        x: float
+        y: float
+
+    @dataclass
+    class Shape:
+        name: str
+        a: Point
+        b: Point | None = None
+        pts: list = field(default_factory=list)
+        tags: dict = field(default_factory=dict)
+
+    @dataclass
+    class Circle:
+        radius: float
+
+        def _ser(self):
+            return dict(perimeter=2*self.radius*3.14)
+
+        @staticmethod
+        def _der(d):
+            return Circle(radius=d["perimeter"] / 2 / 3.14)
+
+    assert dictifier(Shape) is dictifier(Shape)  # cached
+    assert datifier(Shape) is datifier(Shape)
+
+    shape = Shape(name="s", a=Point(1, 2), pts=[Point(3, 4), [5, 6]],
+                  tags=dict(p=Point(7, 8)))
+    d = dictifier(Shape)(shape)
+    assert d == dictify(shape) == asdict(shape)
+    assert d["pts"] is not shape.pts  # containers rebuilt
+    assert datifier(Shape)(d) == datify(Shape, d)
+    assert datifier(Shape)(d).a == Point(1, 2)
+
+    c = Circle(radius=4)
+    assert dictifier(Circle)(c) == dictify(c) == {'perimeter': 25.12}
+    assert datifier(Circle)(dictify(c)) == datify(Circle, dictify(c))
+    assert datifier(Circle)(dict(area=1)) == dict(area=1)  # _der fails
+
+    # mismatched dicts are returned unchanged as datify does
+    for bad in (dict(x=1), dict(x=1, y=2, z=3), None, [1, 2], "xy"):
+        assert datifier(Point)(bad) == datify(Point, bad) == bad
+    bad = dict(name="s", a=Point(1, 2), c=3)
+    assert datifier(Shape)(bad) == datify(Shape, bad) == bad
+    shape = datifier(Shape)(dict(name="s", a=None))
+    assert shape == datify(Shape, dict(name="s", a=None))
+    assert shape.a is None
+
+    # non dataclasses are left as is
+    assert datifier(int)(3) == 3
+    assert datifier(list[Point])([dict(x=1, y=2)]) == [dict(x=1, y=2)]
+
+    """End Test"""
+
+
 def test_klasify():
     """
     Test klasify utility function
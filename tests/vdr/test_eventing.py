@@ -7,7 +7,7 @@ import pytest
 
 from keri.app import openKS
 from keri.core import (Signer, Diger, SerderKERI, SealEvent,
-                       Prefixer, Seqner, Diger, MtrDex)
+                       Prefixer, Seqner, Diger, Saider, MtrDex)
 from keri.db import openDB, snKey, dgKey
 from keri import (Ilks, TraitDex, MissingAnchorError, ValidationError,
                   MissingWitnessSignatureError, LikelyDuplicitousError,
@@ -663,6 +663,8 @@ def test_tevery():
         status = tev.vcState(vcdig.decode("utf-8"))
         assert status.et == Ilks.iss
         assert status.s == '0'
+        assert status == reg.vcss.get(keys=vcdig.decode("utf-8"))
+        assert status == tev.calcVcState(vcdig.decode("utf-8"))
 
         # revoke the vc
         rev = revoke(vcdig=vcdig.decode("utf-8"), regk=regk, dig=iss.said, version=Vrsn_1_0, kind=Kinds.json)
@@ -679,6 +681,16 @@ def test_tevery():
         status = tev.vcState(vcdig.decode("utf-8"))
         assert status.et == Ilks.rev
         assert status.s == '1'
+        assert status.d == rev.said
+        assert status == tev.calcVcState(vcdig.decode("utf-8"))
+
+        # status record missing such as logged before records is calculated and saved
+        assert reg.vcss.rem(keys=vcdig.decode("utf-8")) is True
+        assert tev.vcState(vcdig.decode("utf-8")) == status
+        assert reg.vcss.get(keys=vcdig.decode("utf-8")) == status
+
+        states = reg.vcStates([vcdig.decode("utf-8"), Saider(qb64=iss.said)])
+        assert states == {vcdig.decode("utf-8"): status, iss.said: None}
 
 
 def test_tevery_process_escrow(mockCoringRandomNonce):
@@ -515,6 +515,19 @@ def test_verifier_chained_credential(seeder):
         assert cue["kin"] == "saved"
         assert cue["creder"].raw == vLeiCreder.raw
 
+        # shared chained credential is expanded once per call
+        saids = [Saider(qb64=vLeiCreder.said), Saider(qb64=vLeiCreder.said)]
+        creds = vicreg.reger.cloneCreds(saids=saids, db=vic.db)
+        assert creds[0] is creds[1]
+        assert [chain["sad"]["d"] for chain in creds[0]["chains"]] == [creder.said]
+        assert creds[0]["chains"][0]["chains"] == []
+        creds = vicreg.reger.cloneCreds(saids=saids, db=vic.db, depth=0)
+        assert creds[0]["chains"] == []
+
+        creds = list(vicreg.reger.cloneCredIter(saids=saids, db=vic.db))
+        assert [cred["sad"]["d"] for cred in creds] == [creder.said, vLeiCreder.said]
+        assert creds[1]["chains"] == [creder.said]
+
         # Revoke Ian's issuer credential and vic should no longer be able to verify
         # Han's credential that's linked to it
         rev = roniss.revoke(said=creder.said)
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+bench_habery.py -- Habery startup benchmark for many habs.
+
+Creates a persistent Habery with N single key habs in a scratch directory,
+then reopens it in fresh processes, once loading all habs eagerly and once
+lazily with a bounded hab cache, and reports the time to open the Habery
+and the resident memory of the process afterwards.
+
+Usage:
+    bench_habery.py [--habs N] [--cache C] [--dir PATH]
+
+Creating the habs dominates the run time for large N.  The scratch directory
+is reused when it already holds a Habery with N habs.
+"""
+
+import argparse
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from keri.app import Habery, Algos
+
+NAME = "bench"
+
+
+def create(path, count):
+    """Creates Habery at path with count habs unless already there"""
+    hby = Habery(name=NAME, temp=False, headDirPath=path, habCacheSize=1)
+    try:
+        have = len(hby.habs)
+        for i in range(have, count):
+            hby.makeHab(name=f"hab{i}", algo=Algos.randy, icount=1, ncount=1)
+            if i % 1000 == 999:
+                print(f"created {i + 1} habs", file=sys.stderr)
+    finally:
+        hby.close()
+
+
+def load(path, cache):
+    """Opens Habery at path and prints seconds taken and max resident MB"""
+    start = time.perf_counter()
+    hby = Habery(name=NAME, temp=False, headDirPath=path, habCacheSize=cache)
+    elapsed = time.perf_counter() - start
+    hab = hby.habByName("hab0")  # first access of a hab
+    assert hab is not None and hab.kever.sn == 0
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    hby.close()
+    print(f"{elapsed:.3f} {rss:.1f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Habery startup benchmark")
+    parser.add_argument("--habs", type=int, default=10000,
+                        help="number of habs in Habery")
+    parser.add_argument("--cache", type=int, default=256,
+                        help="hab cache size of lazy Habery")
+    parser.add_argument("--dir", default=None,
+                        help="scratch directory, default new temp directory")
+    parser.add_argument("--load", type=int, default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    path = args.dir if args.dir is not None else tempfile.mkdtemp(prefix="bench_habery_")
+
+    if args.load is not None:  # child process of one reopen
+        load(path, args.load)
+        return 0
+
+    create(path, args.habs)
+    for label, cache in (("eager", 0), (f"lazy cache={args.cache}", args.cache)):
+        out = subprocess.run([sys.executable, __file__, "--dir", path,
+                              "--load", str(cache)],
+                             check=True, capture_output=True, text=True).stdout
+        elapsed, rss = out.split()
+        print(f"{args.habs} habs {label}: open {elapsed} s, max rss {rss} MB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
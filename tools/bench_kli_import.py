@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+bench_kli_import.py -- kli startup import time regression benchmark.
+
+Runs `python -X importtime` in a fresh interpreter for each common kli
+command that builds the kli parser with keri.cli.kli.loadParser and parses the
+command line, as kli does before running the command handler. Reports the
+total import time and the number of keri modules imported.
+
+Usage:
+    bench_kli_import.py [--repeat R] [--max MS]
+
+Exits non zero when --max is given and any command imports for longer than
+MS milliseconds so that it may be used as a regression check.
+"""
+
+import argparse
+import subprocess
+import sys
+
+Commands = [
+    ["version"],
+    ["list", "--name", "bench"],
+    ["status", "--name", "bench", "--alias", "bench"],
+    ["incept", "--name", "bench", "--alias", "bench"],
+    ["rotate", "--name", "bench", "--alias", "bench"],
+    ["oobi", "resolve", "--name", "bench", "--oobi", "http://127.0.0.1/oobi"],
+    ["vc", "list", "--name", "bench", "--alias", "bench"],
+]
+
+Code = ("import sys\n"
+        "from keri.cli.kli import loadParser\n"
+        "argv = sys.argv[1:]\n"
+        "loadParser(argv, prog='kli').parse_args(argv)\n"
+        "print(sum(1 for m in sys.modules if m.startswith('keri')))\n")
+
+
+def importTime(argv):
+    """Returns (total import microseconds, keri module count) for argv"""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", Code, *argv],
+                            check=True, capture_output=True, text=True)
+    total = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if cumulative.strip().isdigit() and not name.startswith("  "):  # top level
+            total += int(cumulative)
+    return total, int(result.stdout.split()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="kli import time benchmark")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="runs per command, best is reported")
+    parser.add_argument("--max", type=float, default=None,
+                        help="fail when import time of a command exceeds MS")
+    args = parser.parse_args(argv)
+
+    failed = False
+    for command in Commands:
+        best, count = min(importTime(command) for _ in range(args.repeat))
+        ms = best / 1000
+        name = " ".join(command[:next((i for i, arg in enumerate(command)
+                                       if arg.startswith("-")), len(command))])
+        print(f"kli {name:<20} {ms:8.1f} ms {count:4d} keri modules")
+        if args.max is not None and ms > args.max:
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+bench_lmdb.py -- LMDBer write throughput benchmark per tuning profile.
+
+Opens a temporary LMDBer once for each tuning profile in keri.db.Profiles and
+writes N values of S bytes each with one putVal, i.e. one commit, per value.
+Reports commits per second of each profile.
+
+Usage:
+    bench_lmdb.py [--count N] [--size S]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from keri.db import openLMDB, Profiles
+
+
+def bench(profile, count, size):
+    """Returns commits per second of count puts of size bytes with profile"""
+    with openLMDB(name=f"bench_{profile}", profile=profile) as dber:
+        sdb = dber.env.open_db(key=b'bench.')
+        vals = [os.urandom(size) for _ in range(count)]
+        start = time.perf_counter()
+        for i, val in enumerate(vals):
+            dber.putVal(sdb, b'%032x' % i, val)
+        elapsed = time.perf_counter() - start
+    return count / elapsed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="LMDBer profile benchmark")
+    parser.add_argument("--count", type=int, default=5000,
+                        help="number of puts each in own commit")
+    parser.add_argument("--size", type=int, default=256,
+                        help="bytes per value")
+    args = parser.parse_args(argv)
+
+    for profile in Profiles:
+        rate = bench(profile, args.count, args.size)
+        print(f"{profile}: {rate:,.0f} commits/s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
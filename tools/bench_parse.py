@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+bench_parse.py -- KEL replay parsing benchmark.
+
+Builds the replay stream of a KEL of N signed events, an inception followed by
+interactions, and times Parser.parse of the whole stream into the Kevery of a
+fresh database for each N. Parser consumes its bytearray stream by deleting
+from the front, so a stream whose parse time grows faster than linearly in N
+would show quadratic copying. Also times consuming a stream of the size of
+the largest replay by front deletes versus walking a memoryview with an offset
+cursor in chunks of the average message size.
+
+Usage:
+    bench_parse.py [--counts N ...] [--lmdb PROFILE] [--extract] [--profile]
+
+With --lmdb opens the Kevery database with that LMDBer profile instead of
+the default durable one. With --extract parses without a Kevery so only
+message extraction and dispatch are timed, each event is then dropped.
+
+With --profile prints the top functions by own time of parsing the largest
+replay.
+"""
+
+import argparse
+import cProfile
+import logging
+import os
+import pstats
+import sys
+import time
+
+from keri.app import openHby
+from keri.core import Kevery, Parser, Salter
+from keri.db import openDB
+from keri.db.dbing import KERILMDBProfileKey, Profiles
+
+
+def replay(count):
+    """Returns (pre, stream, kind) of replay of KEL of count events"""
+    with openHby(name="bench_parse", temp=True,
+                 salt=Salter(raw=b'0123456789abcdef').qb64) as hby:
+        hab = hby.makeHab(name="bench", transferable=True)
+        for _ in range(count - 1):
+            hab.interact()
+        return hab.pre, bytes(hab.replay()), hab.kever.serder.kind
+
+
+def extract(stream):
+    """Returns seconds to parse stream without Kevery"""
+    psr = Parser()
+    ims = bytearray(stream)
+    start = time.perf_counter()
+    psr.parse(ims=ims)
+    elapsed = time.perf_counter() - start
+    assert not ims, "replay not fully extracted"
+    return elapsed
+
+
+def parse(pre, stream, count):
+    """Returns seconds to parse stream into fresh Kevery"""
+    with openDB(name="bench_parse_kvy", temp=True) as db:
+        psr = Parser(kvy=Kevery(db=db))
+        ims = bytearray(stream)
+        start = time.perf_counter()
+        psr.parse(ims=ims)
+        elapsed = time.perf_counter() - start
+        assert db.kevers[pre].sn == count - 1, "replay not fully accepted"
+    return elapsed
+
+
+def consume(size, chunk):
+    """Returns (front delete, view cursor) seconds to consume size bytes"""
+    ims = bytearray(size)
+    start = time.perf_counter()
+    while ims:
+        del ims[:chunk]
+    deleting = time.perf_counter() - start
+
+    view = memoryview(bytearray(size))
+    start = time.perf_counter()
+    offset = 0
+    while offset < size:
+        view[offset:offset + chunk]
+        offset += chunk
+    walking = time.perf_counter() - start
+    return deleting, walking
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="KEL replay parse benchmark")
+    parser.add_argument("--counts", type=int, nargs="+", default=[2500, 10000],
+                        help="events per KEL replay")
+    parser.add_argument("--profile", action="store_true",
+                        help="profile parse of largest replay")
+    parser.add_argument("--lmdb", choices=list(Profiles), default=None,
+                        help="LMDBer profile of Kevery database")
+    parser.add_argument("--extract", action="store_true",
+                        help="parse without Kevery, extraction only")
+    args = parser.parse_args(argv)
+
+    if args.lmdb:
+        os.environ[KERILMDBProfileKey] = args.lmdb
+    logging.disable(logging.INFO)  # dropped msgs of --extract log each event
+    timer = (lambda pre, stream, count: extract(stream)) if args.extract else parse
+
+    base = None
+    for count in sorted(args.counts):
+        pre, stream, kind = replay(count)
+        elapsed = timer(pre, stream, count)
+        base = base or (count, elapsed)
+        scale = (elapsed / base[1]) / (count / base[0])  # 1.0 means linear
+        print(f"{count:6d} events {len(stream) / 1e6:6.2f} MB {kind}: "
+              f"{elapsed:6.2f} s {count / elapsed:8,.0f} events/s "
+              f"{scale:4.2f}x linear")
+
+    deleting, walking = consume(len(stream), len(stream) // count)
+    print(f"consume {len(stream) / 1e6:.2f} MB in {len(stream) // count} byte "
+          f"chunks: front delete {deleting * 1e3:.1f} ms, "
+          f"view cursor {walking * 1e3:.1f} ms")
+
+    if args.profile:
+        profiler = cProfile.Profile()
+        profiler.enable()
+        timer(pre, stream, count)
+        profiler.disable()
+        pstats.Stats(profiler).sort_stats("tottime").print_stats(12)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+bench_qb64.py -- qb64 extraction micro benchmark.
+
+Times Matter, Indexer and Counter ._exfil over a corpus of mixed CESR
+primitives as they appear when parsing events: keys, digests, indexed and
+unindexed signatures, numbers, datetimes, salts and attachment group counters,
+given as bytes, as bytearray streams with trailing material, and as str.
+
+Usage:
+    bench_qb64.py [--number N] [--repeat R]
+
+Prints the best time per primitive in nanoseconds for each class.
+"""
+
+import argparse
+import sys
+import timeit
+
+from keri.kering import Vrsn_1_0, Vrsn_2_0
+from keri.core import (Matter, Indexer, Counter, Codens, Salter, Diger,
+                       Number, Dater)
+
+
+def corpus():
+    """Returns list of (name, instance, primitives) of the benchmark corpus"""
+    signer = Salter(raw=b'0123456789abcdef').signer()
+    ser = b'abcdefghijklmnopqrstuvwxyz0123456789' * 4
+
+    mats = [signer.verfer.qb64b, Diger(ser=ser).qb64b, signer.sign(ser).qb64b,
+            Number(num=5).qb64b, Dater().qb64b, Salter().qb64b]
+    mats = (mats + [bytearray(qb64b) + b'-AAB' for qb64b in mats]
+            + [qb64b.decode() for qb64b in mats])
+
+    sigers = [signer.sign(ser, index=0).qb64b,
+              signer.sign(ser, index=70, ondex=2).qb64b]
+    sigers = (sigers + [bytearray(qb64b) + b'-AAB' for qb64b in sigers]
+              + [qb64b.decode() for qb64b in sigers])
+
+    ctrs = [Counter(code=Codens.ControllerIdxSigs, count=3, version=Vrsn_1_0).qb64b,
+            Counter(code=Codens.WitnessIdxSigs, count=7, version=Vrsn_1_0).qb64b]
+    ctrs = (ctrs + [bytearray(qb64b) + b'AAAA' for qb64b in ctrs]
+            + [qb64b.decode() for qb64b in ctrs])
+
+    return [("Matter", Matter.__new__(Matter), mats),
+            ("Indexer", Indexer.__new__(Indexer), sigers),
+            ("Counter", Counter(code=Codens.ControllerIdxSigs, count=1,
+                                version=Vrsn_1_0), ctrs)]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="qb64 extraction benchmark")
+    parser.add_argument("--number", type=int, default=20000,
+                        help="passes over corpus per timing")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="timings of which best is reported")
+    args = parser.parse_args(argv)
+
+    for name, inst, prims in corpus():
+        def run():
+            for prim in prims:
+                inst._exfil(prim)
+
+        best = min(timeit.repeat(run, number=args.number, repeat=args.repeat))
+        print(f"{name}._exfil: {best / (args.number * len(prims)) * 1e9:.0f} ns "
+              f"per primitive over {len(prims)} primitives")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
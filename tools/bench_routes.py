@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+bench_routes.py -- reply route dispatch micro benchmark.
+
+Registers the stock reply routes plus N application routes, half exact and
+half templated, on a Router and times Revery.processReply of reply messages
+spread over all of the routes. Compares the compiled route table of Router
+with a linear regex scan of every registered route.
+
+Usage:
+    bench_routes.py [--routes N] [--number K] [--repeat R]
+
+Prints the best time per processReply and per Router._find in microseconds.
+"""
+
+import argparse
+import sys
+import timeit
+
+from keri.core import Router, Revery
+from keri.core.eventing import reply
+
+
+class Sink:
+    """Reply resource that accepts any processReply{suffix} call"""
+
+    def __getattr__(self, name):
+        if name.startswith("processReply"):
+            return lambda **kwa: None
+        raise AttributeError(name)
+
+
+class LinearRouter(Router):
+    """Router that finds routes by linear regex scan as a baseline"""
+
+    def _find(self, route):
+        for r in self.routes:
+            if res := r.regex.search(route):
+                return r, res.groupdict()
+        return None, None
+
+
+def routes(count):
+    """Returns list of (template, route) of stock and count app reply routes"""
+    pre = "EBabiu_JCkE0GbiglDXNB5C4NQq-hiGgxhHKXBxkiojg"
+    pairs = [("/end/role/{action}", "/end/role/add"),
+             ("/loc/scheme", "/loc/scheme"),
+             ("/ksn/{aid}", f"/ksn/{pre}"),
+             ("/watcher/{aid}/{action}", f"/watcher/{pre}/add"),
+             ("/tsn/registry/{aid}", f"/tsn/registry/{pre}"),
+             ("/tsn/credential/{aid}", f"/tsn/credential/{pre}"),
+             ("/introduce", "/introduce")]
+    for i in range(count):
+        if i % 2:
+            pairs.append((f"/app{i}/state/{{aid}}", f"/app{i}/state/{pre}"))
+        else:
+            pairs.append((f"/app{i}/status", f"/app{i}/status"))
+    return pairs
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Reply route dispatch benchmark")
+    parser.add_argument("--routes", type=int, default=50,
+                        help="number of application routes added to stock routes")
+    parser.add_argument("--number", type=int, default=100,
+                        help="passes over all messages per timing")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="number of timings, best is reported")
+    args = parser.parse_args(argv)
+
+    pairs = routes(args.routes)
+    serders = [reply(route=route, data=dict(n=i)) for i, (_, route) in enumerate(pairs)]
+    sink = Sink()
+    print(f"{len(pairs)} registered routes")
+    for label, klas in (("linear", LinearRouter), ("compiled", Router)):
+        rtr = klas()
+        for template, _ in pairs:
+            rtr.addRoute(template, sink, suffix="Bench")
+        rvy = Revery(db=None, rtr=rtr)
+
+        def process():
+            for serder in serders:
+                rvy.processReply(serder=serder)
+
+        def find():
+            for serder in serders:
+                rtr._find(serder.ked["r"])
+
+        for name, fn in (("processReply", process), ("_find", find)):
+            best = min(timeit.repeat(fn, number=args.number, repeat=args.repeat))
+            per = best / (args.number * len(serders)) * 1e6
+            print(f"{label:>8} {name}: {per:.2f} us")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())